@@ -0,0 +1,46 @@
+"""Add tracker_task_metrics table with precomputed per-task metrics
+
+Revision ID: a3c5e7f9b1d2
+Revises: 559cdae67d39
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a3c5e7f9b1d2"
+down_revision = "559cdae67d39"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create tracker_task_metrics table."""
+    op.create_table(
+        "tracker_task_metrics",
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("history_version", sa.String(length=255), nullable=False),
+        sa.Column("config_version", sa.String(length=64), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=True),
+        sa.Column("ttm", sa.Integer(), nullable=True),
+        sa.Column("tail", sa.Integer(), nullable=True),
+        sa.Column("devlt", sa.Integer(), nullable=True),
+        sa.Column("ttd", sa.Integer(), nullable=True),
+        sa.Column("pause", sa.Integer(), nullable=True),
+        sa.Column("ttd_pause", sa.Integer(), nullable=True),
+        sa.Column("discovery_backlog_days", sa.Integer(), nullable=True),
+        sa.Column("ready_for_dev_days", sa.Integer(), nullable=True),
+        sa.Column("ttd_target_date", sa.DateTime(), nullable=True),
+        sa.Column("last_discovery_backlog_exit_date", sa.DateTime(), nullable=True),
+        sa.Column("stable_done_date", sa.DateTime(), nullable=True),
+        sa.Column("has_development", sa.Boolean(), nullable=True),
+        sa.Column("current_status", sa.String(length=255), nullable=True),
+        sa.PrimaryKeyConstraint("task_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop tracker_task_metrics table."""
+    op.drop_table("tracker_task_metrics")
@@ -0,0 +1,73 @@
+"""Add tracker_task_links edge table normalized from tracker_tasks.links
+
+Revision ID: b4d6f8a0c2e3
+Revises: a3c5e7f9b1d2
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b4d6f8a0c2e3"
+down_revision = "a3c5e7f9b1d2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create tracker_task_links table and fill it from existing links."""
+    op.create_table(
+        "tracker_task_links",
+        sa.Column("src_key", sa.String(length=255), nullable=False),
+        sa.Column("dst_key", sa.String(length=255), nullable=False),
+        sa.Column("type_id", sa.String(length=255), nullable=False),
+        sa.Column("direction", sa.String(length=32), nullable=False),
+        sa.Column("dst_display", sa.String(length=500), nullable=True),
+        sa.PrimaryKeyConstraint("src_key", "dst_key", "type_id", "direction"),
+    )
+    op.create_index(
+        "idx_tracker_task_links_dst",
+        "tracker_task_links",
+        ["dst_key", "type_id", "direction"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_tracker_task_links_src",
+        "tracker_task_links",
+        ["src_key", "type_id"],
+        unique=False,
+    )
+
+    # Backfill edges from links already stored in tracker_tasks
+    op.execute(
+        """
+        INSERT INTO tracker_task_links
+            (src_key, dst_key, type_id, direction, dst_display)
+        SELECT DISTINCT ON (src_key, dst_key, type_id, direction)
+            src_key, dst_key, type_id, direction, dst_display
+        FROM (
+            SELECT
+                t.key AS src_key,
+                link->'object'->>'key' AS dst_key,
+                link->'type'->>'id' AS type_id,
+                COALESCE(link->>'direction', '') AS direction,
+                LEFT(link->'object'->>'display', 500) AS dst_display
+            FROM tracker_tasks t
+            CROSS JOIN LATERAL jsonb_array_elements(
+                CASE WHEN jsonb_typeof(t.links) = 'array' THEN t.links ELSE '[]' END
+            ) AS link
+            WHERE t.key IS NOT NULL
+            AND jsonb_typeof(link) = 'object'
+        ) AS edges
+        WHERE dst_key IS NOT NULL AND type_id IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop tracker_task_links table."""
+    op.drop_index("idx_tracker_task_links_src", table_name="tracker_task_links")
+    op.drop_index("idx_tracker_task_links_dst", table_name="tracker_task_links")
+    op.drop_table("tracker_task_links")
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Benchmark Google Sheets upload of TTM Details reports offline.
+
+Every report is uploaded the way the CSV uploader does it with pivots
+(upload_csv_to_sheet + create_pivot_tables_from_dataframe), but against
+FakeSheetsHttp instead of the real API. For each upload the benchmark
+reports API calls by operation, batchUpdate sub-requests, bytes sent and
+received, simulated network wait and wall time.
+
+Without input files a synthetic TTM Details report of --rows rows is used.
+Simulated latency (--latency) and quota (--quota) make the call count
+visible in the wall time; with zero latency the wall time is the client
+side cost of building and serialising requests.
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from radiator.commands.models.ttm_details_columns import TTMDetailsColumns
+from radiator.services.fake_sheets_transport import FakeSheetsHttp
+from radiator.services.google_sheets_service import GoogleSheetsService
+
+BENCHMARK_DOCUMENT_ID = "benchmark"
+DEFAULT_SYNTHETIC_ROWS = 2000
+OPERATIONS = [
+    "spreadsheets.get",
+    "spreadsheets.batchUpdate",
+    "values.update",
+    "values.batchUpdate",
+]
+
+
+def write_synthetic_report(path: Path, rows: int, seed: int = 0) -> Path:
+    """
+    Write synthetic TTM Details report with the real column structure.
+
+    Args:
+        path: Output CSV path
+        rows: Number of tasks
+        seed: Random seed, the same seed gives the same report
+
+    Returns:
+        Path to the written report
+    """
+    rng = random.Random(seed)
+    teams = ["Команда A", "Команда B", "Команда C", "Команда D", ""]
+    quarters = ["2025.Q1", "2025.Q2", "2025.Q3", "2025.Q4", ""]
+    text_values = {
+        "Автор": lambda i: f"author{i % 40}",
+        "Команда": lambda i: rng.choice(teams),
+        "PM Lead": lambda i: f"lead{i % 7}",
+        "Квартал": lambda i: rng.choice(quarters),
+        "Квартал TTD": lambda i: rng.choice(quarters),
+    }
+    start = date(2025, 1, 1)
+
+    records = []
+    for i in range(rows):
+        record: Dict[str, Any] = {}
+        for column, kind in TTMDetailsColumns.get_column_types().items():
+            if column == "Ключ задачи":
+                record[column] = f"CPO-{1000 + i}"
+            elif column == "Название":
+                record[column] = f"Задача {i}: доработка отчетов и интеграций"
+            elif column in text_values:
+                record[column] = text_values[column](i)
+            elif kind == "date":
+                day = start + timedelta(days=rng.randrange(365))
+                record[column] = day.isoformat() if rng.random() > 0.1 else ""
+            elif column in TTMDetailsColumns.FLAG_COLUMNS:
+                record[column] = rng.randint(0, 1)
+            else:
+                record[column] = rng.randrange(200) if rng.random() > 0.2 else ""
+        records.append(record)
+
+    pd.DataFrame(records, columns=TTMDetailsColumns.COLUMN_NAMES).to_csv(
+        path, index=False
+    )
+    return path
+
+
+def benchmark_upload(
+    csv_path: Path,
+    latency: float = 0.0,
+    bandwidth: Optional[float] = None,
+    quota_per_minute: Optional[int] = None,
+    pivots: bool = True,
+) -> Dict[str, Any]:
+    """
+    Upload one report to a fresh fake document and measure it.
+
+    Args:
+        csv_path: Path to TTM Details CSV report
+        latency: Simulated round trip time per call in seconds
+        bandwidth: Simulated transfer speed in bytes per second
+        quota_per_minute: Simulated per-minute request quota
+        pivots: Also create TTD and TTM pivot tables
+
+    Returns:
+        Dictionary with file, rows, ok flag, wall time and FakeSheetsHttp summary
+    """
+    http = FakeSheetsHttp(
+        document_id=BENCHMARK_DOCUMENT_ID,
+        latency=latency,
+        bandwidth=bandwidth,
+        quota_per_minute=quota_per_minute,
+    )
+    service = GoogleSheetsService("", BENCHMARK_DOCUMENT_ID, http=http)
+
+    started = time.perf_counter()
+    sheet_name = service.upload_csv_to_sheet(csv_path)
+    ok = sheet_name is not None
+    rows = 0
+    if ok and pivots:
+        df = service._read_csv_file(csv_path)
+        rows = len(df)
+        results = service.create_pivot_tables_from_dataframe(
+            df, BENCHMARK_DOCUMENT_ID, source_sheet_name=sheet_name
+        )
+        ok = all(sheet_id is not None for sheet_id in results.values())
+    elif ok:
+        rows = len(http.sheet_by_title(sheet_name).values) - 1
+    wall_time = time.perf_counter() - started
+
+    return {
+        "file": csv_path.name,
+        "rows": rows,
+        "ok": ok,
+        "wall_time": round(wall_time, 3),
+        **http.summary(),
+    }
+
+
+def format_results(results: List[Dict[str, Any]]) -> List[str]:
+    """
+    Format benchmark results as text table lines.
+
+    Args:
+        results: Results of benchmark_upload
+
+    Returns:
+        Table lines
+    """
+    headers = ["File", "Rows", "OK", "Calls"]
+    headers += OPERATIONS + ["Sub-req", "Sent KB", "Recv KB", "Wait s", "Wall s"]
+    table = [headers]
+    for result in results:
+        by_operation = result["by_operation"]
+        table.append(
+            [
+                result["file"],
+                result["rows"],
+                "yes" if result["ok"] else "NO",
+                result["calls"],
+                *(by_operation.get(operation, 0) for operation in OPERATIONS),
+                result["subrequests"],
+                f"{result['bytes_sent'] / 1024:.1f}",
+                f"{result['bytes_received'] / 1024:.1f}",
+                f"{result['simulated_wait']:.2f}",
+                f"{result['wall_time']:.2f}",
+            ]
+        )
+
+    widths = [max(len(str(row[i])) for row in table) for i in range(len(headers))]
+    lines = [" | ".join(str(c).ljust(w) for c, w in zip(row, widths)) for row in table]
+    lines.insert(1, "-+-".join("-" * w for w in widths))
+    return lines
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark Google Sheets upload of TTM Details reports offline"
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="TTM Details CSV reports (default: one synthetic report)",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=DEFAULT_SYNTHETIC_ROWS,
+        help=f"Rows of the synthetic report (default: {DEFAULT_SYNTHETIC_ROWS})",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Simulated round trip time per API call in seconds (default: 0)",
+    )
+    parser.add_argument(
+        "--bandwidth",
+        type=float,
+        help="Simulated transfer speed in KB per second (default: unlimited)",
+    )
+    parser.add_argument(
+        "--quota",
+        type=int,
+        help="Simulated API requests per minute (real quota: 60 per user)",
+    )
+    parser.add_argument(
+        "--no-pivots",
+        action="store_true",
+        help="Upload details sheet only, without TTD / TTM pivot tables",
+    )
+    parser.add_argument(
+        "--output",
+        help="Write results to CSV",
+    )
+    args = parser.parse_args(argv)
+
+    for path in args.files:
+        if not Path(path).exists():
+            print(f"Error: File not found: {path}")
+            sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = [Path(path) for path in args.files]
+        if not paths:
+            paths = [
+                write_synthetic_report(
+                    Path(tmp_dir) / f"synthetic_ttm_details_{args.rows}.csv", args.rows
+                )
+            ]
+
+        print(f"📊 Benchmarking Google Sheets upload of {len(paths)} report(s)")
+        results = [
+            benchmark_upload(
+                path,
+                latency=args.latency,
+                bandwidth=args.bandwidth * 1024 if args.bandwidth else None,
+                quota_per_minute=args.quota,
+                pivots=not args.no_pivots,
+            )
+            for path in paths
+        ]
+
+    print()
+    for line in format_results(results):
+        print(line)
+
+    if args.output:
+        pd.json_normalize(results).to_csv(args.output, index=False)
+        print()
+        print(f"   Results saved to {args.output}")
+
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,288 +2,323 @@
 """
 Compare TTM Details reports month-to-month by team.
 
-This script compares two TTM Details CSV reports and shows:
-- WiP count (tasks in progress)
-- Median DevLT
+This script compares N monthly TTM Details snapshots and shows, per team,
+for every metric column of TTMDetailsColumns:
+- count of WiP tasks with the metric
+- median, mean and p85
+- deltas of these values against the previous snapshot
 
 Filtering rules:
 - Only tasks with Разработка = 1
 - Only tasks with empty Квартал (considered as WiP)
-- Only tasks with non-empty DevLT
+- Statistics of a metric skip tasks with an empty value of that metric
+
+All snapshots are stacked into one long frame (snapshot, team, metric, value)
+and aggregated with a single groupby, so a year of snapshots is one pass.
 """
 
-import csv
+import argparse
 import sys
 from pathlib import Path
-from statistics import mean, median, quantiles
-from typing import Dict, List, Optional
+from typing import List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from radiator.commands.models.ttm_details_columns import TTMDetailsColumns
+from radiator.commands.services.report_output import read_report_table
 
+NO_TEAM = "Без команды"
+GROUP_KEYS = ["snapshot", "team", "metric"]
+STATS = ["count", "median", "mean", "p85"]
+PERCENTILE = 0.85
 
-def load_csv_data(filepath: str) -> List[Dict[str, str]]:
+
+def load_snapshot(filepath: str) -> pd.DataFrame:
     """
-    Load CSV file and return list of dictionaries.
+    Load report snapshot, reading its Parquet / Arrow copy when present.
+
+    Metric and flag columns are converted to numbers, values that are not
+    numbers become NaN.
 
     Args:
         filepath: Path to CSV file
 
     Returns:
-        List of row dictionaries
+        DataFrame with report rows
     """
-    rows = []
-    with open(filepath, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(row)
-    return rows
+    df = read_report_table(filepath)
+    numeric = TTMDetailsColumns.get_metric_columns() + TTMDetailsColumns.FLAG_COLUMNS
+    for column in numeric:
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+    return df
 
 
-def filter_wip_tasks(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
+def filter_wip_tasks(df: pd.DataFrame) -> pd.DataFrame:
     """
     Filter tasks according to rules:
     - Разработка = 1
     - Квартал is empty (WiP)
-    - DevLT is not empty
+
+    Empty team is replaced with NO_TEAM.
 
     Args:
-        rows: List of row dictionaries
+        df: Report rows from load_snapshot
 
     Returns:
-        Filtered list of tasks
+        Filtered rows
     """
-    filtered = []
-    for row in rows:
-        # Check Разработка = 1
-        if row.get("Разработка", "").strip() != "1":
-            continue
+    quarter = df["Квартал"].fillna("").astype(str).str.strip()
+    wip = df.loc[(df["Разработка"] == 1) & (quarter == "")]
+    team = wip["Команда"].fillna("").astype(str).str.strip()
+    return wip.assign(Команда=team.where(team != "", NO_TEAM))
 
-        # Check Квартал is empty (WiP)
-        quarter = row.get("Квартал", "").strip()
-        if quarter:  # Not empty = not WiP
-            continue
 
-        # Check DevLT is not empty
-        devlt = row.get("DevLT", "").strip()
-        if not devlt:
-            continue
+def stack_snapshots(snapshots: Mapping[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Stack WiP rows of all snapshots into long format.
 
-        # Try to parse DevLT as number
-        try:
-            float(devlt)
-            filtered.append(row)
-        except ValueError:
-            # Skip if DevLT is not a valid number
-            continue
+    Args:
+        snapshots: WiP rows (filter_wip_tasks) by snapshot label
 
-    return filtered
+    Returns:
+        DataFrame with columns snapshot, team, metric, value without empty values
+    """
+    metrics = TTMDetailsColumns.get_metric_columns()
+    frames = [
+        df.melt(
+            id_vars="Команда",
+            value_vars=[metric for metric in metrics if metric in df.columns],
+            var_name="metric",
+            value_name="value",
+        ).assign(snapshot=label)
+        for label, df in snapshots.items()
+    ]
+    long = pd.concat(frames, ignore_index=True).rename(columns={"Команда": "team"})
+    long["value"] = long["value"].astype(float)
+    return long.dropna(subset=["value"])[GROUP_KEYS + ["value"]]
 
 
-def aggregate_by_team(rows: List[Dict[str, str]]) -> Dict[str, Dict[str, any]]:
+def _group_p85(long: pd.DataFrame) -> pd.Series:
     """
-    Aggregate tasks by team.
+    85th percentile of value per (snapshot, team, metric) group.
+
+    Uses the (n + 1) * p rank of statistics.quantiles (exclusive method),
+    clamped to the group, so groups of up to 5 values get a value within
+    min..max instead of an extrapolated one.
 
     Args:
-        rows: Filtered list of tasks
+        long: Long frame from stack_snapshots
 
     Returns:
-        Dictionary with team name as key and aggregated data as value:
-        {
-            "team_name": {
-                "wip_count": int,
-                "median_devlt": float,
-                "mean_devlt": float,
-                "p85_devlt": float
-            }
-        }
+        Series indexed by GROUP_KEYS
     """
-    teams = {}
+    if long.empty:
+        return pd.Series(dtype=float)
+
+    ordered = long.sort_values(GROUP_KEYS + ["value"])
+    sizes = ordered.groupby(GROUP_KEYS, sort=False).size()
+    n = sizes.to_numpy()
+    # Группы идут подряд в отсортированном фрейме: позиция первой строки группы
+    starts = np.concatenate(([0], np.cumsum(n)[:-1]))
+    rank = np.clip(PERCENTILE * (n + 1), 1, n)
+    lower = np.floor(rank).astype(int)
+    upper = np.minimum(lower + 1, n)
+
+    values = ordered["value"].to_numpy()
+    low_values = values[starts + lower - 1]
+    high_values = values[starts + upper - 1]
+    return pd.Series(
+        low_values + (rank - lower) * (high_values - low_values), index=sizes.index
+    )
 
-    for row in rows:
-        team = row.get("Команда", "").strip()
-        if not team:
-            team = "Без команды"
-
-        devlt = float(row.get("DevLT", "0"))
-
-        if team not in teams:
-            teams[team] = {"devlt_values": []}
-
-        teams[team]["devlt_values"].append(devlt)
-
-    # Calculate statistics for each team
-    result = {}
-    for team, data in teams.items():
-        devlt_values = data["devlt_values"]
-
-        if devlt_values:
-            # Calculate 85th percentile using quantiles
-            # quantiles(data, n=100) gives 99 cut points (percentiles 1-99)
-            # For 85th percentile, we need the 85th element (index 84)
-            if len(devlt_values) == 1:
-                p85 = devlt_values[0]
-            else:
-                try:
-                    percentiles = quantiles(devlt_values, n=100)
-                    p85 = percentiles[84]  # 85th percentile (0-indexed)
-                except:
-                    # Fallback for edge cases
-                    sorted_values = sorted(devlt_values)
-                    idx = int(0.85 * len(sorted_values))
-                    p85 = sorted_values[min(idx, len(sorted_values) - 1)]
-
-            result[team] = {
-                "wip_count": len(devlt_values),
-                "median_devlt": round(median(devlt_values), 1),
-                "mean_devlt": round(mean(devlt_values), 1),
-                "p85_devlt": round(p85, 1),
-            }
-        else:
-            result[team] = {
-                "wip_count": 0,
-                "median_devlt": 0.0,
-                "mean_devlt": 0.0,
-                "p85_devlt": 0.0,
-            }
-
-    return result
-
-
-def compare_months(
-    prev_month_data: Dict[str, Dict[str, any]],
-    current_month_data: Dict[str, Dict[str, any]],
-) -> List[List[any]]:
+
+def aggregate_snapshots(long: pd.DataFrame) -> pd.DataFrame:
     """
-    Compare data from two months and prepare table rows.
+    Aggregate long frame by snapshot, team and metric.
 
     Args:
-        prev_month_data: Aggregated data from previous month
-        current_month_data: Aggregated data from current month
+        long: Long frame from stack_snapshots
 
     Returns:
-        List of table rows for tabulate
+        DataFrame indexed by GROUP_KEYS with STATS columns
     """
-    # Get all unique teams
-    all_teams = set(prev_month_data.keys()) | set(current_month_data.keys())
+    stats = long.groupby(GROUP_KEYS)["value"].agg(["count", "median", "mean"])
+    stats["p85"] = _group_p85(long)
+    return stats
 
-    default_data = {
-        "wip_count": 0,
-        "median_devlt": 0.0,
-        "mean_devlt": 0.0,
-        "p85_devlt": 0.0,
-    }
 
-    rows = []
-    for team in sorted(all_teams):
-        prev = prev_month_data.get(team, default_data)
-        curr = current_month_data.get(team, default_data)
-
-        rows.append(
-            [
-                team,
-                prev["wip_count"],
-                curr["wip_count"],
-                prev["median_devlt"],
-                curr["median_devlt"],
-                prev["mean_devlt"],
-                curr["mean_devlt"],
-                prev["p85_devlt"],
-                curr["p85_devlt"],
-            ]
-        )
+def compare_snapshots(snapshots: Mapping[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Compare N snapshots: statistics and deltas against the previous snapshot.
+
+    Every team and metric present in any snapshot gets a row for every
+    snapshot; missing groups have count 0 and empty statistics. Deltas of
+    the first snapshot are empty.
+
+    Args:
+        snapshots: WiP rows (filter_wip_tasks) by snapshot label, oldest first
+
+    Returns:
+        DataFrame with columns snapshot, team, metric, STATS and delta_<stat>,
+        values rounded to 1 decimal
+    """
+    long = stack_snapshots(snapshots)
+    stats = aggregate_snapshots(long)
+
+    present = set(long["metric"].unique())
+    metrics = [m for m in TTMDetailsColumns.get_metric_columns() if m in present]
+    full_index = pd.MultiIndex.from_product(
+        [list(snapshots), sorted(long["team"].unique()), metrics], names=GROUP_KEYS
+    )
+    stats = stats.reindex(full_index)
+    stats["count"] = stats["count"].fillna(0).astype(int)
+
+    # Индекс упорядочен по снимкам, diff внутри группы — дельта к предыдущему
+    deltas = (
+        stats.groupby(level=["team", "metric"], sort=False)[STATS]
+        .diff()
+        .add_prefix("delta_")
+    )
+    return pd.concat([stats, deltas], axis=1).round(1).reset_index()
+
+
+def format_comparison_table(
+    comparison: pd.DataFrame, prev: str, curr: str, metric: str = "DevLT"
+) -> List[List]:
+    """
+    Prepare table rows comparing one metric of two snapshots.
+
+    Args:
+        comparison: Result of compare_snapshots
+        prev: Label of previous snapshot
+        curr: Label of current snapshot
+        metric: Metric column
+
+    Returns:
+        List of rows [team, count, median, mean, p85 for prev and curr]
+    """
+    selected = comparison[comparison["metric"] == metric]
+    if selected.empty:
+        return []
+
+    table = selected.pivot(index="team", columns="snapshot", values=STATS).fillna(0)
+    table = table[(table["count"][prev] > 0) | (table["count"][curr] > 0)]
 
+    rows = []
+    for team, values in table.iterrows():
+        row = [team]
+        for stat in STATS:
+            for label in (prev, curr):
+                value = values[(stat, label)]
+                row.append(int(value) if stat == "count" else float(value))
+        rows.append(row)
     return rows
 
 
-def main():
+def snapshot_labels(paths: Sequence[str]) -> List[str]:
+    """
+    Snapshot labels: file names without suffix, full paths if names collide.
+
+    Args:
+        paths: Report paths
+
+    Returns:
+        Labels in the same order
+    """
+    stems = [Path(path).stem for path in paths]
+    if len(set(stems)) == len(stems):
+        return stems
+    return list(paths)
+
+
+def print_table(headers: List[str], rows: List[List]) -> None:
+    """Print rows as a plain text table."""
+    col_widths = [len(h) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            col_widths[i] = max(col_widths[i], len(str(cell)))
+
+    print(" | ".join(headers[i].ljust(col_widths[i]) for i in range(len(headers))))
+    print("-+-".join("-" * w for w in col_widths))
+    for row in rows:
+        print(" | ".join(str(row[i]).ljust(col_widths[i]) for i in range(len(row))))
+
+
+def main(argv: Optional[Sequence[str]] = None):
     """Main function."""
-    if len(sys.argv) != 3:
-        print(
-            "Usage: python compare_ttm_month_to_month.py <prev_month_csv> <current_month_csv>"
-        )
-        print()
-        print("Example:")
-        print("  python compare_ttm_month_to_month.py \\")
-        print("    data/reports/new_ttm_details_20260206_123124_aod_20260118.csv \\")
-        print("    data/reports/new_ttm_details_20260206_123133.csv")
-        sys.exit(1)
-
-    prev_month_file = sys.argv[1]
-    current_month_file = sys.argv[2]
-
-    # Check files exist
-    if not Path(prev_month_file).exists():
-        print(f"Error: File not found: {prev_month_file}")
-        sys.exit(1)
-
-    if not Path(current_month_file).exists():
-        print(f"Error: File not found: {current_month_file}")
-        sys.exit(1)
-
-    print(f"📊 Comparing TTM Details reports month-to-month")
-    print(f"   Previous month: {prev_month_file}")
-    print(f"   Current month:  {current_month_file}")
-    print()
+    parser = argparse.ArgumentParser(
+        description="Compare TTM Details snapshots month-to-month by team",
+        epilog=(
+            "Example: python -m radiator.commands.compare_ttm_month_to_month "
+            "data/reports/new_ttm_details_20260206_123124_aod_20260118.csv "
+            "data/reports/new_ttm_details_20260206_123133.csv"
+        ),
+    )
+    parser.add_argument(
+        "snapshots",
+        nargs="+",
+        help="TTM Details CSV reports, oldest first (at least two)",
+    )
+    parser.add_argument(
+        "--metric",
+        default="DevLT",
+        choices=TTMDetailsColumns.get_metric_columns(),
+        help="Metric shown in the console table (default: DevLT)",
+    )
+    parser.add_argument(
+        "--output",
+        help="Write statistics and deltas of all metrics and snapshots to CSV",
+    )
+    args = parser.parse_args(argv)
 
-    # Load data
-    print("📥 Loading data...")
-    prev_month_rows = load_csv_data(prev_month_file)
-    current_month_rows = load_csv_data(current_month_file)
-    print(f"   Previous month: {len(prev_month_rows)} tasks")
-    print(f"   Current month:  {len(current_month_rows)} tasks")
+    if len(args.snapshots) < 2:
+        parser.error("at least two snapshots are required")
+    for path in args.snapshots:
+        if not Path(path).exists():
+            print(f"Error: File not found: {path}")
+            sys.exit(1)
+
+    labels = snapshot_labels(args.snapshots)
+    print(f"📊 Comparing {len(labels)} TTM Details snapshots month-to-month")
     print()
 
-    # Filter WiP tasks
-    print("🔍 Filtering WiP tasks (Разработка=1, Квартал empty, DevLT not empty)...")
-    prev_month_filtered = filter_wip_tasks(prev_month_rows)
-    current_month_filtered = filter_wip_tasks(current_month_rows)
-    print(f"   Previous month: {len(prev_month_filtered)} WiP tasks")
-    print(f"   Current month:  {len(current_month_filtered)} WiP tasks")
+    print("📥 Loading data, 🔍 filtering WiP tasks (Разработка=1, Квартал empty)...")
+    snapshots = {}
+    for label, path in zip(labels, args.snapshots):
+        df = load_snapshot(path)
+        snapshots[label] = filter_wip_tasks(df)
+        print(f"   {label}: {len(df)} tasks, {len(snapshots[label])} WiP tasks")
     print()
 
-    # Aggregate by team
     print("📊 Aggregating by team...")
-    prev_month_agg = aggregate_by_team(prev_month_filtered)
-    current_month_agg = aggregate_by_team(current_month_filtered)
-    print(f"   Previous month: {len(prev_month_agg)} teams")
-    print(f"   Current month:  {len(current_month_agg)} teams")
+    comparison = compare_snapshots(snapshots)
+    if args.output:
+        comparison.to_csv(args.output, index=False)
+        print(f"   Full comparison saved to {args.output}")
     print()
 
-    # Compare and display results
-    print("📈 Month-to-Month Comparison by Team:")
+    prev, curr = labels[-2], labels[-1]
+    print(f"📈 Month-to-Month Comparison by Team ({args.metric}):")
+    print(f"   Previous month: {prev}")
+    print(f"   Current month:  {curr}")
     print()
 
-    comparison_rows = compare_months(prev_month_agg, current_month_agg)
-
+    comparison_rows = format_comparison_table(comparison, prev, curr, args.metric)
+    short = "DLT" if args.metric == "DevLT" else args.metric
     headers = [
         "Команда",
         "WiP (пред.)",
         "WiP (тек.)",
-        "Med. DLT (пред.)",
-        "Med. DLT (тек.)",
-        "Ср. DLT (пред.)",
-        "Ср. DLT (тек.)",
-        "P85 DLT (пред.)",
-        "P85 DLT (тек.)",
+        f"Med. {short} (пред.)",
+        f"Med. {short} (тек.)",
+        f"Ср. {short} (пред.)",
+        f"Ср. {short} (тек.)",
+        f"P85 {short} (пред.)",
+        f"P85 {short} (тек.)",
     ]
-
-    # Calculate column widths
-    col_widths = [len(h) for h in headers]
-    for row in comparison_rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
-
-    # Print header
-    header_line = " | ".join(
-        headers[i].ljust(col_widths[i]) for i in range(len(headers))
-    )
-    separator = "-+-".join("-" * w for w in col_widths)
-    print(header_line)
-    print(separator)
-
-    # Print rows
-    for row in comparison_rows:
-        row_line = " | ".join(str(row[i]).ljust(col_widths[i]) for i in range(len(row)))
-        print(row_line)
-
+    print_table(headers, comparison_rows)
     print()
 
     # Summary statistics
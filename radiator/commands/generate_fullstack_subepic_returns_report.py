@@ -1,15 +1,16 @@
 """Отчёт по возвратам для подэпиков FULLSTACK."""
 
-import csv
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select, true
 
 from radiator.commands.models.time_to_market_models import StatusHistoryEntry
 from radiator.commands.services.data_service import DataService
+from radiator.commands.services.report_output import REPORT_FORMATS, ReportTableWriter
 from radiator.commands.services.testing_returns_service import TestingReturnsService
-from radiator.models.tracker import TrackerTask
+from radiator.models.tracker import TrackerTask, TrackerTaskLink
 
 DEFAULT_START_DATE = datetime(2025, 1, 1)
 PRODTEAM_FIELD_KEY = "63515d47fe387b7ce7b9fc55--prodteam"
@@ -50,6 +51,12 @@ class FullstackSubepicReturnsReportGenerator:
         "Возвраты Done",
     ]
 
+    # Типы колонок для Parquet / Arrow: счетчики возвратов целые, остальное текст
+    COLUMN_TYPES: Dict[str, str] = {
+        name: "int" if name.startswith("Возвраты ") else "string"
+        for name in COLUMN_NAMES
+    }
+
     RETURN_STATUSES: List[str] = [
         "InProgress",
         "Ревью",
@@ -67,10 +74,23 @@ class FullstackSubepicReturnsReportGenerator:
         self.returns_service = TestingReturnsService(db)
 
     def _fetch_candidate_tasks(self):
-        """Загрузить кандидатов из БД (FULLSTACK, от стартовой даты)."""
+        """Загрузить кандидатов из БД (FULLSTACK, от стартовой даты) с эпиком."""
         if not self.db:
             return []
 
+        # Эпик берём из tracker_task_links (поиск по индексу src_key, type_id)
+        epic_link = (
+            select(TrackerTaskLink.dst_key, TrackerTaskLink.dst_display)
+            .where(
+                TrackerTaskLink.src_key == TrackerTask.key,
+                TrackerTaskLink.type_id == "epic",
+                TrackerTaskLink.direction == "outward",
+            )
+            .order_by(TrackerTaskLink.dst_key)
+            .limit(1)
+            .lateral("epic_link")
+        )
+
         return (
             self.db.query(
                 TrackerTask.key,
@@ -78,9 +98,11 @@ class FullstackSubepicReturnsReportGenerator:
                 TrackerTask.author,
                 TrackerTask.prodteam,
                 TrackerTask.full_data,
-                TrackerTask.links,
                 TrackerTask.created_at,
+                epic_link.c.dst_key.label("epic_key"),
+                epic_link.c.dst_display.label("epic_summary"),
             )
+            .outerjoin(epic_link, true())
             .filter(
                 TrackerTask.key.like("FULLSTACK-%"),
                 TrackerTask.created_at >= self.start_date,
@@ -108,12 +130,12 @@ class FullstackSubepicReturnsReportGenerator:
 
     def _parse_task(self, task) -> Optional[SubepicInfo]:
         """Преобразовать задачу в SubepicInfo."""
-        links = getattr(task, "links", None)
+        epic_key = getattr(task, "epic_key", None) or ""
+        epic_summary = getattr(task, "epic_summary", None) or ""
 
-        epic_key = ""
-        epic_summary = ""
-
-        if links:
+        # Задачи не из БД (без рёбер связей) - разбираем links
+        links = getattr(task, "links", None)
+        if not epic_key and links:
             for link in links:
                 res = self._extract_epic_from_link(link)
                 if res:
@@ -546,17 +568,13 @@ class FullstackSubepicReturnsReportGenerator:
 
         return rows
 
-    def generate_csv(self, output_path: str) -> str:
-        """Сформировать CSV."""
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
+    def generate_csv(self, output_path: str, output_format: str = "csv") -> str:
+        """Сформировать CSV (и Parquet / Arrow копию при output_format != "csv")."""
         rows = self._collect_rows()
 
-        with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=self.COLUMN_NAMES)
-            writer.writeheader()
-            if rows:
-                writer.writerows(rows)
+        with ReportTableWriter(output_path, self.COLUMN_TYPES, output_format) as writer:
+            for row in rows:
+                writer.write_row(row)
 
         return output_path
 
@@ -577,6 +595,12 @@ def main():
         default="data/reports/fullstack_subepic_returns.csv",
         help="Путь к выходному CSV (по умолчанию data/reports/fullstack_subepic_returns.csv)",
     )
+    parser.add_argument(
+        "--format",
+        choices=REPORT_FORMATS,
+        default="csv",
+        help="Дополнительно записать типизированную Parquet или Arrow IPC копию рядом с CSV",
+    )
     args = parser.parse_args()
 
     start_date = datetime.fromisoformat(args.start_date)
@@ -585,7 +609,7 @@ def main():
 
     with SessionLocal() as db:
         generator = FullstackSubepicReturnsReportGenerator(db=db, start_date=start_date)
-        csv_path = generator.generate_csv(args.output)
+        csv_path = generator.generate_csv(args.output, output_format=args.format)
         print(f"Report generated: {csv_path}")
 
 
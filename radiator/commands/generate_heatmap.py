@@ -12,6 +12,10 @@ What it does (per each input CSV):
 - Hatch "///" when value <= threshold
 - Saves PNGs
 
+All aggregations of a metric are computed in one groupby().agg() pass; PNGs
+of all input files are rendered in a process pool (--workers) with the
+non-interactive Agg backend.
+
 Metrics supported:
 1) DevLT: uses rows with DevLT not null
 2) Tail: uses rows with Tail > 0
@@ -30,16 +34,22 @@ import glob
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
+import matplotlib
 import matplotlib.patheffects as pe
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from matplotlib import colors
+from matplotlib.collections import PatchCollection
 from matplotlib.patches import Rectangle
 
+from radiator.commands.services.report_output import read_report_table
 from radiator.core.logging import logger
 
 # =========================
@@ -95,57 +105,129 @@ def find_discovery_backlog_column(cols: List[str]) -> Optional[str]:
     return None
 
 
-def agg_func(agg: str) -> Callable[[pd.Series], float]:
-    if agg == "median":
-        return np.median
-    if agg == "mean":
-        return np.mean
-    if agg == "p85":
-        return lambda x: float(np.percentile(x, 85))
-    raise ValueError(f"Unknown agg: {agg}")
+def p85(x: pd.Series) -> float:
+    """85th percentile (named so that groupby().agg() labels the column p85)."""
+    return float(np.percentile(x, 85))
+
+
+# groupby().agg() functions by aggregation name
+AGG_FUNCS: Dict[str, Union[str, Callable[[pd.Series], float]]] = {
+    "median": "median",
+    "mean": "mean",
+    "p85": p85,
+}
+
+
+@dataclass
+class HeatmapJob:
+    """Aggregated matrix of one heatmap, picklable for worker processes."""
+
+    metric_col: str
+    agg: str
+    threshold: float
+    out_path: str
+    title: str
+    teams: List[str]
+    quarters: List[str]
+    values: np.ndarray
+    counts: np.ndarray
+
+
+def aggregate_metric(
+    df: pd.DataFrame, metric_col: str, filter_mask: pd.Series, aggs: List[str]
+) -> Optional[pd.DataFrame]:
+    """
+    Aggregate metric by Команда x Квартал for all aggregations in one pass.
+
+    Args:
+        df: Prepared report rows
+        metric_col: Metric column
+        filter_mask: Rows used for the metric
+        aggs: Aggregation names (keys of AGG_FUNCS)
+
+    Returns:
+        DataFrame indexed by (Команда, Квартал) with "count" and aggs columns,
+        None if no rows left after filters
+    """
+    values = pd.to_numeric(df.loc[filter_mask, metric_col], errors="coerce")
+    d = df.loc[filter_mask, ["Команда", "Квартал"]].assign(value=values).dropna()
+    if d.empty:
+        return None
+
+    funcs = ["count"] + [AGG_FUNCS[agg] for agg in aggs]
+    return d.groupby(["Команда", "Квартал"])["value"].agg(funcs)
 
 
-def build_heatmap(
+def build_jobs(
     df: pd.DataFrame,
     metric_col: str,
-    agg: str,
+    aggs: List[str],
     threshold: float,
-    out_path: str,
+    out_base: str,
     filter_mask: pd.Series,
-    title: str,
-) -> None:
-    d = df.loc[filter_mask].copy()
-    d[metric_col] = pd.to_numeric(d[metric_col], errors="coerce")
-    d = d[~d[metric_col].isna()].copy()
+) -> List[HeatmapJob]:
+    """
+    Build heatmap jobs of one metric for all aggregations.
+
+    Args:
+        df: Prepared report rows
+        metric_col: Metric column
+        aggs: Aggregation names
+        threshold: Hatch / color threshold
+        out_base: Output directory of the report
+        filter_mask: Rows used for the metric
+
+    Returns:
+        One job per aggregation (empty if no rows after filters)
+    """
+    stats = aggregate_metric(df, metric_col, filter_mask, aggs)
+    if stats is None:
+        log(f"SKIP {metric_col}: no rows after filters")
+        return []
+
+    table = stats.unstack("Квартал").sort_index()
+    quarters = sorted(stats.index.unique("Квартал"), key=quarter_sort_key)
+    counts = table["count"].reindex(columns=quarters).to_numpy(dtype=float)
+    teams = table.index.tolist()
+
+    jobs = []
+    for agg in aggs:
+        jobs.append(
+            HeatmapJob(
+                metric_col=metric_col,
+                agg=agg,
+                threshold=threshold,
+                out_path=os.path.join(
+                    out_base, f"{metric_col.lower()}_{agg}_heatmap.png"
+                ),
+                title=f"{metric_col} heatmap ({agg}) | оранжевый от {threshold} | штриховка: {agg} ≤ {threshold} | WiP = незавершённые задачи",
+                teams=teams,
+                quarters=quarters,
+                values=table[agg].reindex(columns=quarters).to_numpy(dtype=float),
+                counts=counts,
+            )
+        )
+    return jobs
 
-    if d.empty:
-        log(f"SKIP {title}: no rows after filters")
-        return
-
-    pv = d.pivot_table(
-        index="Команда",
-        columns="Квартал",
-        values=metric_col,
-        aggfunc=agg_func(agg),
-    )
-    cnt = d.pivot_table(
-        index="Команда",
-        columns="Квартал",
-        values=metric_col,
-        aggfunc="count",
-    )
 
-    cols = sorted(pv.columns.tolist(), key=quarter_sort_key)
-    pv = pv.reindex(columns=cols).sort_index()
-    cnt = cnt.reindex(index=pv.index, columns=cols)
+def render_heatmap(job: HeatmapJob) -> Optional[str]:
+    """
+    Render heatmap PNG (runs in worker processes, Agg backend).
+
+    Args:
+        job: Aggregated heatmap data
 
-    vals = pv.to_numpy(dtype=float)
+    Returns:
+        Saved file path, None if skipped
+    """
+    vals = job.values
+    threshold = job.threshold
 
     # "orange from threshold": hinge at vcenter=threshold
     vmax = np.nanmax(vals)
     if not np.isfinite(vmax):
-        log(f"SKIP {title}: vmax is not finite")
-        return
+        log(f"SKIP {job.title}: vmax is not finite")
+        return None
     if vmax <= threshold:
         vmax = threshold * 1.01
 
@@ -154,63 +236,61 @@ def build_heatmap(
     fig, ax = plt.subplots(figsize=FIGSIZE)
     im = ax.imshow(vals, cmap=CMAP, norm=norm, aspect="auto")
 
-    ax.set_xticks(np.arange(len(cols)))
-    ax.set_yticks(np.arange(len(pv.index)))
-    ax.set_xticklabels(cols, rotation=45, ha="right")
-    ax.set_yticklabels(pv.index)
+    ax.set_xticks(np.arange(len(job.quarters)))
+    ax.set_yticks(np.arange(len(job.teams)))
+    ax.set_xticklabels(job.quarters, rotation=45, ha="right")
+    ax.set_yticklabels(job.teams)
 
     # light grid
-    ax.set_xticks(np.arange(-0.5, len(cols), 1), minor=True)
-    ax.set_yticks(np.arange(-0.5, len(pv.index), 1), minor=True)
+    ax.set_xticks(np.arange(-0.5, len(job.quarters), 1), minor=True)
+    ax.set_yticks(np.arange(-0.5, len(job.teams), 1), minor=True)
     ax.grid(which="minor", color="white", linewidth=1)
     ax.tick_params(which="minor", bottom=False, left=False)
 
-    # labels + hatch
-    for i in range(vals.shape[0]):
-        for j in range(vals.shape[1]):
-            v = vals[i, j]
-            n = cnt.iloc[i, j]
-            if np.isfinite(v) and np.isfinite(n) and n > 0:
-                t = ax.text(
-                    j,
-                    i,
-                    f"{int(n)} / {int(round(v))}",
-                    ha="center",
-                    va="center",
-                    color=TEXT_COLOR,
-                    fontsize=TEXT_SIZE,
-                )
-                t.set_path_effects(
-                    [
-                        pe.Stroke(linewidth=TEXT_STROKE_WIDTH, foreground="black"),
-                        pe.Normal(),
-                    ]
-                )
-                if v <= threshold:
-                    ax.add_patch(
-                        Rectangle(
-                            (j - 0.5, i - 0.5),
-                            1,
-                            1,
-                            fill=False,
-                            hatch="///",
-                            linewidth=0,
-                        )
-                    )
-
-    ax.set_title(title)
-    fig.colorbar(im, ax=ax, label=f"{agg}({metric_col})")
-
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    fig.savefig(out_path, dpi=200, bbox_inches="tight")
+    # labels only for cells with data, hatch as one collection
+    filled = np.isfinite(vals) & np.isfinite(job.counts) & (job.counts > 0)
+    stroke = [
+        pe.Stroke(linewidth=TEXT_STROKE_WIDTH, foreground="black"),
+        pe.Normal(),
+    ]
+    for i, j in np.argwhere(filled):
+        ax.text(
+            j,
+            i,
+            f"{int(job.counts[i, j])} / {int(round(vals[i, j]))}",
+            ha="center",
+            va="center",
+            color=TEXT_COLOR,
+            fontsize=TEXT_SIZE,
+            path_effects=stroke,
+        )
+    hatched = np.argwhere(filled & (vals <= threshold))
+    if len(hatched):
+        ax.add_collection(
+            PatchCollection(
+                [Rectangle((j - 0.5, i - 0.5), 1, 1) for i, j in hatched],
+                facecolor="none",
+                edgecolor="black",
+                hatch="///",
+                linewidth=0,
+            )
+        )
+
+    ax.set_title(job.title)
+    fig.colorbar(im, ax=ax, label=f"{job.agg}({job.metric_col})")
+
+    os.makedirs(os.path.dirname(job.out_path), exist_ok=True)
+    fig.savefig(job.out_path, dpi=200, bbox_inches="tight")
     plt.close(fig)
 
-    log(f"saved: {out_path}")
+    log(f"saved: {job.out_path}")
+    return job.out_path
 
 
 def load_and_prepare(csv_path: str) -> pd.DataFrame:
     log(f"loading: {csv_path}")
-    df = pd.read_csv(csv_path)
+    # Parquet / Arrow copy next to the CSV is read without text parsing
+    df = read_report_table(csv_path)
 
     required = ["Разработка", "Квартал", "Команда"]
     for c in required:
@@ -227,10 +307,10 @@ def load_and_prepare(csv_path: str) -> pd.DataFrame:
     return df
 
 
-def generate_for_file(
+def jobs_for_file(
     csv_path: str, output_dir: str, aggs: List[str], thresholds: Dict[str, float]
-) -> None:
-    """Generate heatmaps for a single CSV file."""
+) -> List[HeatmapJob]:
+    """Load CSV file and aggregate all its heatmaps."""
     df = load_and_prepare(csv_path)
 
     stem = os.path.splitext(os.path.basename(csv_path))[0]
@@ -248,56 +328,93 @@ def generate_for_file(
         df["TTM_adj"] = (df["TTM"] - disc).clip(lower=0)
 
     # Masks per metric
-    devlt_mask = (
-        df["DevLT"].apply(lambda x: pd.notna(pd.to_numeric(x, errors="coerce")))
-        if "DevLT" in df.columns
-        else None
-    )
-    tail_mask = (
-        (pd.to_numeric(df["Tail"], errors="coerce") > 0)
-        if "Tail" in df.columns
-        else None
+    masks: Dict[str, pd.Series] = {}
+    if "DevLT" in df.columns:
+        masks["DevLT"] = pd.to_numeric(df["DevLT"], errors="coerce").notna()
+    if "Tail" in df.columns:
+        masks["Tail"] = pd.to_numeric(df["Tail"], errors="coerce") > 0
+    if "TTM_adj" in df.columns:
+        masks["TTM_adj"] = df["TTM_adj"].notna()
+
+    jobs = []
+    for metric_col, mask in masks.items():
+        jobs.extend(
+            build_jobs(df, metric_col, aggs, thresholds[metric_col], out_base, mask)
+        )
+    return jobs
+
+
+def generate_for_files(
+    csv_paths: List[str],
+    output_dir: str,
+    aggs: List[str],
+    thresholds: Dict[str, float],
+    workers: int = 1,
+) -> List[str]:
+    """
+    Generate heatmaps for CSV files, rendering in a process pool.
+
+    Charts of all files share one pool, so several files render concurrently.
+
+    Args:
+        csv_paths: Input CSV files
+        output_dir: Output directory
+        aggs: Aggregation names
+        thresholds: Threshold by metric
+        workers: Number of rendering processes (1 - no pool)
+
+    Returns:
+        Saved file paths
+    """
+    jobs: List[HeatmapJob] = []
+    for csv_path in csv_paths:
+        try:
+            log(f"Processing: {csv_path}")
+            jobs.extend(jobs_for_file(csv_path, output_dir, aggs, thresholds))
+        except Exception as e:
+            logger.error(f"Failed to process {csv_path}: {e}", exc_info=True)
+
+    executor = (
+        ProcessPoolExecutor(
+            max_workers=min(workers, len(jobs)), initializer=_use_agg_backend
+        )
+        if workers > 1 and len(jobs) > 1
+        else nullcontext()
     )
-    ttm_adj_mask = df["TTM_adj"].notna() if "TTM_adj" in df.columns else None
+    with executor as pool:
+        # map() keeps job order, so log output stays deterministic
+        results = list((pool.map if pool else map)(_render_safely, jobs))
+    return [path for path in results if path is not None]
 
-    # Generate
-    for agg in aggs:
-        if devlt_mask is not None:
-            build_heatmap(
-                df=df,
-                metric_col="DevLT",
-                agg=agg,
-                threshold=thresholds["DevLT"],
-                out_path=os.path.join(out_base, f"devlt_{agg}_heatmap.png"),
-                filter_mask=devlt_mask,
-                title=f"DevLT heatmap ({agg}) | оранжевый от {thresholds['DevLT']} | штриховка: {agg} ≤ {thresholds['DevLT']} | WiP = незавершённые задачи",
-            )
 
-        if tail_mask is not None:
-            build_heatmap(
-                df=df,
-                metric_col="Tail",
-                agg=agg,
-                threshold=thresholds["Tail"],
-                out_path=os.path.join(out_base, f"tail_{agg}_heatmap.png"),
-                filter_mask=tail_mask,
-                title=f"Tail heatmap ({agg}) | оранжевый от {thresholds['Tail']} | штриховка: {agg} ≤ {thresholds['Tail']} | WiP = незавершённые задачи",
-            )
+def _use_agg_backend() -> None:
+    """Select non-interactive backend: charts are only rendered to PNG files."""
+    matplotlib.use("Agg")
 
-        if ttm_adj_mask is not None:
-            build_heatmap(
-                df=df,
-                metric_col="TTM_adj",
-                agg=agg,
-                threshold=thresholds["TTM_adj"],
-                out_path=os.path.join(out_base, f"ttm_adj_{agg}_heatmap.png"),
-                filter_mask=ttm_adj_mask,
-                title=f"TTM_adj heatmap ({agg}) | оранжевый от {thresholds['TTM_adj']} | штриховка: {agg} ≤ {thresholds['TTM_adj']} | WiP = незавершённые задачи",
-            )
+
+def _render_safely(job: HeatmapJob) -> Optional[str]:
+    """Render heatmap, logging errors so one chart does not stop the others."""
+    try:
+        return render_heatmap(job)
+    except Exception as e:
+        logger.error(f"Failed to render {job.out_path}: {e}", exc_info=True)
+        return None
+
+
+def generate_for_file(
+    csv_path: str,
+    output_dir: str,
+    aggs: List[str],
+    thresholds: Dict[str, float],
+    workers: int = 1,
+) -> List[str]:
+    """Generate heatmaps for a single CSV file."""
+    return generate_for_files([csv_path], output_dir, aggs, thresholds, workers)
 
 
 def main():
     """Main function for command line execution."""
+    _use_agg_backend()
     parser = argparse.ArgumentParser(
         description="Generate heatmaps from TTM Details CSV reports"
     )
@@ -340,6 +457,13 @@ def main():
         help=f"Threshold for TTM_adj metric (default: {DEFAULT_THRESHOLDS['TTM_adj']})",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes rendering heatmaps of all input files (default: 1)",
+    )
+
     args = parser.parse_args()
 
     # Build thresholds dict
@@ -387,12 +511,10 @@ def main():
 
     # Process each file
     log(f"Processing {len(input_files)} file(s)...")
-    for csv_path in input_files:
-        try:
-            log(f"Processing: {csv_path}")
-            generate_for_file(csv_path, args.output_dir, args.aggs, thresholds)
-        except Exception as e:
-            logger.error(f"Failed to process {csv_path}: {e}", exc_info=True)
+    saved = generate_for_files(
+        input_files, args.output_dir, args.aggs, thresholds, workers=args.workers
+    )
+    log(f"Saved {len(saved)} heatmap(s)")
 
     log("✅ Heatmap generation complete!")
     log(f"Output directory: {args.output_dir}")
@@ -6,10 +6,11 @@ import sys
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+from sqlalchemy import and_, case, distinct, func
 from sqlalchemy.orm import Session
 
 # Add project root to path
@@ -80,6 +81,38 @@ class GenerateStatusChangeReportCommand:
         if self.db:
             self.db.close()
 
+    def _map_authors_to_teams(self, authors: Iterable[Any]) -> Dict[str, str]:
+        """
+        Map distinct authors to teams in one AuthorTeamMappingService call.
+
+        Args:
+            authors: Author values from query rows (duplicates allowed)
+
+        Returns:
+            Dictionary author -> team (empty when grouping by author)
+        """
+        if self.group_by == "author":
+            return {}
+        unique_authors = list(
+            dict.fromkeys(author for author in authors if isinstance(author, str))
+        )
+        teams = self.author_team_mapping_service.map_authors(unique_authors)
+        return dict(zip(unique_authors, teams))
+
+    def _get_team(self, team_by_author: Dict[str, str], author: str) -> str:
+        """
+        Get team from authors mapped for this query, falling back to single lookup.
+
+        team_by_author is a snapshot taken when the query rows were mapped. The
+        fallback asks the mapping service, which re-reads the mapping file
+        whenever its mtime or size has changed.
+        """
+        team = team_by_author.get(author)
+        if team is None:
+            # Author value was decoded from bytes after pre-mapping
+            team = self.author_team_mapping_service.get_team_by_author(author)
+        return team
+
     def get_status_changes_by_group(
         self, start_date: datetime, end_date: datetime
     ) -> Dict[str, Dict[str, int]]:
@@ -91,100 +124,120 @@ class GenerateStatusChangeReportCommand:
             end_date: End of date range
 
         Returns:
-            Dictionary mapping author/team to dict with 'changes', 'tasks', and 'open_tasks' counts
+            Dictionary mapping author/team to dict with 'changes' and 'tasks' counts
+        """
+        return self.get_status_changes_by_periods([(start_date, end_date)])[0]
+
+    def get_status_changes_by_periods(
+        self, periods: List[Tuple[datetime, datetime]]
+    ) -> List[Dict[str, Dict[str, int]]]:
         """
+        Get status changes and unique tasks by author or team for several periods in one query.
+
+        History rows are aggregated in the database: COUNT(*) and
+        COUNT(DISTINCT task_id) grouped by author and period bucket. Author to
+        team mapping is applied to the aggregated rows; a task has a single
+        author, so unique task counts of authors add up to team counts.
+
+        Args:
+            periods: Non-overlapping (start, end) date ranges, end exclusive
+
+        Returns:
+            One dictionary per period mapping author/team to 'changes' and 'tasks' counts
+        """
+        results: List[Dict[str, Dict[str, int]]] = [{} for _ in periods]
+        if not periods:
+            return results
+
         try:
-            # Query status changes within date range
-            # We need to join tracker_tasks with tracker_task_history to get author/team information
-            if self.group_by == "author":
-                group_field = TrackerTask.author
-                filter_condition = TrackerTask.author.isnot(None)
-            else:  # team - use author field and map to team via AuthorTeamMappingService
-                if not self.author_team_mapping_service:
-                    logger.error(
-                        "AuthorTeamMappingService is required for team grouping"
+            # Team grouping uses author field and maps it via AuthorTeamMappingService
+            if self.group_by == "team" and not self.author_team_mapping_service:
+                logger.error("AuthorTeamMappingService is required for team grouping")
+                return results
+
+            period = case(
+                *[
+                    (
+                        and_(
+                            TrackerTaskHistory.start_date >= start_date,
+                            TrackerTaskHistory.start_date < end_date,
+                        ),
+                        index,
                     )
-                    return {}
-                group_field = TrackerTask.author
-                filter_condition = TrackerTask.author.isnot(None)
+                    for index, (start_date, end_date) in enumerate(periods)
+                ]
+            ).label("period")
 
             query = (
                 self.db.query(
-                    group_field, TrackerTaskHistory.id, TrackerTaskHistory.task_id
+                    TrackerTask.author,
+                    period,
+                    func.count(TrackerTaskHistory.id),
+                    func.count(distinct(TrackerTaskHistory.task_id)),
                 )
                 .join(TrackerTaskHistory, TrackerTask.id == TrackerTaskHistory.task_id)
                 .filter(
-                    TrackerTaskHistory.start_date >= start_date,
-                    TrackerTaskHistory.start_date < end_date,
-                    filter_condition,  # Exclude tasks without author/team
+                    TrackerTaskHistory.start_date >= min(start for start, _ in periods),
+                    TrackerTaskHistory.start_date < max(end for _, end in periods),
+                    TrackerTask.author.isnot(None),  # Exclude tasks without author
                     TrackerTask.key.like("CPO-%"),  # Only CPO tasks
                 )
+                .group_by(TrackerTask.author, "period")
             )
 
             logger.info(
-                f"Executing query for CPO tasks grouped by {self.group_by} in date range: {start_date.date()} to {end_date.date()}"
+                f"Executing aggregated query for CPO tasks grouped by {self.group_by} "
+                f"for {len(periods)} periods"
             )
 
-            # Execute query and count by author/team
-            results = query.all()
-            logger.info(f"Query returned {len(results)} results")
-
-            group_data = defaultdict(lambda: {"changes": 0, "tasks": set()})
-
-            for i, (group_value, _, task_id) in enumerate(results):
-                if group_value:  # Double check group value is not None
-                    try:
-                        # Handle potential encoding issues
-                        if isinstance(group_value, bytes):
-                            group_value = group_value.decode("utf-8", errors="replace")
-                        elif isinstance(group_value, str):
-                            # Ensure it's valid UTF-8
-                            group_value.encode("utf-8").decode("utf-8")
-
-                        # Determine final group value based on grouping type
-                        if self.group_by == "author":
-                            final_group_value = group_value
-                        else:  # team
-                            # Map author to team using AuthorTeamMappingService
-                            final_group_value = (
-                                self.author_team_mapping_service.get_team_by_author(
-                                    group_value
-                                )
-                            )
-                            logger.debug(
-                                f"Mapped author '{group_value}' to team '{final_group_value}'"
-                            )
+            rows = query.all()
+            logger.info(f"Query returned {len(rows)} aggregated rows")
+
+            team_by_author = self._map_authors_to_teams(row[0] for row in rows)
+
+            for group_value, index, changes, tasks in rows:
+                if not group_value or index is None:
+                    continue
+                try:
+                    # Handle potential encoding issues
+                    if isinstance(group_value, bytes):
+                        group_value = group_value.decode("utf-8", errors="replace")
+                    elif isinstance(group_value, str):
+                        # Ensure it's valid UTF-8
+                        group_value.encode("utf-8").decode("utf-8")
+                except (UnicodeDecodeError, UnicodeEncodeError) as e:
+                    logger.warning(
+                        f"Skipping {self.group_by} with encoding issue: {e}, value: {repr(group_value)}"
+                    )
+                    continue
 
-                        group_data[final_group_value]["changes"] += 1
-                        group_data[final_group_value]["tasks"].add(task_id)
-                    except (UnicodeDecodeError, UnicodeEncodeError) as e:
-                        logger.warning(
-                            f"Skipping {self.group_by} with encoding issue at position {i}: {e}, value: {repr(group_value)}"
-                        )
-                        continue
+                # Determine final group value based on grouping type
+                if self.group_by == "author":
+                    final_group_value = group_value
+                else:  # team
+                    final_group_value = self._get_team(team_by_author, group_value)
 
-            # Convert sets to counts and return
-            result = {}
-            for group_value, data in group_data.items():
-                result[group_value] = {
-                    "changes": data["changes"],
-                    "tasks": len(data["tasks"]),
-                }
+                data = results[index].setdefault(
+                    final_group_value, {"changes": 0, "tasks": 0}
+                )
+                data["changes"] += changes
+                data["tasks"] += tasks
 
-            total_changes = sum(data["changes"] for data in result.values())
-            total_tasks = sum(data["tasks"] for data in result.values())
             group_name = "authors" if self.group_by == "author" else "teams"
-            logger.info(
-                f"Found {total_changes} status changes across {total_tasks} unique tasks for {len(result)} {group_name} from {start_date.date()} to {end_date.date()}"
-            )
-            return result
+            for (start_date, end_date), result in zip(periods, results):
+                total_changes = sum(data["changes"] for data in result.values())
+                total_tasks = sum(data["tasks"] for data in result.values())
+                logger.info(
+                    f"Found {total_changes} status changes across {total_tasks} unique tasks for {len(result)} {group_name} from {start_date.date()} to {end_date.date()}"
+                )
+            return results
 
         except Exception as e:
             logger.error(f"Failed to get status changes by author: {e}")
             import traceback
 
             logger.error(f"Traceback: {traceback.format_exc()}")
-            return {}
+            return [{} for _ in periods]
 
     def get_open_tasks_by_group(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -231,6 +284,8 @@ class GenerateStatusChangeReportCommand:
                 }
             )
 
+            team_by_author = self._map_authors_to_teams(row[0] for row in open_tasks)
+
             for group_value, task_id, status, task_updated_at in open_tasks:
                 if group_value:  # Double check group value is not None
                     try:
@@ -245,11 +300,8 @@ class GenerateStatusChangeReportCommand:
                         if self.group_by == "author":
                             final_group_value = group_value
                         else:  # team
-                            # Map author to team using AuthorTeamMappingService
-                            final_group_value = (
-                                self.author_team_mapping_service.get_team_by_author(
-                                    group_value
-                                )
+                            final_group_value = self._get_team(
+                                team_by_author, group_value
                             )
 
                         # Map status to block
@@ -364,12 +416,18 @@ class GenerateStatusChangeReportCommand:
         logger.info(f"  Week 2: {week2_start.date()} to {week2_end.date()}")
         logger.info(f"  Week 3 (hidden): {week3_start.date()} to {week3_end.date()}")
 
-        # Get data for each week
-        self.week1_data = self.get_status_changes_by_group(week1_start, week1_end)
-        self.week2_data = self.get_status_changes_by_group(week2_start, week2_end)
-        self.week3_data = self.get_status_changes_by_group(
-            week3_start, week3_end
-        )  # Hidden week for dynamics
+        # Get data for all weeks in one aggregated query
+        (
+            self.week1_data,
+            self.week2_data,
+            self.week3_data,  # Hidden week for dynamics
+        ) = self.get_status_changes_by_periods(
+            [
+                (week1_start, week1_end),
+                (week2_start, week2_end),
+                (week3_start, week3_end),
+            ]
+        )
 
         # Get current open tasks data
         self.open_tasks_data = self.get_open_tasks_by_group()
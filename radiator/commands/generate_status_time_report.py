@@ -1,17 +1,38 @@
 import argparse
-import csv
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
 from sqlalchemy.orm import Session
 
-from radiator.commands.services.data_service import DataService
+from radiator.commands.models.time_to_market_models import TaskData
+from radiator.commands.services.data_service import DataService, iter_chunks
+from radiator.commands.services.report_output import REPORT_FORMATS, ReportTableWriter
 from radiator.core.database import SessionLocal
 from radiator.core.logging import logger
 
+BASE_HEADER = [
+    "Ключ задачи",
+    "Название",
+    "Текущий статус",
+    "Дата создания",
+    "Дата последнего изменения статуса",
+]
+
+# Types of BASE_HEADER columns in Parquet / Arrow output; status columns are int
+BASE_COLUMN_TYPES = {
+    "Ключ задачи": "string",
+    "Название": "string",
+    "Текущий статус": "string",
+    "Дата создания": "date",
+    "Дата последнего изменения статуса": "date",
+}
+
 
 class StatusTimeReportGenerator:
+    # Tasks per history query; rows are written and dropped chunk by chunk
+    CHUNK_SIZE = 1000
+
     def __init__(
         self,
         db: Optional[Session] = None,
@@ -38,6 +59,7 @@ class StatusTimeReportGenerator:
         queue: str,
         created_since: Optional[datetime] = None,
         output_path: Optional[Path] = None,
+        output_format: str = "csv",
     ) -> Path:
         if output_path is None:
             output_path = self._default_output_path()
@@ -45,99 +67,80 @@ class StatusTimeReportGenerator:
         output_path = Path(output_path)
         self._ensure_output_dir(output_path)
 
-        tasks = list(self._get_tasks(queue, created_since))
-        if not tasks:
+        # Header needs all statuses before the first row, take them from SQL
+        # so tasks and histories can be streamed chunk by chunk
+        statuses = self.data_service.get_statuses_by_queue(queue, created_since)
+
+        header = BASE_HEADER + statuses
+        columns = dict.fromkeys(header, "int")
+        columns.update(BASE_COLUMN_TYPES)
+
+        with ReportTableWriter(output_path, columns, output_format) as writer:
+            tasks = self._get_tasks(queue, created_since)
+            for chunk in iter_chunks(tasks, self.CHUNK_SIZE):
+                histories_by_key = self.data_service.get_task_histories_by_keys_batch(
+                    [task.key for task in chunk]
+                )
+                for task in chunk:
+                    history = histories_by_key.get(task.key, [])
+                    if not history:
+                        logger.warning("No history entries for task %s", task.key)
+                    row = self._format_row(task, history, statuses)
+                    writer.write_row(dict(zip(header, row)))
+
+        if not writer.row_count:
             logger.warning(
                 "No tasks found for queue '%s' with created_since=%s",
                 queue,
                 created_since,
             )
-            with output_path.open("w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(
-                    [
-                        "Ключ задачи",
-                        "Название",
-                        "Текущий статус",
-                        "Дата создания",
-                        "Дата последнего изменения статуса",
-                    ]
-                )
-            return output_path
 
-        histories_by_key = self.data_service.get_task_histories_by_keys_batch(
-            [task.key for task in tasks]
+        return output_path
+
+    def _get_tasks(
+        self, queue: str, created_since: Optional[datetime] = None
+    ) -> Iterator[TaskData]:
+        return self.data_service.iter_tasks_by_queue(
+            queue, created_since, chunk_size=self.CHUNK_SIZE
         )
-        statuses = self._collect_unique_statuses(tasks, histories_by_key)
-
-        with output_path.open("w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.writer(csvfile)
-            header = [
-                "Ключ задачи",
-                "Название",
-                "Текущий статус",
-                "Дата создания",
-                "Дата последнего изменения статуса",
-            ] + statuses
-            writer.writerow(header)
-
-            for task in tasks:
-                history = histories_by_key.get(task.key, [])
-                if not history:
-                    logger.warning("No history entries for task %s", task.key)
-                status_times = self._calculate_status_times(history)
-                last_status_change = self._get_last_status_change_date(history)
-
-                # Format dates
-                created_at_str = (
-                    task.created_at.strftime("%Y-%m-%d") if task.created_at else ""
-                )
-                last_status_change_str = (
-                    last_status_change.strftime("%Y-%m-%d")
-                    if last_status_change
-                    else ""
-                )
 
-                row = [
-                    task.key,
-                    task.summary or "",
-                    task.status or "",
-                    created_at_str,
-                    last_status_change_str,
-                ]
-                for status in statuses:
-                    value = status_times.get(status)
-                    if value is None:
-                        row.append("")
-                    else:
-                        row.append(str(value))
-
-                writer.writerow(row)
+    def _format_row(
+        self, task: TaskData, history: Iterable, statuses: list[str]
+    ) -> list[str]:
+        """
+        Build CSV row for one task.
 
-        return output_path
+        Args:
+            task: Task data
+            history: List of StatusHistoryEntry objects of the task
+            statuses: Status columns of the report
 
-    def _get_tasks(self, queue: str, created_since: Optional[datetime] = None):
-        return self.data_service.get_tasks_by_queue(queue, created_since)
+        Returns:
+            Row values in header order
+        """
+        status_times = self._calculate_status_times(history)
+        last_status_change = self._get_last_status_change_date(history)
 
-    def _collect_unique_statuses(
-        self,
-        tasks: Iterable,
-        histories_by_key: Optional[dict[str, Iterable]] = None,
-    ) -> list[str]:
-        unique_statuses = set()
+        # Format dates
+        created_at_str = task.created_at.strftime("%Y-%m-%d") if task.created_at else ""
+        last_status_change_str = (
+            last_status_change.strftime("%Y-%m-%d") if last_status_change else ""
+        )
 
-        for task in tasks:
-            if histories_by_key is not None:
-                history = histories_by_key.get(task.key, [])
+        row = [
+            task.key,
+            task.summary or "",
+            task.status or "",
+            created_at_str,
+            last_status_change_str,
+        ]
+        for status in statuses:
+            value = status_times.get(status)
+            if value is None:
+                row.append("")
             else:
-                history = self.data_service.get_task_history(task.id)
-            if not history:
-                continue
-            for entry in history:
-                if entry.status:
-                    unique_statuses.add(entry.status)
-
-        return sorted(unique_statuses)
+                row.append(str(value))
+        return row
 
     def _calculate_status_times(self, history: Iterable) -> dict[str, int]:
         if not history:
@@ -199,6 +202,12 @@ def parse_args() -> argparse.Namespace:
         "--output",
         help="Optional path to output CSV file (defaults to data/reports with timestamp)",
     )
+    parser.add_argument(
+        "--format",
+        choices=REPORT_FORMATS,
+        default="csv",
+        help="Also write a typed Parquet or Arrow IPC copy next to the CSV",
+    )
     return parser.parse_args()
 
 
@@ -217,7 +226,10 @@ def main() -> None:
     with SessionLocal() as db:
         generator = StatusTimeReportGenerator(db=db)
         csv_path = generator.generate_csv(
-            queue=args.queue, created_since=created_since, output_path=output_path
+            queue=args.queue,
+            created_since=created_since,
+            output_path=output_path,
+            output_format=args.format,
         )
 
     print(f"Status time report generated: {csv_path}")
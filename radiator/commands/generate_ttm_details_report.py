@@ -1,9 +1,9 @@
 """TTM Details Report generator for Time To Market metrics."""
 
-import csv
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -17,26 +17,39 @@ from radiator.commands.services.author_team_mapping_service import (
     AuthorTeamMappingService,
 )
 from radiator.commands.services.config_service import ConfigService
-from radiator.commands.services.data_service import DataService
+from radiator.commands.services.data_service import DataService, iter_chunks
 from radiator.commands.services.metrics_service import MetricsService
+from radiator.commands.services.report_output import REPORT_FORMATS, ReportTableWriter
+from radiator.commands.services.task_metrics_store import TaskMetricsStore
 from radiator.commands.services.team_lead_mapping_service import TeamLeadMappingService
 from radiator.commands.services.testing_returns_service import TestingReturnsService
 from radiator.core.logging import logger
 
+# Number of task chunks per worker process (smaller chunks balance load better)
+METRICS_CHUNKS_PER_WORKER = 4
+
+# Tasks per streamed chunk of CSV rows (histories and returns are loaded per chunk)
+CSV_CHUNK_SIZE = 2000
+
+# Compact picklable form of StatusHistoryEntry sent to worker processes
+HistoryTuple = Tuple[str, str, datetime, Optional[datetime]]
+
 
 class TTMDetailsReportGenerator:
     """Generator for TTM Details CSV report."""
 
-    def __init__(self, db: Session, config_dir: str = "data/config"):
+    def __init__(self, db: Session, config_dir: str = "data/config", workers: int = 1):
         """
         Initialize TTM Details Report generator.
 
         Args:
             db: Database session
             config_dir: Configuration directory path
+            workers: Number of processes for per-task metrics (1 - no pool)
         """
         self.db = db
         self.config_dir = config_dir
+        self.workers = max(1, workers)
         self.config_service = ConfigService(config_dir)
         self.data_service = DataService(db)
         self.metrics_service = MetricsService(config_dir=config_dir)
@@ -47,6 +60,7 @@ class TTMDetailsReportGenerator:
             f"{config_dir}/teamsleads.txt"
         )
         self.testing_returns_service = TestingReturnsService(db)
+        self.metrics_store = TaskMetricsStore(db, config_dir)
 
     def _load_quarters(self) -> List[Quarter]:
         """
@@ -174,7 +188,7 @@ class TTMDetailsReportGenerator:
 
     def _get_ttm_tasks_for_date_range_corrected(
         self, start_date: datetime, end_date: datetime
-    ) -> List[TaskData]:
+    ) -> Iterable[TaskData]:
         """
         Get TTM tasks within date range using the same logic as quarter-based approach.
 
@@ -183,17 +197,18 @@ class TTMDetailsReportGenerator:
             end_date: End date of range
 
         Returns:
-            List of TaskData objects (already filtered by TTM)
+            TaskData objects (already filtered by TTM) streamed in key order
         """
         from radiator.commands.models.time_to_market_models import GroupBy
 
         status_mapping = self.config_service.load_status_mapping()
-        return self.data_service.get_tasks_for_period(
+        return self.data_service.iter_tasks_for_period(
             start_date=start_date,
             end_date=end_date,
             group_by=GroupBy.AUTHOR,
             status_mapping=status_mapping,
             metric_type="ttm",  # Ключевое отличие - фильтрация по TTM
+            chunk_size=CSV_CHUNK_SIZE,
         )
 
     def _determine_quarter_for_ttm(
@@ -280,7 +295,14 @@ class TTMDetailsReportGenerator:
             list(all_fullstack_keys)
         )
 
-        # Step 4: Calculate returns for each CPO task using in-memory data
+        # Step 4: Count returns of all FULLSTACK tasks in one pass
+        fullstack_returns = (
+            self.testing_returns_service.calculate_testing_returns_batch(
+                {key: history for key, history in all_histories.items() if history}
+            )
+        )
+
+        # Step 5: Sum returns for each CPO task using in-memory data
         result = {}
         for cpo_key, fullstack_keys in cpo_to_fullstack.items():
             if not fullstack_keys:
@@ -291,15 +313,8 @@ class TTMDetailsReportGenerator:
             total_external_returns = 0
 
             for fullstack_key in fullstack_keys:
-                history = all_histories.get(fullstack_key, [])
-                if not history:
-                    continue
-
-                (
-                    testing_returns,
-                    external_returns,
-                ) = self.testing_returns_service.calculate_testing_returns_for_task(
-                    fullstack_key, history
+                testing_returns, external_returns = fullstack_returns.get(
+                    fullstack_key, (0, 0)
                 )
 
                 total_testing_returns += testing_returns
@@ -679,20 +694,19 @@ class TTMDetailsReportGenerator:
             logger.warning(f"Failed to calculate testing returns for {task_key}: {e}")
             return 0, 0
 
-    def _get_unfinished_tasks(
+    def _get_ready_tasks(
         self, as_of_date: Optional[datetime] = None
-    ) -> List[TaskData]:
+    ) -> Iterable[TaskData]:
         """
-        Get unfinished tasks (tasks that transitioned to 'Готова к разработке' but don't have stable_done).
+        Get tasks that transitioned to 'Готова к разработке'.
 
         Args:
-            as_of_date: Optional date to check unfinished tasks as-of
+            as_of_date: Optional date to extend search range to
 
         Returns:
-            List of TaskData objects for unfinished tasks
+            TaskData objects streamed in key order
         """
         quarters = self._load_quarters()
-        done_statuses = self._load_done_statuses()
 
         # Берем диапазон от начала первого до конца последнего квартала
         # Но для незавершенных задач нужно расширить до as_of_date
@@ -709,23 +723,69 @@ class TTMDetailsReportGenerator:
         from radiator.commands.models.time_to_market_models import GroupBy
 
         status_mapping = self.config_service.load_status_mapping()
-        all_ready_tasks = self.data_service.get_tasks_for_period(
+        return self.data_service.iter_tasks_for_period(
             start_date=start_date,
             end_date=end_date,
             group_by=GroupBy.AUTHOR,
             status_mapping=status_mapping,
             metric_type="ttd",  # Получаем задачи с переходом в "Готова к разработке"
+            chunk_size=CSV_CHUNK_SIZE,
         )
 
+    def _get_unfinished_tasks(
+        self,
+        as_of_date: Optional[datetime] = None,
+        ready_tasks: Optional[List[TaskData]] = None,
+        histories: Optional[Dict[int, List[StatusHistoryEntry]]] = None,
+    ) -> List[TaskData]:
+        """
+        Get unfinished tasks (tasks that transitioned to 'Готова к разработке' but don't have stable_done).
+
+        Args:
+            as_of_date: Optional date to check unfinished tasks as-of
+            ready_tasks: Preloaded ready tasks (e.g. one chunk of _get_ready_tasks)
+            histories: Preloaded full histories by task ID (one batch query if None)
+
+        Returns:
+            List of TaskData objects for unfinished tasks
+        """
+        done_statuses = self._load_done_statuses()
+        if ready_tasks is None:
+            ready_tasks = list(self._get_ready_tasks(as_of_date))
+        if histories is None:
+            histories = self.data_service.get_filtered_task_histories_batch(
+                [task.id for task in ready_tasks]
+            )
+
         # Фильтруем задачи, у которых нет stable_done
-        unfinished_tasks = []
-        for task in all_ready_tasks:
-            history = self.data_service.get_task_history(task.id)
-            stable_done = self.metrics_service._find_stable_done(history, done_statuses)
-            if not stable_done:
-                unfinished_tasks.append(task)
+        stable_dones = self.metrics_service.find_stable_done_batch(
+            [histories.get(task.id, []) for task in ready_tasks], done_statuses
+        )
+        return [
+            task
+            for task, stable_done in zip(ready_tasks, stable_dones)
+            if not stable_done
+        ]
+
+    def _history_as_of(
+        self, history: List[StatusHistoryEntry], as_of_date: Optional[datetime]
+    ) -> List[StatusHistoryEntry]:
+        """
+        Cut preloaded history at as_of_date (same as get_task_history with as_of_date).
 
-        return unfinished_tasks
+        Args:
+            history: Full task history with short transitions filtered out
+            as_of_date: Optional date to filter history by
+
+        Returns:
+            History as of the given date
+        """
+        if as_of_date is None:
+            return history
+
+        from radiator.commands.services.history_filter import HistoryFilter
+
+        return HistoryFilter.filter_by_as_of_date(history, as_of_date)
 
     def _get_current_status(self, history: List[StatusHistoryEntry]) -> str:
         """
@@ -755,6 +815,7 @@ class TTMDetailsReportGenerator:
         stable_done: Optional[object] = None,
         is_finished: bool = True,
         as_of_date: Optional[datetime] = None,
+        history_metrics: Optional[dict] = None,
     ) -> dict:
         """
         Calculate all metrics for a task (finished or unfinished).
@@ -767,10 +828,24 @@ class TTMDetailsReportGenerator:
             stable_done: Optional stable_done entry (for finished tasks)
             is_finished: Whether task is finished
             as_of_date: Optional date to calculate metrics as-of
+            history_metrics: Pause and status durations precomputed by
+                _calculate_history_metrics_batch (calculated here if None)
 
         Returns:
             Dictionary with task metrics
         """
+        if history_metrics is None:
+            history_metrics = {
+                "pause": self._calculate_pause(task.id, history),
+                "ttd_pause": self._calculate_ttd_pause(task.id, history, as_of_date),
+                "discovery_backlog_days": self._calculate_discovery_backlog_days(
+                    task.id, history, as_of_date
+                ),
+                "ready_for_dev_days": self._calculate_ready_for_dev_days(
+                    task.id, history, as_of_date
+                ),
+            }
+
         # Calculate TTM based on task status
         if is_finished:
             ttm = self._calculate_ttm(task.id, done_statuses, history)
@@ -798,14 +873,7 @@ class TTMDetailsReportGenerator:
                 task.id, ["Готова к разработке"], history, as_of_date
             ),
             "ttd_quarter": self._calculate_ttd_quarter(history, quarters),
-            "pause": self._calculate_pause(task.id, history),
-            "ttd_pause": self._calculate_ttd_pause(task.id, history, as_of_date),
-            "discovery_backlog_days": self._calculate_discovery_backlog_days(
-                task.id, history, as_of_date
-            ),
-            "ready_for_dev_days": self._calculate_ready_for_dev_days(
-                task.id, history, as_of_date
-            ),
+            **history_metrics,
             "created_at": task.created_at,
             "last_discovery_backlog_exit_date": self._get_last_discovery_backlog_exit_date(
                 history
@@ -821,97 +889,458 @@ class TTMDetailsReportGenerator:
             ),
         }
 
-    def _collect_csv_rows(self, as_of_date: Optional[datetime] = None) -> List[dict]:
+    def _calculate_history_metrics(
+        self,
+        task_id: int,
+        history: List[StatusHistoryEntry],
+        done_statuses: List[str],
+        stable_done: StatusHistoryEntry,
+        history_metrics: Optional[dict] = None,
+    ) -> dict:
         """
-        Collect CSV rows data with optimized batch processing.
+        Calculate metrics of a finished task stored in tracker_task_metrics.
+
+        Without as_of_date these values depend only on history and status
+        configuration, so they can be materialized after sync.
 
         Args:
-            as_of_date: Optional date to generate report as-of
+            task_id: Task ID
+            history: Task history entries
+            done_statuses: List of done status names
+            stable_done: Stable done entry of the task
+            history_metrics: Pause and status durations precomputed by
+                _calculate_history_metrics_batch (calculated here if None)
 
         Returns:
-            List of dictionaries with CSV row data
-        """
-        rows = []
-        quarters = self._load_quarters()
-        done_statuses = self._load_done_statuses()
+            Dictionary with TrackerTaskMetrics column values
+        """
+        if history_metrics is None:
+            history_metrics = {
+                "pause": self._calculate_pause(task_id, history),
+                "ttd_pause": self._calculate_ttd_pause(task_id, history),
+                "discovery_backlog_days": self._calculate_discovery_backlog_days(
+                    task_id, history
+                ),
+                "ready_for_dev_days": self._calculate_ready_for_dev_days(
+                    task_id, history
+                ),
+            }
 
-        # Берем диапазон от начала первого до конца последнего квартала
-        start_date = min(q.start_date for q in quarters)
-        end_date = max(q.end_date for q in quarters)
+        return {
+            "ttm": self._calculate_ttm(task_id, done_statuses, history),
+            "tail": self._calculate_tail(task_id, done_statuses, history),
+            "devlt": self._calculate_devlt(task_id, history),
+            "ttd": self._calculate_ttd(task_id, ["Готова к разработке"], history),
+            **history_metrics,
+            "ttd_target_date": self._get_ttd_target_date(history),
+            "last_discovery_backlog_exit_date": self._get_last_discovery_backlog_exit_date(
+                history
+            ),
+            "stable_done_date": stable_done.start_date,
+            "has_development": self._has_valid_work_status(task_id, history),
+            "current_status": self._get_current_status(history),
+        }
 
-        # Получаем ВСЕ задачи одним запросом (с правильной фильтрацией по TTM)
-        all_tasks = self._get_ttm_tasks_for_date_range_corrected(start_date, end_date)
+    def _calculate_history_metrics_batch(
+        self,
+        histories: List[List[StatusHistoryEntry]],
+        as_of_date: Optional[datetime] = None,
+    ) -> List[dict]:
+        """
+        Calculate pause and status durations for many tasks at once.
 
-        # Собираем все метрики КРОМЕ возвратов
-        # Задачи уже отфильтрованы по TTM в _get_ttm_tasks_for_date_range_corrected
-        tasks_data = []
-        for task in all_tasks:
-            history = self.data_service.get_task_history(task.id, as_of_date=as_of_date)
+        Same values as _calculate_pause, _calculate_ttd_pause,
+        _calculate_discovery_backlog_days and _calculate_ready_for_dev_days,
+        but each metric is one HistoryArray pass over all histories.
 
-            # Находим stable_done один раз для использования в нескольких местах
-            stable_done = self.metrics_service._find_stable_done(history, done_statuses)
+        Args:
+            histories: Task histories, one per task
+            as_of_date: Optional date to calculate up to (for unfinished tasks)
 
-            # Определяем квартал для задачи (TTM уже есть)
-            quarter_name = None
-            if stable_done:
-                from radiator.commands.services.datetime_utils import normalize_to_utc
+        Returns:
+            Dictionaries with pause, ttd_pause, discovery_backlog_days and
+            ready_for_dev_days per history, in input order (None if history is empty)
+        """
+        pauses = self.metrics_service.calculate_pause_time_batch(histories)
+        durations = self.metrics_service.calculate_status_durations_batch(
+            histories, ["Discovery backlog", "Готова к разработке"], as_of_date
+        )
 
-                done_date = normalize_to_utc(stable_done.start_date)
-                # Find matching quarter
-                for quarter in quarters:
-                    if quarter.start_date <= done_date <= quarter.end_date:
-                        quarter_name = quarter.name
-                        break
+        # TTD pause считается до "Готова к разработке", иначе до as_of_date
+        ttd_end_dates = [
+            self._get_ttd_target_date(history) or as_of_date for history in histories
+        ]
+        ttd_indexes = [i for i, date in enumerate(ttd_end_dates) if date is not None]
+        ttd_pauses = dict(
+            zip(
+                ttd_indexes,
+                self.metrics_service.calculate_pause_time_batch(
+                    [histories[i] for i in ttd_indexes],
+                    [ttd_end_dates[i] for i in ttd_indexes],
+                ),
+            )
+        )
 
-            if not quarter_name:
+        result = []
+        for i, history in enumerate(histories):
+            if not history:
+                result.append(
+                    {
+                        "pause": None,
+                        "ttd_pause": None,
+                        "discovery_backlog_days": None,
+                        "ready_for_dev_days": None,
+                    }
+                )
                 continue
+            result.append(
+                {
+                    "pause": pauses[i],
+                    "ttd_pause": ttd_pauses.get(i),
+                    "discovery_backlog_days": durations["Discovery backlog"][i],
+                    "ready_for_dev_days": durations["Готова к разработке"][i],
+                }
+            )
+        return result
 
-            # Собираем все метрики кроме возвратов
-            task_metrics = self._calculate_task_metrics(
+    def _calculate_task_metrics_batch(
+        self,
+        metric_jobs: List[tuple],
+        done_statuses: List[str],
+        quarters: List[Quarter],
+        as_of_date: Optional[datetime] = None,
+    ) -> List[dict]:
+        """
+        Calculate metrics for tasks in this process, history metrics in bulk.
+
+        Args:
+            metric_jobs: List of (task, history, stable_done, is_finished) tuples
+            done_statuses: List of done status names
+            quarters: List of Quarter objects
+            as_of_date: Optional date to calculate metrics as-of
+
+        Returns:
+            List of task metrics dictionaries in the same order as metric_jobs
+        """
+        history_metrics = self._calculate_history_metrics_batch(
+            [history for _, history, _, _ in metric_jobs], as_of_date
+        )
+        return [
+            self._calculate_task_metrics(
                 task,
                 history,
                 done_statuses,
                 quarters,
                 stable_done,
-                is_finished=True,
+                is_finished=is_finished,
                 as_of_date=as_of_date,
+                history_metrics=task_history_metrics,
+            )
+            for (task, history, stable_done, is_finished), task_history_metrics in zip(
+                metric_jobs, history_metrics
             )
-            tasks_data.append(task_metrics)
+        ]
+
+    def _metrics_from_store(
+        self, task: TaskData, stored, quarters: List[Quarter], quarter_name: str
+    ) -> dict:
+        """
+        Build task metrics dictionary from a stored TrackerTaskMetrics row.
+
+        Args:
+            task: Task data
+            stored: TrackerTaskMetrics row
+            quarters: List of Quarter objects
+            quarter_name: Quarter of task's stable done
+
+        Returns:
+            Dictionary with task metrics (same keys as _calculate_task_metrics)
+        """
+        current_status = stored.current_status or ""
+        return {
+            "task": task,
+            "quarter_name": quarter_name,
+            "ttm": stored.ttm,
+            "tail": stored.tail,
+            "devlt": stored.devlt,
+            "ttd": stored.ttd,
+            "ttd_quarter": (
+                self._determine_quarter_for_date(stored.ttd_target_date, quarters)
+                if stored.ttd_target_date
+                else None
+            ),
+            "pause": stored.pause,
+            "ttd_pause": stored.ttd_pause,
+            "discovery_backlog_days": stored.discovery_backlog_days,
+            "ready_for_dev_days": stored.ready_for_dev_days,
+            "created_at": task.created_at,
+            "last_discovery_backlog_exit_date": stored.last_discovery_backlog_exit_date,
+            "stable_done_date": stored.stable_done_date,
+            "has_development": stored.has_development,
+            "is_finished": True,
+            "current_status": current_status,
+            "status_group": self.config_service.get_status_group(current_status),
+        }
 
-        # Добавляем незавершенные задачи
-        unfinished_tasks = self._get_unfinished_tasks(as_of_date=as_of_date)
-        for task in unfinished_tasks:
-            history = self.data_service.get_task_history(task.id, as_of_date=as_of_date)
+    def _calculate_metrics_for_tasks(
+        self,
+        metric_jobs: List[tuple],
+        done_statuses: List[str],
+        quarters: List[Quarter],
+        as_of_date: Optional[datetime] = None,
+        executor: Optional[ProcessPoolExecutor] = None,
+    ) -> List[dict]:
+        """
+        Calculate metrics for tasks, in worker processes if workers > 1.
 
-            # Проверяем, что задача действительно незавершенная (нет stable_done)
-            stable_done = self.metrics_service._find_stable_done(history, done_statuses)
-            if stable_done:
-                continue  # Пропускаем, если есть stable_done
+        Args:
+            metric_jobs: List of (task, history, stable_done, is_finished) tuples
+            done_statuses: List of done status names
+            quarters: List of Quarter objects
+            as_of_date: Optional date to calculate metrics as-of
+            executor: Process pool to reuse (a new one is created if None)
 
-            # Собираем все метрики для незавершенной задачи
-            task_metrics = self._calculate_task_metrics(
+        Returns:
+            List of task metrics dictionaries in the same order as metric_jobs
+        """
+        if self.workers == 1 or len(metric_jobs) < 2:
+            return self._calculate_task_metrics_batch(
+                metric_jobs, done_statuses, quarters, as_of_date
+            )
+
+        compact_jobs = [
+            (
                 task,
-                history,
-                done_statuses,
-                quarters,
-                stable_done=None,
-                is_finished=False,
-                as_of_date=as_of_date,
+                _history_to_tuples(history),
+                _history_to_tuples([stable_done])[0] if stable_done else None,
+                is_finished,
             )
-            tasks_data.append(task_metrics)
+            for task, history, stable_done, is_finished in metric_jobs
+        ]
+        chunk_count = min(len(compact_jobs), self.workers * METRICS_CHUNKS_PER_WORKER)
+        chunk_size = -(-len(compact_jobs) // chunk_count)
+        chunks = [
+            (compact_jobs[i : i + chunk_size], done_statuses, quarters, as_of_date)
+            for i in range(0, len(compact_jobs), chunk_size)
+        ]
+
+        logger.info(
+            f"Calculating metrics for {len(compact_jobs)} tasks "
+            f"in {self.workers} processes ({len(chunks)} chunks)"
+        )
+        if executor is not None:
+            # map() keeps input order, so CSV rows stay deterministic
+            results = executor.map(_calculate_metrics_chunk, chunks)
+            return [task_metrics for chunk in results for task_metrics in chunk]
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(chunks)),
+            initializer=_init_metrics_worker,
+            initargs=(self.config_dir,),
+        ) as executor:
+            results = executor.map(_calculate_metrics_chunk, chunks)
+            return [task_metrics for chunk in results for task_metrics in chunk]
+
+    def _metrics_executor(self):
+        """
+        Process pool shared by all chunks of a report (None if workers == 1).
+
+        Returns:
+            Context manager yielding ProcessPoolExecutor or None
+        """
+        if self.workers == 1:
+            return nullcontext()
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_metrics_worker,
+            initargs=(self.config_dir,),
+        )
+
+    def _collect_csv_rows(self, as_of_date: Optional[datetime] = None) -> List[dict]:
+        """
+        Collect all CSV rows in memory.
 
-        # Шаг 2: Собираем все ключи CPO задач для расчета возвратов
-        cpo_task_keys = [td["task"].key for td in tasks_data]
+        Args:
+            as_of_date: Optional date to generate report as-of
 
-        # Шаг 3: Batch-расчет возвратов для всех задач сразу
-        returns_data = self._calculate_all_returns_batched(cpo_task_keys)
+        Returns:
+            List of dictionaries with CSV row data
+        """
+        return list(self._iter_csv_rows(as_of_date))
+
+    def _iter_csv_rows(self, as_of_date: Optional[datetime] = None) -> Iterator[dict]:
+        """
+        Stream CSV rows chunk by chunk.
+
+        Tasks are read in key order from server-side cursors. Histories,
+        metrics and returns are loaded for CSV_CHUNK_SIZE tasks at a time and
+        dropped once the chunk's rows are yielded, so memory stays flat with
+        the number of tasks. Finished tasks come first, then unfinished ones.
+
+        Args:
+            as_of_date: Optional date to generate report as-of
+
+        Yields:
+            Dictionaries with CSV row data
+        """
+        from radiator.commands.services.datetime_utils import normalize_to_utc
+
+        quarters = self._load_quarters()
+        done_statuses = self._load_done_statuses()
+
+        # Берем диапазон от начала первого до конца последнего квартала
+        start_date = min(q.start_date for q in quarters)
+        end_date = max(q.end_date for q in quarters)
+
+        with self._metrics_executor() as executor:
+            # Завершенные задачи (уже отфильтрованы по TTM)
+            all_tasks = self._get_ttm_tasks_for_date_range_corrected(
+                start_date, end_date
+            )
+            for chunk in iter_chunks(all_tasks, CSV_CHUNK_SIZE):
+                histories = self.data_service.get_filtered_task_histories_batch(
+                    [task.id for task in chunk]
+                )
+
+                chunk_histories = [
+                    self._history_as_of(histories.get(task.id, []), as_of_date)
+                    for task in chunk
+                ]
+                # Находим stable_done один раз для всего чанка
+                stable_dones = self.metrics_service.find_stable_done_batch(
+                    chunk_histories, done_statuses
+                )
+
+                # Задачи для расчета метрик: (task, history, stable_done, is_finished)
+                metric_jobs = []
+                quarter_by_task: Dict[int, str] = {}
+                for task, history, stable_done in zip(
+                    chunk, chunk_histories, stable_dones
+                ):
+                    # Определяем квартал для задачи (TTM уже есть)
+                    quarter_name = None
+                    if stable_done:
+                        done_date = normalize_to_utc(stable_done.start_date)
+                        for quarter in quarters:
+                            if quarter.start_date <= done_date <= quarter.end_date:
+                                quarter_name = quarter.name
+                                break
+
+                    if not quarter_name:
+                        continue
+
+                    quarter_by_task[task.id] = quarter_name
+                    metric_jobs.append((task, history, stable_done, True))
+
+                yield from self._rows_for_jobs(
+                    metric_jobs,
+                    quarter_by_task,
+                    done_statuses,
+                    quarters,
+                    as_of_date,
+                    executor,
+                )
+
+            # Незавершенные задачи: перешли в "Готова к разработке", нет stable_done
+            ready_tasks = self._get_ready_tasks(as_of_date)
+            for chunk in iter_chunks(ready_tasks, CSV_CHUNK_SIZE):
+                histories = self.data_service.get_filtered_task_histories_batch(
+                    [task.id for task in chunk]
+                )
+                unfinished_tasks = self._get_unfinished_tasks(
+                    as_of_date=as_of_date, ready_tasks=chunk, histories=histories
+                )
+                missing_ids = [
+                    task.id for task in unfinished_tasks if task.id not in histories
+                ]
+                if missing_ids:
+                    histories.update(
+                        self.data_service.get_filtered_task_histories_batch(missing_ids)
+                    )
+
+                unfinished_histories = [
+                    self._history_as_of(histories.get(task.id, []), as_of_date)
+                    for task in unfinished_tasks
+                ]
+                # Проверяем, что задача действительно незавершенная (нет stable_done)
+                stable_dones = self.metrics_service.find_stable_done_batch(
+                    unfinished_histories, done_statuses
+                )
+
+                metric_jobs = [
+                    (task, history, None, False)
+                    for task, history, stable_done in zip(
+                        unfinished_tasks, unfinished_histories, stable_dones
+                    )
+                    if not stable_done  # Пропускаем, если есть stable_done
+                ]
+
+                yield from self._rows_for_jobs(
+                    metric_jobs, {}, done_statuses, quarters, as_of_date, executor
+                )
+
+    def _rows_for_jobs(
+        self,
+        metric_jobs: List[tuple],
+        quarter_by_task: Dict[int, str],
+        done_statuses: List[str],
+        quarters: List[Quarter],
+        as_of_date: Optional[datetime],
+        executor: Optional[ProcessPoolExecutor],
+    ) -> Iterator[dict]:
+        """
+        Calculate metrics and returns for one chunk of tasks and format rows.
+
+        Args:
+            metric_jobs: List of (task, history, stable_done, is_finished) tuples
+            quarter_by_task: Quarter name by task ID for finished tasks
+            done_statuses: List of done status names
+            quarters: List of Quarter objects
+            as_of_date: Optional date to calculate metrics as-of
+            executor: Shared process pool (None - calculate in this process)
+
+        Yields:
+            Dictionaries with CSV row data in metric_jobs order
+        """
+        if not metric_jobs:
+            return
+
+        # Метрики завершенных задач берем из tracker_task_metrics, если они
+        # актуальны; исторические отчеты (as_of_date) всегда считаются заново
+        stored_metrics = {}
+        if as_of_date is None and quarter_by_task:
+            stored_metrics = self.metrics_store.load_fresh(list(quarter_by_task))
+        live_jobs = [
+            job for job in metric_jobs if not (job[3] and job[0].id in stored_metrics)
+        ]
+
+        # Собираем все метрики кроме возвратов (в процессах при workers > 1)
+        live_metrics = iter(
+            self._calculate_metrics_for_tasks(
+                live_jobs, done_statuses, quarters, as_of_date, executor=executor
+            )
+        )
+        tasks_data = [
+            (
+                self._metrics_from_store(
+                    task, stored_metrics[task.id], quarters, quarter_by_task[task.id]
+                )
+                if is_finished and task.id in stored_metrics
+                else next(live_metrics)
+            )
+            for task, _, _, is_finished in metric_jobs
+        ]
+
+        # Возвраты считаем одним batch-запросом на чанк
+        returns_data = self._calculate_all_returns_batched(
+            [td["task"].key for td in tasks_data]
+        )
 
-        # Шаг 4: Формируем финальные строки отчета
         for task_metrics in tasks_data:
             task_key = task_metrics["task"].key
             testing_returns, external_returns = returns_data.get(task_key, (0, 0))
 
-            row = self._format_task_row(
+            yield self._format_task_row(
                 task_metrics["task"],
                 task_metrics["ttm"],
                 task_metrics["quarter_name"],
@@ -936,9 +1365,6 @@ class TTMDetailsReportGenerator:
                 task_metrics.get("current_status", ""),
                 task_metrics.get("status_group", ""),
             )
-            rows.append(row)
-
-        return rows
 
     def _format_task_row(
         self,
@@ -995,27 +1421,29 @@ class TTMDetailsReportGenerator:
             "DevLT": devlt if devlt is not None else "",
             "TTD": ttd if ttd is not None else "",
             "TTD Pause": ttd_pause if ttd_pause is not None else "",
-            "Discovery backlog (дни)": discovery_backlog_days
-            if discovery_backlog_days is not None
-            else "",
-            "Готова к разработке (дни)": ready_for_dev_days
-            if ready_for_dev_days is not None
-            else "",
-            "Возвраты с Testing": testing_returns
-            if testing_returns is not None
-            else "",
-            "Возвраты с Внешний тест": external_returns
-            if external_returns is not None
-            else "",
+            "Discovery backlog (дни)": (
+                discovery_backlog_days if discovery_backlog_days is not None else ""
+            ),
+            "Готова к разработке (дни)": (
+                ready_for_dev_days if ready_for_dev_days is not None else ""
+            ),
+            "Возвраты с Testing": (
+                testing_returns if testing_returns is not None else ""
+            ),
+            "Возвраты с Внешний тест": (
+                external_returns if external_returns is not None else ""
+            ),
             "Всего возвратов": total_returns if total_returns is not None else "",
             "Квартал TTD": ttd_quarter or "",
             "Создана": created_at.strftime("%Y-%m-%d") if created_at else "",
-            "Начало работы": last_discovery_backlog_exit_date.strftime("%Y-%m-%d")
-            if last_discovery_backlog_exit_date
-            else "",
-            "Завершено": stable_done_date.strftime("%Y-%m-%d")
-            if stable_done_date
-            else "",
+            "Начало работы": (
+                last_discovery_backlog_exit_date.strftime("%Y-%m-%d")
+                if last_discovery_backlog_exit_date
+                else ""
+            ),
+            "Завершено": (
+                stable_done_date.strftime("%Y-%m-%d") if stable_done_date else ""
+            ),
             "Разработка": 1 if has_development else 0,
             "Завершена": 1 if is_finished else 0,
             "Статус": current_status,
@@ -1040,7 +1468,10 @@ class TTMDetailsReportGenerator:
         return normalize_to_utc(as_of_date)
 
     def generate_csv(
-        self, output_path: str, as_of_date: Optional[datetime] = None
+        self,
+        output_path: str,
+        as_of_date: Optional[datetime] = None,
+        output_format: str = "csv",
     ) -> str:
         """
         Generate TTM Details CSV report.
@@ -1048,27 +1479,25 @@ class TTMDetailsReportGenerator:
         Args:
             output_path: Path to output CSV file
             as_of_date: Optional date to generate report as-of (for historical reports)
+            output_format: "csv", or "parquet"/"arrow" to also write a typed
+                columnar copy next to the CSV
 
         Returns:
             Path to generated CSV file
         """
         try:
-            # Ensure output directory exists
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-            # Collect CSV rows data
-            rows = self._collect_csv_rows(as_of_date)
-
-            # Create CSV with data
-            with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-                fieldnames = TTMDetailsColumns.COLUMN_NAMES
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
+            # Rows are written as they are computed, not collected in memory
+            with ReportTableWriter(
+                output_path, TTMDetailsColumns.get_column_types(), output_format
+            ) as writer:
+                for row in self._iter_csv_rows(as_of_date):
+                    writer.write_row(row)
 
             logger.info(
-                f"TTM Details CSV generated: {output_path} with {len(rows)} rows"
+                f"TTM Details CSV generated: {output_path} with {writer.row_count} rows"
             )
+            if writer.columnar_path:
+                logger.info(f"TTM Details {output_format} copy: {writer.columnar_path}")
             return output_path
 
         except Exception as e:
@@ -1076,6 +1505,41 @@ class TTMDetailsReportGenerator:
             raise
 
 
+# Generator instance of a worker process, created by _init_metrics_worker
+_worker_generator: Optional[TTMDetailsReportGenerator] = None
+
+
+def _history_to_tuples(history: List[StatusHistoryEntry]) -> List[HistoryTuple]:
+    """Convert history entries to compact tuples for worker processes."""
+    return [
+        (entry.status, entry.status_display, entry.start_date, entry.end_date)
+        for entry in history
+    ]
+
+
+def _init_metrics_worker(config_dir: str) -> None:
+    """Create DB-less generator once per worker process."""
+    global _worker_generator
+    _worker_generator = TTMDetailsReportGenerator(db=None, config_dir=config_dir)
+
+
+def _calculate_metrics_chunk(chunk: Tuple[Any, ...]) -> List[dict]:
+    """Calculate metrics for a chunk of compact jobs in a worker process."""
+    jobs, done_statuses, quarters, as_of_date = chunk
+    metric_jobs = [
+        (
+            task,
+            [StatusHistoryEntry(*entry) for entry in history],
+            StatusHistoryEntry(*stable_done) if stable_done else None,
+            is_finished,
+        )
+        for task, history, stable_done, is_finished in jobs
+    ]
+    return _worker_generator._calculate_task_metrics_batch(
+        metric_jobs, done_statuses, quarters, as_of_date
+    )
+
+
 def main():
     """Main function for command line execution."""
     import argparse
@@ -1093,6 +1557,19 @@ def main():
         help="Generate report as of specific date (format: YYYY-MM-DD). "
         "Useful for historical reports. If not specified, uses current date.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes for per-task metrics calculation (default: 1)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=REPORT_FORMATS,
+        default="csv",
+        help="Also write a typed Parquet or Arrow IPC copy next to the CSV "
+        "(default: csv only)",
+    )
 
     args = parser.parse_args()
 
@@ -1115,8 +1592,12 @@ def main():
                 sys.exit(1)
 
         with SessionLocal() as db:
-            generator = TTMDetailsReportGenerator(db=db, config_dir=args.config_dir)
-            csv_path = generator.generate_csv(args.output, as_of_date=as_of_date)
+            generator = TTMDetailsReportGenerator(
+                db=db, config_dir=args.config_dir, workers=args.workers
+            )
+            csv_path = generator.generate_csv(
+                args.output, as_of_date=as_of_date, output_format=args.format
+            )
             print(f"TTM Details report generated: {csv_path}")
 
     except Exception as e:
@@ -53,6 +53,54 @@ class TTMDetailsColumns:
     # Validate structure at module import time
     _validate_column_structure(COLUMN_NAMES)
 
+    # Columns that are not integer metrics (typed Parquet / Arrow output)
+    TEXT_COLUMNS: List[str] = [
+        "Ключ задачи",
+        "Название",
+        "Автор",
+        "Команда",
+        "PM Lead",
+        "Квартал",
+        "Квартал TTD",
+    ]
+    DATE_COLUMNS: List[str] = ["Создана", "Начало работы", "Завершено"]
+    # 0/1 integer flags, not metrics
+    FLAG_COLUMNS: List[str] = ["Разработка", "Завершена"]
+
+    @classmethod
+    def get_metric_columns(cls) -> List[str]:
+        """
+        Get integer metric columns (durations and return counts).
+
+        Returns:
+            List of metric column names in column order
+        """
+        return [
+            name
+            for name, kind in cls.get_column_types().items()
+            if kind == "int" and name not in cls.FLAG_COLUMNS
+        ]
+
+    @classmethod
+    def get_column_types(cls) -> Dict[str, str]:
+        """
+        Get column types for typed report output.
+
+        Returns:
+            Dictionary mapping column names to "string", "date" or "int"
+            in column order
+        """
+        return {
+            name: (
+                "string"
+                if name in cls.TEXT_COLUMNS
+                else "date"
+                if name in cls.DATE_COLUMNS
+                else "int"
+            )
+            for name in cls.COLUMN_NAMES
+        }
+
     @classmethod
     def get_column_index(cls, column_name: str) -> int:
         """
@@ -1,22 +1,17 @@
 """Service for managing author-team mapping from file."""
 
-from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
+from radiator.commands.services.mapping_file_service import MappingFileService
 from radiator.core.logging import logger
 
 
-class AuthorTeamMappingService:
+class AuthorTeamMappingService(MappingFileService):
     """Service for loading and managing author-team mapping from file."""
 
-    def __init__(self, mapping_file_path: str):
-        """
-        Initialize service with mapping file path.
-
-        Args:
-            mapping_file_path: Path to the author-team mapping file
-        """
-        self.mapping_file_path = Path(mapping_file_path)
+    def _load_mapping(self) -> Dict[str, str]:
+        """Parse the author-team mapping file."""
+        return self.load_author_team_mapping()
 
     def load_author_team_mapping(self) -> Dict[str, str]:
         """
@@ -97,8 +92,20 @@ class AuthorTeamMappingService:
         Returns:
             Team name or "Без команды" if author not found
         """
-        mapping = self.load_author_team_mapping()
-        return mapping.get(author_name, "Без команды")
+        return self._get_mapping().get(author_name, "Без команды")
+
+    def map_authors(self, author_names: Iterable[str]) -> List[str]:
+        """
+        Get team names for many authors at once.
+
+        Args:
+            author_names: Author names
+
+        Returns:
+            Team names in the same order ("Без команды" for unknown authors)
+        """
+        mapping = self._get_mapping()
+        return [mapping.get(author_name, "Без команды") for author_name in author_names]
 
     def get_all_teams(self) -> List[str]:
         """
@@ -107,7 +114,6 @@ class AuthorTeamMappingService:
         Returns:
             List of unique team names
         """
-        mapping = self.load_author_team_mapping()
-        teams = list(set(mapping.values()))
+        teams = list(set(self._get_mapping().values()))
         teams.sort()  # Sort alphabetically
         return teams
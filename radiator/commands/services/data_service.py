@@ -1,7 +1,8 @@
 """Data service for Time To Market report."""
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -20,6 +21,25 @@ from radiator.core.logging import logger
 # CRUD operations removed - using direct SQLAlchemy queries
 from radiator.models.tracker import TrackerTask, TrackerTaskHistory
 
+# Maximum number of task IDs in one IN (...) history query
+HISTORY_BATCH_CHUNK_SIZE = 5000
+
+
+def iter_chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into lists of at most size items without materializing it.
+
+    Args:
+        items: Any iterable, e.g. a streaming query
+        size: Maximum chunk length
+
+    Yields:
+        Consecutive chunks in input order
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 
 class DataService:
     """Service for data operations."""
@@ -98,6 +118,139 @@ class DataService:
             self.db.rollback()
             return []
 
+    def _tasks_for_period_query(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        status_mapping: StatusMapping,
+        metric_type: str,
+    ):
+        """
+        Build query of CPO tasks with target status transitions in the period.
+
+        Args:
+            start_date: Period start date
+            end_date: Period end date
+            status_mapping: Status mapping configuration
+            metric_type: Type of metric - "ttd", "ttm", or "both"
+
+        Returns:
+            Query of (id, key, author, created_at, summary) rows, or None if
+            there are no target statuses
+        """
+        # Determine target statuses based on metric type
+        if metric_type == "ttd":
+            target_statuses = [
+                "Готова к разработке"
+            ]  # Only this specific status for TTD
+            logger.info(
+                f"Getting tasks for TTD (Готова к разработке) in period {start_date.date()} - {end_date.date()}"
+            )
+        elif metric_type == "ttm":
+            target_statuses = status_mapping.done_statuses  # Only done statuses for TTM
+            logger.info(
+                f"Getting tasks for TTM (done statuses) in period {start_date.date()} - {end_date.date()}"
+            )
+        else:  # "both" - legacy behavior for backward compatibility
+            target_statuses = status_mapping.all_target_statuses
+            logger.info(
+                f"Getting tasks for both TTD/TTM (all target statuses) in period {start_date.date()} - {end_date.date()}"
+            )
+
+        if not target_statuses:
+            logger.warning("No target statuses found")
+            return None
+
+        # Get tasks that have target status transitions in the period using JOIN.
+        # Grouping by team also uses author, mapped via AuthorTeamMappingService
+        return (
+            self.db.query(
+                TrackerTask.id,
+                TrackerTask.key,
+                TrackerTask.author,
+                TrackerTask.created_at,
+                TrackerTask.summary,
+            )
+            .join(TrackerTaskHistory, TrackerTask.id == TrackerTaskHistory.task_id)
+            .filter(
+                TrackerTask.author.isnot(None),
+                TrackerTask.key.like("CPO-%"),
+                TrackerTaskHistory.status.in_(target_statuses),
+                TrackerTaskHistory.start_date >= start_date,
+                TrackerTaskHistory.start_date <= end_date,
+            )
+            .distinct()
+        )
+
+    def _rows_to_task_data(self, tasks: List[Any], group_by: GroupBy) -> List[TaskData]:
+        """
+        Convert (id, key, author, created_at, summary) rows to TaskData.
+
+        Args:
+            tasks: Rows of _tasks_for_period_query
+            group_by: Grouping type
+
+        Returns:
+            List of TaskData objects
+        """
+        team_by_author = {}
+        if group_by != GroupBy.AUTHOR:
+            # Map all distinct authors at once instead of one lookup per row
+            authors = list(
+                dict.fromkeys(
+                    row[2] for row in tasks if isinstance(row[2], str) and row[2]
+                )
+            )
+            team_by_author = dict(
+                zip(authors, self.author_team_mapping_service.map_authors(authors))
+            )
+
+        result = []
+        for task_id, key, group_value, created_at, summary in tasks:
+            if group_value:  # Double check group value is not None
+                try:
+                    # Handle potential encoding issues
+                    if isinstance(group_value, bytes):
+                        group_value = group_value.decode("utf-8", errors="replace")
+                    elif isinstance(group_value, str):
+                        # Ensure it's valid UTF-8
+                        group_value.encode("utf-8").decode("utf-8")
+
+                    # Determine final group value based on grouping type
+                    if group_by == GroupBy.AUTHOR:
+                        final_group_value = group_value
+                        author = group_value
+                        team = None
+                    else:  # TEAM
+                        # Map author to team using AuthorTeamMappingService
+                        team = team_by_author.get(group_value)
+                        if team is None:
+                            team = self.author_team_mapping_service.get_team_by_author(
+                                group_value
+                            )
+                        final_group_value = team
+                        author = group_value
+
+                    result.append(
+                        TaskData(
+                            id=task_id,
+                            key=key,
+                            group_value=final_group_value,
+                            author=author,
+                            team=team,
+                            created_at=created_at,
+                            summary=summary,
+                        )
+                    )
+
+                except (UnicodeDecodeError, UnicodeEncodeError) as e:
+                    logger.warning(
+                        f"Skipping task with encoding issue: {e}, task_id: {task_id}"
+                    )
+                    continue
+
+        return result
+
     def get_tasks_for_period(
         self,
         start_date: datetime,
@@ -120,117 +273,82 @@ class DataService:
             List of TaskData objects
         """
         try:
-            if group_by == GroupBy.AUTHOR:
-                group_field = TrackerTask.author
-                filter_condition = TrackerTask.author.isnot(None)
-            else:  # TEAM - use author field and map to team via AuthorTeamMappingService
-                if not self.author_team_mapping_service:
-                    logger.error(
-                        "AuthorTeamMappingService is required for team grouping"
-                    )
-                    return []
-                group_field = TrackerTask.author
-                filter_condition = TrackerTask.author.isnot(None)
-
-            # Determine target statuses based on metric type
-            if metric_type == "ttd":
-                target_statuses = [
-                    "Готова к разработке"
-                ]  # Only this specific status for TTD
-                logger.info(
-                    f"Getting tasks for TTD (Готова к разработке) in period {start_date.date()} - {end_date.date()}"
-                )
-            elif metric_type == "ttm":
-                target_statuses = (
-                    status_mapping.done_statuses
-                )  # Only done statuses for TTM
-                logger.info(
-                    f"Getting tasks for TTM (done statuses) in period {start_date.date()} - {end_date.date()}"
-                )
-            else:  # "both" - legacy behavior for backward compatibility
-                target_statuses = status_mapping.all_target_statuses
-                logger.info(
-                    f"Getting tasks for both TTD/TTM (all target statuses) in period {start_date.date()} - {end_date.date()}"
-                )
-
-            if not target_statuses:
-                logger.warning("No target statuses found")
+            if group_by != GroupBy.AUTHOR and not self.author_team_mapping_service:
+                logger.error("AuthorTeamMappingService is required for team grouping")
                 return []
 
-            # Get tasks that have target status transitions in the period using JOIN
-            tasks_query = (
-                self.db.query(
-                    TrackerTask.id,
-                    TrackerTask.key,
-                    group_field,
-                    TrackerTask.created_at,
-                    TrackerTask.summary,
-                )
-                .join(TrackerTaskHistory, TrackerTask.id == TrackerTaskHistory.task_id)
-                .filter(
-                    filter_condition,
-                    TrackerTask.key.like("CPO-%"),
-                    TrackerTaskHistory.status.in_(target_statuses),
-                    TrackerTaskHistory.start_date >= start_date,
-                    TrackerTaskHistory.start_date <= end_date,
-                )
-                .distinct()
+            tasks_query = self._tasks_for_period_query(
+                start_date, end_date, status_mapping, metric_type
             )
+            if tasks_query is None:
+                return []
 
             tasks = tasks_query.all()
             logger.info(
                 f"Found {len(tasks)} CPO tasks with {metric_type} transitions in period {start_date.date()} - {end_date.date()}"
             )
-
-            result = []
-            for task_id, key, group_value, created_at, summary in tasks:
-                if group_value:  # Double check group value is not None
-                    try:
-                        # Handle potential encoding issues
-                        if isinstance(group_value, bytes):
-                            group_value = group_value.decode("utf-8", errors="replace")
-                        elif isinstance(group_value, str):
-                            # Ensure it's valid UTF-8
-                            group_value.encode("utf-8").decode("utf-8")
-
-                        # Determine final group value based on grouping type
-                        if group_by == GroupBy.AUTHOR:
-                            final_group_value = group_value
-                            author = group_value
-                            team = None
-                        else:  # TEAM
-                            # Map author to team using AuthorTeamMappingService
-                            team = self.author_team_mapping_service.get_team_by_author(
-                                group_value
-                            )
-                            final_group_value = team
-                            author = group_value
-
-                        result.append(
-                            TaskData(
-                                id=task_id,
-                                key=key,
-                                group_value=final_group_value,
-                                author=author,
-                                team=team,
-                                created_at=created_at,
-                                summary=summary,
-                            )
-                        )
-
-                    except (UnicodeDecodeError, UnicodeEncodeError) as e:
-                        logger.warning(
-                            f"Skipping task with encoding issue: {e}, task_id: {task_id}"
-                        )
-                        continue
-
-            return result
+            return self._rows_to_task_data(tasks, group_by)
 
         except Exception as e:
             logger.error(f"Failed to get tasks for period: {e}")
             self.db.rollback()
             return []
 
+    def iter_tasks_for_period(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        group_by: GroupBy,
+        status_mapping: StatusMapping,
+        metric_type: str = "both",
+        chunk_size: int = 1000,
+    ) -> Iterator[TaskData]:
+        """
+        Stream the tasks of get_tasks_for_period in key order.
+
+        Rows are fetched from a server-side cursor chunk_size at a time, so
+        memory does not grow with the number of tasks.
+
+        Args:
+            start_date: Period start date
+            end_date: Period end date
+            group_by: Grouping type
+            status_mapping: Status mapping configuration
+            metric_type: Type of metric - "ttd", "ttm", or "both"
+            chunk_size: Rows per fetch from the cursor
+
+        Yields:
+            TaskData objects ordered by task key
+
+        Raises:
+            Exception: Database errors are logged and re-raised, so the output
+                is never silently truncated; the caller's session is not rolled
+                back
+        """
+        try:
+            if group_by != GroupBy.AUTHOR and not self.author_team_mapping_service:
+                logger.error("AuthorTeamMappingService is required for team grouping")
+                return
+
+            tasks_query = self._tasks_for_period_query(
+                start_date, end_date, status_mapping, metric_type
+            )
+            if tasks_query is None:
+                return
+
+            rows = tasks_query.order_by(TrackerTask.key).yield_per(chunk_size)
+            total = 0
+            for chunk in iter_chunks(rows, chunk_size):
+                total += len(chunk)
+                yield from self._rows_to_task_data(chunk, group_by)
+            logger.info(
+                f"Streamed {total} CPO tasks with {metric_type} transitions in period {start_date.date()} - {end_date.date()}"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to stream tasks for period: {e}")
+            raise
+
     def get_task_history(
         self, task_id: int, as_of_date: Optional[datetime] = None
     ) -> List[StatusHistoryEntry]:
@@ -374,6 +492,36 @@ class DataService:
             self.db.rollback()
             return {task_id: [] for task_id in task_ids}
 
+    def get_filtered_task_histories_batch(
+        self, task_ids: List[int], as_of_date: Optional[datetime] = None
+    ) -> Dict[int, List[StatusHistoryEntry]]:
+        """
+        Batch equivalent of get_task_history for multiple tasks.
+
+        Histories are loaded with one query per HISTORY_BATCH_CHUNK_SIZE tasks,
+        then short transitions and as_of_date filtering are applied in memory.
+
+        Args:
+            task_ids: List of task IDs to load histories for
+            as_of_date: Optional date to filter history by
+
+        Returns:
+            Dictionary mapping task_id to filtered list of StatusHistoryEntry
+        """
+        from radiator.commands.services.history_filter import HistoryFilter
+
+        unique_ids = list(dict.fromkeys(task_ids))
+        result = {}
+        for start in range(0, len(unique_ids), HISTORY_BATCH_CHUNK_SIZE):
+            chunk = unique_ids[start : start + HISTORY_BATCH_CHUNK_SIZE]
+            for task_id, history in self.get_task_histories_batch(chunk).items():
+                filtered = self._filter_short_transitions(history)
+                if as_of_date is not None:
+                    filtered = HistoryFilter.filter_by_as_of_date(filtered, as_of_date)
+                result[task_id] = filtered
+
+        return result
+
     def get_task_histories_by_keys_batch(
         self, task_keys: List[str]
     ) -> Dict[str, List[StatusHistoryEntry]]:
@@ -524,3 +672,100 @@ class DataService:
             logger.error(f"Failed to load tasks by queue {queue}: {e}")
             self.db.rollback()
             return []
+
+    def iter_tasks_by_queue(
+        self,
+        queue: str,
+        created_since: Optional[datetime] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[TaskData]:
+        """
+        Stream the tasks of get_tasks_by_queue in key order.
+
+        Only the columns needed for TaskData are selected and fetched from a
+        server-side cursor, so no ORM objects accumulate in the session.
+
+        Args:
+            queue: Tracker queue name (e.g. "CPO")
+            created_since: Optional date filter (inclusive)
+            chunk_size: Rows per fetch from the cursor
+
+        Yields:
+            TaskData objects ordered by task key
+
+        Raises:
+            Exception: Database errors are logged and re-raised, so the output
+                is never silently truncated; the caller's session is not rolled
+                back
+        """
+        try:
+            query = self.db.query(
+                TrackerTask.id,
+                TrackerTask.key,
+                TrackerTask.author,
+                TrackerTask.team,
+                TrackerTask.summary,
+                TrackerTask.created_at,
+                TrackerTask.status,
+            ).filter(TrackerTask.key.like(f"{queue}-%"))
+
+            if created_since:
+                query = query.filter(TrackerTask.created_at >= created_since)
+
+            for (
+                task_id,
+                key,
+                author,
+                team,
+                summary,
+                created_at,
+                status,
+            ) in query.order_by(TrackerTask.key).yield_per(chunk_size):
+                yield TaskData(
+                    id=task_id,
+                    key=key,
+                    group_value=author,
+                    author=author,
+                    team=team,
+                    summary=summary,
+                    created_at=created_at,
+                    status=status,
+                )
+
+        except Exception as e:
+            logger.error(f"Failed to stream tasks by queue {queue}: {e}")
+            raise
+
+    def get_statuses_by_queue(
+        self, queue: str, created_since: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Get distinct statuses from histories of queue tasks.
+
+        Args:
+            queue: Tracker queue name (e.g. "CPO")
+            created_since: Optional date filter (inclusive)
+
+        Returns:
+            Sorted list of status names
+        """
+        try:
+            query = (
+                self.db.query(TrackerTaskHistory.status)
+                .join(TrackerTask, TrackerTask.id == TrackerTaskHistory.task_id)
+                .filter(
+                    TrackerTask.key.like(f"{queue}-%"),
+                    TrackerTaskHistory.status.isnot(None),
+                    TrackerTaskHistory.status != "",
+                )
+            )
+
+            if created_since:
+                query = query.filter(TrackerTask.created_at >= created_since)
+
+            return sorted(status for (status,) in query.distinct())
+
+        except Exception as e:
+            logger.error(f"Failed to load statuses by queue {queue}: {e}")
+            self.db.rollback()
+            return []
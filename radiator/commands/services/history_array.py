@@ -0,0 +1,308 @@
+"""Columnar NumPy representation of status histories for bulk metrics."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from radiator.commands.models.time_to_market_models import StatusHistoryEntry
+
+# Timestamps are stored as int64 microseconds since Unix epoch (UTC)
+DAY_US = 86_400_000_000
+# Marker for open intervals (end_date is None)
+OPEN_END = np.iinfo(np.int64).min
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+# Scalar epoch timestamp or one timestamp per task
+Timestamps = Union[int, np.ndarray]
+
+
+def to_epoch_us(value: datetime) -> int:
+    """
+    Convert datetime to epoch microseconds (naive datetimes are treated as UTC).
+
+    Args:
+        value: Datetime to convert
+
+    Returns:
+        Microseconds since Unix epoch
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _ONE_US
+
+
+class HistoryArray:
+    """
+    Status histories of one or many tasks stored as NumPy columns.
+
+    Entries of all tasks are concatenated: task ``i`` owns positions
+    ``offsets[i]:offsets[i + 1]``. Inside each task entries are sorted by
+    start date once on construction (stable, like ``sorted``), so kernels
+    never re-sort. Statuses are int-coded via ``names``.
+
+    Every kernel returns one value per task. Build one array per batch of
+    histories (a TTM details chunk, a metrics refresh batch); single-task
+    MetricsService methods keep their own loops.
+    """
+
+    def __init__(
+        self,
+        status: np.ndarray,
+        start: np.ndarray,
+        end: np.ndarray,
+        offsets: np.ndarray,
+        names: List[str],
+        order: np.ndarray,
+    ):
+        """
+        Initialize from already sorted columns. Use from_histories instead.
+
+        Args:
+            status: Status codes (int32), indexes into names
+            start: Start timestamps in epoch microseconds (int64)
+            end: End timestamps in epoch microseconds, OPEN_END if open (int64)
+            offsets: Task boundaries, len = tasks + 1 (int64)
+            names: Status names by code
+            order: Position of each sorted entry in its task's input list
+        """
+        self.status = status
+        self.start = start
+        self.end = end
+        self.offsets = offsets
+        self.names = names
+        self.order = order
+        self._codes: Dict[str, int] = {name: code for code, name in enumerate(names)}
+
+        self.lengths = np.diff(offsets)
+        self.task_of_entry = np.repeat(np.arange(len(self.lengths)), self.lengths)
+        self._task_end = offsets[1:][self.task_of_entry]
+
+    @classmethod
+    def from_entries(cls, history: Sequence[StatusHistoryEntry]) -> "HistoryArray":
+        """
+        Build array for a single task.
+
+        Args:
+            history: Status history entries in any order
+
+        Returns:
+            HistoryArray with one task
+        """
+        return cls.from_histories([history])
+
+    @classmethod
+    def from_histories(
+        cls, histories: Iterable[Sequence[StatusHistoryEntry]]
+    ) -> "HistoryArray":
+        """
+        Build array for many tasks, sorting each history once.
+
+        Args:
+            histories: Status histories, one per task
+
+        Returns:
+            HistoryArray with one task per history
+        """
+        codes: Dict[str, int] = {}
+        status: List[int] = []
+        start: List[int] = []
+        end: List[int] = []
+        task_ids: List[int] = []
+        offsets = [0]
+
+        for task_index, history in enumerate(histories):
+            for entry in history:
+                status.append(codes.setdefault(entry.status, len(codes)))
+                start.append(to_epoch_us(entry.start_date))
+                end.append(to_epoch_us(entry.end_date) if entry.end_date else OPEN_END)
+                task_ids.append(task_index)
+            offsets.append(len(status))
+
+        offsets_array = np.array(offsets, dtype=np.int64)
+        start_array = np.array(start, dtype=np.int64)
+        # lexsort is stable: equal start dates keep input order, like sorted()
+        sort_index = np.lexsort((start_array, np.array(task_ids, dtype=np.int64)))
+        task_of_entry = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets_array))
+
+        return cls(
+            status=np.array(status, dtype=np.int32)[sort_index],
+            start=start_array[sort_index],
+            end=np.array(end, dtype=np.int64)[sort_index],
+            offsets=offsets_array,
+            names=list(codes),
+            order=sort_index - offsets_array[:-1][task_of_entry],
+        )
+
+    def __len__(self) -> int:
+        """Number of tasks."""
+        return len(self.lengths)
+
+    def code(self, status: str) -> int:
+        """Status code, -1 if status never occurs (matches nothing)."""
+        return self._codes.get(status, -1)
+
+    def is_status(self, statuses: Union[str, Iterable[str]]) -> np.ndarray:
+        """Boolean mask of entries having one of statuses."""
+        if isinstance(statuses, str):
+            return self.status == self.code(statuses)
+        codes = [self.code(status) for status in statuses]
+        return np.isin(self.status, [code for code in codes if code >= 0])
+
+    def next_index(self, mask: np.ndarray) -> np.ndarray:
+        """
+        For every entry find the next entry of the same task where mask is set.
+
+        Args:
+            mask: Boolean mask over entries
+
+        Returns:
+            Global entry index per entry, -1 if there is none
+        """
+        size = len(mask)
+        candidates = np.where(mask, np.arange(size), size)
+        suffix_min = np.minimum.accumulate(candidates[::-1])[::-1]
+        following = np.append(suffix_min[1:], size)
+        return np.where(following < self._task_end, following, -1)
+
+    def pause_days(
+        self,
+        pause_status: str,
+        since: Optional[Timestamps] = None,
+        until: Optional[Timestamps] = None,
+    ) -> np.ndarray:
+        """
+        Days spent in pause status per task.
+
+        Each pause entry lasts until the next non-pause entry (or until
+        ``until`` if there is none) and is clipped to ``[since, until]``.
+        Whole days are counted per entry, like ``timedelta.days``.
+
+        Args:
+            pause_status: Pause status name
+            since: Optional lower bound (epoch us, scalar or per task)
+            until: Optional upper bound (epoch us, scalar or per task)
+
+        Returns:
+            int64 array with pause days per task
+        """
+        is_pause = self.is_status(pause_status)
+        next_other = self.next_index(~is_pause)
+        has_next = next_other >= 0
+
+        stop = np.where(has_next, self.start[np.maximum(next_other, 0)], 0)
+        counted = is_pause & has_next
+        begin = self.start
+        if since is not None:
+            begin = np.maximum(begin, self._per_entry(since))
+        if until is not None:
+            until_per_entry = self._per_entry(until)
+            stop = np.where(
+                has_next, np.minimum(stop, until_per_entry), until_per_entry
+            )
+            counted = is_pause
+
+        days = np.maximum((stop - begin) // DAY_US, 0)
+        return self._sum_per_task(np.where(counted & (stop > begin), days, 0))
+
+    def status_days(
+        self, status: str, as_of: Optional[Timestamps] = None
+    ) -> np.ndarray:
+        """
+        Days spent in a status per task.
+
+        Each entry lasts until the next entry with another status; the last
+        interval is counted up to ``as_of`` if given, otherwise ignored.
+
+        Args:
+            status: Status name
+            as_of: Optional date for open intervals (epoch us, scalar or per task)
+
+        Returns:
+            int64 array with days per task
+        """
+        in_status = self.is_status(status)
+        next_other = self.next_index(~in_status)
+        has_next = next_other >= 0
+
+        stop = np.where(has_next, self.start[np.maximum(next_other, 0)], 0)
+        counted = in_status & has_next
+        if as_of is not None:
+            stop = np.where(has_next, stop, self._per_entry(as_of))
+            counted = in_status
+
+        days = np.maximum((stop - self.start) // DAY_US, 0)
+        return self._sum_per_task(np.where(counted, days, 0))
+
+    def stable_done_index(
+        self, done_statuses: Iterable[str], pause_status: str
+    ) -> np.ndarray:
+        """
+        Find the last stable done entry per task.
+
+        A done entry is stable if only done or pause entries follow it. If no
+        done entry is stable, the first done entry is used.
+
+        Args:
+            done_statuses: Done status names
+            pause_status: Pause status name
+
+        Returns:
+            Global entry index per task, -1 if task has no done entries
+        """
+        is_done = self.is_status(done_statuses)
+        is_other = ~is_done & ~self.is_status(pause_status)
+        positions = np.arange(len(self.status))
+
+        first_done = self._segment_reduce(
+            np.minimum, np.where(is_done, positions, len(positions)), -1
+        )
+        last_done = self._segment_reduce(
+            np.maximum, np.where(is_done, positions, -1), -1
+        )
+        last_other = self._segment_reduce(
+            np.maximum, np.where(is_other, positions, -1), -1
+        )
+
+        result = np.where(last_done > last_other, last_done, first_done)
+        return np.where(last_done >= 0, result, -1)
+
+    def status_returns(self, status: str) -> np.ndarray:
+        """
+        Count returns to a status per task (entries into status minus one).
+
+        Args:
+            status: Status name
+
+        Returns:
+            int64 array with returns per task
+        """
+        in_status = self.is_status(status)
+        previous_in_status = np.append(False, in_status[:-1])
+        # Task boundaries: the first entry of a task has no previous status
+        previous_in_status[self.offsets[:-1][self.lengths > 0]] = False
+        entries = self._sum_per_task(in_status & ~previous_in_status)
+        return np.maximum(entries - 1, 0)
+
+    def _per_entry(self, value: Timestamps) -> Union[int, np.ndarray]:
+        """Broadcast scalar or per-task value to entries."""
+        if np.ndim(value) == 0:
+            return value
+        return np.asarray(value, dtype=np.int64)[self.task_of_entry]
+
+    def _sum_per_task(self, values: np.ndarray) -> np.ndarray:
+        """Sum entry values per task."""
+        sums = np.bincount(self.task_of_entry, weights=values, minlength=len(self))
+        return np.rint(sums).astype(np.int64)
+
+    def _segment_reduce(
+        self, ufunc: np.ufunc, values: np.ndarray, empty: int
+    ) -> np.ndarray:
+        """Reduce entry values per task with ufunc, empty for tasks without entries."""
+        result = np.full(len(self), empty, dtype=np.int64)
+        non_empty = self.lengths > 0
+        if values.size:
+            result[non_empty] = ufunc.reduceat(values, self.offsets[:-1][non_empty])
+        return result
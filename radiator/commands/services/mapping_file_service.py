@@ -0,0 +1,46 @@
+"""Base class for services backed by a "key;value" mapping file."""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+
+class MappingFileService(ABC):
+    """Cache a mapping file's contents until the file changes."""
+
+    def __init__(self, mapping_file_path: str):
+        """
+        Initialize service with mapping file path.
+
+        Args:
+            mapping_file_path: Path to the mapping file
+        """
+        self.mapping_file_path = Path(mapping_file_path)
+        self._mapping: Optional[Mapping[str, str]] = None
+        self._mapping_signature: Optional[Tuple[int, int]] = None
+
+    @abstractmethod
+    def _load_mapping(self) -> Dict[str, str]:
+        """Parse the mapping file."""
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of mapping file or None if it doesn't exist."""
+        try:
+            stat = self.mapping_file_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_mapping(self) -> Mapping[str, str]:
+        """
+        Return cached read-only mapping, re-reading file only when it changed.
+
+        Returns:
+            Immutable mapping parsed by _load_mapping
+        """
+        signature = self._file_signature()
+        if self._mapping is None or signature != self._mapping_signature:
+            self._mapping = MappingProxyType(self._load_mapping())
+            self._mapping_signature = signature
+        return self._mapping
@@ -3,7 +3,7 @@
 import os
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol, Sequence
 
 import numpy as np
 
@@ -15,6 +15,7 @@ from radiator.commands.models.time_to_market_models import (
     TimeMetrics,
 )
 from radiator.commands.services.config_service import ConfigService
+from radiator.commands.services.history_array import HistoryArray, to_epoch_us
 from radiator.core.logging import logger
 
 
@@ -202,18 +203,14 @@ class MetricsService:
             total_pause_time = 0
             sorted_history = sorted(history_data, key=lambda x: x.start_date)
 
-            for i, entry in enumerate(sorted_history):
-                if entry.status == self.pause_status:
-                    # Find the next status change to calculate pause duration
-                    next_entry = None
-                    for j in range(i + 1, len(sorted_history)):
-                        if sorted_history[j].status != self.pause_status:
-                            next_entry = sorted_history[j]
-                            break
-
-                    if next_entry:
-                        pause_duration = (next_entry.start_date - entry.start_date).days
-                        total_pause_time += max(0, pause_duration)
+            # Walk backwards so the next non-pause entry is always at hand
+            next_entry = None
+            for entry in reversed(sorted_history):
+                if entry.status != self.pause_status:
+                    next_entry = entry
+                elif next_entry:
+                    pause_duration = (next_entry.start_date - entry.start_date).days
+                    total_pause_time += max(0, pause_duration)
 
             return total_pause_time
 
@@ -248,18 +245,17 @@ class MetricsService:
             total_pause_time = 0
             sorted_history = sorted(history_data, key=lambda x: x.start_date)
 
-            for i, entry in enumerate(sorted_history):
+            # Walk backwards so the next non-pause entry is always at hand
+            next_entry = None
+            for entry in reversed(sorted_history):
+                if entry.status != self.pause_status:
+                    next_entry = entry
+                    continue
+
                 # Нормализуем entry.start_date к timezone-aware (UTC)
                 entry_start = normalize_to_utc(entry.start_date)
 
-                if entry.status == self.pause_status and entry_start < end_date:
-                    # Find the next status change to calculate pause duration
-                    next_entry = None
-                    for j in range(i + 1, len(sorted_history)):
-                        if sorted_history[j].status != self.pause_status:
-                            next_entry = sorted_history[j]
-                            break
-
+                if entry_start < end_date:
                     if next_entry:
                         # Нормализуем next_entry.start_date к timezone-aware (UTC)
                         next_start = normalize_to_utc(next_entry.start_date)
@@ -306,30 +302,28 @@ class MetricsService:
             total_pause_time = 0
             sorted_history = sorted(history_data, key=lambda x: x.start_date)
 
-            for i, entry in enumerate(sorted_history):
-                if entry.status == self.pause_status:
-                    # Find the next status change to get actual pause end
-                    next_entry = None
-                    for j in range(i + 1, len(sorted_history)):
-                        if sorted_history[j].status != self.pause_status:
-                            next_entry = sorted_history[j]
-                            break
-
-                    # Determine the actual pause period
-                    pause_start = entry.start_date
-                    if next_entry:
-                        pause_end = next_entry.start_date
-                    else:
-                        # Pause continues to the end, use end_date as limit
-                        pause_end = end_date
+            # Walk backwards so the next non-pause entry is always at hand
+            next_entry = None
+            for entry in reversed(sorted_history):
+                if entry.status != self.pause_status:
+                    next_entry = entry
+                    continue
 
-                    # Check if pause period overlaps with our date range
-                    overlap_start = max(pause_start, start_date)
-                    overlap_end = min(pause_end, end_date)
+                # Determine the actual pause period
+                pause_start = entry.start_date
+                if next_entry:
+                    pause_end = next_entry.start_date
+                else:
+                    # Pause continues to the end, use end_date as limit
+                    pause_end = end_date
 
-                    if overlap_start < overlap_end:
-                        pause_duration = (overlap_end - overlap_start).days
-                        total_pause_time += max(0, pause_duration)
+                # Check if pause period overlaps with our date range
+                overlap_start = max(pause_start, start_date)
+                overlap_end = min(pause_end, end_date)
+
+                if overlap_start < overlap_end:
+                    pause_duration = (overlap_end - overlap_start).days
+                    total_pause_time += max(0, pause_duration)
 
             return total_pause_time
 
@@ -479,32 +473,14 @@ class MetricsService:
             if len(done_entries) == 1:
                 return done_entries[0]
 
-            # Check each done status for stability (from last to first)
-            for i in range(len(done_entries) - 1, -1, -1):
-                done_entry = done_entries[i]
-                # Find the position of this done in sorted history
-                done_index = sorted_history.index(done_entry)
-
-                # Check if there are any non-done, non-pause statuses after this done
-                is_stable = True
-                for j in range(done_index + 1, len(sorted_history)):
-                    next_entry = sorted_history[j]
-
-                    # If next status is done or pause, it's still stable
-                    if (
-                        next_entry.status in target_statuses
-                        or next_entry.status == "Приостановлено"
-                    ):
-                        continue
-
-                    # If next status is not-done (backlog/discovery/delivery), it's unstable
-                    is_stable = False
+            # Walk back from the end: the first done reached before any
+            # not-done status (backlog/discovery/delivery) is the last stable one
+            for entry in reversed(sorted_history):
+                if entry.status in target_statuses:
+                    return entry
+                if entry.status != self.pause_status:
                     break
 
-                # If this done is stable, return it (it's the last stable one)
-                if is_stable:
-                    return done_entry
-
             # If we get here, all done statuses are unstable, return the first one
             return done_entries[0]
 
@@ -513,6 +489,92 @@ class MetricsService:
             # Fallback to first done
             return done_entries[0] if done_entries else None
 
+    def find_stable_done_batch(
+        self,
+        histories: Sequence[List[StatusHistoryEntry]],
+        target_statuses: List[str],
+    ) -> List[Optional[StatusHistoryEntry]]:
+        """
+        Bulk version of _find_stable_done for many tasks.
+
+        Args:
+            histories: Status histories, one per task
+            target_statuses: List of done status names
+
+        Returns:
+            Stable done entry (or None) for each history, in input order
+        """
+        filtered = [
+            self._filter_short_status_transitions(history) or []
+            for history in histories
+        ]
+        history_array = HistoryArray.from_histories(filtered)
+        done_indexes = history_array.stable_done_index(
+            target_statuses, self.pause_status
+        )
+
+        result = []
+        for task_index, done_index in enumerate(done_indexes):
+            if done_index < 0:
+                result.append(None)
+            else:
+                entry_index = history_array.order[done_index]
+                result.append(filtered[task_index][entry_index])
+        return result
+
+    def calculate_pause_time_batch(
+        self,
+        histories: Sequence[List[StatusHistoryEntry]],
+        end_dates: Optional[Sequence[datetime]] = None,
+    ) -> List[int]:
+        """
+        Bulk version of calculate_pause_time for many tasks.
+
+        With end_dates it matches calculate_pause_time_up_to_date instead.
+
+        Args:
+            histories: Status histories, one per task
+            end_dates: Optional date to calculate pause time up to, one per task
+
+        Returns:
+            Pause days for each history, in input order
+        """
+        history_array = HistoryArray.from_histories(histories)
+        until = None
+        if end_dates is not None:
+            until = np.array([to_epoch_us(date) for date in end_dates], dtype=np.int64)
+        return history_array.pause_days(self.pause_status, until=until).tolist()
+
+    def calculate_status_durations_batch(
+        self,
+        histories: Sequence[List[StatusHistoryEntry]],
+        target_statuses: List[str],
+        as_of_date: Optional[datetime] = None,
+    ) -> Dict[str, List[int]]:
+        """
+        Bulk version of calculate_status_duration for several statuses.
+
+        Short transitions are filtered once per history for all statuses.
+
+        Args:
+            histories: Status histories, one per task
+            target_statuses: Status names to calculate duration for
+            as_of_date: Optional date to calculate up to (for open intervals)
+
+        Returns:
+            Days per history (in input order) for each target status
+        """
+        filtered = [
+            self._filter_short_status_transitions(history) or []
+            for history in histories
+        ]
+        history_array = HistoryArray.from_histories(filtered)
+        as_of = to_epoch_us(as_of_date) if as_of_date is not None else None
+        return {
+            status: history_array.status_days(status, as_of=as_of).tolist()
+            for status in target_statuses
+        }
+
     def calculate_tail_metric(
         self,
         history_data: List[StatusHistoryEntry],
@@ -645,32 +707,27 @@ class MetricsService:
                 return 0
 
             total_duration = 0
-            sorted_history = sorted(filtered_history, key=lambda x: x.start_date)
-
-            for i, entry in enumerate(filtered_history):
-                if entry.status == target_status:
-                    # Find the next status change to calculate duration
-                    next_entry = None
-                    for j in range(i + 1, len(filtered_history)):
-                        if filtered_history[j].status != target_status:
-                            next_entry = filtered_history[j]
-                            break
 
-                    if next_entry:
-                        duration = (next_entry.start_date - entry.start_date).days
-                        total_duration += max(0, duration)  # Ensure non-negative
-                    elif as_of_date is not None:
-                        # Open interval - use as_of_date to calculate duration
-                        from radiator.commands.services.datetime_utils import (
-                            normalize_to_utc,
-                        )
+            # Walk backwards so the next status change is always at hand
+            next_entry = None
+            for entry in reversed(filtered_history):
+                if entry.status != target_status:
+                    next_entry = entry
+                elif next_entry:
+                    duration = (next_entry.start_date - entry.start_date).days
+                    total_duration += max(0, duration)  # Ensure non-negative
+                elif as_of_date is not None:
+                    # Open interval - use as_of_date to calculate duration
+                    from radiator.commands.services.datetime_utils import (
+                        normalize_to_utc,
+                    )
 
-                        entry_start = normalize_to_utc(entry.start_date)
-                        effective_date = normalize_to_utc(as_of_date)
+                    entry_start = normalize_to_utc(entry.start_date)
+                    effective_date = normalize_to_utc(as_of_date)
 
-                        duration = (effective_date - entry_start).days
-                        total_duration += max(0, duration)
-                    # If no next entry and no as_of_date, this is open interval - no duration
+                    duration = (effective_date - entry_start).days
+                    total_duration += max(0, duration)
+                # If no next entry and no as_of_date, this is open interval - no duration
 
             return total_duration
 
@@ -971,9 +1028,9 @@ class MetricsService:
                 pause_times=pause_times if pause_times else [],
                 pause_mean=None,
                 pause_p85=None,
-                discovery_backlog_times=discovery_backlog_times
-                if discovery_backlog_times
-                else [],
+                discovery_backlog_times=(
+                    discovery_backlog_times if discovery_backlog_times else []
+                ),
                 discovery_backlog_mean=None,
                 discovery_backlog_p85=None,
                 ready_for_dev_times=ready_for_dev_times if ready_for_dev_times else [],
@@ -1017,9 +1074,9 @@ class MetricsService:
                 pause_times=pause_times if pause_times else [],
                 pause_mean=pause_mean,
                 pause_p85=pause_p85,
-                discovery_backlog_times=discovery_backlog_times
-                if discovery_backlog_times
-                else [],
+                discovery_backlog_times=(
+                    discovery_backlog_times if discovery_backlog_times else []
+                ),
                 discovery_backlog_mean=discovery_backlog_mean,
                 discovery_backlog_p85=discovery_backlog_p85,
                 ready_for_dev_times=ready_for_dev_times if ready_for_dev_times else [],
@@ -1039,9 +1096,9 @@ class MetricsService:
                 pause_times=pause_times if pause_times else [],
                 pause_mean=None,
                 pause_p85=None,
-                discovery_backlog_times=discovery_backlog_times
-                if discovery_backlog_times
-                else [],
+                discovery_backlog_times=(
+                    discovery_backlog_times if discovery_backlog_times else []
+                ),
                 discovery_backlog_mean=None,
                 discovery_backlog_p85=None,
                 ready_for_dev_times=ready_for_dev_times if ready_for_dev_times else [],
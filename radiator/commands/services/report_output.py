@@ -0,0 +1,251 @@
+"""Report output: CSV plus optional typed Parquet / Arrow IPC copy."""
+
+import csv
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import pandas as pd
+
+from radiator.core.logging import logger
+
+# Output formats of report commands (--format)
+REPORT_FORMATS = ("csv", "parquet", "arrow")
+
+# File suffix of the columnar copy written next to the CSV
+COLUMNAR_SUFFIXES = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# Logical column types of report schemas
+COLUMN_TYPES = ("string", "int", "date")
+
+
+def columnar_path(csv_path: Union[str, Path], output_format: str) -> Path:
+    """
+    Path of the columnar copy of a CSV report.
+
+    Args:
+        csv_path: Path to CSV report
+        output_format: "parquet" or "arrow"
+
+    Returns:
+        CSV path with the format suffix
+    """
+    return Path(csv_path).with_suffix(COLUMNAR_SUFFIXES[output_format])
+
+
+def find_columnar_report(csv_path: Union[str, Path]) -> Optional[Path]:
+    """
+    Find columnar copy of a CSV report that is not older than the CSV.
+
+    Args:
+        csv_path: Path to CSV report (may not exist)
+
+    Returns:
+        Path to .parquet or .arrow file, or None if there is no fresh copy
+    """
+    csv_path = Path(csv_path)
+    if csv_path.suffix in COLUMNAR_SUFFIXES.values():
+        return csv_path if csv_path.exists() else None
+
+    csv_mtime = csv_path.stat().st_mtime if csv_path.exists() else None
+    for output_format in COLUMNAR_SUFFIXES:
+        path = columnar_path(csv_path, output_format)
+        if not path.exists():
+            continue
+        if csv_mtime is not None and path.stat().st_mtime < csv_mtime:
+            # CSV перегенерирован без --format, колоночная копия устарела
+            continue
+        return path
+    return None
+
+
+def read_columnar_report(path: Path, dates_as_text: bool = False) -> pd.DataFrame:
+    """
+    Read Parquet or Arrow IPC report without text parsing.
+
+    Integer columns with nulls come back as float64 with NaN, the same as
+    pd.read_csv, so consumers written for CSV keep working.
+
+    Args:
+        path: Path to .parquet or .arrow file
+        dates_as_text: Format date columns as YYYY-MM-DD strings (as in CSV)
+
+    Returns:
+        DataFrame with report columns in schema order
+    """
+    if path.suffix == COLUMNAR_SUFFIXES["parquet"]:
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_feather(path)
+
+    if dates_as_text:
+        for column in df.columns:
+            values = df[column].dropna()
+            if not values.empty and isinstance(values.iloc[0], date):
+                df[column] = df[column].map(
+                    lambda value: value.isoformat() if isinstance(value, date) else ""
+                )
+    return df
+
+
+def read_report_table(csv_path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Read report, preferring its columnar copy over the CSV.
+
+    Args:
+        csv_path: Path to CSV report
+
+    Returns:
+        DataFrame with report data
+    """
+    columnar = find_columnar_report(csv_path)
+    if columnar is not None:
+        logger.debug(f"Reading columnar report {columnar}")
+        return read_columnar_report(columnar)
+    return pd.read_csv(csv_path)
+
+
+def _to_date(value: Any) -> Optional[date]:
+    """Convert report date value (date, datetime or YYYY-MM-DD) to date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+class ReportTableWriter:
+    """
+    Stream report rows to CSV and, for parquet/arrow, to a typed columnar copy.
+
+    Rows are buffered only up to BATCH_ROWS before a record batch is written,
+    so the columnar copy keeps the memory profile of the CSV writer. Empty
+    strings in the CSV rows become nulls in the columnar copy.
+
+    Usage:
+        with ReportTableWriter(path, columns, "parquet") as writer:
+            for row in rows:
+                writer.write_row(row)
+    """
+
+    # Rows per record batch of the columnar copy
+    BATCH_ROWS = 5000
+
+    def __init__(
+        self,
+        csv_path: Union[str, Path],
+        columns: Mapping[str, str],
+        output_format: str = "csv",
+    ):
+        """
+        Initialize report writer.
+
+        Args:
+            csv_path: Path to CSV report
+            columns: Column name -> type ("string", "int", "date") in CSV order
+            output_format: One of REPORT_FORMATS
+
+        Raises:
+            ValueError: If format or column type is unknown
+        """
+        if output_format not in REPORT_FORMATS:
+            raise ValueError(
+                f"Unknown report format '{output_format}', "
+                f"expected one of {', '.join(REPORT_FORMATS)}"
+            )
+        unknown = {kind for kind in columns.values() if kind not in COLUMN_TYPES}
+        if unknown:
+            raise ValueError(f"Unknown column types: {sorted(unknown)}")
+
+        self.csv_path = Path(csv_path)
+        self.columns = dict(columns)
+        self.output_format = output_format
+        self.row_count = 0
+        self._csv_file = None
+        self._csv_writer: Optional[csv.DictWriter] = None
+        self._sink = None
+        self._schema = None
+        self._buffer: Dict[str, List[Any]] = {}
+
+    @property
+    def columnar_path(self) -> Optional[Path]:
+        """Path of the columnar copy, None for plain CSV output."""
+        if self.output_format == "csv":
+            return None
+        return columnar_path(self.csv_path, self.output_format)
+
+    def __enter__(self) -> "ReportTableWriter":
+        self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+        self._csv_file = open(self.csv_path, "w", newline="", encoding="utf-8")
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=list(self.columns))
+        self._csv_writer.writeheader()
+
+        if self.output_format != "csv":
+            self._open_sink()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # CSV закрываем первым: колоночная копия не должна быть старше CSV,
+        # иначе find_columnar_report сочтет ее устаревшей
+        self._csv_file.close()
+        if self._sink is not None:
+            if exc_type is None:
+                self._flush()
+            self._sink.close()
+        if exc_type is not None:
+            # Не оставляем недописанный отчет: его подхватили бы мониторы CSV
+            self.csv_path.unlink(missing_ok=True)
+            if self.columnar_path:
+                self.columnar_path.unlink(missing_ok=True)
+
+    def _open_sink(self) -> None:
+        """Open Parquet / Arrow IPC writer with schema built from column types."""
+        import pyarrow as pa
+
+        arrow_types = {"string": pa.string(), "int": pa.int64(), "date": pa.date32()}
+        self._schema = pa.schema(
+            [(name, arrow_types[kind]) for name, kind in self.columns.items()]
+        )
+        self._buffer = {name: [] for name in self.columns}
+
+        if self.output_format == "parquet":
+            import pyarrow.parquet as pq
+
+            self._sink = pq.ParquetWriter(self.columnar_path, self._schema)
+        else:
+            self._sink = pa.ipc.new_file(str(self.columnar_path), self._schema)
+
+    def write_row(self, row: Dict[str, Any]) -> None:
+        """
+        Write one report row.
+
+        Args:
+            row: Row dictionary with CSV values
+        """
+        self._csv_writer.writerow(row)
+        self.row_count += 1
+
+        if self._sink is None:
+            return
+        for name, kind in self.columns.items():
+            value = row.get(name)
+            if value is None or value == "":
+                value = None
+            elif kind == "int":
+                value = int(value)
+            elif kind == "date":
+                value = _to_date(value)
+            else:
+                value = str(value)
+            self._buffer[name].append(value)
+        if len(self._buffer[next(iter(self.columns))]) >= self.BATCH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write buffered rows as one row group / record batch."""
+        import pyarrow as pa
+
+        if not self._buffer or not next(iter(self._buffer.values())):
+            return
+        self._sink.write_table(pa.Table.from_pydict(self._buffer, schema=self._schema))
+        self._buffer = {name: [] for name in self.columns}
@@ -0,0 +1,255 @@
+"""Streaming pipeline for Tracker sync: search, upsert, changelogs, history."""
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from tqdm import tqdm
+
+from radiator.core.logging import logger
+from radiator.services.tracker_service import tracker_service
+
+# Polling interval for blocking waits, so threads notice stop requests
+POLL_INTERVAL = 0.1
+
+
+@dataclass
+class PipelineResult:
+    """Totals collected by SyncPipeline."""
+
+    tasks_found: int = 0
+    tasks_created: int = 0
+    tasks_updated: int = 0
+    history_entries: int = 0
+    tasks_with_history: int = 0
+    api_errors: int = 0
+    pages: int = 0
+
+
+@dataclass
+class PendingPage:
+    """Persisted search page waiting for its changelogs."""
+
+    tasks_data: List[tuple[str, Optional[Dict[str, Any]]]]
+    db_tasks: Dict[str, Any]
+    fetch_ids: List[str]
+    last_changelog_ids: Dict[str, str]
+
+
+class SyncPipeline:
+    """
+    Overlap Tracker search, task upserts, changelog fetches and history writes.
+
+    Stages:
+    1. search thread - yields search result pages (iter_search_pages)
+    2. main thread - upserts each page, then queues its changelog fetch
+    3. fetch thread - loads changelogs for a page (get_changelogs_batch)
+    4. main thread - rebuilds and saves history for fetched changelogs
+
+    All DB work stays in the calling thread, so the SQLAlchemy session is never
+    shared. Backpressure: at most ``max_pages`` pages are in flight between
+    search and finished history write; search blocks until a slot is free.
+    """
+
+    def __init__(
+        self,
+        sync_cmd,
+        max_pages: int = 4,
+        skip_history: bool = False,
+        force_full_history: bool = True,
+    ):
+        """
+        Initialize pipeline.
+
+        Args:
+            sync_cmd: TrackerSyncCommand providing DB session and persistence
+            max_pages: Maximum number of search pages in flight
+            skip_history: Only upsert tasks, don't fetch changelogs
+            force_full_history: Rebuild full history instead of incremental update
+        """
+        self.sync_cmd = sync_cmd
+        self.max_pages = max(1, max_pages)
+        self.skip_history = skip_history
+        self.force_full_history = force_full_history
+
+        self._slots = threading.BoundedSemaphore(self.max_pages)
+        # Each in-flight page produces at most two events
+        self._events: queue.Queue = queue.Queue(maxsize=2 * self.max_pages + 2)
+        self._fetch_queue: queue.Queue = queue.Queue(maxsize=self.max_pages)
+        self._stop = threading.Event()
+
+    def run(self, query: str, limit: Optional[int] = None) -> PipelineResult:
+        """
+        Run pipeline until all pages are persisted.
+
+        Args:
+            query: Tracker search query
+            limit: Maximum number of tasks (None - all matching)
+
+        Returns:
+            PipelineResult with totals
+
+        Raises:
+            Exception: First error raised by search or fetch stage
+        """
+        result = PipelineResult()
+        threads = [
+            threading.Thread(
+                target=self._search_worker,
+                args=(query, limit),
+                name="sync-search",
+                daemon=True,
+            )
+        ]
+        if not self.skip_history:
+            threads.append(
+                threading.Thread(
+                    target=self._fetch_worker, name="sync-changelogs", daemon=True
+                )
+            )
+        for thread in threads:
+            thread.start()
+
+        pages_in_flight = 0
+        search_done = False
+        try:
+            with tqdm(desc="🚀 Конвейер синхронизации", unit="задача") as pbar:
+                while not (search_done and pages_in_flight == 0):
+                    kind, payload = self._events.get()
+
+                    if kind == "error":
+                        raise payload
+                    if kind == "search_done":
+                        search_done = True
+                        continue
+
+                    if kind == "tasks":
+                        pages_in_flight += 1
+                        page_tasks_data = self._upsert_page(payload, result)
+                        if self.skip_history:
+                            self._finish_page(pbar, len(payload))
+                            pages_in_flight -= 1
+                        else:
+                            self._put(
+                                self._fetch_queue, self._plan_fetch(page_tasks_data)
+                            )
+                    elif kind == "history":
+                        page, changelogs_data = payload
+                        self._persist_history(page, changelogs_data, result)
+                        self._finish_page(pbar, len(page.tasks_data))
+                        pages_in_flight -= 1
+        finally:
+            self._stop.set()
+            if not self.skip_history:
+                # Wake up fetch worker if it's waiting for work
+                try:
+                    self._fetch_queue.put_nowait(None)
+                except queue.Full:
+                    pass
+            for thread in threads:
+                thread.join(timeout=5)
+
+        return result
+
+    def _search_worker(self, query: str, limit: Optional[int]) -> None:
+        """Stream search pages into events queue, waiting for free slots."""
+        try:
+            pages = tracker_service.iter_search_pages(
+                query, limit, expand=self.sync_cmd.expand, fields=self.sync_cmd.fields
+            )
+            for page_tasks in pages:
+                if not self._acquire_slot():
+                    return
+                self._put(self._events, ("tasks", page_tasks))
+            self._put(self._events, ("search_done", None))
+        except Exception as e:
+            logger.error(f"❌ Ошибка поиска задач в конвейере: {e}")
+            self._put(self._events, ("error", e))
+
+    def _fetch_worker(self) -> None:
+        """Fetch changelogs for persisted pages."""
+        try:
+            while not self._stop.is_set():
+                try:
+                    page = self._fetch_queue.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                if page is None:
+                    return
+                changelogs_data = (
+                    tracker_service.get_changelogs_batch(
+                        page.fetch_ids, page.last_changelog_ids
+                    )
+                    if page.fetch_ids
+                    else []
+                )
+                self._put(self._events, ("history", (page, changelogs_data)))
+        except Exception as e:
+            logger.error(f"❌ Ошибка загрузки истории в конвейере: {e}")
+            self._put(self._events, ("error", e))
+
+    def _upsert_page(
+        self, page_tasks: List[Dict[str, Any]], result: PipelineResult
+    ) -> List[tuple[str, Optional[Dict[str, Any]]]]:
+        """Save one search page of tasks and update totals."""
+        tasks_result, page_tasks_data, api_errors = self.sync_cmd.sync_tasks(page_tasks)
+        result.pages += 1
+        result.tasks_found += len(page_tasks)
+        result.tasks_created += tasks_result["created"]
+        result.tasks_updated += tasks_result["updated"]
+        result.api_errors += api_errors
+        return page_tasks_data
+
+    def _plan_fetch(
+        self, page_tasks_data: List[tuple[str, Optional[Dict[str, Any]]]]
+    ) -> PendingPage:
+        """Decide which changelogs of a just persisted page must be fetched."""
+        task_ids = [task_id for task_id, _ in page_tasks_data]
+        db_tasks = self.sync_cmd._load_db_tasks(task_ids)
+        fetch_ids, last_changelog_ids = self.sync_cmd._plan_changelog_fetch(
+            task_ids, db_tasks, self.force_full_history
+        )
+        return PendingPage(page_tasks_data, db_tasks, fetch_ids, last_changelog_ids)
+
+    def _persist_history(
+        self,
+        page: PendingPage,
+        changelogs_data: List[tuple[str, Optional[List[Dict[str, Any]]]]],
+        result: PipelineResult,
+    ) -> None:
+        """Rebuild history for one page and update totals."""
+        tasks_dict = {
+            task_id: task_data for task_id, task_data in page.tasks_data if task_data
+        }
+        (
+            history_entries,
+            tasks_with_history,
+            api_errors,
+        ) = self.sync_cmd._persist_task_histories(
+            changelogs_data, tasks_dict, self.force_full_history, db_tasks=page.db_tasks
+        )
+        result.history_entries += history_entries
+        result.tasks_with_history += tasks_with_history
+        result.api_errors += api_errors
+
+    def _finish_page(self, pbar: tqdm, tasks_count: int) -> None:
+        """Free a slot for the search stage."""
+        self._slots.release()
+        pbar.update(tasks_count)
+
+    def _acquire_slot(self) -> bool:
+        """Wait for a free page slot. Returns False if pipeline is stopping."""
+        while not self._stop.is_set():
+            if self._slots.acquire(timeout=POLL_INTERVAL):
+                return True
+        return False
+
+    def _put(self, target: queue.Queue, item: Any) -> None:
+        """Put item into bounded queue unless pipeline is stopping."""
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
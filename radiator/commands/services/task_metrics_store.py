@@ -0,0 +1,165 @@
+"""Materialized per-task metrics (tracker_task_metrics) for TTM reports."""
+
+import hashlib
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from radiator.core.logging import logger
+from radiator.models.tracker import TrackerTask, TrackerTaskMetrics
+
+
+class TaskMetricsStore:
+    """
+    Read and refresh precomputed metrics of finished tasks.
+
+    Rows are stored only for tasks with stable done: their metrics depend on
+    history and status configuration, not on the current date. A row is fresh
+    while its history_version equals tracker_tasks.last_changelog_id and its
+    config_version matches current configuration.
+    """
+
+    # Tasks per history query / insert during refresh and load
+    BATCH_SIZE = 1000
+
+    def __init__(self, db: Session, config_dir: str = "data/config"):
+        """
+        Initialize metrics store.
+
+        Args:
+            db: Database session
+            config_dir: Configuration directory path
+        """
+        self.db = db
+        self.config_dir = config_dir
+
+    def config_version(self) -> str:
+        """
+        Fingerprint of configuration the metrics depend on.
+
+        Returns:
+            Short hash of status_order.txt and minimal status duration
+        """
+        status_order = Path(self.config_dir) / "status_order.txt"
+        digest = hashlib.sha256(
+            status_order.read_bytes() if status_order.exists() else b""
+        )
+        digest.update(os.getenv("MIN_STATUS_DURATION_SECONDS", "300").encode())
+        return digest.hexdigest()[:16]
+
+    def refresh(self, task_ids: Iterable[int]) -> int:
+        """
+        Recompute stored metrics for tasks.
+
+        Finished tasks get new rows, rows of tasks without stable done are removed.
+
+        Args:
+            task_ids: Task IDs (tracker_tasks.id) whose history changed
+
+        Returns:
+            Number of stored rows
+        """
+        from radiator.commands.generate_ttm_details_report import (
+            TTMDetailsReportGenerator,
+        )
+
+        generator = TTMDetailsReportGenerator(self.db, self.config_dir)
+        done_statuses = generator._load_done_statuses()
+        config_version = self.config_version()
+        computed_at = datetime.now(timezone.utc)
+
+        unique_ids = sorted(set(task_ids))
+        stored = 0
+        for start in range(0, len(unique_ids), self.BATCH_SIZE):
+            batch = unique_ids[start : start + self.BATCH_SIZE]
+            versions = dict(
+                self.db.query(
+                    TrackerTask.id, func.coalesce(TrackerTask.last_changelog_id, "")
+                ).filter(TrackerTask.id.in_(batch))
+            )
+            histories = generator.data_service.get_filtered_task_histories_batch(
+                list(versions)
+            )
+
+            # Stable done and history metrics are computed for the whole batch
+            task_histories = [histories.get(task_id, []) for task_id in versions]
+            stable_dones = generator.metrics_service.find_stable_done_batch(
+                task_histories, done_statuses
+            )
+            finished = [
+                (task_id, history_version, history, stable_done)
+                for (task_id, history_version), history, stable_done in zip(
+                    versions.items(), task_histories, stable_dones
+                )
+                if stable_done
+            ]
+            history_metrics = generator._calculate_history_metrics_batch(
+                [history for _, _, history, _ in finished]
+            )
+
+            rows = []
+            for (task_id, history_version, history, stable_done), metrics in zip(
+                finished, history_metrics
+            ):
+                row = generator._calculate_history_metrics(
+                    task_id, history, done_statuses, stable_done, metrics
+                )
+                row.update(
+                    task_id=task_id,
+                    history_version=history_version,
+                    config_version=config_version,
+                    computed_at=computed_at,
+                )
+                rows.append(row)
+
+            self.db.query(TrackerTaskMetrics).filter(
+                TrackerTaskMetrics.task_id.in_(batch)
+            ).delete(synchronize_session=False)
+            if rows:
+                self.db.execute(insert(TrackerTaskMetrics), rows)
+            self.db.commit()
+            stored += len(rows)
+
+        logger.info(f"Refreshed metrics for {stored} of {len(unique_ids)} tasks")
+        return stored
+
+    def load_fresh(self, task_ids: List[int]) -> Dict[int, TrackerTaskMetrics]:
+        """
+        Load stored metrics that are still valid for current history and config.
+
+        Args:
+            task_ids: Task IDs to load metrics for
+
+        Returns:
+            Dictionary mapping task_id to TrackerTaskMetrics (stale rows omitted)
+        """
+        if not task_ids:
+            return {}
+
+        try:
+            config_version = self.config_version()
+            result = {}
+            for start in range(0, len(task_ids), self.BATCH_SIZE):
+                batch = task_ids[start : start + self.BATCH_SIZE]
+                rows = (
+                    self.db.query(TrackerTaskMetrics)
+                    .join(TrackerTask, TrackerTask.id == TrackerTaskMetrics.task_id)
+                    .filter(
+                        TrackerTaskMetrics.task_id.in_(batch),
+                        TrackerTaskMetrics.config_version == config_version,
+                        TrackerTaskMetrics.history_version
+                        == func.coalesce(TrackerTask.last_changelog_id, ""),
+                    )
+                    .all()
+                )
+                result.update({row.task_id: row for row in rows})
+            return result
+
+        except Exception as e:
+            logger.warning(f"Failed to load stored task metrics: {e}")
+            self.db.rollback()
+            return {}
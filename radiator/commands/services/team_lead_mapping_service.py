@@ -1,22 +1,17 @@
 """Service for managing team-lead mapping from file."""
 
-from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, List
 
+from radiator.commands.services.mapping_file_service import MappingFileService
 from radiator.core.logging import logger
 
 
-class TeamLeadMappingService:
+class TeamLeadMappingService(MappingFileService):
     """Service for loading and managing team-lead mapping from file."""
 
-    def __init__(self, mapping_file_path: str):
-        """
-        Initialize service with mapping file path.
-
-        Args:
-            mapping_file_path: Path to the team-lead mapping file
-        """
-        self.mapping_file_path = Path(mapping_file_path)
+    def _load_mapping(self) -> Dict[str, str]:
+        """Parse the team-lead mapping file."""
+        return self.load_team_lead_mapping()
 
     def load_team_lead_mapping(self) -> Dict[str, str]:
         """
@@ -97,5 +92,17 @@ class TeamLeadMappingService:
         Returns:
             PM Lead name or "Без команды" if team not found
         """
-        mapping = self.load_team_lead_mapping()
-        return mapping.get(team_name, "Без команды")
+        return self._get_mapping().get(team_name, "Без команды")
+
+    def map_teams(self, team_names: Iterable[str]) -> List[str]:
+        """
+        Get PM Lead names for many teams at once.
+
+        Args:
+            team_names: Team names
+
+        Returns:
+            PM Lead names in the same order ("Без команды" for unknown teams)
+        """
+        mapping = self._get_mapping()
+        return [mapping.get(team_name, "Без команды") for team_name in team_names]
@@ -2,10 +2,34 @@
 
 from typing import Dict, List, Optional, Set
 
+from sqlalchemy import text
+
 from radiator.commands.models.time_to_market_models import StatusHistoryEntry
+from radiator.commands.services.history_array import HistoryArray
 from radiator.core.database import SessionLocal
 from radiator.core.logging import logger
-from radiator.models.tracker import TrackerTask
+from radiator.models.tracker import TrackerTask, TrackerTaskLink
+
+# Subtask edges (child -> parent) come from tracker_task_links via the
+# (dst_key, type_id, direction) index; UNION in the recursive part discards
+# (root, task) pairs that were already found, so cycles terminate and depth
+# is unlimited.
+HIERARCHY_QUERY = """
+    WITH RECURSIVE hierarchy(root_key, task_key) AS (
+        SELECT root_key, root_key FROM unnest(CAST(:root_keys AS text[])) AS root_key
+        UNION
+        SELECT h.root_key, e.src_key
+        FROM hierarchy h
+        JOIN tracker_task_links e
+            ON e.dst_key = h.task_key
+            AND e.type_id = 'subtask'
+            AND e.direction = 'inward'
+        WHERE e.src_key LIKE 'FULLSTACK%'
+    )
+    SELECT root_key, task_key
+    FROM hierarchy
+    WHERE task_key <> root_key
+"""
 
 
 class TestingReturnsService:
@@ -78,27 +102,15 @@ class TestingReturnsService:
             return self._fullstack_links_cache[cpo_task_key]
 
         try:
-            task = (
-                self.db.query(TrackerTask)
-                .filter(TrackerTask.key == cpo_task_key)
-                .first()
-            )
-
-            if not task or not task.links:
-                self._fullstack_links_cache[cpo_task_key] = []
-                return []
-
-            # Filter FULLSTACK relates (both inward and outward)
+            # Both inward and outward relates count:
             # Outward: CPO -> FULLSTACK (CPO task has outward link to FULLSTACK)
             # Inward: FULLSTACK -> CPO (FULLSTACK task has inward link from CPO)
-            fullstack_keys = []
-            for link in task.links:
-                if link and isinstance(link, dict):  # Check if link is valid
-                    if link.get("type", {}).get("id") == "relates" and link.get(
-                        "object", {}
-                    ).get("key", "").startswith("FULLSTACK"):
-                        # Accept both inward and outward directions
-                        fullstack_keys.append(link["object"]["key"])
+            rows = (
+                self._fullstack_links_query()
+                .filter(TrackerTaskLink.src_key == cpo_task_key)
+                .all()
+            )
+            fullstack_keys = [dst_key for _, dst_key in rows]
 
             # Cache the result
             self._fullstack_links_cache[cpo_task_key] = fullstack_keys
@@ -114,11 +126,7 @@ class TestingReturnsService:
         self, parent_key: str, visited: Optional[Set[str]] = None
     ) -> List[str]:
         """
-        Recursively get epic + all subtasks using optimized JSONB query.
-
-        OPTIMIZATION: Instead of loading ALL FULLSTACK tasks (10k+),
-        we only load tasks that have a link to parent_key.
-        This reduces 62,111 queries to ~10-20 queries.
+        Get epic + all subtasks with a single recursive query.
 
         Args:
             parent_key: Parent task key
@@ -138,46 +146,45 @@ class TestingReturnsService:
             return self._task_hierarchy_cache[parent_key]
 
         visited.add(parent_key)
-        result = [parent_key]
+        descendants = self.get_descendants_batch([parent_key]).get(parent_key, [])
+        result = [parent_key] + [key for key in descendants if key not in visited]
+        visited.update(result)
 
-        try:
-            # ✅ OPTIMIZED: Single query to find subtasks using JSONB operators
-            # Only load tasks that actually link to parent_key
-            from sqlalchemy import text
-
-            query = text(
-                """
-                SELECT key, links
-                FROM tracker_tasks
-                WHERE key LIKE 'FULLSTACK%'
-                AND links IS NOT NULL
-                AND jsonb_typeof(links) = 'array'
-                AND EXISTS (
-                    SELECT 1
-                    FROM jsonb_array_elements(links) AS link
-                    WHERE link->'type'->>'id' = 'subtask'
-                    AND link->>'direction' = 'inward'
-                    AND link->'object'->>'key' = :parent_key
-                )
-            """
-            )
+        self._task_hierarchy_cache[parent_key] = result
+        return result
 
-            subtasks = self.db.execute(query, {"parent_key": parent_key}).fetchall()
+    def get_descendants_batch(self, root_keys: List[str]) -> Dict[str, List[str]]:
+        """
+        Resolve all FULLSTACK subtasks of many roots in one recursive query.
 
-            # Recursively process each subtask
-            for subtask_key, subtask_links in subtasks:
-                if subtask_key not in visited:
-                    result.extend(self.get_task_hierarchy(subtask_key, visited))
+        Subtask edges are projected from links once, then traversed with
+        WITH RECURSIVE. UNION discards already found (root, task) pairs, which
+        protects from cycles without a depth limit.
+
+        Args:
+            root_keys: Root task keys
+
+        Returns:
+            Dict mapping root key to list of descendant keys (root excluded)
+        """
+        result: Dict[str, List[str]] = {key: [] for key in root_keys}
+        if not root_keys:
+            return result
+
+        try:
+            rows = self.db.execute(
+                text(HIERARCHY_QUERY), {"root_keys": list(result)}
+            ).fetchall()
+
+            for root_key, task_key in rows:
+                result[root_key].append(task_key)
 
-            # Cache the result
-            self._task_hierarchy_cache[parent_key] = result
             return result
 
         except Exception as e:
-            logger.warning(f"Failed to get task hierarchy for {parent_key}: {e}")
+            logger.warning(f"Failed to resolve task hierarchy: {e}")
             self.db.rollback()
-            self._task_hierarchy_cache[parent_key] = [parent_key]
-            return [parent_key]
+            return {key: [] for key in root_keys}
 
     def calculate_testing_returns_for_task(
         self, task_key: str, history: List[StatusHistoryEntry]
@@ -197,6 +204,27 @@ class TestingReturnsService:
 
         return testing_returns, external_returns
 
+    def calculate_testing_returns_batch(
+        self, histories: Dict[str, List[StatusHistoryEntry]]
+    ) -> Dict[str, tuple[int, int]]:
+        """
+        Bulk version of calculate_testing_returns_for_task for many tasks.
+
+        Args:
+            histories: Status history by task key
+
+        Returns:
+            Dict mapping task key to (testing_returns, external_test_returns)
+        """
+        if not histories:
+            return {}
+
+        history_array = HistoryArray.from_histories(histories.values())
+        testing_returns = history_array.status_returns("Testing").tolist()
+        external_returns = history_array.status_returns("Внешний тест").tolist()
+
+        return dict(zip(histories, zip(testing_returns, external_returns)))
+
     def _batch_check_task_existence(self, task_keys: List[str]) -> Set[str]:
         """
         Batch check which tasks exist in the database.
@@ -378,24 +406,16 @@ class TestingReturnsService:
 
         try:
             # Batch query for all tasks
-            tasks = (
-                self.db.query(TrackerTask.key, TrackerTask.links)
-                .filter(TrackerTask.key.in_(uncached_keys))
+            rows = (
+                self._fullstack_links_query()
+                .filter(TrackerTaskLink.src_key.in_(uncached_keys))
                 .all()
             )
 
-            # Process links
-            for task_key, links in tasks:
-                fullstack_keys = []
-                if links:
-                    for link in links:
-                        if link and isinstance(link, dict):
-                            if link.get("type", {}).get("id") == "relates" and link.get(
-                                "object", {}
-                            ).get("key", "").startswith("FULLSTACK"):
-                                fullstack_keys.append(link["object"]["key"])
-
-                self._fullstack_links_cache[task_key] = fullstack_keys
+            for task_key in uncached_keys:
+                self._fullstack_links_cache[task_key] = []
+            for task_key, fullstack_key in rows:
+                self._fullstack_links_cache[task_key].append(fullstack_key)
 
             # Return all results
             return {k: self._fullstack_links_cache.get(k, []) for k in cpo_task_keys}
@@ -404,20 +424,29 @@ class TestingReturnsService:
             logger.warning(f"Failed to batch load FULLSTACK links: {e}")
             return {k: [] for k in cpo_task_keys}
 
+    def _fullstack_links_query(self):
+        """Query (src_key, dst_key) of relates links to FULLSTACK tasks."""
+        return (
+            self.db.query(TrackerTaskLink.src_key, TrackerTaskLink.dst_key)
+            .filter(
+                TrackerTaskLink.type_id == "relates",
+                TrackerTaskLink.dst_key.like("FULLSTACK%"),
+            )
+            .distinct()
+            .order_by(TrackerTaskLink.src_key, TrackerTaskLink.dst_key)
+        )
+
     def build_fullstack_hierarchy_batched(
-        self, cpo_task_keys: List[str], max_depth: int = 6
+        self, cpo_task_keys: List[str]
     ) -> Dict[str, List[str]]:
         """
-        Build FULLSTACK hierarchy for multiple CPO tasks with depth limit.
+        Build FULLSTACK hierarchy for multiple CPO tasks.
 
-        Загружает иерархию за несколько проходов:
-        1. Получаем все CPO задачи и их прямые FULLSTACK связи
-        2. Для каждого уровня глубины ищем дочерние FULLSTACK задачи
-        3. Останавливаемся на глубине 6 или когда нет новых задач
+        Прямые FULLSTACK связи загружаются одним запросом, все уровни
+        подзадач — одним рекурсивным запросом для всех эпиков сразу.
 
         Args:
             cpo_task_keys: List of CPO task keys
-            max_depth: Maximum depth for hierarchy traversal (default 6)
 
         Returns:
             Dict mapping CPO key to list of all related FULLSTACK keys
@@ -426,63 +455,17 @@ class TestingReturnsService:
             f"Building FULLSTACK hierarchy for {len(cpo_task_keys)} CPO tasks..."
         )
 
-        # Step 1: Batch load direct FULLSTACK links for all CPO tasks
         cpo_to_fullstack = self.batch_load_fullstack_links(cpo_task_keys)
 
-        # Step 2: Initialize state for each CPO task
-        # Храним для каждой CPO: все найденные задачи + родители текущего уровня
-        cpo_state = {}
-        for cpo_key, direct_fullstack_keys in cpo_to_fullstack.items():
-            if not direct_fullstack_keys:
-                cpo_state[cpo_key] = {"all_tasks": set(), "current_parents": set()}
-            else:
-                cpo_state[cpo_key] = {
-                    "all_tasks": set(direct_fullstack_keys),
-                    "current_parents": set(direct_fullstack_keys),
-                }
-
-        # Step 3: Iterate through depth levels
-        for depth in range(1, max_depth + 1):
-            # Собираем всех уникальных родителей от ВСЕХ CPO задач
-            all_current_parents = set()
-            for state in cpo_state.values():
-                all_current_parents.update(state["current_parents"])
-
-            if not all_current_parents:
-                break
+        epic_keys = sorted({key for keys in cpo_to_fullstack.values() for key in keys})
+        descendants = self.get_descendants_batch(epic_keys)
 
-            logger.info(
-                f"Processing depth {depth} with {len(all_current_parents)} unique parents..."
-            )
-
-            # ОДИН батчевый запрос для всех родителей
-            children_batch = self.get_task_hierarchy_batch(list(all_current_parents))
-
-            # Обновляем каждую CPO задачу ИНДИВИДУАЛЬНО
-            for cpo_key, state in cpo_state.items():
-                next_parents = set()
-
-                # Для каждого родителя ЭТОЙ конкретной CPO задачи
-                for parent in state["current_parents"]:
-                    children = children_batch.get(parent, [])
-                    for child in children:
-                        if child not in state["all_tasks"] and child != parent:
-                            state["all_tasks"].add(child)
-                            next_parents.add(child)
-
-                state["current_parents"] = next_parents
-
-            # Check if we hit max depth with remaining tasks
-            if depth == max_depth and all_current_parents:
-                logger.warning(
-                    f"Reached max depth {max_depth} with {len(all_current_parents)} "
-                    f"remaining tasks. Possible cyclic dependencies."
-                )
-
-        # Формируем результат
-        result = {
-            cpo_key: list(state["all_tasks"]) for cpo_key, state in cpo_state.items()
-        }
+        result = {}
+        for cpo_key, direct_fullstack_keys in cpo_to_fullstack.items():
+            all_tasks = set(direct_fullstack_keys)
+            for epic_key in direct_fullstack_keys:
+                all_tasks.update(descendants.get(epic_key, []))
+            result[cpo_key] = list(all_tasks)
 
         logger.info(
             f"Built hierarchy: {len(result)} CPO tasks -> "
@@ -513,37 +496,22 @@ class TestingReturnsService:
         )
 
         try:
-            # Batch query for all parent-child relationships using JSONB
-            from sqlalchemy import text
-
-            # Create a single query for all parent keys
-            parent_keys_str = "', '".join(parent_keys)
-            query = text(
-                f"""
-                SELECT key,
-                       jsonb_array_elements(links)->'object'->>'key' as parent_key
-                FROM tracker_tasks
-                WHERE key LIKE 'FULLSTACK%'
-                AND links IS NOT NULL
-                AND EXISTS (
-                    SELECT 1
-                    FROM jsonb_array_elements(links) AS link
-                    WHERE link->'type'->>'id' = 'subtask'
-                    AND link->>'direction' = 'inward'
-                    AND link->'object'->>'key' IN ('{parent_keys_str}')
+            # Index seek on (dst_key, type_id, direction) for all parents at once
+            subtasks = (
+                self.db.query(TrackerTaskLink.src_key, TrackerTaskLink.dst_key)
+                .filter(
+                    TrackerTaskLink.dst_key.in_(parent_keys),
+                    TrackerTaskLink.type_id == "subtask",
+                    TrackerTaskLink.direction == "inward",
+                    TrackerTaskLink.src_key.like("FULLSTACK%"),
                 )
-            """
+                .all()
             )
 
-            subtasks = self.db.execute(query).fetchall()
-
             # Group children by parent
             result = {}
             for child_key, parent_key in subtasks:
-                if parent_key and parent_key in parent_keys:
-                    if parent_key not in result:
-                        result[parent_key] = []
-                    result[parent_key].append(child_key)
+                result.setdefault(parent_key, []).append(child_key)
 
             # Ensure all parent keys are in result (even if no children)
             for parent_key in parent_keys:
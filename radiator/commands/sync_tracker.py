@@ -36,11 +36,13 @@ logging.basicConfig(
 logging.getLogger("radiator").setLevel(logging.ERROR)
 
 import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from sqlalchemy import func
+from sqlalchemy import Row, and_, case, func, literal_column, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from tqdm import tqdm
 
@@ -48,21 +50,46 @@ from tqdm import tqdm
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from radiator.commands.services.sync_pipeline import SyncPipeline
+from radiator.commands.services.task_metrics_store import TaskMetricsStore
 from radiator.core.config import settings, with_default_limit
 from radiator.core.database import SessionLocal
 from radiator.core.logging import logger
 from radiator.core.single_instance import SingleInstance
 from radiator.models.tracker import TrackerSyncLog, TrackerTask, TrackerTaskHistory
-
-# CRUD operations removed - using direct SQLAlchemy queries
+from radiator.services.task_history_writer import TaskHistoryWriter
+from radiator.services.task_links_writer import TaskLinksWriter
+from radiator.services.tracker_response_cache import DEFAULT_CACHE_PATH
+from radiator.services.tracker_search_planner import deduplicate_by_key
 from radiator.services.tracker_service import tracker_service
+from radiator.utils.field_profiles import FIELD_PROFILES, get_field_profile
 from radiator.utils.fields_loader import load_fields_list
+from radiator.utils.json_stream import orjson_available
+
+
+def build_keys_query(keys: List[str]) -> str:
+    """
+    Build Tracker query selecting tasks by keys.
+
+    Args:
+        keys: Task keys (e.g. CPO-123)
+
+    Returns:
+        Query string "Key: A-1, A-2"
+    """
+    return f"Key: {', '.join(keys)}"
 
 
 class TrackerSyncCommand:
     """Command for syncing tracker data."""
 
-    def __init__(self, db: Optional[Session] = None):
+    # Rows per INSERT ... ON CONFLICT round trip
+    UPSERT_BATCH_SIZE = 1000
+
+    # Keys per "Key: ..." query in run_by_keys
+    KEYS_BATCH_SIZE = 200
+
+    def __init__(self, db: Optional[Session] = None, field_profile: str = None):
         """
         Initialize TrackerSyncCommand.
 
@@ -70,6 +97,8 @@ class TrackerSyncCommand:
             db: Optional database session. If not provided, creates a new session.
                 In test environment, it's recommended to pass db_session fixture
                 to avoid connecting to production database.
+            field_profile: Name of the field profile (minimal, report, full);
+                defaults to TRACKER_FIELD_PROFILE
         """
         if db is None:
             # Check for test environment and warn if SessionLocal might connect to production
@@ -86,8 +115,21 @@ class TrackerSyncCommand:
         else:
             self.db = db
         self.sync_log: Optional[TrackerSyncLog] = None
+        # Tracker IDs of tasks whose updatedAt matched stored value in last sync_tasks
+        self.unchanged_task_ids: set[str] = set()
+        # DB IDs of tasks whose history was rewritten during this sync
+        self.history_changed_task_ids: set[int] = set()
+        # Поля запроса, expand и записываемые колонки задают профиль
+        self.field_profile = get_field_profile(
+            field_profile or settings.TRACKER_FIELD_PROFILE
+        )
+        self.expand = list(self.field_profile.expand)
         try:
-            self.fields = load_fields_list()
+            self.fields = (
+                load_fields_list(self.field_profile.fields_path)
+                if self.field_profile.fields_file
+                else None
+            )
         except FileNotFoundError:
             logger.warning("Fields file not found, using all fields")
             self.fields = None
@@ -159,6 +201,7 @@ class TrackerSyncCommand:
                 filters,
                 limit=limit,
                 fields=self.fields,
+                expand=self.expand,
                 progress_callback=update_progress if show_progress else None,
             )
 
@@ -191,7 +234,7 @@ class TrackerSyncCommand:
             for task_obj in task_data:
                 if task_obj and isinstance(task_obj, dict):
                     task_info = tracker_service.extract_task_data(task_obj)
-                    valid_tasks.append(task_info)
+                    valid_tasks.append(self.field_profile.apply(task_info, self.fields))
                     tasks_data.append((task_obj["id"], task_obj))
                 else:
                     logger.warning(f"Failed to process task data: {task_obj}")
@@ -201,14 +244,14 @@ class TrackerSyncCommand:
             logger.info("📥 Получаем данные задач из Tracker...")
             task_ids = task_data
             # Use expand=links to get task links along with task data
-            tasks_data = tracker_service.get_tasks_batch(task_ids, expand=["links"])
+            tasks_data = tracker_service.get_tasks_batch(task_ids, expand=self.expand)
 
             # Process tasks data
             logger.info("🔄 Обрабатываем полученные данные...")
             for task_id, task_obj in tasks_data:
                 if task_obj:
                     task_info = tracker_service.extract_task_data(task_obj)
-                    valid_tasks.append(task_info)
+                    valid_tasks.append(self.field_profile.apply(task_info, self.fields))
                 else:
                     logger.warning(f"Failed to get data for task {task_id}")
                     api_errors += 1  # Count as API error
@@ -217,6 +260,9 @@ class TrackerSyncCommand:
             logger.warning("No valid tasks data received")
             return {"created": 0, "updated": 0}, tasks_data, api_errors
 
+        # Must run before upsert overwrites stored task_updated_at
+        self.unchanged_task_ids = self._find_unchanged_tasks(valid_tasks)
+
         # Save tasks to database
         logger.info(f"💾 Сохраняем {len(valid_tasks)} задач в базу данных...")
         result = self._bulk_create_or_update_tasks(valid_tasks)
@@ -227,57 +273,166 @@ class TrackerSyncCommand:
     def _bulk_create_or_update_tasks(
         self, tasks_data: List[Dict[str, Any]]
     ) -> Dict[str, int]:
-        """Bulk create or update tasks in database."""
+        """
+        Bulk create or update tasks in database.
+
+        Rows are written in batches of UPSERT_BATCH_SIZE with
+        INSERT ... ON CONFLICT (tracker_id) DO UPDATE. Created/updated counts
+        come from RETURNING (xmax = 0), which is true only for inserted rows.
+        Links of upserted tasks are mirrored to tracker_task_links.
+        """
         created = 0
         updated = 0
 
         # Дедупликация: оставляем только последнее вхождение каждого tracker_id
         # Это решает проблему, когда API возвращает дубликаты из-за обновления во время пагинации
-        unique_tasks = {}
-        for task_data in tasks_data:
-            tracker_id = task_data.get("tracker_id")
-            if tracker_id:
-                # Берем последнее вхождение (более свежие данные)
-                unique_tasks[tracker_id] = task_data
+        # Берем последнее вхождение (более свежие данные)
+        unique_tasks = deduplicate_by_key(tasks_data, "tracker_id")
 
         logger.info(
             f"📊 Обрабатываем {len(tasks_data)} задач, после дедупликации: {len(unique_tasks)}"
         )
 
-        # Обрабатываем только уникальные задачи
-        for task_data in unique_tasks.values():
-            # Check if task exists
-            existing_task = (
-                self.db.query(TrackerTask)
-                .filter(TrackerTask.tracker_id == task_data.get("tracker_id"))
-                .first()
-            )
-
-            if existing_task:
-                # Update existing task
-                for key, value in task_data.items():
-                    if hasattr(existing_task, key):
-                        # Не затираем продкоманду пустой строкой
-                        if key == "prodteam":
-                            if (value is None or str(value).strip() == "") and getattr(
-                                existing_task, "prodteam"
-                            ):
-                                continue
-                        setattr(existing_task, key, value)
-                existing_task.last_sync_at = datetime.now(timezone.utc)
-                updated += 1
-            else:
-                # Create new task
-                new_task = TrackerTask(**task_data)
-                new_task.last_sync_at = datetime.now(timezone.utc)
-                self.db.add(new_task)
-                created += 1
+        # Группируем строки по набору колонок: один INSERT требует одинаковых ключей.
+        # Сортировка по tracker_id даёт стабильный порядок блокировок строк.
+        columns = TrackerTask.__table__.columns
+        rows_by_columns: Dict[tuple, List[Dict[str, Any]]] = {}
+        sync_time = datetime.now(timezone.utc)
+        for tracker_id in sorted(unique_tasks):
+            row = {
+                key: value
+                for key, value in unique_tasks[tracker_id].items()
+                if key in columns and key not in ("id", "last_sync_at")
+            }
+            row["last_sync_at"] = sync_time
+            rows_by_columns.setdefault(tuple(sorted(row)), []).append(row)
+
+        for column_names, rows in rows_by_columns.items():
+            for start in range(0, len(rows), self.UPSERT_BATCH_SIZE):
+                batch = rows[start : start + self.UPSERT_BATCH_SIZE]
+                inserted_flags = self.db.execute(
+                    self._build_tasks_upsert(column_names, batch)
+                ).scalars()
+                for inserted in inserted_flags:
+                    if inserted:
+                        created += 1
+                    else:
+                        updated += 1
+
+        # Рёбра связей пишутся в той же транзакции, что и задачи
+        links_by_key = {
+            task["key"]: task.get("links")
+            for task in unique_tasks.values()
+            if task.get("key") and "links" in task
+        }
+        TaskLinksWriter(self.db, self.UPSERT_BATCH_SIZE).replace(links_by_key)
 
         logger.info("💾 Сохранение задач в базу данных...")
         self.db.commit()
         logger.info("✅ Задачи успешно сохранены")
         return {"created": created, "updated": updated}
 
+    def _build_tasks_upsert(self, column_names: tuple, rows: List[Dict[str, Any]]):
+        """Build INSERT ... ON CONFLICT (tracker_id) DO UPDATE for a batch of rows."""
+        table = TrackerTask.__table__
+        stmt = pg_insert(table).values(rows)
+        excluded = stmt.excluded
+
+        set_ = {name: excluded[name] for name in column_names if name != "tracker_id"}
+        if "prodteam" in set_:
+            # Не затираем продкоманду пустой строкой
+            set_["prodteam"] = case(
+                (
+                    and_(
+                        func.coalesce(func.btrim(excluded.prodteam), "") == "",
+                        func.coalesce(table.c.prodteam, "") != "",
+                    ),
+                    table.c.prodteam,
+                ),
+                else_=excluded.prodteam,
+            )
+        # ORM onupdate не срабатывает для ON CONFLICT - ставим время синхронизации
+        set_["updated_at"] = excluded.last_sync_at
+
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.tracker_id], set_=set_
+        ).returning(literal_column("(xmax = 0)").label("inserted"))
+
+    def _find_unchanged_tasks(self, tasks_data: List[Dict[str, Any]]) -> set[str]:
+        """
+        Find tasks not updated in Tracker since their history was last synced.
+
+        A task is unchanged if stored task_updated_at equals fresh updatedAt and
+        its history was synced before (last_changelog_id is set). Values are
+        compared in SQL so both sides go through the same timestamp conversion.
+
+        Args:
+            tasks_data: Task data from extract_task_data
+
+        Returns:
+            Set of tracker IDs
+        """
+        watermarks = {
+            task["tracker_id"]: task["task_updated_at"]
+            for task in tasks_data
+            if task.get("tracker_id") and task.get("task_updated_at")
+        }
+        if not watermarks:
+            return set()
+
+        rows = self.db.execute(
+            text(
+                """
+                SELECT t.tracker_id
+                FROM tracker_tasks AS t
+                JOIN unnest(
+                    CAST(:tracker_ids AS varchar[]), CAST(:updated_at AS timestamp[])
+                ) AS v(tracker_id, task_updated_at)
+                    ON t.tracker_id = v.tracker_id
+                WHERE t.task_updated_at = v.task_updated_at
+                    AND t.last_changelog_id IS NOT NULL
+                """
+            ),
+            {
+                "tracker_ids": list(watermarks.keys()),
+                "updated_at": list(watermarks.values()),
+            },
+        )
+        return {row.tracker_id for row in rows}
+
+    def _plan_changelog_fetch(
+        self,
+        task_ids: List[str],
+        db_tasks: Dict[str, Row],
+        force_full_history: bool,
+    ) -> tuple[List[str], Dict[str, str]]:
+        """
+        Select tasks whose changelog has to be fetched.
+
+        Unchanged tasks are skipped unless full history is forced. Changed tasks
+        with last_changelog_id get only newer entries.
+
+        Returns:
+            Tuple of (task IDs to fetch, last_changelog_id by task ID)
+        """
+        if force_full_history:
+            return list(task_ids), {}
+
+        fetch_ids = [
+            task_id for task_id in task_ids if task_id not in self.unchanged_task_ids
+        ]
+        last_changelog_ids = {
+            task_id: db_tasks[task_id].last_changelog_id
+            for task_id in fetch_ids
+            if task_id in db_tasks and db_tasks[task_id].last_changelog_id
+        }
+        skipped = len(task_ids) - len(fetch_ids)
+        if skipped:
+            logger.info(
+                f"⏭️ Пропускаем загрузку истории для {skipped} задач без изменений"
+            )
+        return fetch_ids, last_changelog_ids
+
     def sync_task_history(
         self,
         task_data: List[Any],
@@ -296,10 +451,20 @@ class TrackerSyncCommand:
         logger.info(f"📚 Начинаем синхронизацию истории для {len(task_ids)} задач")
         logger.info(f"🔍 ID задач для истории: {task_ids}")
 
+        # Load all DB tasks for the batch in one query instead of one per task
+        db_tasks = self._load_db_tasks(task_ids)
+        fetch_ids, last_changelog_ids = self._plan_changelog_fetch(
+            task_ids, db_tasks, force_full_history
+        )
+
         # Get changelogs with progress indication
         logger.info("📥 Получаем данные истории из Tracker...")
         start_time = datetime.now()
-        changelogs_data = tracker_service.get_changelogs_batch(task_ids)
+        changelogs_data = (
+            tracker_service.get_changelogs_batch(fetch_ids, last_changelog_ids)
+            if fetch_ids
+            else []
+        )
         load_time = datetime.now() - start_time
         logger.info(
             f"⏱️ Загрузка истории завершена за {load_time.total_seconds():.1f} секунд"
@@ -312,13 +477,66 @@ class TrackerSyncCommand:
             task_id: task_data for task_id, task_data in tasks_data if task_data
         }
 
+        return self._persist_task_histories(
+            changelogs_data, tasks_dict, force_full_history, db_tasks=db_tasks
+        )
+
+    def _persist_task_histories(
+        self,
+        changelogs_data: List[tuple[str, Optional[List[Dict[str, Any]]]]],
+        tasks_dict: Dict[str, Dict[str, Any]],
+        force_full_history: bool = True,
+        db_tasks: Optional[Dict[str, Row]] = None,
+    ) -> tuple[int, int, int]:
+        """
+        Rebuild and save history for already fetched changelogs.
+
+        Args:
+            changelogs_data: (task_id, changelog) pairs from get_changelogs_batch
+            tasks_dict: Task data from Tracker by task ID
+            force_full_history: Rebuild full history instead of incremental update
+            db_tasks: Preloaded tasks by tracker ID (loaded if not given)
+
+        Returns:
+            Tuple of (history entries, tasks with history, API errors)
+        """
         total_history_entries = 0
         tasks_with_history = 0
         api_errors = 0  # Count API errors
 
+        if db_tasks is None:
+            db_tasks = self._load_db_tasks([task_id for task_id, _ in changelogs_data])
+        history_writer = TaskHistoryWriter(
+            self.db, batch_size=settings.TRACKER_SYNC_BATCH_SIZE
+        )
+        # Tasks queued in history_writer: task_id -> (task_key, entries_count)
+        pending_tasks: Dict[str, tuple[str, int]] = {}
+
         # Process history with progress bar
         logger.info("💾 Обрабатываем и сохраняем историю в базу данных...")
         failed_tasks = []
+
+        def flush_history() -> None:
+            nonlocal total_history_entries, tasks_with_history, api_errors
+            try:
+                history_writer.flush()
+            except Exception as e:
+                logger.error(
+                    f"❌ Ошибка сохранения истории для {len(pending_tasks)} задач: "
+                    f"{type(e).__name__}: {e}"
+                )
+                logger.error(f"📍 Stacktrace: {traceback.format_exc()}")
+                for task_key, _ in pending_tasks.values():
+                    failed_tasks.append((task_key, str(e)))
+                api_errors += len(pending_tasks)
+            else:
+                for pending_task_id, (_, entries_count) in pending_tasks.items():
+                    total_history_entries += entries_count
+                    if entries_count > 0:
+                        tasks_with_history += 1
+                    self._mark_history_changed(db_tasks.get(pending_task_id))
+            pending_tasks.clear()
+
         with tqdm(
             total=len(changelogs_data), desc="💾 Обработка истории", unit="задача"
         ) as pbar:
@@ -333,12 +551,27 @@ class TrackerSyncCommand:
                         pbar.update(1)
                         continue
 
+                    queued_before = history_writer.pending_tasks
                     history_entries, has_history = self._process_single_task_history(
-                        task_id, changelog, tasks_dict, force_full_history
+                        task_id,
+                        changelog,
+                        tasks_dict,
+                        force_full_history,
+                        db_task=db_tasks.get(task_id),
+                        history_writer=history_writer,
                     )
-                    total_history_entries += history_entries
-                    if has_history:
-                        tasks_with_history += 1
+                    if history_writer.pending_tasks > queued_before:
+                        # Counted after the batch is actually persisted
+                        task_key = tasks_dict.get(task_id, {}).get("key", task_id)
+                        pending_tasks[task_id] = (task_key, history_entries)
+                        if history_writer.is_full():
+                            flush_history()
+                    else:
+                        total_history_entries += history_entries
+                        if has_history:
+                            tasks_with_history += 1
+                        if history_entries > 0:
+                            self._mark_history_changed(db_tasks.get(task_id))
 
                     # Update progress bar
                     task_key = tasks_dict.get(task_id, {}).get(
@@ -356,6 +589,8 @@ class TrackerSyncCommand:
                     pbar.update(1)
                     # Продолжаем обработку остальных задач
 
+            flush_history()
+
         if failed_tasks:
             logger.warning(
                 f"⚠️ Не удалось обработать историю для {len(failed_tasks)} задач:"
@@ -370,18 +605,81 @@ class TrackerSyncCommand:
         )
         return total_history_entries, tasks_with_history, api_errors
 
+    def _mark_history_changed(self, db_task: Optional[Union[TrackerTask, Row]]) -> None:
+        """Remember task for metrics refresh after sync."""
+        if db_task is not None:
+            self.history_changed_task_ids.add(db_task.id)
+
+    def _refresh_task_metrics(self) -> None:
+        """Recompute tracker_task_metrics rows of tasks with changed history."""
+        if (
+            not settings.TRACKER_SYNC_REFRESH_METRICS
+            or not self.history_changed_task_ids
+        ):
+            return
+
+        logger.info(
+            f"📐 Пересчитываем метрики для {len(self.history_changed_task_ids)} задач..."
+        )
+        try:
+            TaskMetricsStore(self.db).refresh(sorted(self.history_changed_task_ids))
+        except Exception as e:
+            # Отчеты посчитают метрики на лету, синхронизация не должна падать
+            logger.warning(f"⚠️ Не удалось пересчитать метрики задач: {e}")
+            self.db.rollback()
+        else:
+            self.history_changed_task_ids.clear()
+
+    def _load_db_tasks(self, task_ids: List[str]) -> Dict[str, Row]:
+        """
+        Load tasks needed for history sync by tracker_id in one query.
+
+        Plain (id, tracker_id, key, last_changelog_id) rows are returned
+        instead of ORM objects: history flushes commit the session, which would
+        expire ORM objects and reload each of them on the next attribute access.
+        """
+        if not task_ids:
+            return {}
+        rows = (
+            self.db.query(
+                TrackerTask.id,
+                TrackerTask.tracker_id,
+                TrackerTask.key,
+                TrackerTask.last_changelog_id,
+            )
+            .filter(TrackerTask.tracker_id.in_(task_ids))
+            .all()
+        )
+        return {row.tracker_id: row for row in rows}
+
+    def _set_last_changelog_id(self, task_id: int, last_changelog_id: str) -> None:
+        """Update last_changelog_id by task ID (works for ORM objects and rows)."""
+        self.db.query(TrackerTask).filter(TrackerTask.id == task_id).update(
+            {TrackerTask.last_changelog_id: last_changelog_id}
+        )
+
     def _process_single_task_history(
         self,
         task_id: str,
         changelog: List[Dict[str, Any]],
         tasks_dict: Dict[str, Any],
         force_full_history: bool = True,
+        db_task: Optional[Union[TrackerTask, Row]] = None,
+        history_writer: Optional[TaskHistoryWriter] = None,
     ) -> tuple[int, bool]:
-        """Process history for a single task. Returns (history_entries_count, has_history)."""
+        """
+        Process history for a single task. Returns (history_entries_count, has_history).
+
+        If history_writer is given, full history rebuilds are queued there and
+        persisted when the writer is flushed instead of being committed per task.
+        """
         # Get task from database
-        db_task = (
-            self.db.query(TrackerTask).filter(TrackerTask.tracker_id == task_id).first()
-        )
+        if db_task is None:
+            db_task = (
+                self.db.query(TrackerTask)
+                .filter(TrackerTask.tracker_id == task_id)
+                .first()
+            )
         if not db_task:
             logger.warning(
                 f"⚠️ Задача {task_id} не найдена в базе данных, пропускаем историю"
@@ -425,6 +723,13 @@ class TrackerSyncCommand:
             if not status_history:
                 return 0, False
 
+            if history_writer is not None:
+                history_data = self._prepare_history_data(
+                    status_history, db_task.id, task_id
+                )
+                queued_count = history_writer.add(db_task.id, history_data, changelog)
+                return queued_count, queued_count > 0
+
             # Delete existing history for this task to ensure clean slate
             self.db.query(TrackerTaskHistory).filter(
                 TrackerTaskHistory.task_id == db_task.id
@@ -467,7 +772,7 @@ class TrackerSyncCommand:
     def _bulk_create_history(
         self,
         history_data: List[Dict[str, Any]],
-        db_task: TrackerTask,
+        db_task: Union[TrackerTask, Row],
         changelog: List[Dict[str, Any]],
     ) -> int:
         """Bulk create history entries in database and update last_changelog_id atomically."""
@@ -479,7 +784,7 @@ class TrackerSyncCommand:
 
         # Update last_changelog_id in the same transaction
         if changelog:
-            db_task.last_changelog_id = changelog[-1]["id"]
+            self._set_last_changelog_id(db_task.id, changelog[-1]["id"])
             logger.debug(
                 f"Set last_changelog_id to {changelog[-1]['id']} for task {db_task.tracker_id}"
             )
@@ -493,7 +798,7 @@ class TrackerSyncCommand:
         self,
         task_id: int,
         new_changelog_entries: List[Dict[str, Any]],
-        db_task: TrackerTask,
+        db_task: Union[TrackerTask, Row],
     ) -> int:
         """
         Append new history entries without deleting existing ones.
@@ -578,7 +883,7 @@ class TrackerSyncCommand:
         if added_count > 0:
             # Update last_changelog_id in the same transaction
             if new_changelog_entries:
-                db_task.last_changelog_id = new_changelog_entries[-1]["id"]
+                self._set_last_changelog_id(db_task.id, new_changelog_entries[-1]["id"])
                 logger.debug(
                     f"Updated last_changelog_id to {new_changelog_entries[-1]['id']} for task {db_task.tracker_id}"
                 )
@@ -629,14 +934,123 @@ class TrackerSyncCommand:
             self.db.rollback()
             return 0
 
+    def _run_pipeline(
+        self,
+        filters: Dict[str, Any],
+        limit: Optional[int],
+        skip_history: bool,
+        force_full_history: bool,
+    ) -> bool:
+        """Run sync as streaming pipeline (see SyncPipeline)."""
+        query = tracker_service.build_search_query(filters)
+        if not query:
+            logger.error(f"❌ Не задан фильтр для синхронизации")
+            self.update_sync_log(
+                status="failed",
+                sync_completed_at=datetime.now(timezone.utc),
+                error_details="No filters provided",
+            )
+            return False
+
+        logger.info(
+            f"🚀 Конвейерная синхронизация: до {settings.TRACKER_PIPELINE_MAX_PAGES} "
+            f"страниц в обработке"
+        )
+        result = SyncPipeline(
+            self,
+            max_pages=settings.TRACKER_PIPELINE_MAX_PAGES,
+            skip_history=skip_history,
+            force_full_history=force_full_history,
+        ).run(query, limit)
+
+        if not result.tasks_found:
+            logger.error(f"❌ Не найдено задач для синхронизации")
+            self.update_sync_log(
+                status="failed",
+                sync_completed_at=datetime.now(timezone.utc),
+                error_details="No tasks found to sync",
+            )
+            return False
+
+        self.update_sync_log(
+            tasks_processed=result.tasks_found,
+            tasks_created=result.tasks_created,
+            tasks_updated=result.tasks_updated,
+        )
+
+        if result.history_entries > 0:
+            logger.info("🧹 Очищаем возможные дубликаты в истории...")
+            cleaned_count = self._cleanup_duplicate_history()
+            if cleaned_count > 0:
+                logger.info(f"🧹 Очищено {cleaned_count} дублирующихся записей")
+
+        self._complete_sync(
+            {"created": result.tasks_created, "updated": result.tasks_updated},
+            result.history_entries,
+            result.tasks_with_history,
+            result.api_errors,
+        )
+        return True
+
+    def _complete_sync(
+        self,
+        tasks_result: Dict[str, int],
+        history_entries: int,
+        tasks_with_history: int,
+        total_api_errors: int,
+    ) -> None:
+        """Mark sync log as completed and print final summary."""
+        self._refresh_task_metrics()
+
+        # Mark sync as completed
+        logger.info("💾 Сохранение результатов синхронизации в базу данных...")
+        self.update_sync_log(
+            status="completed",
+            sync_completed_at=datetime.now(timezone.utc),
+            errors_count=total_api_errors,
+        )
+        logger.info("✅ Результаты успешно сохранены")
+
+        # Print final summary to stdout (works even with disabled logging)
+        print(f"\n🎉 Синхронизация завершена успешно!")
+        print(f"   📝 Создано: {tasks_result['created']} задач")
+        print(f"   🔄 Обновлено: {tasks_result['updated']} задач")
+        print(f"   📚 Записей истории: {history_entries}")
+        print(f"   📋 Задач с историей: {tasks_with_history}")
+        if total_api_errors > 0:
+            print(f"   ❌ Ошибок API: {total_api_errors}")
+        else:
+            print(f"   ✅ Ошибок API: 0")
+
+        logger.info(f"🎉 Синхронизация завершена успешно!")
+        logger.info(f"   📝 Создано: {tasks_result['created']} задач")
+        logger.info(f"   🔄 Обновлено: {tasks_result['updated']} задач")
+        logger.info(f"   📚 Записей истории: {history_entries}")
+        logger.info(f"   📋 Задач с историей: {tasks_with_history}")
+        if total_api_errors > 0:
+            logger.info(f"   ❌ Ошибок API: {total_api_errors}")
+        else:
+            logger.info(f"   ✅ Ошибок API: 0")
+
     def run(
         self,
         filters: Dict[str, Any] = None,
         limit: int = None,
         skip_history: bool = False,
         force_full_history: bool = True,
+        pipeline: bool = False,
     ):
-        """Run the sync command."""
+        """
+        Run the sync command.
+
+        Args:
+            filters: Custom filters for getting tasks
+            limit: Maximum number of tasks to sync
+            skip_history: Skip syncing task history
+            force_full_history: Rebuild full history (ignore last_changelog_id)
+            pipeline: Stream search pages through upsert, changelog fetch and
+                history write instead of running the stages one after another
+        """
         try:
             # Debug: log all parameters
             logger.debug(f"🔍 DEBUG: run() вызван с параметрами:")
@@ -644,6 +1058,7 @@ class TrackerSyncCommand:
             logger.debug(f"   limit: {limit}")
             logger.debug(f"   skip_history: {skip_history}")
             logger.debug(f"   force_full_history: {force_full_history}")
+            logger.debug(f"   pipeline: {pipeline}")
 
             # Create sync log
             self.sync_log = self.create_sync_log()
@@ -657,6 +1072,11 @@ class TrackerSyncCommand:
             logger.info(f"   📋 Фильтр: {filters}")
             logger.info(f"   🎯 Лимит: {limit} задач")
 
+            if pipeline:
+                return self._run_pipeline(
+                    filters, limit, skip_history, force_full_history
+                )
+
             task_data = self.get_tasks_to_sync(filters, limit, show_progress=True)
             if not task_data:
                 logger.error(f"❌ Не найдено задач для синхронизации")
@@ -735,35 +1155,9 @@ class TrackerSyncCommand:
             # Calculate total API errors
             total_api_errors = tasks_api_errors + history_api_errors
 
-            # Mark sync as completed
-            logger.info("💾 Сохранение результатов синхронизации в базу данных...")
-            self.update_sync_log(
-                status="completed",
-                sync_completed_at=datetime.now(timezone.utc),
-                errors_count=total_api_errors,
+            self._complete_sync(
+                tasks_result, history_entries, tasks_with_history, total_api_errors
             )
-            logger.info("✅ Результаты успешно сохранены")
-
-            # Print final summary to stdout (works even with disabled logging)
-            print(f"\n🎉 Синхронизация завершена успешно!")
-            print(f"   📝 Создано: {tasks_result['created']} задач")
-            print(f"   🔄 Обновлено: {tasks_result['updated']} задач")
-            print(f"   📚 Записей истории: {history_entries}")
-            print(f"   📋 Задач с историей: {tasks_with_history}")
-            if total_api_errors > 0:
-                print(f"   ❌ Ошибок API: {total_api_errors}")
-            else:
-                print(f"   ✅ Ошибок API: 0")
-
-            logger.info(f"🎉 Синхронизация завершена успешно!")
-            logger.info(f"   📝 Создано: {tasks_result['created']} задач")
-            logger.info(f"   🔄 Обновлено: {tasks_result['updated']} задач")
-            logger.info(f"   📚 Записей истории: {history_entries}")
-            logger.info(f"   📋 Задач с историей: {tasks_with_history}")
-            if total_api_errors > 0:
-                logger.info(f"   ❌ Ошибок API: {total_api_errors}")
-            else:
-                logger.info(f"   ✅ Ошибок API: 0")
             return True
 
         except Exception as e:
@@ -776,6 +1170,141 @@ class TrackerSyncCommand:
                 )
             return False
 
+    def _sync_keys_batch(
+        self,
+        keys: List[str],
+        own_session: bool,
+        skip_history: bool,
+        force_full_history: bool,
+        limit: Optional[int],
+    ) -> bool:
+        """
+        Sync one batch of keys.
+
+        Args:
+            keys: Task keys of the batch
+            own_session: Run in a new command with its own session (required
+                when batches run in parallel threads)
+            skip_history: Skip syncing task history
+            force_full_history: Rebuild full history (ignore last_changelog_id)
+            limit: Maximum number of tasks to sync
+
+        Returns:
+            True if the batch was synced
+        """
+        filters = {"query": build_keys_query(keys)}
+        if not own_session:
+            return self.run(filters, limit, skip_history, force_full_history)
+        # Сессия на поток, пул соединений engine и tracker_service общие
+        with TrackerSyncCommand(
+            db=SessionLocal(), field_profile=self.field_profile.name
+        ) as command:
+            return command.run(filters, limit, skip_history, force_full_history)
+
+    def run_by_keys(
+        self,
+        keys: List[str],
+        batch_size: Optional[int] = None,
+        concurrency: int = 1,
+        skip_history: bool = False,
+        force_full_history: bool = True,
+        limit: Optional[int] = None,
+        start_batch: int = 0,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> bool:
+        """
+        Sync tasks by keys in batches of "Key: ..." queries inside this process.
+
+        Each batch is a separate sync (own sync log), as with one sync_tracker
+        process per batch, but the interpreter, DB engine and tracker_service
+        are shared. With concurrency > 1 batches run in parallel threads, each
+        with its own session. Every worker thread keeps its HTTP connections
+        open across batches; they are closed when all batches are done.
+
+        Progress is the number of leading batches that are all synced: after a
+        failure no new batches are started, and a rerun from that number
+        repeats only batches that were not synced.
+
+        Args:
+            keys: Task keys
+            batch_size: Keys per batch (defaults to KEYS_BATCH_SIZE)
+            concurrency: Number of batches synced at the same time
+            skip_history: Skip syncing task history
+            force_full_history: Rebuild full history (ignore last_changelog_id)
+            limit: Maximum number of tasks to sync per batch
+            start_batch: Index of the first batch to sync (resume)
+            on_progress: Called with (synced leading batches, total batches)
+                whenever the first number grows
+
+        Returns:
+            True if all batches were synced
+        """
+        batch_size = batch_size or self.KEYS_BATCH_SIZE
+        batches = [keys[i : i + batch_size] for i in range(0, len(keys), batch_size)]
+        total = len(batches)
+        own_session = concurrency > 1
+        logger.info(
+            f"🔑 Синхронизация {len(keys)} задач по ключам: {total} батчей "
+            f"по {batch_size}, параллельно {concurrency}"
+        )
+
+        completed: set[int] = set()
+        synced_prefix = start_batch
+        failed = False
+        pending = iter(range(start_batch, total))
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            running: Dict[Future, int] = {}
+
+            def submit_next() -> None:
+                index = next(pending, None)
+                if index is None:
+                    return
+                logger.info(
+                    f"📦 Батч {index + 1}/{total} ({len(batches[index])} ключей)..."
+                )
+                future = executor.submit(
+                    self._sync_keys_batch,
+                    batches[index],
+                    own_session,
+                    skip_history,
+                    force_full_history,
+                    limit,
+                )
+                running[future] = index
+
+            for _ in range(max(1, concurrency)):
+                submit_next()
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Батч {index + 1} завершился с ошибкой: {e}")
+                        success = False
+
+                    if not success:
+                        logger.warning(f"❌ Батч {index + 1} не синхронизирован")
+                        failed = True
+                        continue
+
+                    logger.info(f"✅ Батч {index + 1} синхронизирован")
+                    completed.add(index)
+                    previous_prefix = synced_prefix
+                    while synced_prefix in completed:
+                        synced_prefix += 1
+                    if on_progress and synced_prefix > previous_prefix:
+                        on_progress(synced_prefix, total)
+                    if not failed:
+                        submit_next()
+
+        # Пулы соединений привязаны к потокам пула, которые уже завершились
+        tracker_service.close_connections()
+        return not failed and synced_prefix == total
+
 
 def main():
     """Main entry point for the sync command."""
@@ -825,6 +1354,55 @@ Maximum limit is 10000 tasks per sync operation.
         action="store_true",
         help="Force full history sync for all tasks (ignore last_changelog_id)",
     )
+    parser.add_argument(
+        "--async-http",
+        action="store_true",
+        help="Use pooled asyncio HTTP client with adaptive rate limiting for batch fetches",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Stream search pages through task upsert, changelog fetch and history write",
+    )
+    parser.add_argument(
+        "--stream-json",
+        action="store_true",
+        help="Decode search pages issue by issue from the response stream "
+        "(lower memory on 1000-issue scroll pages, best with --pipeline)",
+    )
+    parser.add_argument(
+        "--orjson",
+        action="store_true",
+        help="Parse remaining full response bodies with orjson (if installed)",
+    )
+    parser.add_argument(
+        "--field-profile",
+        choices=sorted(FIELD_PROFILES),
+        help="Fields requested from Tracker and task columns written: minimal "
+        "(history only), report (TTM/TTD reports), full (archive with description) "
+        f"(default: {settings.TRACKER_FIELD_PROFILE})",
+    )
+    parser.add_argument(
+        "--search-shards",
+        type=int,
+        default=None,
+        help="Split unlimited searches into date ranges fetched by N threads "
+        f"(default: {settings.TRACKER_SEARCH_SHARDS}, 1 - single search stream)",
+    )
+    parser.add_argument(
+        "--response-cache",
+        nargs="?",
+        const=str(DEFAULT_CACHE_PATH),
+        default=None,
+        metavar="PATH",
+        help="Cache issue, changelog and search responses on disk, revalidated "
+        f"by updatedAt (default path: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Replay the sync from the response cache without network requests",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     args = parser.parse_args()
@@ -838,15 +1416,40 @@ def _run_sync_logic(args):
     if args.debug:
         logger.setLevel("DEBUG")
 
-    # Check required environment variables
-    if not settings.TRACKER_API_TOKEN:
+    # Check required environment variables (not needed to replay from cache)
+    if not settings.TRACKER_API_TOKEN and not args.offline:
         logger.error("TRACKER_API_TOKEN environment variable is required")
         sys.exit(1)
 
-    if not settings.TRACKER_ORG_ID:
+    if not settings.TRACKER_ORG_ID and not args.offline:
         logger.error("TRACKER_ORG_ID environment variable is required")
         sys.exit(1)
 
+    if args.response_cache or args.offline:
+        tracker_service.enable_response_cache(
+            Path(
+                args.response_cache
+                or settings.TRACKER_RESPONSE_CACHE
+                or DEFAULT_CACHE_PATH
+            ),
+            offline=args.offline,
+        )
+
+    if args.async_http:
+        tracker_service.use_async_client = True
+
+    if args.search_shards:
+        tracker_service.search_shards = args.search_shards
+
+    if args.stream_json:
+        tracker_service.stream_json = True
+
+    if args.orjson:
+        if orjson_available():
+            tracker_service.use_orjson = True
+        else:
+            logger.warning("⚠️ orjson не установлен, используем стандартный json")
+
     # Build filters
     filters = {}
     if args.filter:
@@ -859,13 +1462,18 @@ def _run_sync_logic(args):
         f"🔍 Параметры: filters={filters}, limit={args.limit}, skip_history={args.skip_history}, force_full_history={args.force_full_history}"
     )
 
-    with TrackerSyncCommand() as sync_cmd:
+    with TrackerSyncCommand(field_profile=args.field_profile) as sync_cmd:
         success = sync_cmd.run(
             filters=filters,
             limit=args.limit,
             skip_history=args.skip_history,
             force_full_history=args.force_full_history,
+            pipeline=args.pipeline,
         )
+        if tracker_service.response_cache is not None:
+            logger.info(
+                f"📦 Кэш ответов Tracker: {tracker_service.response_cache.stats}"
+            )
         sys.exit(0 if success else 1)
 
 
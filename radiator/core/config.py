@@ -71,12 +71,56 @@ class Settings(BaseSettings):
     TRACKER_MAX_WORKERS: int = Field(
         default=10, json_schema_extra={"env": "TRACKER_MAX_WORKERS"}
     )
+    # Не используется: частоту запросов задает AdaptiveRateLimiter
+    # (TRACKER_RATE_LIMIT_*), поле оставлено для старых .env
     TRACKER_REQUEST_DELAY: float = Field(
         default=1.0, json_schema_extra={"env": "TRACKER_REQUEST_DELAY"}
     )
     TRACKER_SYNC_BATCH_SIZE: int = Field(
         default=100, json_schema_extra={"env": "TRACKER_SYNC_BATCH_SIZE"}
     )
+    TRACKER_PIPELINE_MAX_PAGES: int = Field(
+        default=4, json_schema_extra={"env": "TRACKER_PIPELINE_MAX_PAGES"}
+    )
+    TRACKER_SEARCH_SHARDS: int = Field(
+        default=1, json_schema_extra={"env": "TRACKER_SEARCH_SHARDS"}
+    )
+    TRACKER_SEARCH_SHARD_SIZE: int = Field(
+        default=5000, json_schema_extra={"env": "TRACKER_SEARCH_SHARD_SIZE"}
+    )
+    TRACKER_SEARCH_SHARD_FIELD: str = Field(
+        default="Created", json_schema_extra={"env": "TRACKER_SEARCH_SHARD_FIELD"}
+    )
+    TRACKER_STREAM_JSON: bool = Field(
+        default=False, json_schema_extra={"env": "TRACKER_STREAM_JSON"}
+    )
+    TRACKER_ORJSON: bool = Field(
+        default=False, json_schema_extra={"env": "TRACKER_ORJSON"}
+    )
+    TRACKER_RESPONSE_CACHE: str = Field(
+        default="", json_schema_extra={"env": "TRACKER_RESPONSE_CACHE"}
+    )
+    TRACKER_RESPONSE_CACHE_MAX_MB: int = Field(
+        default=1024, json_schema_extra={"env": "TRACKER_RESPONSE_CACHE_MAX_MB"}
+    )
+    TRACKER_OFFLINE: bool = Field(
+        default=False, json_schema_extra={"env": "TRACKER_OFFLINE"}
+    )
+    TRACKER_FIELD_PROFILE: str = Field(
+        default="report", json_schema_extra={"env": "TRACKER_FIELD_PROFILE"}
+    )
+    TRACKER_SYNC_REFRESH_METRICS: bool = Field(
+        default=True, json_schema_extra={"env": "TRACKER_SYNC_REFRESH_METRICS"}
+    )
+    TRACKER_ASYNC_CLIENT: bool = Field(
+        default=False, json_schema_extra={"env": "TRACKER_ASYNC_CLIENT"}
+    )
+    TRACKER_RATE_LIMIT_RPS: float = Field(
+        default=10.0, json_schema_extra={"env": "TRACKER_RATE_LIMIT_RPS"}
+    )
+    TRACKER_RATE_LIMIT_MAX_RPS: float = Field(
+        default=50.0, json_schema_extra={"env": "TRACKER_RATE_LIMIT_MAX_RPS"}
+    )
 
     # Task limits - unified constants for all components
     DEFAULT_LARGE_LIMIT: int = Field(
@@ -1,5 +1,17 @@
 """Database models."""
 
-from radiator.models.tracker import TrackerSyncLog, TrackerTask, TrackerTaskHistory
+from radiator.models.tracker import (
+    TrackerSyncLog,
+    TrackerTask,
+    TrackerTaskHistory,
+    TrackerTaskLink,
+    TrackerTaskMetrics,
+)
 
-__all__ = ["TrackerTask", "TrackerTaskHistory", "TrackerSyncLog"]
+__all__ = [
+    "TrackerTask",
+    "TrackerTaskHistory",
+    "TrackerSyncLog",
+    "TrackerTaskMetrics",
+    "TrackerTaskLink",
+]
@@ -4,7 +4,7 @@ import uuid
 from datetime import UTC, datetime
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from radiator.core.database import Base
@@ -97,6 +97,54 @@ class TrackerSyncLog(Base):
         return f"<TrackerSyncLog(id={self.id}, status='{self.status}')>"
 
 
+class TrackerTaskMetrics(Base):
+    """Model for precomputed per-task metrics of finished tasks."""
+
+    __tablename__ = "tracker_task_metrics"
+
+    task_id = Column(Integer, primary_key=True)  # tracker_tasks.id
+    # tracker_tasks.last_changelog_id the metrics were computed from
+    history_version = Column(String(255), nullable=False, default="")
+    # Fingerprint of status configuration used for calculation
+    config_version = Column(String(64), nullable=False)
+    computed_at = Column(DateTime, default=lambda: datetime.now(UTC))
+
+    ttm = Column(Integer, nullable=True)
+    tail = Column(Integer, nullable=True)
+    devlt = Column(Integer, nullable=True)
+    ttd = Column(Integer, nullable=True)
+    pause = Column(Integer, nullable=True)
+    ttd_pause = Column(Integer, nullable=True)
+    discovery_backlog_days = Column(Integer, nullable=True)
+    ready_for_dev_days = Column(Integer, nullable=True)
+    ttd_target_date = Column(DateTime, nullable=True)
+    last_discovery_backlog_exit_date = Column(DateTime, nullable=True)
+    stable_done_date = Column(DateTime, nullable=True)
+    has_development = Column(Boolean, nullable=True)
+    current_status = Column(String(255), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<TrackerTaskMetrics(task_id={self.task_id}, ttm={self.ttm})>"
+
+
+class TrackerTaskLink(Base):
+    """Model for task links normalized from TrackerTask.links (one row per edge)."""
+
+    __tablename__ = "tracker_task_links"
+
+    src_key = Column(String(255), primary_key=True)  # Task owning the link
+    dst_key = Column(String(255), primary_key=True)  # Linked task (object.key)
+    type_id = Column(String(255), primary_key=True)  # subtask, epic, relates, ...
+    direction = Column(String(32), primary_key=True)  # inward / outward
+    dst_display = Column(String(500), nullable=True)  # Linked task summary
+
+    def __repr__(self) -> str:
+        return (
+            f"<TrackerTaskLink(src_key='{self.src_key}', dst_key='{self.dst_key}', "
+            f"type_id='{self.type_id}')>"
+        )
+
+
 # Create indexes for better performance
 Index("idx_tracker_tasks_tracker_id", TrackerTask.tracker_id)
 Index("idx_tracker_tasks_key", TrackerTask.key)  # Index for task codes
@@ -117,6 +165,15 @@ Index(
     TrackerTaskHistory.start_date,
     TrackerTaskHistory.end_date,
 )
+Index(
+    "idx_tracker_task_links_dst",
+    TrackerTaskLink.dst_key,
+    TrackerTaskLink.type_id,
+    TrackerTaskLink.direction,
+)  # Children of a parent: dst_key = parent, subtask / inward
+Index(
+    "idx_tracker_task_links_src", TrackerTaskLink.src_key, TrackerTaskLink.type_id
+)  # Links of a task by type
 Index("idx_tracker_sync_logs_status", TrackerSyncLog.status)
 Index("idx_tracker_sync_logs_started", TrackerSyncLog.sync_started_at)
 
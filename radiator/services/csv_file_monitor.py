@@ -4,7 +4,7 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 
 from .google_sheets_config import GoogleSheetsConfig
 
@@ -61,10 +61,16 @@ class CSVFileMonitor:
         except Exception as e:
             logger.error(f"Could not save state file: {e}")
 
-    def get_current_csv_files(self) -> Dict[str, float]:
+    def get_current_csv_files(
+        self, filenames: Optional[Iterable[str]] = None
+    ) -> Dict[str, float]:
         """
         Get current CSV files in reports directory with timestamps.
 
+        Args:
+            filenames: Only check these files (e.g. reported by the directory
+                watcher) instead of listing the whole directory
+
         Returns:
             Dictionary mapping filename to modification timestamp
         """
@@ -72,34 +78,42 @@ class CSVFileMonitor:
             logger.warning(f"Reports directory does not exist: {self.reports_dir}")
             return {}
 
+        if filenames is None:
+            paths = self.reports_dir.iterdir()
+        else:
+            paths = (self.reports_dir / filename for filename in filenames)
+
         current_files = {}
-        for file_path in self.reports_dir.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() == ".csv":
+        for file_path in paths:
+            if file_path.suffix.lower() == ".csv" and file_path.is_file():
                 # Check file size
                 try:
-                    file_size = file_path.stat().st_size
-                    if file_size > GoogleSheetsConfig.MAX_FILE_SIZE:
+                    stat = file_path.stat()
+                    if stat.st_size > GoogleSheetsConfig.MAX_FILE_SIZE:
                         logger.warning(
-                            f"File {file_path.name} is too large ({file_size / (1024*1024):.1f}MB), skipping"
+                            f"File {file_path.name} is too large ({stat.st_size / (1024*1024):.1f}MB), skipping"
                         )
                         continue
 
-                    file_key = file_path.name
-                    current_files[file_key] = file_path.stat().st_mtime
+                    current_files[file_path.name] = stat.st_mtime
                 except OSError as e:
                     logger.warning(f"Could not access file {file_path.name}: {e}")
                     continue
 
         return current_files
 
-    def get_new_csv_files(self) -> List[str]:
+    def get_new_csv_files(self, filenames: Optional[Iterable[str]] = None) -> List[str]:
         """
         Get list of new or modified CSV files since last check.
 
+        Args:
+            filenames: Only check these files instead of listing the whole
+                directory
+
         Returns:
             List of new or modified filenames
         """
-        current_files = self.get_current_csv_files()
+        current_files = self.get_current_csv_files(filenames)
         new_files = []
 
         for filename, timestamp in current_files.items():
@@ -6,6 +6,11 @@ from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
+from radiator.commands.services.report_output import (
+    find_columnar_report,
+    read_columnar_report,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -106,12 +111,23 @@ class CSVProcessor:
         """
         Read CSV file with multiple encoding attempts.
 
+        A fresh Parquet / Arrow copy of the report is read instead when present.
+
         Args:
             file_path: Path to CSV file
 
         Returns:
             DataFrame or None if failed
         """
+        columnar = find_columnar_report(file_path)
+        if columnar is not None:
+            try:
+                df = read_columnar_report(columnar, dates_as_text=True)
+                logger.debug(f"Read columnar copy {columnar.name} of {file_path.name}")
+                return df
+            except Exception as e:
+                logger.warning(f"Failed to read columnar copy {columnar.name}: {e}")
+
         for encoding in self.supported_encodings:
             try:
                 df = pd.read_csv(file_path, encoding=encoding)
@@ -0,0 +1,436 @@
+"""In-memory stand-in for the Google Sheets API v4 at the HTTP transport level.
+
+FakeSheetsHttp replaces the httplib2 transport of the googleapiclient
+discovery service, so GoogleSheetsService runs its real request building and
+JSON serialisation while no network is used. Every call is recorded with its
+payload sizes; latency, bandwidth and the per-minute quota can be simulated.
+
+Usage:
+    http = FakeSheetsHttp(latency=0.2, quota_per_minute=60)
+    service = GoogleSheetsService("", "benchmark", http=http)
+    service.upload_csv_to_sheet(Path("report.csv"))
+    print(http.summary())
+"""
+
+import json
+import re
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+import httplib2
+
+# Grid size of the default sheet of a new document
+DEFAULT_GRID_ROWS = 1000
+DEFAULT_GRID_COLUMNS = 26
+
+# Path of spreadsheet calls: /v4/spreadsheets/{id}[/values/{range} | :method]
+SPREADSHEET_PATH = re.compile(
+    r"^/v4/spreadsheets/(?P<document_id>[^/:]+)"
+    r"(?:/values/(?P<range>[^:]+)|/values:(?P<values_method>\w+)|:(?P<method>\w+))?$"
+)
+CELL_PATTERN = re.compile(r"^(?P<column>[A-Z]*)(?P<row>\d*)$")
+
+
+@dataclass
+class FakeSheet:
+    """Sheet of the fake document."""
+
+    sheet_id: int
+    title: str
+    row_count: int = DEFAULT_GRID_ROWS
+    column_count: int = DEFAULT_GRID_COLUMNS
+    values: List[List[Any]] = field(default_factory=list)
+
+    def properties(self) -> Dict[str, Any]:
+        """Sheet properties as returned by spreadsheets.get."""
+        return {
+            "sheetId": self.sheet_id,
+            "title": self.title,
+            "gridProperties": {
+                "rowCount": self.row_count,
+                "columnCount": self.column_count,
+            },
+        }
+
+
+@dataclass
+class CallRecord:
+    """One API call seen by the transport."""
+
+    operation: str
+    http_method: str
+    status: int
+    request_bytes: int
+    response_bytes: int
+    # Sub-requests of spreadsheets.batchUpdate, ranges of values.batchUpdate
+    subrequests: int = 0
+
+
+class FakeSheetsError(Exception):
+    """API error returned to the client as an HTTP error response."""
+
+    def __init__(self, status: int, message: str, reason: str = "INVALID_ARGUMENT"):
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+
+
+def _split_range(range_name: str) -> Tuple[str, str]:
+    """
+    Split A1 range into sheet title and cells.
+
+    Args:
+        range_name: Range like "Sheet!A1:C3" or "'My sheet'!A5"
+
+    Returns:
+        (sheet title, cells part, empty for a whole-sheet range)
+    """
+    title, _, cells = range_name.rpartition("!")
+    if not title:
+        title, cells = cells, ""
+    if len(title) > 1 and title.startswith("'") and title.endswith("'"):
+        title = title[1:-1].replace("''", "'")
+    return title, cells
+
+
+def _column_index(letters: str) -> int:
+    """Convert column letters (A, Z, AA) to 0-based index."""
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def _range_start(cells: str) -> Tuple[int, int]:
+    """
+    Get 0-based (row, column) of the top left cell of an A1 range.
+
+    Args:
+        cells: Cells part of the range ("B3:D5", "A:Z", "" for the whole sheet)
+
+    Returns:
+        (row index, column index)
+    """
+    match = CELL_PATTERN.match(cells.split(":")[0].upper())
+    if not match:
+        raise FakeSheetsError(400, f"Unable to parse range: {cells}")
+    column = _column_index(match["column"]) if match["column"] else 0
+    row = int(match["row"]) - 1 if match["row"] else 0
+    return row, column
+
+
+class FakeSheetsHttp:
+    """
+    httplib2.Http replacement serving one in-memory Google Sheets document.
+
+    Supported calls: spreadsheets.get, spreadsheets.batchUpdate (addSheet and
+    deleteSheet change the document, other requests are only counted),
+    spreadsheets.values.get / update / batchUpdate. Writing outside the grid
+    of a sheet fails with 400 like the real API.
+    """
+
+    def __init__(
+        self,
+        document_id: Optional[str] = None,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        quota_per_minute: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize fake transport.
+
+        Args:
+            document_id: Only serve this document (any document if None)
+            latency: Simulated round trip time per call in seconds
+            bandwidth: Simulated transfer speed in bytes per second
+            quota_per_minute: Calls allowed per rolling minute, further calls
+                get 429 RESOURCE_EXHAUSTED
+            clock: Time source of the quota window
+            sleep: Function used to wait for simulated latency
+        """
+        self.document_id = document_id
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.quota_per_minute = quota_per_minute
+        self.clock = clock
+        self.sleep = sleep
+        self.calls: List[CallRecord] = []
+        self.simulated_wait = 0.0
+        self.sheets: List[FakeSheet] = [FakeSheet(sheet_id=0, title="Лист1")]
+        self._call_times: Deque[float] = deque()
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        redirections: int = 5,
+        connection_type: Optional[Any] = None,
+    ) -> Tuple[httplib2.Response, bytes]:
+        """
+        Handle API call (signature of httplib2.Http.request).
+
+        Returns:
+            (response with status, JSON content)
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        request_bytes = len(body or b"")
+        operation = "unknown"
+        subrequests = 0
+
+        try:
+            url = urlsplit(uri)
+            match = SPREADSHEET_PATH.match(url.path)
+            if not match:
+                raise FakeSheetsError(404, f"Unknown endpoint: {url.path}", "NOT_FOUND")
+            operation = self._operation(method, match)
+            self._check_quota()
+            if self.document_id and match["document_id"] != self.document_id:
+                raise FakeSheetsError(
+                    404,
+                    f"Requested entity was not found: {match['document_id']}",
+                    "NOT_FOUND",
+                )
+            payload = json.loads(body) if body else {}
+            result, subrequests = self._dispatch(operation, match, payload)
+            status = 200
+        except FakeSheetsError as e:
+            status = e.status
+            result = {
+                "error": {"code": e.status, "message": str(e), "status": e.reason}
+            }
+
+        content = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        self.calls.append(
+            CallRecord(
+                operation=operation,
+                http_method=method,
+                status=status,
+                request_bytes=request_bytes,
+                response_bytes=len(content),
+                subrequests=subrequests,
+            )
+        )
+        self._simulate_transfer(request_bytes + len(content))
+
+        response = httplib2.Response(
+            {"status": status, "content-type": "application/json; charset=UTF-8"}
+        )
+        return response, content
+
+    def _check_quota(self) -> None:
+        """Reject the call if the per-minute quota is used up."""
+        if self.quota_per_minute is None:
+            return
+        now = self.clock()
+        while self._call_times and now - self._call_times[0] >= 60:
+            self._call_times.popleft()
+        if len(self._call_times) >= self.quota_per_minute:
+            raise FakeSheetsError(
+                429,
+                "Quota exceeded for quota metric 'Requests' per minute",
+                "RESOURCE_EXHAUSTED",
+            )
+        self._call_times.append(now)
+
+    def _simulate_transfer(self, num_bytes: int) -> None:
+        """Wait for simulated latency and transfer time."""
+        wait = self.latency
+        if self.bandwidth:
+            wait += num_bytes / self.bandwidth
+        if wait > 0:
+            self.simulated_wait += wait
+            self.sleep(wait)
+
+    @staticmethod
+    def _operation(method: str, match: re.Match) -> str:
+        """
+        Get API operation name of a call.
+
+        Raises:
+            FakeSheetsError: If the call is not supported
+        """
+        if match["range"] is not None and method in ("GET", "PUT"):
+            return "values.get" if method == "GET" else "values.update"
+        if match["values_method"] == "batchUpdate" and method == "POST":
+            return "values.batchUpdate"
+        if match["method"] == "batchUpdate" and method == "POST":
+            return "spreadsheets.batchUpdate"
+        if match["values_method"] is None and match["method"] is None:
+            if method == "GET":
+                return "spreadsheets.get"
+        raise FakeSheetsError(
+            404, f"Unsupported call: {method} {match.string}", "NOT_FOUND"
+        )
+
+    def _dispatch(
+        self, operation: str, match: re.Match, payload: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Run operation handler.
+
+        Returns:
+            (response body, number of sub-requests)
+        """
+        if operation == "values.get":
+            return self._values_get(unquote(match["range"])), 0
+        if operation == "values.update":
+            values = payload.get("values", [])
+            return self._write(unquote(match["range"]), values), 1
+        if operation == "values.batchUpdate":
+            data = payload.get("data", [])
+            return self._values_batch_update(data), len(data)
+        if operation == "spreadsheets.batchUpdate":
+            requests = payload.get("requests", [])
+            return self._batch_update(match["document_id"], requests), len(requests)
+        return self._get(match["document_id"]), 0
+
+    def sheet_by_title(self, title: str) -> FakeSheet:
+        """
+        Find sheet by title.
+
+        Raises:
+            FakeSheetsError: If there is no such sheet
+        """
+        for sheet in self.sheets:
+            if sheet.title == title:
+                return sheet
+        raise FakeSheetsError(400, f"Unable to parse range: {title}")
+
+    def _get(self, document_id: str) -> Dict[str, Any]:
+        """spreadsheets.get: document title and sheet properties."""
+        return {
+            "spreadsheetId": document_id,
+            "properties": {"title": "Fake document"},
+            "sheets": [{"properties": sheet.properties()} for sheet in self.sheets],
+        }
+
+    def _batch_update(
+        self, document_id: str, requests: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """spreadsheets.batchUpdate: apply sheet requests atomically."""
+        sheets = list(self.sheets)
+        replies = []
+        for request in requests:
+            if "addSheet" in request:
+                properties = request["addSheet"].get("properties", {})
+                replies.append(
+                    {"addSheet": {"properties": self._add_sheet(sheets, properties)}}
+                )
+            elif "deleteSheet" in request:
+                sheet_id = request["deleteSheet"]["sheetId"]
+                if not any(sheet.sheet_id == sheet_id for sheet in sheets):
+                    raise FakeSheetsError(400, f"No grid with id: {sheet_id}")
+                sheets = [sheet for sheet in sheets if sheet.sheet_id != sheet_id]
+                replies.append({})
+            else:
+                replies.append({})
+        self.sheets = sheets
+        return {"spreadsheetId": document_id, "replies": replies}
+
+    def _add_sheet(
+        self, sheets: List[FakeSheet], properties: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Add sheet to the list, validating title and ID like the API."""
+        title = properties.get("title") or f"Лист{len(sheets) + 1}"
+        if any(sheet.title == title for sheet in sheets):
+            raise FakeSheetsError(
+                400,
+                f'A sheet with the name "{title}" already exists. '
+                "Please enter another name.",
+            )
+        sheet_id = properties.get("sheetId")
+        if sheet_id is None:
+            sheet_id = max(sheet.sheet_id for sheet in sheets) + 1
+        elif any(sheet.sheet_id == sheet_id for sheet in sheets):
+            raise FakeSheetsError(400, f"A sheet with the ID {sheet_id} already exists")
+        grid = properties.get("gridProperties", {})
+        sheet = FakeSheet(
+            sheet_id=sheet_id,
+            title=title,
+            row_count=grid.get("rowCount", DEFAULT_GRID_ROWS),
+            column_count=grid.get("columnCount", DEFAULT_GRID_COLUMNS),
+        )
+        sheets.append(sheet)
+        return sheet.properties()
+
+    def _write(self, range_name: str, values: List[List[Any]]) -> Dict[str, Any]:
+        """Write rows into a sheet, rejecting writes outside the grid."""
+        title, cells = _split_range(range_name)
+        sheet = self.sheet_by_title(title)
+        start_row, start_column = _range_start(cells)
+        width = max((len(row) for row in values), default=0)
+        if (
+            start_row + len(values) > sheet.row_count
+            or start_column + width > sheet.column_count
+        ):
+            raise FakeSheetsError(
+                400, f"Range ({range_name}) exceeds grid limits of sheet {title}"
+            )
+
+        if len(sheet.values) < start_row + len(values):
+            sheet.values.extend(
+                [] for _ in range(start_row + len(values) - len(sheet.values))
+            )
+        for offset, row in enumerate(values):
+            target = sheet.values[start_row + offset]
+            if len(target) < start_column + len(row):
+                target.extend([""] * (start_column + len(row) - len(target)))
+            target[start_column : start_column + len(row)] = row
+        return {
+            "updatedRange": range_name,
+            "updatedRows": len(values),
+            "updatedColumns": width,
+            "updatedCells": sum(len(row) for row in values),
+        }
+
+    def _values_batch_update(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """spreadsheets.values.batchUpdate."""
+        responses = [
+            self._write(item["range"], item.get("values", [])) for item in data
+        ]
+        return {
+            "totalUpdatedRows": sum(r["updatedRows"] for r in responses),
+            "totalUpdatedCells": sum(r["updatedCells"] for r in responses),
+            "responses": responses,
+        }
+
+    def _values_get(self, range_name: str) -> Dict[str, Any]:
+        """spreadsheets.values.get: written rows from the start of the range."""
+        title, cells = _split_range(range_name)
+        start_row, start_column = _range_start(cells)
+        rows = [
+            row[start_column:] for row in self.sheet_by_title(title).values[start_row:]
+        ]
+        return {"range": range_name, "majorDimension": "ROWS", "values": rows}
+
+    def reset_stats(self) -> None:
+        """Forget recorded calls, keeping the document."""
+        self.calls = []
+        self.simulated_wait = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize recorded calls.
+
+        Returns:
+            Dictionary with total calls, calls by operation, failed calls,
+            sub-requests, bytes sent / received and simulated wait in seconds
+        """
+        return {
+            "calls": len(self.calls),
+            "by_operation": dict(Counter(call.operation for call in self.calls)),
+            "failed": sum(1 for call in self.calls if call.status >= 300),
+            "throttled": sum(1 for call in self.calls if call.status == 429),
+            "subrequests": sum(call.subrequests for call in self.calls),
+            "bytes_sent": sum(call.request_bytes for call in self.calls),
+            "bytes_received": sum(call.response_bytes for call in self.calls),
+            "simulated_wait": round(self.simulated_wait, 3),
+        }
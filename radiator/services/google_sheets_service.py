@@ -1,10 +1,11 @@
 """Google Sheets service for uploading CSV files as new sheets."""
 
 import logging
+import random
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 from google.oauth2 import service_account
@@ -12,9 +13,23 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from radiator.commands.models.ttm_details_columns import TTMDetailsColumns
+from radiator.commands.services.report_output import (
+    find_columnar_report,
+    read_columnar_report,
+)
 
 logger = logging.getLogger(__name__)
 
+# Rows per values.update call when uploading report data
+VALUE_CHUNK_ROWS = 5000
+
+# Grid size of a new sheet by default in Google Sheets
+DEFAULT_GRID_ROWS = 1000
+DEFAULT_GRID_COLUMNS = 26
+
+# Fixed width of 'Название' column in pixels
+NAME_COLUMN_WIDTH = 500
+
 # Column notes mapping based on TTM_DETAILS_REPORT_GUIDE.md
 COLUMN_NOTES = {
     "Ключ задачи": "Ключ задачи из трекера (например, CPO-123)",
@@ -47,7 +62,11 @@ class GoogleSheetsService:
     """Service for uploading CSV files to Google Sheets as new worksheets."""
 
     def __init__(
-        self, credentials_path: str, document_id: str, sheet_prefix: str = "Report_"
+        self,
+        credentials_path: str,
+        document_id: str,
+        sheet_prefix: str = "Report_",
+        http: Optional[Any] = None,
     ):
         """
         Initialize Google Sheets service.
@@ -56,15 +75,25 @@ class GoogleSheetsService:
             credentials_path: Path to service account JSON file
             document_id: Google Sheets document ID
             sheet_prefix: Prefix for new sheet names
+            http: Optional httplib2-compatible transport used instead of
+                authenticated HTTP (e.g. FakeSheetsHttp for tests and benchmarks)
         """
         self.credentials_path = credentials_path
         self.document_id = document_id
         self.sheet_prefix = sheet_prefix
+        self.http = http
         self.service = None
+        # Properties (sheetId, title) of document sheets, see _sheet_properties
+        self._sheets_cache: Optional[List[Dict[str, Any]]] = None
         self._authenticate()
 
     def _authenticate(self):
         """Authenticate with Google Sheets API."""
+        if self.http is not None:
+            # Подмененный транспорт: учетные данные не нужны
+            self.service = build("sheets", "v4", http=self.http)
+            logger.info("Using custom HTTP transport for Google Sheets API")
+            return
         try:
             credentials = service_account.Credentials.from_service_account_file(
                 self.credentials_path,
@@ -111,12 +140,23 @@ class GoogleSheetsService:
         """
         Read CSV file with multiple encoding attempts.
 
+        A fresh Parquet / Arrow copy of the report is read instead when present.
+
         Args:
             file_path: Path to CSV file
 
         Returns:
             DataFrame or None if failed
         """
+        columnar = find_columnar_report(file_path)
+        if columnar is not None:
+            try:
+                df = read_columnar_report(columnar, dates_as_text=True)
+                logger.info(f"Read columnar copy {columnar.name} of {file_path.name}")
+                return df
+            except Exception as e:
+                logger.warning(f"Failed to read columnar copy {columnar.name}: {e}")
+
         encodings = ["utf-8", "utf-8-sig", "windows-1251", "cp1251", "iso-8859-1"]
 
         for encoding in encodings:
@@ -175,41 +215,190 @@ class GoogleSheetsService:
 
         return data
 
-    def create_sheet(self, sheet_name: str) -> bool:
+    def _sheet_properties(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
-        Create a new sheet in the Google Sheets document.
+        Get properties (sheetId, title) of all sheets in the document.
+
+        Metadata is fetched once and reused by sheet lookups; sheets added by
+        this service are appended to the cache. Upload refreshes it once.
 
         Args:
-            sheet_name: Name for the new sheet
+            refresh: Re-fetch metadata from the API
 
         Returns:
-            True if successful, False otherwise
+            List of sheet properties
         """
-        try:
-            # Get existing sheets to check for duplicates
+        if self._sheets_cache is None or refresh:
             spreadsheet = (
                 self.service.spreadsheets()
-                .get(spreadsheetId=self.document_id)
+                .get(
+                    spreadsheetId=self.document_id,
+                    fields="sheets.properties(sheetId,title)",
+                )
                 .execute()
             )
-            existing_sheets = [
-                sheet["properties"]["title"] for sheet in spreadsheet["sheets"]
+            self._sheets_cache = [
+                sheet["properties"] for sheet in spreadsheet.get("sheets", [])
             ]
+        return self._sheets_cache
 
-            # If sheet already exists, add timestamp
-            if sheet_name in existing_sheets:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                sheet_name = f"{sheet_name}_{timestamp}"
+    def _find_sheet(self, key: str, value: Any) -> Optional[Dict[str, Any]]:
+        """
+        Find sheet properties by property value, re-fetching metadata on a miss.
+
+        Args:
+            key: Property name ("title" or "sheetId")
+            value: Property value
+
+        Returns:
+            Sheet properties or None if not found
+        """
+        was_cached = self._sheets_cache is not None
+        for refresh in (False, True) if was_cached else (False,):
+            for properties in self._sheet_properties(refresh=refresh):
+                if properties.get(key) == value:
+                    return properties
+        return None
+
+    def _remember_sheet(self, sheet_id: int, sheet_name: str) -> None:
+        """Add sheet created by this service to the metadata cache."""
+        if self._sheets_cache is not None:
+            self._sheets_cache.append({"sheetId": sheet_id, "title": sheet_name})
+
+    def _unique_sheet_name(self, sheet_name: str) -> str:
+        """
+        Get sheet name that does not clash with existing sheets.
+
+        Args:
+            sheet_name: Desired sheet name
 
-            # Create new sheet
-            request_body = {
-                "requests": [{"addSheet": {"properties": {"title": sheet_name}}}]
+        Returns:
+            Sheet name, with timestamp suffix if the name is taken
+        """
+        existing_sheets = {
+            properties.get("title") for properties in self._sheet_properties()
+        }
+        if sheet_name in existing_sheets:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            sheet_name = f"{sheet_name}_{timestamp}"
+        return sheet_name
+
+    def _new_sheet_id(self) -> int:
+        """
+        Pick unused sheet ID for a new sheet.
+
+        Choosing the ID on the client lets requests of the same batchUpdate
+        reference the sheet before the API has created it.
+
+        Returns:
+            Sheet ID not used in the document
+        """
+        try:
+            used = {
+                properties.get("sheetId") for properties in self._sheet_properties()
             }
+        except Exception as e:
+            logger.warning(f"Failed to load sheet IDs, using random ID: {e}")
+            used = set()
+        while True:
+            sheet_id = random.randint(1, 2**31 - 1)
+            if sheet_id not in used:
+                return sheet_id
+
+    def _add_sheet_request(
+        self,
+        sheet_id: int,
+        sheet_name: str,
+        row_count: Optional[int] = None,
+        column_count: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build addSheet request.
+
+        Args:
+            sheet_id: ID of the new sheet (from _new_sheet_id)
+            sheet_name: Name of the new sheet
+            row_count: Optional grid row count
+            column_count: Optional grid column count
+
+        Returns:
+            addSheet request
+        """
+        properties: Dict[str, Any] = {"sheetId": sheet_id, "title": sheet_name}
+        grid_properties = {}
+        if row_count is not None:
+            grid_properties["rowCount"] = row_count
+        if column_count is not None:
+            grid_properties["columnCount"] = column_count
+        if grid_properties:
+            properties["gridProperties"] = grid_properties
+        return {"addSheet": {"properties": properties}}
+
+    def _batch_update(
+        self, requests: List[Dict[str, Any]], document_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Send requests in one batchUpdate call.
+
+        Args:
+            requests: batchUpdate requests, applied in order
+            document_id: Document ID (defaults to the service document)
+
+        Returns:
+            batchUpdate response
+        """
+        response = (
+            self.service.spreadsheets()
+            .batchUpdate(
+                spreadsheetId=document_id or self.document_id,
+                body={"requests": requests},
+            )
+            .execute()
+        )
+        logger.debug(f"batchUpdate: {len(requests)} requests")
+        return response
+
+    def _write_values(
+        self,
+        sheet_name: str,
+        data: List[List[Any]],
+        chunk_rows: Optional[int] = None,
+    ) -> None:
+        """
+        Write rows starting at A1, one values.update call per chunk of rows.
 
-            self.service.spreadsheets().batchUpdate(
-                spreadsheetId=self.document_id, body=request_body
+        Args:
+            sheet_name: Name of the sheet
+            data: Rows including header
+            chunk_rows: Rows per call (defaults to VALUE_CHUNK_ROWS)
+        """
+        chunk_rows = chunk_rows or VALUE_CHUNK_ROWS
+        for start in range(0, len(data), chunk_rows):
+            self.service.spreadsheets().values().update(
+                spreadsheetId=self.document_id,
+                range=f"{sheet_name}!A{start + 1}",
+                valueInputOption="USER_ENTERED",  # Use USER_ENTERED to process formulas like HYPERLINK
+                body={"values": data[start : start + chunk_rows]},
             ).execute()
 
+    def create_sheet(self, sheet_name: str) -> bool:
+        """
+        Create a new sheet in the Google Sheets document.
+
+        Args:
+            sheet_name: Name for the new sheet
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # If sheet already exists, add timestamp
+            sheet_name = self._unique_sheet_name(sheet_name)
+            sheet_id = self._new_sheet_id()
+
+            self._batch_update([self._add_sheet_request(sheet_id, sheet_name)])
+            self._remember_sheet(sheet_id, sheet_name)
+
             logger.info(f"Successfully created sheet: {sheet_name}")
             return True
 
@@ -226,6 +415,10 @@ class GoogleSheetsService:
         """
         Upload CSV file as a new sheet in Google Sheets.
 
+        The upload takes one metadata read, one batchUpdate creating the
+        sheet, values.update calls per VALUE_CHUNK_ROWS rows and one
+        batchUpdate with all formatting.
+
         Args:
             file_path: Path to CSV file
             sheet_name: Optional custom sheet name (defaults to filename)
@@ -243,52 +436,49 @@ class GoogleSheetsService:
             if sheet_name is None:
                 sheet_name = self._sanitize_sheet_name(file_path.name)
 
-            # Create new sheet
-            if not self.create_sheet(sheet_name):
-                return None
+            # Metadata is read once for the whole upload
+            self._sheet_properties(refresh=True)
+            sheet_name = self._unique_sheet_name(sheet_name)
+            sheet_id = self._new_sheet_id()
 
             # Prepare data for upload
             data = self._prepare_data_for_sheets(df)
+            num_columns = len(df.columns)
+
+            # Create sheet large enough for all value chunks: values.update
+            # cannot start outside the grid
+            self._batch_update(
+                [
+                    self._add_sheet_request(
+                        sheet_id,
+                        sheet_name,
+                        row_count=max(len(data), DEFAULT_GRID_ROWS),
+                        column_count=max(num_columns, DEFAULT_GRID_COLUMNS),
+                    )
+                ]
+            )
+            self._remember_sheet(sheet_id, sheet_name)
+            logger.info(f"Successfully created sheet: {sheet_name}")
 
             # Upload data to sheet
-            range_name = f"{sheet_name}!A1"
-
-            body = {"values": data}
-
-            self.service.spreadsheets().values().update(
-                spreadsheetId=self.document_id,
-                range=range_name,
-                valueInputOption="USER_ENTERED",  # Use USER_ENTERED to process formulas like HYPERLINK
-                body=body,
-            ).execute()
-
-            # Auto-resize columns
-            self._auto_resize_columns(sheet_name, len(df.columns))
-
-            # Add filter to all data (headers + data rows)
-            self._add_filter_to_all_data(sheet_name, len(df.columns), len(df) + 1)
-
-            # Apply conditional formatting to highlight cells exceeding thresholds
-            sheet_id = self._get_sheet_id(sheet_name)
-            if sheet_id is not None:
-                self._apply_conditional_formatting_to_details(
-                    sheet_id=sheet_id, sheet_name=sheet_name, num_rows=len(df)
-                )
-
-                # Freeze first row and resize 'Название' column
-                self._freeze_first_row(sheet_id=sheet_id, sheet_name=sheet_name)
-                self._resize_name_column(sheet_id=sheet_id, sheet_name=sheet_name)
-
-                # Freeze first row and resize 'Название' column
-                self._freeze_first_row(sheet_id=sheet_id, sheet_name=sheet_name)
-                self._resize_name_column(sheet_id=sheet_id, sheet_name=sheet_name)
-
-                # Add notes to column headers
-                self._add_column_notes_to_details(
-                    sheet_id=sheet_id,
-                    sheet_name=sheet_name,
-                    column_names=list(df.columns),
-                )
+            self._write_values(sheet_name, data)
+
+            # All formatting in one batchUpdate: auto-resize goes after the values
+            # are written, fixed 'Название' width after auto-resize
+            requests = [self._auto_resize_request(sheet_id, num_columns)]
+            requests.append(self._filter_request(sheet_id, num_columns, len(df) + 1))
+            requests.extend(
+                self._details_conditional_formatting_requests(sheet_id, len(df))
+            )
+            requests.append(self._freeze_first_row_request(sheet_id))
+            requests.append(self._resize_name_column_request(sheet_id))
+            requests.extend(self._column_notes_requests(sheet_id, list(df.columns)))
+            try:
+                self._batch_update(requests)
+            except Exception as e:
+                # batchUpdate is atomic: the sheet keeps its values, only
+                # formatting is missing
+                logger.warning(f"Failed to format sheet {sheet_name}: {e}")
 
             logger.info(f"Successfully uploaded {file_path.name} to sheet {sheet_name}")
             return sheet_name
@@ -300,6 +490,28 @@ class GoogleSheetsService:
             logger.error(f"Unexpected error uploading CSV {file_path.name}: {e}")
             return None
 
+    def _auto_resize_request(self, sheet_id: int, num_columns: int) -> Dict[str, Any]:
+        """
+        Build request auto-resizing the first num_columns columns.
+
+        Args:
+            sheet_id: ID of the sheet
+            num_columns: Number of columns to resize
+
+        Returns:
+            autoResizeDimensions request
+        """
+        return {
+            "autoResizeDimensions": {
+                "dimensions": {
+                    "sheetId": sheet_id,
+                    "dimension": "COLUMNS",
+                    "startIndex": 0,
+                    "endIndex": num_columns,
+                }
+            }
+        }
+
     def _auto_resize_columns(self, sheet_name: str, num_columns: int):
         """
         Auto-resize columns in the sheet.
@@ -309,34 +521,43 @@ class GoogleSheetsService:
             num_columns: Number of columns to resize
         """
         try:
-            # Create column range (A to last column)
-            end_column = chr(ord("A") + num_columns - 1)
-            range_name = f"{sheet_name}!A:{end_column}"
-
-            request_body = {
-                "requests": [
-                    {
-                        "autoResizeDimensions": {
-                            "dimensions": {
-                                "sheetId": self._get_sheet_id(sheet_name),
-                                "dimension": "COLUMNS",
-                                "startIndex": 0,
-                                "endIndex": num_columns,
-                            }
-                        }
-                    }
-                ]
-            }
-
-            self.service.spreadsheets().batchUpdate(
-                spreadsheetId=self.document_id, body=request_body
-            ).execute()
+            self._batch_update(
+                [self._auto_resize_request(self._get_sheet_id(sheet_name), num_columns)]
+            )
 
             logger.debug(f"Auto-resized columns for sheet {sheet_name}")
 
         except Exception as e:
             logger.warning(f"Failed to auto-resize columns for sheet {sheet_name}: {e}")
 
+    def _filter_request(
+        self, sheet_id: int, num_columns: int, num_rows: int
+    ) -> Dict[str, Any]:
+        """
+        Build basic filter request over headers and data rows.
+
+        Args:
+            sheet_id: ID of the sheet
+            num_columns: Number of columns to include in filter
+            num_rows: Number of rows to include in filter (including header)
+
+        Returns:
+            setBasicFilter request
+        """
+        return {
+            "setBasicFilter": {
+                "filter": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "startRowIndex": 0,
+                        "endRowIndex": num_rows,
+                        "startColumnIndex": 0,
+                        "endColumnIndex": num_columns,
+                    }
+                }
+            }
+        }
+
     def _add_filter_to_all_data(self, sheet_name: str, num_columns: int, num_rows: int):
         """
         Add filter to all data in the sheet (headers + data rows).
@@ -353,31 +574,7 @@ class GoogleSheetsService:
                 logger.warning(f"Cannot add filter: sheet {sheet_name} not found")
                 return
 
-            # Create column range (A to last column)
-            end_column = chr(ord("A") + num_columns - 1)
-            range_name = f"{sheet_name}!A1:{end_column}{num_rows}"
-
-            request_body = {
-                "requests": [
-                    {
-                        "setBasicFilter": {
-                            "filter": {
-                                "range": {
-                                    "sheetId": sheet_id,
-                                    "startRowIndex": 0,
-                                    "endRowIndex": num_rows,
-                                    "startColumnIndex": 0,
-                                    "endColumnIndex": num_columns,
-                                }
-                            }
-                        }
-                    }
-                ]
-            }
-
-            self.service.spreadsheets().batchUpdate(
-                spreadsheetId=self.document_id, body=request_body
-            ).execute()
+            self._batch_update([self._filter_request(sheet_id, num_columns, num_rows)])
 
             logger.debug(
                 f"Added filter to all data ({num_rows} rows, {num_columns} columns) for sheet {sheet_name}"
@@ -399,15 +596,8 @@ class GoogleSheetsService:
             Sheet ID or None if not found
         """
         try:
-            spreadsheet = (
-                self.service.spreadsheets()
-                .get(spreadsheetId=self.document_id)
-                .execute()
-            )
-            for sheet in spreadsheet["sheets"]:
-                if sheet["properties"]["title"] == sheet_name:
-                    return sheet["properties"]["sheetId"]
-            return None
+            properties = self._find_sheet("title", sheet_name)
+            return properties["sheetId"] if properties else None
         except Exception as e:
             logger.error(f"Failed to get sheet ID for {sheet_name}: {e}")
             return None
@@ -423,15 +613,8 @@ class GoogleSheetsService:
             Sheet name or None if not found
         """
         try:
-            spreadsheet = (
-                self.service.spreadsheets()
-                .get(spreadsheetId=self.document_id)
-                .execute()
-            )
-            for sheet in spreadsheet["sheets"]:
-                if sheet["properties"]["sheetId"] == sheet_id:
-                    return sheet["properties"]["title"]
-            return None
+            properties = self._find_sheet("sheetId", sheet_id)
+            return properties["title"] if properties else None
         except Exception as e:
             logger.error(f"Failed to get sheet name for ID {sheet_id}: {e}")
             return None
@@ -493,24 +676,14 @@ class GoogleSheetsService:
             if source_sheet_name is None:
                 source_sheet_name = self._get_sheet_name_by_id(source_sheet_id)
 
-            # Create TTD pivot table with unique name
+            # TTD and TTM pivot tables with unique names in one batchUpdate
             import time
 
             timestamp = int(time.time())
-            ttd_sheet_id = self._create_google_pivot_table(
-                document_id,
-                source_sheet_id,
-                f"TTD Pivot {timestamp}",
-                "ttd",
-                source_sheet_name=source_sheet_name,
-            )
-
-            # Create TTM pivot table with unique name
-            ttm_sheet_id = self._create_google_pivot_table(
+            ttd_sheet_id, ttm_sheet_id = self._create_google_pivot_tables(
                 document_id,
                 source_sheet_id,
-                f"TTM Pivot {timestamp}",
-                "ttm",
+                [(f"TTD Pivot {timestamp}", "ttd"), (f"TTM Pivot {timestamp}", "ttm")],
                 source_sheet_name=source_sheet_name,
             )
 
@@ -583,73 +756,101 @@ class GoogleSheetsService:
         Returns:
             New sheet ID if successful, None otherwise
         """
-        try:
-            # Create new sheet for pivot table
-            request_body = {
-                "requests": [
-                    {
-                        "addSheet": {
-                            "properties": {
-                                "title": sheet_name,
-                                "gridProperties": {"rowCount": 1000, "columnCount": 20},
-                            }
-                        }
-                    }
-                ]
-            }
-
-            response = (
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=document_id, body=request_body)
-                .execute()
-            )
-
-            new_sheet_id = response["replies"][0]["addSheet"]["properties"]["sheetId"]
+        return self._create_google_pivot_tables(
+            document_id,
+            source_sheet_id,
+            [(sheet_name, pivot_type)],
+            source_sheet_name=source_sheet_name,
+        )[0]
+
+    def _create_google_pivot_tables(
+        self,
+        document_id: str,
+        source_sheet_id: int,
+        pivots: List[Tuple[str, str]],
+        source_sheet_name: Optional[str] = None,
+    ) -> List[Optional[int]]:
+        """
+        Create Google Sheets pivot tables with one batchUpdate and one values call.
 
-            # Create pivot table
-            pivot_table_request = self._build_pivot_table_request(
-                source_sheet_id, new_sheet_id, pivot_type
-            )
+        Sheets, pivot tables and all their formatting go into a single
+        batchUpdate; percentile statistics formulas of all pivots are written
+        with one values.batchUpdate.
 
-            if pivot_table_request:
-                self.service.spreadsheets().batchUpdate(
-                    spreadsheetId=document_id, body={"requests": [pivot_table_request]}
-                ).execute()
+        Args:
+            document_id: Google Sheets document ID
+            source_sheet_id: Source sheet ID with data
+            pivots: (sheet name, pivot type "ttd" or "ttm") of each pivot
+            source_sheet_name: Optional name of the source sheet (for percentile statistics)
 
-            # Add percentile statistics
+        Returns:
+            New sheet IDs in pivots order (all None if failed)
+        """
+        names = ", ".join(sheet_name for sheet_name, _ in pivots)
+        try:
             # Get source sheet name if not provided
             if source_sheet_name is None:
                 source_sheet_name = self._get_sheet_name_by_id(source_sheet_id)
+            if not source_sheet_name:
+                logger.warning(
+                    "Could not determine source sheet name for percentile statistics"
+                )
 
-            if source_sheet_name:
-                self._add_percentile_statistics(
-                    sheet_id=new_sheet_id,
-                    sheet_name=sheet_name,
-                    source_sheet_name=source_sheet_name,
-                    pivot_type=pivot_type,
+            sheet_ids = [self._new_sheet_id() for _ in pivots]
+            requests = []
+            value_ranges = []
+            for sheet_id, (sheet_name, pivot_type) in zip(sheet_ids, pivots):
+                requests.append(
+                    self._add_sheet_request(
+                        sheet_id, sheet_name, row_count=1000, column_count=20
+                    )
                 )
-            else:
-                logger.warning(
-                    f"Could not determine source sheet name for percentile statistics"
+
+                pivot_table_request = self._build_pivot_table_request(
+                    source_sheet_id, sheet_id, pivot_type
                 )
+                if pivot_table_request:
+                    requests.append(pivot_table_request)
 
-            # Apply conditional formatting to highlight threshold values
-            # Use large number for rows since pivot tables can have dynamic row count
-            self._apply_conditional_formatting_to_pivot(
-                sheet_id=new_sheet_id,
-                sheet_name=sheet_name,
-                pivot_type=pivot_type,
-                num_rows=1000,
-            )
+                if source_sheet_name:
+                    statistics = self._percentile_statistics_values(
+                        sheet_name, source_sheet_name, pivot_type
+                    )
+                    if statistics:
+                        range_name, data = statistics
+                        value_ranges.append({"range": range_name, "values": data})
+                        requests.extend(
+                            self._percentile_statistics_formatting_requests(
+                                sheet_id,
+                                self._percentile_statistics_start_column(pivot_type),
+                                pivot_type,
+                            )
+                        )
+
+                # Use large number for rows since pivot tables can have dynamic row count
+                requests.extend(
+                    self._pivot_conditional_formatting_requests(
+                        sheet_id, pivot_type, num_rows=1000
+                    )
+                )
 
-            logger.info(f"Successfully created Google Sheets pivot table: {sheet_name}")
-            return new_sheet_id
+            self._batch_update(requests, document_id)
+            if document_id == self.document_id:
+                for sheet_id, (sheet_name, _) in zip(sheet_ids, pivots):
+                    self._remember_sheet(sheet_id, sheet_name)
+
+            if value_ranges:
+                self.service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=document_id,
+                    body={"valueInputOption": "USER_ENTERED", "data": value_ranges},
+                ).execute()
+
+            logger.info(f"Successfully created Google Sheets pivot tables: {names}")
+            return sheet_ids
 
         except Exception as e:
-            logger.error(
-                f"Failed to create Google Sheets pivot table {sheet_name}: {e}"
-            )
-            return None
+            logger.error(f"Failed to create Google Sheets pivot tables {names}: {e}")
+            return [None] * len(pivots)
 
     def _build_pivot_table_request(
         self, source_sheet_id: int, target_sheet_id: int, pivot_type: str
@@ -899,6 +1100,89 @@ class GoogleSheetsService:
             logger.warning(f"Unknown pivot type: {pivot_type}, defaulting to TTD width")
             return base_groupings + 6
 
+    def _percentile_statistics_start_column(self, pivot_type: str) -> int:
+        """
+        Get column index of percentile statistics (end of pivot table + 2 columns).
+
+        Args:
+            pivot_type: Type of pivot ("ttd" or "ttm")
+
+        Returns:
+            Start column index (0-based)
+        """
+        return self._calculate_pivot_table_width(pivot_type) + 2
+
+    def _percentile_statistics_values(
+        self, sheet_name: str, source_sheet_name: str, pivot_type: str
+    ) -> Optional[Tuple[str, List[List[Any]]]]:
+        """
+        Build percentile statistics block placed next to pivot table.
+
+        Args:
+            sheet_name: Name of the sheet with pivot table
+            source_sheet_name: Name of the source sheet with data
+            pivot_type: Type of pivot ("ttd" or "ttm")
+
+        Returns:
+            (A1 range, rows with headers and PERCENTILE formulas), None for
+            unknown pivot type
+        """
+        start_column_index = self._percentile_statistics_start_column(pivot_type)
+        start_column_letter = self._index_to_column_letter(start_column_index)
+        end_column_letter = self._index_to_column_letter(start_column_index + 2)
+
+        # Get column letters for metrics using TTMDetailsColumns indices
+        ttm_column_index = TTMDetailsColumns.get_column_index("TTM")
+        tail_column_index = TTMDetailsColumns.get_column_index("Tail")
+        devlt_column_index = TTMDetailsColumns.get_column_index("DevLT")
+        ttd_column_index = TTMDetailsColumns.get_column_index("TTD")
+
+        ttm_column_letter = self._index_to_column_letter(ttm_column_index)
+        tail_column_letter = self._index_to_column_letter(tail_column_index)
+        devlt_column_letter = self._index_to_column_letter(devlt_column_index)
+        ttd_column_letter = self._index_to_column_letter(ttd_column_index)
+
+        # Prepare data based on pivot type
+        if pivot_type == "ttm":
+            # TTM Pivot: 6 rows, 3 columns
+            data = [
+                ["ТТМ, 50 перц.", "ТТМ, 85 перц. ", "TTM, порог"],
+                [
+                    f"=PERCENTILE('{source_sheet_name}'!{ttm_column_letter}:{ttm_column_letter};0,5)",
+                    f"=PERCENTILE('{source_sheet_name}'!{ttm_column_letter}:{ttm_column_letter};0,85)",
+                    180,
+                ],
+                ["Tail, 50 перц.", "Tail, 85 перц. ", "Tail, порог"],
+                [
+                    f"=PERCENTILE('{source_sheet_name}'!{tail_column_letter}:{tail_column_letter};0,5)",
+                    f"=PERCENTILE('{source_sheet_name}'!{tail_column_letter}:{tail_column_letter};0,85)",
+                    60,
+                ],
+                ["DevLT, 50 perc", "DevLT, 85 perc", "DevLT, порог"],
+                [
+                    f"=PERCENTILE('{source_sheet_name}'!{devlt_column_letter}:{devlt_column_letter};0,5)",
+                    f"=PERCENTILE('{source_sheet_name}'!{devlt_column_letter}:{devlt_column_letter};0,85)",
+                    60,
+                ],
+            ]
+            range_name = f"{sheet_name}!{start_column_letter}2:{end_column_letter}7"
+        elif pivot_type == "ttd":
+            # TTD Pivot: 2 rows, 3 columns
+            data = [
+                ["ТТD, 50 перц.", "ТТD, 85 перц. ", "TTD, порог"],
+                [
+                    f"=PERCENTILE('{source_sheet_name}'!{ttd_column_letter}:{ttd_column_letter};0,5)",
+                    f"=PERCENTILE('{source_sheet_name}'!{ttd_column_letter}:{ttd_column_letter};0,85)",
+                    60,
+                ],
+            ]
+            range_name = f"{sheet_name}!{start_column_letter}2:{end_column_letter}3"
+        else:
+            logger.error(f"Unknown pivot type: {pivot_type}")
+            return None
+
+        return range_name, data
+
     def _add_percentile_statistics(
         self,
         sheet_id: int,
@@ -919,63 +1203,12 @@ class GoogleSheetsService:
             True if successful, False otherwise
         """
         try:
-            # Calculate pivot table width
-            pivot_table_width = self._calculate_pivot_table_width(pivot_type)
-
-            # Calculate start column index (end of pivot table + 2 columns)
-            start_column_index = pivot_table_width + 2
-            start_column_letter = self._index_to_column_letter(start_column_index)
-            end_column_letter = self._index_to_column_letter(start_column_index + 2)
-
-            # Get column letters for metrics using TTMDetailsColumns indices
-            ttm_column_index = TTMDetailsColumns.get_column_index("TTM")
-            tail_column_index = TTMDetailsColumns.get_column_index("Tail")
-            devlt_column_index = TTMDetailsColumns.get_column_index("DevLT")
-            ttd_column_index = TTMDetailsColumns.get_column_index("TTD")
-
-            ttm_column_letter = self._index_to_column_letter(ttm_column_index)
-            tail_column_letter = self._index_to_column_letter(tail_column_index)
-            devlt_column_letter = self._index_to_column_letter(devlt_column_index)
-            ttd_column_letter = self._index_to_column_letter(ttd_column_index)
-
-            # Prepare data based on pivot type
-            if pivot_type == "ttm":
-                # TTM Pivot: 6 rows, 3 columns
-                data = [
-                    ["ТТМ, 50 перц.", "ТТМ, 85 перц. ", "TTM, порог"],
-                    [
-                        f"=PERCENTILE('{source_sheet_name}'!{ttm_column_letter}:{ttm_column_letter};0,5)",
-                        f"=PERCENTILE('{source_sheet_name}'!{ttm_column_letter}:{ttm_column_letter};0,85)",
-                        180,
-                    ],
-                    ["Tail, 50 перц.", "Tail, 85 перц. ", "Tail, порог"],
-                    [
-                        f"=PERCENTILE('{source_sheet_name}'!{tail_column_letter}:{tail_column_letter};0,5)",
-                        f"=PERCENTILE('{source_sheet_name}'!{tail_column_letter}:{tail_column_letter};0,85)",
-                        60,
-                    ],
-                    ["DevLT, 50 perc", "DevLT, 85 perc", "DevLT, порог"],
-                    [
-                        f"=PERCENTILE('{source_sheet_name}'!{devlt_column_letter}:{devlt_column_letter};0,5)",
-                        f"=PERCENTILE('{source_sheet_name}'!{devlt_column_letter}:{devlt_column_letter};0,85)",
-                        60,
-                    ],
-                ]
-                range_name = f"{sheet_name}!{start_column_letter}2:{end_column_letter}7"
-            elif pivot_type == "ttd":
-                # TTD Pivot: 2 rows, 3 columns
-                data = [
-                    ["ТТD, 50 перц.", "ТТD, 85 перц. ", "TTD, порог"],
-                    [
-                        f"=PERCENTILE('{source_sheet_name}'!{ttd_column_letter}:{ttd_column_letter};0,5)",
-                        f"=PERCENTILE('{source_sheet_name}'!{ttd_column_letter}:{ttd_column_letter};0,85)",
-                        60,
-                    ],
-                ]
-                range_name = f"{sheet_name}!{start_column_letter}2:{end_column_letter}3"
-            else:
-                logger.error(f"Unknown pivot type: {pivot_type}")
+            statistics = self._percentile_statistics_values(
+                sheet_name, source_sheet_name, pivot_type
+            )
+            if statistics is None:
                 return False
+            range_name, data = statistics
 
             # Write data to sheet
             body = {"values": data}
@@ -993,7 +1226,7 @@ class GoogleSheetsService:
             # Apply formatting
             self._apply_percentile_statistics_formatting(
                 sheet_id=sheet_id,
-                start_column_index=start_column_index,
+                start_column_index=self._percentile_statistics_start_column(pivot_type),
                 pivot_type=pivot_type,
             )
 
@@ -1003,11 +1236,11 @@ class GoogleSheetsService:
             logger.error(f"Failed to add percentile statistics to {sheet_name}: {e}")
             return False
 
-    def _apply_percentile_statistics_formatting(
+    def _percentile_statistics_formatting_requests(
         self, sheet_id: int, start_column_index: int, pivot_type: str
-    ) -> bool:
+    ) -> List[Dict[str, Any]]:
         """
-        Apply formatting to percentile statistics (bold headers, orange threshold values).
+        Build formatting requests of percentile statistics (bold headers, orange threshold values).
 
         Args:
             sheet_id: ID of the sheet with pivot table
@@ -1015,81 +1248,26 @@ class GoogleSheetsService:
             pivot_type: Type of pivot ("ttd" or "ttm")
 
         Returns:
-            True if successful, False otherwise
+            List of batchUpdate requests
         """
-        try:
-            requests = []
+        requests = []
 
-            if pivot_type == "ttm":
-                # TTM Pivot: bold headers in rows 2, 4, 6 (0-based: 1, 3, 5)
-                # Orange thresholds in column 3 (start_column_index + 2) of rows 3, 5, 7 (0-based: 2, 4, 6)
-                header_rows = [1, 3, 5]  # Rows 2, 4, 6 (0-based)
-                threshold_rows = [2, 4, 6]  # Rows 3, 5, 7 (0-based)
-                threshold_column = start_column_index + 2  # Third column (0-based)
+        if pivot_type == "ttm":
+            # TTM Pivot: bold headers in rows 2, 4, 6 (0-based: 1, 3, 5)
+            # Orange thresholds in column 3 (start_column_index + 2) of rows 3, 5, 7 (0-based: 2, 4, 6)
+            header_rows = [1, 3, 5]  # Rows 2, 4, 6 (0-based)
+            threshold_rows = [2, 4, 6]  # Rows 3, 5, 7 (0-based)
+            threshold_column = start_column_index + 2  # Third column (0-based)
 
-                # Apply bold formatting to header rows (all 3 columns)
-                for row_index in header_rows:
-                    requests.append(
-                        {
-                            "repeatCell": {
-                                "range": {
-                                    "sheetId": sheet_id,
-                                    "startRowIndex": row_index,
-                                    "endRowIndex": row_index + 1,
-                                    "startColumnIndex": start_column_index,
-                                    "endColumnIndex": start_column_index + 3,
-                                },
-                                "cell": {
-                                    "userEnteredFormat": {
-                                        "textFormat": {"bold": True},
-                                    }
-                                },
-                                "fields": "userEnteredFormat.textFormat.bold",
-                            }
-                        }
-                    )
-
-                # Apply orange background to threshold values
-                for row_index in threshold_rows:
-                    requests.append(
-                        {
-                            "repeatCell": {
-                                "range": {
-                                    "sheetId": sheet_id,
-                                    "startRowIndex": row_index,
-                                    "endRowIndex": row_index + 1,
-                                    "startColumnIndex": threshold_column,
-                                    "endColumnIndex": threshold_column + 1,
-                                },
-                                "cell": {
-                                    "userEnteredFormat": {
-                                        "backgroundColor": {
-                                            "red": 1.0,
-                                            "green": 0.647,
-                                            "blue": 0.0,
-                                        }
-                                    }
-                                },
-                                "fields": "userEnteredFormat.backgroundColor",
-                            }
-                        }
-                    )
-
-            elif pivot_type == "ttd":
-                # TTD Pivot: bold header in row 2 (0-based: 1)
-                # Orange threshold in column 3 (start_column_index + 2) of row 3 (0-based: 2)
-                header_row = 1  # Row 2 (0-based)
-                threshold_row = 2  # Row 3 (0-based)
-                threshold_column = start_column_index + 2  # Third column (0-based)
-
-                # Apply bold formatting to header row (all 3 columns)
+            # Apply bold formatting to header rows (all 3 columns)
+            for row_index in header_rows:
                 requests.append(
                     {
                         "repeatCell": {
                             "range": {
                                 "sheetId": sheet_id,
-                                "startRowIndex": header_row,
-                                "endRowIndex": header_row + 1,
+                                "startRowIndex": row_index,
+                                "endRowIndex": row_index + 1,
                                 "startColumnIndex": start_column_index,
                                 "endColumnIndex": start_column_index + 3,
                             },
@@ -1103,14 +1281,15 @@ class GoogleSheetsService:
                     }
                 )
 
-                # Apply orange background to threshold value
+            # Apply orange background to threshold values
+            for row_index in threshold_rows:
                 requests.append(
                     {
                         "repeatCell": {
                             "range": {
                                 "sheetId": sheet_id,
-                                "startRowIndex": threshold_row,
-                                "endRowIndex": threshold_row + 1,
+                                "startRowIndex": row_index,
+                                "endRowIndex": row_index + 1,
                                 "startColumnIndex": threshold_column,
                                 "endColumnIndex": threshold_column + 1,
                             },
@@ -1128,15 +1307,86 @@ class GoogleSheetsService:
                     }
                 )
 
-            else:
-                logger.error(f"Unknown pivot type: {pivot_type}")
-                return False
+        elif pivot_type == "ttd":
+            # TTD Pivot: bold header in row 2 (0-based: 1)
+            # Orange threshold in column 3 (start_column_index + 2) of row 3 (0-based: 2)
+            header_row = 1  # Row 2 (0-based)
+            threshold_row = 2  # Row 3 (0-based)
+            threshold_column = start_column_index + 2  # Third column (0-based)
+
+            # Apply bold formatting to header row (all 3 columns)
+            requests.append(
+                {
+                    "repeatCell": {
+                        "range": {
+                            "sheetId": sheet_id,
+                            "startRowIndex": header_row,
+                            "endRowIndex": header_row + 1,
+                            "startColumnIndex": start_column_index,
+                            "endColumnIndex": start_column_index + 3,
+                        },
+                        "cell": {
+                            "userEnteredFormat": {
+                                "textFormat": {"bold": True},
+                            }
+                        },
+                        "fields": "userEnteredFormat.textFormat.bold",
+                    }
+                }
+            )
+
+            # Apply orange background to threshold value
+            requests.append(
+                {
+                    "repeatCell": {
+                        "range": {
+                            "sheetId": sheet_id,
+                            "startRowIndex": threshold_row,
+                            "endRowIndex": threshold_row + 1,
+                            "startColumnIndex": threshold_column,
+                            "endColumnIndex": threshold_column + 1,
+                        },
+                        "cell": {
+                            "userEnteredFormat": {
+                                "backgroundColor": {
+                                    "red": 1.0,
+                                    "green": 0.647,
+                                    "blue": 0.0,
+                                }
+                            }
+                        },
+                        "fields": "userEnteredFormat.backgroundColor",
+                    }
+                }
+            )
+
+        else:
+            raise ValueError(f"Unknown pivot type: {pivot_type}")
+
+        return requests
+
+    def _apply_percentile_statistics_formatting(
+        self, sheet_id: int, start_column_index: int, pivot_type: str
+    ) -> bool:
+        """
+        Apply formatting to percentile statistics (bold headers, orange threshold values).
+
+        Args:
+            sheet_id: ID of the sheet with pivot table
+            start_column_index: Starting column index for statistics (0-based)
+            pivot_type: Type of pivot ("ttd" or "ttm")
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            requests = self._percentile_statistics_formatting_requests(
+                sheet_id, start_column_index, pivot_type
+            )
 
             # Apply formatting via batchUpdate
             if requests:
-                self.service.spreadsheets().batchUpdate(
-                    spreadsheetId=self.document_id, body={"requests": requests}
-                ).execute()
+                self._batch_update(requests)
 
                 logger.info(
                     f"Successfully applied formatting to percentile statistics (pivot_type={pivot_type})"
@@ -1148,6 +1398,83 @@ class GoogleSheetsService:
             logger.error(f"Failed to apply formatting to percentile statistics: {e}")
             return False
 
+    def _details_conditional_formatting_requests(
+        self, sheet_id: int, num_rows: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Build conditional formatting requests highlighting Details cells exceeding thresholds.
+
+        Args:
+            sheet_id: ID of the sheet
+            num_rows: Number of data rows (excluding header)
+
+        Returns:
+            List of batchUpdate requests
+        """
+        requests = []
+
+        # Define columns and thresholds
+        formatting_rules = [
+            {
+                "column_index": TTMDetailsColumns.get_column_index("TTM"),
+                "threshold": 180,
+            },
+            {
+                "column_index": TTMDetailsColumns.get_column_index("Tail"),
+                "threshold": 60,
+            },
+            {
+                "column_index": TTMDetailsColumns.get_column_index("DevLT"),
+                "threshold": 60,
+            },
+            {
+                "column_index": TTMDetailsColumns.get_column_index("TTD"),
+                "threshold": 60,
+            },
+        ]
+
+        # Create conditional formatting rule for each column
+        for rule_index, rule_config in enumerate(formatting_rules):
+            requests.append(
+                {
+                    "addConditionalFormatRule": {
+                        "rule": {
+                            "ranges": [
+                                {
+                                    "sheetId": sheet_id,
+                                    "startRowIndex": 1,  # Skip header row
+                                    "endRowIndex": num_rows + 1,
+                                    "startColumnIndex": rule_config["column_index"],
+                                    "endColumnIndex": rule_config["column_index"] + 1,
+                                }
+                            ],
+                            "booleanRule": {
+                                "condition": {
+                                    "type": "NUMBER_GREATER",
+                                    "values": [
+                                        {
+                                            "userEnteredValue": str(
+                                                rule_config["threshold"]
+                                            )
+                                        }
+                                    ],
+                                },
+                                "format": {
+                                    "backgroundColor": {
+                                        "red": 1.0,
+                                        "green": 0.647,
+                                        "blue": 0.0,
+                                    }
+                                },
+                            },
+                        },
+                        "index": rule_index,
+                    }
+                }
+            )
+
+        return requests
+
     def _apply_conditional_formatting_to_details(
         self, sheet_id: int, sheet_name: str, num_rows: int
     ) -> bool:
@@ -1163,74 +1490,11 @@ class GoogleSheetsService:
             True if successful, False otherwise
         """
         try:
-            requests = []
-
-            # Define columns and thresholds
-            formatting_rules = [
-                {
-                    "column_index": TTMDetailsColumns.get_column_index("TTM"),
-                    "threshold": 180,
-                },
-                {
-                    "column_index": TTMDetailsColumns.get_column_index("Tail"),
-                    "threshold": 60,
-                },
-                {
-                    "column_index": TTMDetailsColumns.get_column_index("DevLT"),
-                    "threshold": 60,
-                },
-                {
-                    "column_index": TTMDetailsColumns.get_column_index("TTD"),
-                    "threshold": 60,
-                },
-            ]
-
-            # Create conditional formatting rule for each column
-            for rule_index, rule_config in enumerate(formatting_rules):
-                requests.append(
-                    {
-                        "addConditionalFormatRule": {
-                            "rule": {
-                                "ranges": [
-                                    {
-                                        "sheetId": sheet_id,
-                                        "startRowIndex": 1,  # Skip header row
-                                        "endRowIndex": num_rows + 1,
-                                        "startColumnIndex": rule_config["column_index"],
-                                        "endColumnIndex": rule_config["column_index"]
-                                        + 1,
-                                    }
-                                ],
-                                "booleanRule": {
-                                    "condition": {
-                                        "type": "NUMBER_GREATER",
-                                        "values": [
-                                            {
-                                                "userEnteredValue": str(
-                                                    rule_config["threshold"]
-                                                )
-                                            }
-                                        ],
-                                    },
-                                    "format": {
-                                        "backgroundColor": {
-                                            "red": 1.0,
-                                            "green": 0.647,
-                                            "blue": 0.0,
-                                        }
-                                    },
-                                },
-                            },
-                            "index": rule_index,
-                        }
-                    }
-                )
+            requests = self._details_conditional_formatting_requests(sheet_id, num_rows)
 
             # Apply conditional formatting via batchUpdate
             if requests:
-                self.service.spreadsheets().batchUpdate(
-                    spreadsheetId=self.document_id, body={"requests": requests}
-                ).execute()
+                self._batch_update(requests)
 
                 logger.info(
                     f"Successfully applied conditional formatting to {sheet_name}"
@@ -1242,6 +1506,92 @@ class GoogleSheetsService:
             logger.error(f"Failed to apply conditional formatting to {sheet_name}: {e}")
             return False
 
+    def _pivot_conditional_formatting_requests(
+        self, sheet_id: int, pivot_type: str, num_rows: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Build conditional formatting requests highlighting Pivot cells exceeding thresholds.
+
+        Args:
+            sheet_id: ID of the sheet
+            pivot_type: Type of pivot ("ttd" or "ttm")
+            num_rows: Number of data rows (excluding header)
+
+        Returns:
+            List of batchUpdate requests
+        """
+        requests = []
+
+        # Define columns and thresholds based on pivot type
+        if pivot_type == "ttm":
+            # TTM Pivot columns:
+            # Column 5: TTM Mean (threshold: > 180)
+            # Column 6: TTM Max (threshold: > 180)
+            # Column 9: Tail Mean (threshold: > 60)
+            # Column 10: Tail Max (threshold: > 60)
+            # Column 11: DevLT Mean (threshold: > 60)
+            # Column 12: DevLT Max (threshold: > 60)
+            formatting_rules = [
+                {"column_index": 5, "threshold": 180},  # TTM Mean
+                {"column_index": 6, "threshold": 180},  # TTM Max
+                {"column_index": 9, "threshold": 60},  # Tail Mean
+                {"column_index": 10, "threshold": 60},  # Tail Max
+                {"column_index": 11, "threshold": 60},  # DevLT Mean
+                {"column_index": 12, "threshold": 60},  # DevLT Max
+            ]
+        elif pivot_type == "ttd":
+            # TTD Pivot columns:
+            # Column 5: TTD Mean (threshold: > 60)
+            # Column 6: TTD Max (threshold: > 60)
+            formatting_rules = [
+                {"column_index": 5, "threshold": 60},  # TTD Mean
+                {"column_index": 6, "threshold": 60},  # TTD Max
+            ]
+        else:
+            raise ValueError(f"Unknown pivot type: {pivot_type}")
+
+        # Create conditional formatting rule for each column
+        for rule_index, rule_config in enumerate(formatting_rules):
+            requests.append(
+                {
+                    "addConditionalFormatRule": {
+                        "rule": {
+                            "ranges": [
+                                {
+                                    "sheetId": sheet_id,
+                                    "startRowIndex": 1,  # Skip header row
+                                    "endRowIndex": num_rows + 1,
+                                    "startColumnIndex": rule_config["column_index"],
+                                    "endColumnIndex": rule_config["column_index"] + 1,
+                                }
+                            ],
+                            "booleanRule": {
+                                "condition": {
+                                    "type": "NUMBER_GREATER",
+                                    "values": [
+                                        {
+                                            "userEnteredValue": str(
+                                                rule_config["threshold"]
+                                            )
+                                        }
+                                    ],
+                                },
+                                "format": {
+                                    "backgroundColor": {
+                                        "red": 1.0,
+                                        "green": 0.647,
+                                        "blue": 0.0,
+                                    }
+                                },
+                            },
+                        },
+                        "index": rule_index,
+                    }
+                }
+            )
+
+        return requests
+
     def _apply_conditional_formatting_to_pivot(
         self, sheet_id: int, sheet_name: str, pivot_type: str, num_rows: int
     ) -> bool:
@@ -1258,83 +1608,13 @@ class GoogleSheetsService:
             True if successful, False otherwise
         """
         try:
-            requests = []
-
-            # Define columns and thresholds based on pivot type
-            if pivot_type == "ttm":
-                # TTM Pivot columns:
-                # Column 5: TTM Mean (threshold: > 180)
-                # Column 6: TTM Max (threshold: > 180)
-                # Column 9: Tail Mean (threshold: > 60)
-                # Column 10: Tail Max (threshold: > 60)
-                # Column 11: DevLT Mean (threshold: > 60)
-                # Column 12: DevLT Max (threshold: > 60)
-                formatting_rules = [
-                    {"column_index": 5, "threshold": 180},  # TTM Mean
-                    {"column_index": 6, "threshold": 180},  # TTM Max
-                    {"column_index": 9, "threshold": 60},  # Tail Mean
-                    {"column_index": 10, "threshold": 60},  # Tail Max
-                    {"column_index": 11, "threshold": 60},  # DevLT Mean
-                    {"column_index": 12, "threshold": 60},  # DevLT Max
-                ]
-            elif pivot_type == "ttd":
-                # TTD Pivot columns:
-                # Column 5: TTD Mean (threshold: > 60)
-                # Column 6: TTD Max (threshold: > 60)
-                formatting_rules = [
-                    {"column_index": 5, "threshold": 60},  # TTD Mean
-                    {"column_index": 6, "threshold": 60},  # TTD Max
-                ]
-            else:
-                logger.error(f"Unknown pivot type: {pivot_type}")
-                return False
-
-            # Create conditional formatting rule for each column
-            for rule_index, rule_config in enumerate(formatting_rules):
-                requests.append(
-                    {
-                        "addConditionalFormatRule": {
-                            "rule": {
-                                "ranges": [
-                                    {
-                                        "sheetId": sheet_id,
-                                        "startRowIndex": 1,  # Skip header row
-                                        "endRowIndex": num_rows + 1,
-                                        "startColumnIndex": rule_config["column_index"],
-                                        "endColumnIndex": rule_config["column_index"]
-                                        + 1,
-                                    }
-                                ],
-                                "booleanRule": {
-                                    "condition": {
-                                        "type": "NUMBER_GREATER",
-                                        "values": [
-                                            {
-                                                "userEnteredValue": str(
-                                                    rule_config["threshold"]
-                                                )
-                                            }
-                                        ],
-                                    },
-                                    "format": {
-                                        "backgroundColor": {
-                                            "red": 1.0,
-                                            "green": 0.647,
-                                            "blue": 0.0,
-                                        }
-                                    },
-                                },
-                            },
-                            "index": rule_index,
-                        }
-                    }
-                )
+            requests = self._pivot_conditional_formatting_requests(
+                sheet_id, pivot_type, num_rows
+            )
 
             # Apply conditional formatting via batchUpdate
             if requests:
-                self.service.spreadsheets().batchUpdate(
-                    spreadsheetId=self.document_id, body={"requests": requests}
-                ).execute()
+                self._batch_update(requests)
 
                 logger.info(
                     f"Successfully applied conditional formatting to {sheet_name} (pivot_type={pivot_type})"
@@ -1346,6 +1626,26 @@ class GoogleSheetsService:
             logger.error(f"Failed to apply conditional formatting to {sheet_name}: {e}")
             return False
 
+    def _freeze_first_row_request(self, sheet_id: int) -> Dict[str, Any]:
+        """
+        Build request freezing the first row (header).
+
+        Args:
+            sheet_id: ID of the sheet
+
+        Returns:
+            updateSheetProperties request
+        """
+        return {
+            "updateSheetProperties": {
+                "properties": {
+                    "sheetId": sheet_id,
+                    "gridProperties": {"frozenRowCount": 1},
+                },
+                "fields": "gridProperties.frozenRowCount",
+            }
+        }
+
     def _freeze_first_row(self, sheet_id: int, sheet_name: str) -> bool:
         """
         Freeze the first row (header) in the sheet.
@@ -1358,23 +1658,7 @@ class GoogleSheetsService:
             True if successful, False otherwise
         """
         try:
-            request_body = {
-                "requests": [
-                    {
-                        "updateSheetProperties": {
-                            "properties": {
-                                "sheetId": sheet_id,
-                                "gridProperties": {"frozenRowCount": 1},
-                            },
-                            "fields": "gridProperties.frozenRowCount",
-                        }
-                    }
-                ]
-            }
-
-            self.service.spreadsheets().batchUpdate(
-                spreadsheetId=self.document_id, body=request_body
-            ).execute()
+            self._batch_update([self._freeze_first_row_request(sheet_id)])
 
             logger.info(f"Successfully froze first row in {sheet_name}")
             return True
@@ -1383,6 +1667,30 @@ class GoogleSheetsService:
             logger.error(f"Failed to freeze first row in {sheet_name}: {e}")
             return False
 
+    def _resize_name_column_request(self, sheet_id: int) -> Dict[str, Any]:
+        """
+        Build request setting 'Название' column to fixed width (NAME_COLUMN_WIDTH).
+
+        Args:
+            sheet_id: ID of the sheet
+
+        Returns:
+            updateDimensionProperties request
+        """
+        name_column_index = TTMDetailsColumns.get_column_index("Название")
+        return {
+            "updateDimensionProperties": {
+                "range": {
+                    "sheetId": sheet_id,
+                    "dimension": "COLUMNS",
+                    "startIndex": name_column_index,
+                    "endIndex": name_column_index + 1,
+                },
+                "properties": {"pixelSize": NAME_COLUMN_WIDTH},
+                "fields": "pixelSize",
+            }
+        }
+
     def _resize_name_column(self, sheet_id: int, sheet_name: str) -> bool:
         """
         Resize 'Название' column to fixed width (500 pixels).
@@ -1395,33 +1703,10 @@ class GoogleSheetsService:
             True if successful, False otherwise
         """
         try:
-            # Use fixed width of 500 pixels
-            name_column_index = TTMDetailsColumns.get_column_index("Название")
-            fixed_width = 500
-
-            request_body = {
-                "requests": [
-                    {
-                        "updateDimensionProperties": {
-                            "range": {
-                                "sheetId": sheet_id,
-                                "dimension": "COLUMNS",
-                                "startIndex": name_column_index,
-                                "endIndex": name_column_index + 1,
-                            },
-                            "properties": {"pixelSize": fixed_width},
-                            "fields": "pixelSize",
-                        }
-                    }
-                ]
-            }
-
-            self.service.spreadsheets().batchUpdate(
-                spreadsheetId=self.document_id, body=request_body
-            ).execute()
+            self._batch_update([self._resize_name_column_request(sheet_id)])
 
             logger.info(
-                f"Successfully resized 'Название' column to {fixed_width}px in {sheet_name}"
+                f"Successfully resized 'Название' column to {NAME_COLUMN_WIDTH}px in {sheet_name}"
             )
             return True
 
@@ -1429,6 +1714,45 @@ class GoogleSheetsService:
             logger.error(f"Failed to resize 'Название' column in {sheet_name}: {e}")
             return False
 
+    def _column_notes_requests(
+        self, sheet_id: int, column_names: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build requests adding notes to column headers in Details sheet.
+
+        Args:
+            sheet_id: ID of the sheet
+            column_names: List of column names (headers)
+
+        Returns:
+            List of batchUpdate requests
+        """
+        requests = []
+
+        for column_index, column_name in enumerate(column_names):
+            # Get note for this column if available
+            note_text = COLUMN_NOTES.get(column_name)
+            if not note_text:
+                continue
+
+            requests.append(
+                {
+                    "repeatCell": {
+                        "range": {
+                            "sheetId": sheet_id,
+                            "startRowIndex": 0,  # Header row (0-based)
+                            "endRowIndex": 1,
+                            "startColumnIndex": column_index,
+                            "endColumnIndex": column_index + 1,
+                        },
+                        "cell": {"note": note_text},
+                        "fields": "note",
+                    }
+                }
+            )
+
+        return requests
+
     def _add_column_notes_to_details(
         self, sheet_id: int, sheet_name: str, column_names: List[str]
     ) -> bool:
@@ -1444,35 +1768,11 @@ class GoogleSheetsService:
             True if successful, False otherwise
         """
         try:
-            requests = []
-
-            for column_index, column_name in enumerate(column_names):
-                # Get note for this column if available
-                note_text = COLUMN_NOTES.get(column_name)
-                if not note_text:
-                    continue
-
-                requests.append(
-                    {
-                        "repeatCell": {
-                            "range": {
-                                "sheetId": sheet_id,
-                                "startRowIndex": 0,  # Header row (0-based)
-                                "endRowIndex": 1,
-                                "startColumnIndex": column_index,
-                                "endColumnIndex": column_index + 1,
-                            },
-                            "cell": {"note": note_text},
-                            "fields": "note",
-                        }
-                    }
-                )
+            requests = self._column_notes_requests(sheet_id, column_names)
 
             # Apply notes via batchUpdate
             if requests:
-                self.service.spreadsheets().batchUpdate(
-                    spreadsheetId=self.document_id, body={"requests": requests}
-                ).execute()
+                self._batch_update(requests)
 
                 logger.info(
                     f"Successfully added notes to {len(requests)} column headers in {sheet_name}"
@@ -0,0 +1,203 @@
+"""Event-driven watcher of the reports directory."""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+
+logger = logging.getLogger(__name__)
+
+# Seconds without events (and with unchanged size) before a file counts as written
+DEFAULT_DEBOUNCE = 2.0
+
+# Directory scan interval of the polling fallback in seconds
+DEFAULT_POLL_INTERVAL = 30.0
+
+# Event types meaning that file content may have changed
+CHANGE_EVENTS = {"created", "modified", "moved", "closed"}
+
+
+class _QueueEventHandler(FileSystemEventHandler):
+    """Forward names of changed files from the observer thread to an asyncio queue."""
+
+    def __init__(
+        self,
+        directory: Path,
+        loop: asyncio.AbstractEventLoop,
+        queue: "asyncio.Queue[str]",
+    ):
+        super().__init__()
+        self.directory = directory
+        self.loop = loop
+        self.queue = queue
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.is_directory or event.event_type not in CHANGE_EVENTS:
+            return
+        # При переименовании (запись во временный файл + rename) важен новый путь
+        path = Path(getattr(event, "dest_path", "") or event.src_path)
+        if path.parent != self.directory:
+            return
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, path.name)
+
+
+class ReportDirectoryWatcher:
+    """
+    Watch reports directory for new and modified files.
+
+    Uses inotify (watchdog Observer) and falls back to watchdog's polling
+    observer when inotify is not available (e.g. watch limit reached or a
+    network file system). Events are collected in an asyncio queue; a file is
+    reported once no events arrived for `debounce` seconds and its size did
+    not change, so partially written reports are not picked up.
+
+    Usage:
+        async with ReportDirectoryWatcher(reports_dir) as watcher:
+            while True:
+                filenames = await watcher.wait_for_changes()
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        debounce: float = DEFAULT_DEBOUNCE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        use_polling: bool = False,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            directory: Directory to watch (not recursive)
+            debounce: Quiet period in seconds before a changed file is reported
+            poll_interval: Scan interval of the polling fallback in seconds
+            use_polling: Use polling observer without trying inotify
+        """
+        self.directory = Path(directory)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_polling = use_polling
+        self.observer = None
+        # Name -> (time of last event, size at last event)
+        self._pending: Dict[str, Tuple[float, Optional[int]]] = {}
+        self._queue: Optional["asyncio.Queue[str]"] = None
+
+    @property
+    def is_polling(self) -> bool:
+        """Whether the polling fallback is used."""
+        return isinstance(self.observer, PollingObserver)
+
+    async def __aenter__(self) -> "ReportDirectoryWatcher":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start observer thread; must be called from a running event loop."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._queue = asyncio.Queue()
+        handler = _QueueEventHandler(
+            self.directory.resolve(), asyncio.get_running_loop(), self._queue
+        )
+
+        if not self.use_polling:
+            try:
+                self.observer = self._start_observer(Observer(), handler)
+                logger.info(f"Watching {self.directory} with inotify")
+                return
+            except OSError as e:
+                logger.warning(
+                    f"⚠️ inotify недоступен ({e}), переключаемся на опрос папки"
+                )
+
+        self.observer = self._start_observer(
+            PollingObserver(timeout=self.poll_interval), handler
+        )
+        logger.info(f"Watching {self.directory} by polling every {self.poll_interval}s")
+
+    def _start_observer(self, observer, handler: FileSystemEventHandler):
+        """Schedule handler for the directory and start observer thread."""
+        observer.schedule(handler, str(self.directory.resolve()), recursive=False)
+        observer.start()
+        return observer
+
+    def stop(self) -> None:
+        """Stop observer thread."""
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+
+    def _file_size(self, name: str) -> Optional[int]:
+        """Size of a watched file, None if it does not exist."""
+        try:
+            return (self.directory / name).stat().st_size
+        except OSError:
+            return None
+
+    def _drain_queue(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Move queued event names to pending files."""
+        while not self._queue.empty():
+            name = self._queue.get_nowait()
+            self._pending[name] = (loop.time(), self._file_size(name))
+
+    def _settled_files(self, loop: asyncio.AbstractEventLoop) -> Set[str]:
+        """Pop pending files that were quiet for the debounce period."""
+        now = loop.time()
+        settled = set()
+        for name, (last_event, size) in list(self._pending.items()):
+            if now - last_event < self.debounce:
+                continue
+            current_size = self._file_size(name)
+            if current_size is None:
+                # Файл удален до окончания записи
+                del self._pending[name]
+            elif current_size != size:
+                # Запись продолжается без событий (например, polling fallback)
+                self._pending[name] = (now, current_size)
+            else:
+                del self._pending[name]
+                settled.add(name)
+        return settled
+
+    async def wait_for_changes(self, timeout: Optional[float] = None) -> Set[str]:
+        """
+        Wait until changed files are completely written.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Names of new or modified files, empty set on timeout
+        """
+        if self._queue is None:
+            raise RuntimeError("Watcher is not started")
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            self._drain_queue(loop)
+            settled = self._settled_files(loop)
+            if settled:
+                return settled
+
+            wake_times = [
+                last_event + self.debounce for last_event, _ in self._pending.values()
+            ]
+            if deadline is not None:
+                if loop.time() >= deadline:
+                    return set()
+                wake_times.append(deadline)
+            wait = max(0.0, min(wake_times) - loop.time()) if wake_times else None
+
+            try:
+                name = await asyncio.wait_for(self._queue.get(), timeout=wait)
+            except asyncio.TimeoutError:
+                continue
+            self._pending[name] = (loop.time(), self._file_size(name))
@@ -0,0 +1,208 @@
+"""Batched writer for rebuilt tracker_task_history rows."""
+
+import csv
+import io
+import uuid
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from radiator.core.logging import logger
+from radiator.models.tracker import TrackerTaskHistory
+
+HISTORY_COLUMNS = (
+    "id",
+    "task_id",
+    "tracker_id",
+    "status",
+    "status_display",
+    "start_date",
+    "end_date",
+    "created_at",
+)
+COPY_NULL = r"\N"
+
+# Staging table uses timestamptz so aware datetimes are converted to the
+# session time zone exactly like ORM inserts into the timestamp columns.
+CREATE_STAGING_SQL = """
+    CREATE TEMP TABLE tmp_tracker_task_history_copy (
+        id uuid,
+        task_id integer,
+        tracker_id varchar(255),
+        status varchar(255),
+        status_display varchar(255),
+        start_date timestamptz,
+        end_date timestamptz,
+        created_at timestamptz
+    ) ON COMMIT DROP
+"""
+COPY_STAGING_SQL = (
+    f"COPY tmp_tracker_task_history_copy ({', '.join(HISTORY_COLUMNS)}) "
+    f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+)
+MOVE_STAGING_SQL = f"""
+    INSERT INTO tracker_task_history ({', '.join(HISTORY_COLUMNS)})
+    SELECT {', '.join(HISTORY_COLUMNS)} FROM tmp_tracker_task_history_copy
+"""
+
+
+class TaskHistoryWriter:
+    """
+    Collect rebuilt histories for a batch of tasks and persist them at once.
+
+    Each flush runs in one transaction:
+    1. ``DELETE ... WHERE task_id = ANY(:ids)`` for every queued task
+    2. new rows streamed with ``COPY FROM STDIN`` (psycopg2/psycopg), or a
+       multi-row INSERT when the driver has no COPY support
+    3. one ``UPDATE ... FROM unnest(...)`` for ``last_changelog_id``
+    """
+
+    def __init__(self, db: Session, batch_size: int = 100):
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self._task_ids: List[int] = []
+        self._rows: List[Dict[str, Any]] = []
+        self._last_changelog_ids: Dict[int, str] = {}
+
+    @property
+    def pending_tasks(self) -> int:
+        """Number of tasks queued since last flush."""
+        return len(self._task_ids)
+
+    def is_full(self) -> bool:
+        """Whether queued tasks reached batch_size."""
+        return len(self._task_ids) >= self.batch_size
+
+    def add(
+        self,
+        task_id: int,
+        history_data: List[Dict[str, Any]],
+        changelog: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        """
+        Queue full history replacement for a task.
+
+        Args:
+            task_id: Database ID of the task
+            history_data: Rows prepared by TrackerSyncCommand._prepare_history_data
+            changelog: Changelog used to build history; last entry id is stored
+
+        Returns:
+            Number of history rows queued
+        """
+        self._task_ids.append(task_id)
+        self._rows.extend(history_data)
+        if history_data and changelog:
+            self._last_changelog_ids[task_id] = str(changelog[-1]["id"])
+        return len(history_data)
+
+    def flush(self) -> int:
+        """Persist queued histories and commit. Returns number of rows written."""
+        if not self._task_ids:
+            return 0
+
+        task_ids, rows = self._task_ids, self._rows
+        last_changelog_ids = self._last_changelog_ids
+        self._task_ids, self._rows, self._last_changelog_ids = [], [], {}
+
+        try:
+            self.db.execute(
+                text("DELETE FROM tracker_task_history WHERE task_id = ANY(:ids)"),
+                {"ids": task_ids},
+            )
+            if rows:
+                self._write_rows(rows)
+            if last_changelog_ids:
+                self.db.execute(
+                    text(
+                        """
+                        UPDATE tracker_tasks AS t
+                        SET last_changelog_id = v.last_changelog_id
+                        FROM unnest(
+                            CAST(:ids AS integer[]), CAST(:changelog_ids AS varchar[])
+                        ) AS v(id, last_changelog_id)
+                        WHERE t.id = v.id
+                        """
+                    ),
+                    {
+                        "ids": list(last_changelog_ids.keys()),
+                        "changelog_ids": list(last_changelog_ids.values()),
+                    },
+                )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        logger.debug(
+            f"💾 Записано {len(rows)} записей истории для {len(task_ids)} задач"
+        )
+        return len(rows)
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Write history rows using COPY when the DBAPI driver supports it."""
+        created_at = datetime.now(UTC)
+        records = [
+            (
+                uuid.uuid4(),
+                row["task_id"],
+                row["tracker_id"],
+                row["status"],
+                row["status_display"],
+                row["start_date"],
+                row.get("end_date"),
+                created_at,
+            )
+            for row in rows
+        ]
+
+        cursor = self.db.connection().connection.cursor()
+        try:
+            if self._supports_copy(cursor):
+                self._copy_records(cursor, records)
+                return
+        finally:
+            cursor.close()
+
+        self.db.execute(
+            insert(TrackerTaskHistory.__table__),
+            [dict(zip(HISTORY_COLUMNS, record)) for record in records],
+        )
+
+    @staticmethod
+    def _supports_copy(cursor) -> bool:
+        """Check for psycopg2 copy_expert or psycopg 3 copy on DBAPI cursor."""
+        return hasattr(cursor, "copy_expert") or hasattr(cursor, "copy")
+
+    def _copy_records(self, cursor, records: List[tuple]) -> None:
+        """Stream records into staging table via COPY and move them over."""
+        cursor.execute(CREATE_STAGING_SQL)
+        if hasattr(cursor, "copy_expert"):
+            # psycopg2
+            cursor.copy_expert(COPY_STAGING_SQL, self._to_csv(records))
+        else:
+            # psycopg 3
+            with cursor.copy(COPY_STAGING_SQL) as copy:
+                copy.write(self._to_csv(records).getvalue())
+        cursor.execute(MOVE_STAGING_SQL)
+        cursor.execute("DROP TABLE tmp_tracker_task_history_copy")
+
+    @staticmethod
+    def _to_csv(records: List[tuple]) -> io.StringIO:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        for record in records:
+            writer.writerow(
+                [
+                    COPY_NULL
+                    if value is None
+                    else value.isoformat()
+                    if isinstance(value, datetime)
+                    else value
+                    for value in record
+                ]
+            )
+        buffer.seek(0)
+        return buffer
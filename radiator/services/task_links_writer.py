@@ -0,0 +1,133 @@
+"""Writer for tracker_task_links edges normalized from TrackerTask.links."""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from radiator.core.logging import logger
+from radiator.models.tracker import TrackerTaskLink
+
+# Same projection as _extract_edges, done in SQL for a full rebuild.
+# Non-array links are replaced with an empty array before expansion.
+REBUILD_SQL = """
+    INSERT INTO tracker_task_links (src_key, dst_key, type_id, direction, dst_display)
+    SELECT DISTINCT ON (src_key, dst_key, type_id, direction)
+        src_key, dst_key, type_id, direction, dst_display
+    FROM (
+        SELECT
+            t.key AS src_key,
+            link->'object'->>'key' AS dst_key,
+            link->'type'->>'id' AS type_id,
+            COALESCE(link->>'direction', '') AS direction,
+            LEFT(link->'object'->>'display', 500) AS dst_display
+        FROM tracker_tasks t
+        CROSS JOIN LATERAL jsonb_array_elements(
+            CASE WHEN jsonb_typeof(t.links) = 'array' THEN t.links ELSE '[]' END
+        ) AS link
+        WHERE t.key IS NOT NULL
+        AND jsonb_typeof(link) = 'object'
+    ) AS edges
+    WHERE dst_key IS NOT NULL AND type_id IS NOT NULL
+"""
+
+
+class TaskLinksWriter:
+    """
+    Keep tracker_task_links in sync with TrackerTask.links.
+
+    Edges of a task are always replaced as a whole: links removed in
+    Tracker disappear from the table on the next sync. Methods do not
+    commit, so edges are written in the caller's transaction together
+    with the task rows.
+    """
+
+    def __init__(self, db: Session, batch_size: int = 1000):
+        self.db = db
+        self.batch_size = max(1, batch_size)
+
+    def replace(self, links_by_key: Dict[str, Optional[List[Any]]]) -> int:
+        """
+        Replace edges of the given source tasks.
+
+        Args:
+            links_by_key: Raw links (TrackerTask.links) by task key
+
+        Returns:
+            Number of edges written
+        """
+        if not links_by_key:
+            return 0
+
+        keys = list(links_by_key)
+        rows: List[Dict[str, Any]] = []
+        for src_key, links in links_by_key.items():
+            rows.extend(self._extract_edges(src_key, links))
+
+        for start in range(0, len(keys), self.batch_size):
+            self.db.execute(
+                text("DELETE FROM tracker_task_links WHERE src_key = ANY(:keys)"),
+                {"keys": keys[start : start + self.batch_size]},
+            )
+        for start in range(0, len(rows), self.batch_size):
+            self.db.execute(
+                insert(TrackerTaskLink), rows[start : start + self.batch_size]
+            )
+
+        logger.debug(f"🔗 Записано {len(rows)} связей для {len(keys)} задач")
+        return len(rows)
+
+    def rebuild(self) -> int:
+        """
+        Rebuild the whole table from tracker_tasks.links in one statement.
+
+        Returns:
+            Number of edges written
+        """
+        self.db.execute(text("DELETE FROM tracker_task_links"))
+        written = self.db.execute(text(REBUILD_SQL)).rowcount
+        logger.info(f"🔗 Перестроена таблица связей: {written} связей")
+        return written
+
+    @staticmethod
+    def _extract_edges(
+        src_key: str, links: Optional[Iterable[Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Project raw links of one task to edge rows.
+
+        Malformed links (not a dict, no type or object key) are skipped,
+        duplicates are collapsed by primary key.
+
+        Args:
+            src_key: Key of the task owning the links
+            links: Raw links from Tracker API
+
+        Returns:
+            Edge rows for tracker_task_links
+        """
+        edges: Dict[tuple, Dict[str, Any]] = {}
+        for link in links or []:
+            if not isinstance(link, dict):
+                continue
+            obj = link.get("object")
+            link_type = link.get("type")
+            if not isinstance(obj, dict) or not isinstance(link_type, dict):
+                continue
+            dst_key = obj.get("key")
+            type_id = link_type.get("id")
+            if not dst_key or not type_id:
+                continue
+            direction = link.get("direction") or ""
+            display = obj.get("display")
+            edges.setdefault(
+                (dst_key, type_id, direction),
+                {
+                    "src_key": src_key,
+                    "dst_key": dst_key,
+                    "type_id": type_id,
+                    "direction": direction,
+                    "dst_display": str(display)[:500] if display else None,
+                },
+            )
+        return list(edges.values())
@@ -0,0 +1,430 @@
+"""Asyncio-based Yandex Tracker API client with adaptive rate limiting."""
+
+import asyncio
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from tqdm import tqdm
+
+from radiator.core.logging import logger
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Safety limit of changelog pages per task (50 entries per page)
+MAX_CHANGELOG_PAGES = 100
+NEXT_PAGE_ID_PATTERN = re.compile(r"id=([^&>]+)")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse Retry-After header value into seconds.
+
+    Supports both delta-seconds and HTTP-date formats.
+
+    Args:
+        value: Raw header value
+
+    Returns:
+        Number of seconds to wait or None if header is missing/invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_next_page_id(link_header: str) -> Optional[str]:
+    """Extract changelog page id from Link header if there is a next page."""
+    if not link_header or 'rel="next"' not in link_header:
+        return None
+    match = NEXT_PAGE_ID_PATTERN.search(link_header)
+    return match.group(1) if match else None
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket shared by all in-flight requests.
+
+    The refill rate follows AIMD: every successful response increases the rate
+    by ``increase_step`` (up to ``max_rate``), every 429 halves it (down to
+    ``min_rate``) and pauses the whole bucket for ``Retry-After`` seconds.
+    Explicit quota headers (``X-RateLimit-Remaining`` / ``X-RateLimit-Reset``)
+    cap the rate to what the server says is left in the current window.
+
+    One limiter may be shared by threads running their own event loops: the
+    bucket state is guarded by a thread lock, waiters queue on an asyncio lock
+    of their thread's loop. Synchronous requests take tokens with wait().
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: float = 0.5,
+        max_rate: float = 50.0,
+        increase_step: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        self.burst = max(1, burst)
+        self.increase_step = increase_step
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        self._state_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def _reserve(self) -> float:
+        """Take a token if available, otherwise return seconds to wait."""
+        with self._state_lock:
+            now = self._clock()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            self._refill(now)
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+    def _waiters_lock(self) -> asyncio.Lock:
+        """Asyncio lock of the running loop, kept per thread."""
+        loop = asyncio.get_running_loop()
+        if getattr(self._local, "loop", None) is not loop:
+            # Limiter outlives event loops and is shared between threads
+            self._local.lock = asyncio.Lock()
+            self._local.loop = loop
+        return self._local.lock
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._waiters_lock():
+            while True:
+                delay = self._reserve()
+                if delay <= 0:
+                    return
+                await asyncio.sleep(delay)
+
+    def wait(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        while True:
+            delay = self._reserve()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def on_success(self, headers: Optional[Dict[str, str]] = None) -> None:
+        """Speed up after a successful response, respecting quota headers."""
+        with self._state_lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+        if not headers:
+            return
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining_value = float(remaining)
+            reset_value = float(reset)
+        except (TypeError, ValueError):
+            return
+        # Reset may be an absolute epoch timestamp or seconds until reset
+        if reset_value > 1e9:
+            reset_value = reset_value - time.time()
+        if reset_value <= 0:
+            return
+        with self._state_lock:
+            if remaining_value <= 0:
+                self._block_for(reset_value)
+                return
+            self.rate = max(
+                self.min_rate, min(self.rate, remaining_value / reset_value)
+            )
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Slow down after a 429 response."""
+        with self._state_lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+            self._block_for(retry_after if retry_after is not None else 1.0 / self.rate)
+
+    def _block_for(self, seconds: float) -> None:
+        """Pause the bucket; caller holds the state lock."""
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+
+class AsyncTrackerClient:
+    """
+    Async Tracker API client with a pooled keep-alive connection.
+
+    All requests share one ``httpx.AsyncClient`` and one ``AdaptiveRateLimiter``,
+    so concurrency is bounded by ``max_connections`` and throughput by the
+    limiter instead of a fixed per-request sleep.
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        base_url: str,
+        max_connections: int = 10,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        max_retries: int = 5,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.headers = headers
+        self.base_url = base_url
+        self.max_connections = max(1, max_connections)
+        self.limiter = limiter or AdaptiveRateLimiter(rate=float(self.max_connections))
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self.requests_made = 0
+        self.throttled_count = 0
+
+    async def __aenter__(self) -> "AsyncTrackerClient":
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            transport=self._transport,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def request(self, url: str, method: str = "GET", **kwargs) -> httpx.Response:
+        """Make HTTP request through the shared limiter, retrying 429 and 5xx."""
+        if self._client is None:
+            raise RuntimeError(
+                "AsyncTrackerClient must be used as async context manager"
+            )
+
+        attempt = 0
+        while True:
+            await self.limiter.acquire()
+            self.requests_made += 1
+            try:
+                response = await self._client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                logger.warning(
+                    f"⚠️ Сетевая ошибка {type(e).__name__}, повтор {attempt}: {url}"
+                )
+                await asyncio.sleep(min(2**attempt, 30))
+                continue
+
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                response.raise_for_status()
+                self.limiter.on_success(response.headers)
+                return response
+
+            if attempt >= self.max_retries:
+                response.raise_for_status()
+
+            attempt += 1
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if response.status_code == 429:
+                self.throttled_count += 1
+                self.limiter.on_throttle(retry_after)
+                logger.warning(
+                    f"⚠️ API Error 429: лимит запросов, снижаем скорость до "
+                    f"{self.limiter.rate:.1f} req/s (повтор {attempt})"
+                )
+            else:
+                delay = retry_after if retry_after is not None else min(2**attempt, 30)
+                logger.warning(
+                    f"⚠️ API Error {response.status_code}, повтор {attempt} через {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    async def get_task(
+        self, task_id: str, expand: List[str] = None, fields: List[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get task details by ID."""
+        try:
+            params = {}
+            if expand:
+                params["expand"] = ",".join(expand)
+            if fields:
+                params["fields"] = ",".join(fields)
+            response = await self.request(
+                f"{self.base_url}issues/{task_id}", params=params
+            )
+            return response.json()
+        except Exception as e:
+            logger.error(f"Failed to get task {task_id}: {e}")
+            return None
+
+    async def get_task_changelog(
+        self, task_id: str, last_changelog_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get task status changelog following Link pagination.
+
+        Args:
+            task_id: Task ID in Tracker
+            last_changelog_id: If set, fetch only entries after this ID
+
+        Returns:
+            List of changelog entries
+        """
+        changelog, _ = await self.get_task_changelog_checked(task_id, last_changelog_id)
+        return changelog
+
+    async def get_task_changelog_checked(
+        self, task_id: str, last_changelog_id: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Get task status changelog and whether all of it was fetched.
+
+        Args:
+            task_id: Task ID in Tracker
+            last_changelog_id: If set, fetch only entries after this ID
+
+        Returns:
+            Tuple of (changelog entries, complete); complete is False if
+            MAX_CHANGELOG_PAGES cut the changelog short
+        """
+        all_data = []
+        next_page_id = last_changelog_id
+        pages = 0
+
+        while True:
+            params = {"perPage": 50, "type": "IssueWorkflow"}
+            if next_page_id:
+                params["id"] = next_page_id
+
+            response = await self.request(
+                f"{self.base_url}issues/{task_id}/changelog", params=params
+            )
+            page_data = response.json()
+            if not page_data:
+                break
+
+            all_data.extend(page_data)
+            pages += 1
+
+            next_page_id = parse_next_page_id(response.headers.get("Link", ""))
+            if not next_page_id:
+                break
+            if pages >= MAX_CHANGELOG_PAGES:
+                logger.warning(
+                    f"⚠️ История задачи {task_id} обрезана: больше "
+                    f"{MAX_CHANGELOG_PAGES} страниц"
+                )
+                return all_data, False
+
+        return all_data, True
+
+    async def _gather_batch(
+        self,
+        task_ids: List[str],
+        fetch: Callable[[str], Awaitable[Any]],
+        desc: str,
+        default: Any,
+    ) -> List[Tuple[str, Any]]:
+        """Run fetch for every task ID concurrently, preserving input order."""
+        results: List[Tuple[str, Any]] = [None] * len(task_ids)
+        semaphore = asyncio.Semaphore(self.max_connections)
+        errors = []
+
+        with tqdm(total=len(task_ids), desc=desc, unit="задача") as pbar:
+
+            async def run(index: int, task_id: str) -> None:
+                async with semaphore:
+                    try:
+                        results[index] = (task_id, await fetch(task_id))
+                    except Exception as e:
+                        errors.append((task_id, e))
+                        results[index] = (task_id, default)
+                    pbar.update(1)
+
+            await asyncio.gather(*(run(i, t) for i, t in enumerate(task_ids)))
+
+        for task_id, error in errors:
+            logger.error(
+                f"❌ Failed to fetch {task_id}: {type(error).__name__}: {error}"
+            )
+
+        return results
+
+    async def get_tasks_batch(
+        self, task_ids: List[str], expand: List[str] = None
+    ) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Get multiple tasks concurrently."""
+        return await self._gather_batch(
+            task_ids,
+            lambda task_id: self.get_task(task_id, expand),
+            "📥 Загрузка задач",
+            None,
+        )
+
+    async def get_changelogs_batch(
+        self,
+        task_ids: List[str],
+        last_changelog_ids: Optional[Dict[str, str]] = None,
+    ) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Get changelogs for multiple tasks concurrently ([] for failed tasks)."""
+        results = await self.get_changelogs_batch_checked(task_ids, last_changelog_ids)
+        return [
+            (task_id, result[0] if result is not None else [])
+            for task_id, result in results
+        ]
+
+    async def get_changelogs_batch_checked(
+        self,
+        task_ids: List[str],
+        last_changelog_ids: Optional[Dict[str, str]] = None,
+    ) -> List[Tuple[str, Optional[Tuple[List[Dict[str, Any]], bool]]]]:
+        """
+        Get changelogs for multiple tasks concurrently, reporting failures.
+
+        Args:
+            task_ids: Task IDs in Tracker
+            last_changelog_ids: Last processed changelog ID by task ID
+
+        Returns:
+            List of (task_id, (changelog, complete)) in task_ids order; the
+            value is None if the fetch failed
+        """
+        last_changelog_ids = last_changelog_ids or {}
+        return await self._gather_batch(
+            task_ids,
+            lambda task_id: self.get_task_changelog_checked(
+                task_id, last_changelog_ids.get(task_id)
+            ),
+            "📚 Загрузка истории",
+            None,
+        )
@@ -0,0 +1,296 @@
+"""Persistent SQLite cache of Tracker issue, changelog and search responses."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from radiator.core.logging import logger
+
+DEFAULT_CACHE_PATH = Path("data/cache/tracker_responses.sqlite3")
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# After eviction the cache is trimmed below the cap, so that every put does not
+# evict again
+EVICTION_TARGET = 0.9
+
+KIND_TASK = "task"
+KIND_CHANGELOG = "changelog"
+KIND_SEARCH = "search"
+
+
+class OfflineCacheMiss(RuntimeError):
+    """Response is not in the cache and network access is disabled."""
+
+
+class TrackerResponseCache:
+    """
+    On-disk cache of Tracker API responses with LRU eviction.
+
+    Issues and changelogs are stored per issue id together with the issue's
+    updatedAt at fetch time. Online, an entry is served only if that version
+    equals the updatedAt last seen in search results (note_versions), so a
+    changed issue is always fetched again; issues never seen in a search are
+    not served. Any change to an issue (including a new changelog entry)
+    bumps updatedAt. Incremental changelog requests are served from a cached
+    full changelog by cutting it after last_changelog_id.
+
+    Search result pages are recorded per query and replayed only offline,
+    where every entry is served regardless of its version.
+
+    Bodies are stored as zlib-compressed JSON. When the total size exceeds
+    max_bytes, least recently used entries are deleted.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        offline: bool = False,
+    ):
+        """
+        Open (and create) cache database.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Maximum total size of stored bodies
+            offline: Serve entries without version validation
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Issue id -> updatedAt from the latest search results
+        self._versions: Dict[str, str] = {}
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                version TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (kind, key)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+            "ON responses (accessed_at)"
+        )
+        self._total_size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @property
+    def total_size(self) -> int:
+        """Total size of stored bodies in bytes."""
+        return self._total_size
+
+    def note_versions(self, tasks: Iterable[Dict[str, Any]]) -> None:
+        """Remember updatedAt of issues from fresh search results."""
+        for task in tasks:
+            if isinstance(task, dict) and task.get("id") and task.get("updatedAt"):
+                self._versions[str(task["id"])] = task["updatedAt"]
+
+    def _is_fresh(self, task_id: str, version: Optional[str]) -> bool:
+        """Whether an entry stored with version may be served."""
+        if self.offline:
+            return True
+        current = self._versions.get(task_id)
+        return current is not None and current == version
+
+    def _read(self, kind: str, key: str) -> Optional[tuple]:
+        """Read (version, value) of an entry and mark it as recently used."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, body FROM responses WHERE kind = ? AND key = ?",
+                (kind, key),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE kind = ? AND key = ?",
+                (time.time(), kind, key),
+            )
+        return row[0], json.loads(zlib.decompress(row[1]))
+
+    def _write(self, kind: str, key: str, value: Any, version: Optional[str]) -> None:
+        """Store an entry and evict least recently used ones over the cap."""
+        body = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(kind, key, version, body, size, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, key, version, body, len(body), time.time()),
+            )
+            self._total_size += len(body) - (old[0] if old else 0)
+            self.stats["stores"] += 1
+            if self._total_size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until size is below the target."""
+        target = self.max_bytes * EVICTION_TARGET
+        while self._total_size > target:
+            rows = self._conn.execute(
+                "SELECT kind, key, size FROM responses ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            for kind, key, size in rows:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE kind = ? AND key = ?", (kind, key)
+                )
+                self._total_size -= size
+                self.stats["evictions"] += 1
+                if self._total_size <= target:
+                    break
+        logger.debug(f"Кэш ответов Tracker сокращен до {self._total_size} байт")
+
+    def _count(self, hit: bool) -> None:
+        self.stats["hits" if hit else "misses"] += 1
+
+    @staticmethod
+    def task_key(task_id: str, expand: List[str] = None, fields: List[str] = None):
+        """Cache key of an issue response with given expand/fields params."""
+        return "|".join([task_id, ",".join(expand or []), ",".join(fields or [])])
+
+    def get_task(
+        self, task_id: str, expand: List[str] = None, fields: List[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get cached issue response.
+
+        Returns:
+            Issue data or None if missing or outdated
+        """
+        entry = self._read(KIND_TASK, self.task_key(task_id, expand, fields))
+        hit = entry is not None and self._is_fresh(task_id, entry[0])
+        self._count(hit)
+        return entry[1] if hit else None
+
+    def put_task(
+        self,
+        task_id: str,
+        task: Dict[str, Any],
+        expand: List[str] = None,
+        fields: List[str] = None,
+    ) -> None:
+        """Store issue response; its updatedAt becomes the known version."""
+        self.note_versions([task])
+        self._write(
+            KIND_TASK,
+            self.task_key(task_id, expand, fields),
+            task,
+            task.get("updatedAt") or self._versions.get(task_id),
+        )
+
+    def get_changelog(
+        self, task_id: str, after_id: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached full changelog or its entries after after_id.
+
+        Args:
+            task_id: Issue id
+            after_id: Last processed changelog entry (incremental sync)
+
+        Returns:
+            Changelog entries or None if missing, outdated or after_id is not
+            in the cached changelog
+        """
+        entry = self._read(KIND_CHANGELOG, task_id)
+        changelog = None
+        if entry is not None and self._is_fresh(task_id, entry[0]):
+            changelog = entry[1]
+            if after_id is not None:
+                ids = [str(item.get("id")) for item in changelog]
+                changelog = (
+                    changelog[ids.index(after_id) + 1 :] if after_id in ids else None
+                )
+        self._count(changelog is not None)
+        return changelog
+
+    def put_changelog(self, task_id: str, changelog: List[Dict[str, Any]]) -> None:
+        """Store full changelog under the issue's current known version."""
+        self._write(KIND_CHANGELOG, task_id, changelog, self._versions.get(task_id))
+
+    @staticmethod
+    def search_key(query: str, *params: Any) -> str:
+        """Cache key of a search with its parameters."""
+        raw = json.dumps([query, *params], ensure_ascii=False, default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def put_search_page(self, search_key: str, number: int, page: List[Any]) -> None:
+        """Store one page of search results; page 0 drops the previous recording."""
+        if number == 0:
+            self._delete_search(search_key)
+        self._write(KIND_SEARCH, f"{search_key}:{number}", page, None)
+
+    def finish_search(self, search_key: str, pages: int) -> None:
+        """Mark recorded search as complete."""
+        self._write(KIND_SEARCH, search_key, pages, None)
+
+    def _delete_search(self, search_key: str) -> None:
+        """Delete marker and pages of a recorded search."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses "
+                "WHERE kind = ? AND (key = ? OR key LIKE ?)",
+                (KIND_SEARCH, search_key, f"{search_key}:%"),
+            ).fetchall()
+            for key, size in rows:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE kind = ? AND key = ?",
+                    (KIND_SEARCH, key),
+                )
+                self._total_size -= size
+
+    def iter_search_pages(self, search_key: str) -> Optional[Iterator[List[Any]]]:
+        """
+        Replay recorded search pages.
+
+        Returns:
+            Iterator over pages or None if the search was not recorded
+            completely (or some of its pages were evicted)
+        """
+        marker = self._read(KIND_SEARCH, search_key)
+        if marker is not None:
+            with self._lock:
+                stored = self._conn.execute(
+                    "SELECT COUNT(*) FROM responses WHERE kind = ? AND key LIKE ?",
+                    (KIND_SEARCH, f"{search_key}:%"),
+                ).fetchone()[0]
+            if stored != marker[1]:
+                marker = None
+        self._count(marker is not None)
+        if marker is None:
+            return None
+        return (
+            self._read(KIND_SEARCH, f"{search_key}:{number}")[1]
+            for number in range(marker[1])
+        )
@@ -0,0 +1,158 @@
+"""Split large Tracker searches into disjoint date-range shards."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from radiator.core.logging import logger
+
+# Tasks created before this date fall into one open-ended shard
+DEFAULT_SHARD_START = date(2016, 1, 1)
+
+# Date fields the planner can split on; Created never changes, so shards stay
+# disjoint while tasks are edited during the search
+SHARD_FIELDS = ("Created", "Updated")
+
+
+def deduplicate_by_key(
+    items: Iterable[Dict[str, Any]], key: str = "id"
+) -> Dict[Any, Dict[str, Any]]:
+    """
+    Index items by key, keeping the last occurrence of every key.
+
+    Search pages can repeat a task when it moves between pages (or shards)
+    while results are being fetched; later occurrences carry fresher data.
+    Items without the key are dropped.
+
+    Args:
+        items: Task dictionaries
+        key: Name of the identifying field (e.g. "id" or "tracker_id")
+
+    Returns:
+        Dictionary key -> item in order of first occurrence
+    """
+    unique = {}
+    for item in items:
+        value = item.get(key)
+        if value:
+            unique[value] = item
+    return unique
+
+
+@dataclass
+class SearchShard:
+    """Half-open date range [start, end) of a search; None means unbounded."""
+
+    start: Optional[date]
+    end: Optional[date]
+    count: int = 0
+
+    def query(self, base_query: str, field: str = "Created") -> str:
+        """Base query restricted to the shard's date range."""
+        if self.start is None and self.end is None:
+            return base_query
+        parts = [f"({base_query})"] if base_query else []
+        if self.start is not None:
+            parts.append(f"{field}: >= {self.start.isoformat()}")
+        if self.end is not None:
+            parts.append(f"{field}: < {self.end.isoformat()}")
+        return " AND ".join(parts)
+
+    @property
+    def splittable(self) -> bool:
+        """Whether the range is closed and longer than one day."""
+        return (
+            self.start is not None
+            and self.end is not None
+            and (self.end - self.start).days > 1
+        )
+
+    def split(self) -> List["SearchShard"]:
+        """Split range into two halves."""
+        middle = self.start + timedelta(days=(self.end - self.start).days // 2)
+        return [SearchShard(self.start, middle), SearchShard(middle, self.end)]
+
+
+class SearchShardPlanner:
+    """
+    Plan disjoint date-range shards of a search query from X-Total-Count probes.
+
+    The whole timeline is covered by three ranges: before ``start``,
+    [``start``, ``end``) and from ``end`` on. A range whose task count exceeds
+    ``shard_size`` is halved until every shard fits or is a single day, so
+    each shard can be fetched with v2 pages independently of the others.
+    Probes of one split level run concurrently.
+    """
+
+    def __init__(
+        self,
+        count_tasks: Callable[[str], int],
+        field: str = "Created",
+        shard_size: int = 5000,
+        start: date = DEFAULT_SHARD_START,
+        end: Optional[date] = None,
+        max_workers: int = 4,
+    ):
+        """
+        Initialize planner.
+
+        Args:
+            count_tasks: Returns X-Total-Count of a query (capped at 10000)
+            field: Date field to split on ("Created" or "Updated")
+            shard_size: Maximum number of tasks per shard
+            start: Start of the split range, earlier tasks form one shard
+            end: End of the split range (default: tomorrow)
+            max_workers: Number of concurrent count probes
+        """
+        if field not in SHARD_FIELDS:
+            raise ValueError(f"Unsupported shard field: {field}")
+        self.count_tasks = count_tasks
+        self.field = field
+        self.shard_size = shard_size
+        self.start = start
+        self.end = end or date.today() + timedelta(days=1)
+        self.max_workers = max_workers
+
+    def plan(self, query: str) -> List[SearchShard]:
+        """
+        Split query into shards with at most shard_size tasks where possible.
+
+        Args:
+            query: Yandex Tracker search query
+
+        Returns:
+            Non-empty shards ordered by date; a single unbounded shard if the
+            whole query fits into one
+        """
+        total = self.count_tasks(query)
+        if total <= self.shard_size:
+            return [SearchShard(None, None, total)] if total else []
+
+        shards = []
+        pending = [
+            SearchShard(None, self.start),
+            SearchShard(self.start, self.end),
+            SearchShard(self.end, None),
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending:
+                counts = executor.map(
+                    lambda shard: self.count_tasks(shard.query(query, self.field)),
+                    pending,
+                )
+                next_level = []
+                for shard, count in zip(pending, counts):
+                    shard.count = count
+                    if count > self.shard_size and shard.splittable:
+                        next_level.extend(shard.split())
+                    elif count:
+                        shards.append(shard)
+                pending = next_level
+
+        shards.sort(key=lambda shard: shard.start or date.min)
+        logger.info(
+            f"🧩 Запрос разбит на {len(shards)} частей по полю {self.field} "
+            f"(~{sum(shard.count for shard in shards)} задач)"
+        )
+        return shards
@@ -1,15 +1,40 @@
 """Service for Yandex Tracker API integration."""
 
-import time
+import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import requests
 from tqdm import tqdm
 
 from radiator.core.config import log_limit_info, settings, with_default_limit_method
 from radiator.core.logging import logger
+from radiator.services.tracker_async_client import (
+    AdaptiveRateLimiter,
+    AsyncTrackerClient,
+    parse_retry_after,
+)
+from radiator.services.tracker_response_cache import (
+    DEFAULT_CACHE_PATH,
+    OfflineCacheMiss,
+    TrackerResponseCache,
+)
+from radiator.services.tracker_search_planner import (
+    SearchShard,
+    SearchShardPlanner,
+    deduplicate_by_key,
+)
+from radiator.utils.json_stream import iter_json_array, loads, orjson_available
+
+# Chunk size for streamed search response bodies
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Retries of a request answered with 429, as in AsyncTrackerClient
+MAX_THROTTLE_RETRIES = 5
 
 # Constants for status field handling
 STATUS_FIELD_ID = "status"
@@ -27,17 +52,260 @@ class TrackerAPIService:
             "Content-Type": "application/json",
         }
         self.base_url = settings.TRACKER_BASE_URL
-        self.request_delay = settings.TRACKER_REQUEST_DELAY
         self.max_workers = settings.TRACKER_MAX_WORKERS
+        self.use_async_client = settings.TRACKER_ASYNC_CLIENT
+        # Number of date-range shards searched concurrently (1 - single stream)
+        self.search_shards = settings.TRACKER_SEARCH_SHARDS
+        # Decode scroll/search pages item by item instead of whole bodies
+        self.stream_json = settings.TRACKER_STREAM_JSON
+        # Parse remaining full bodies with orjson (if installed)
+        self.use_orjson = settings.TRACKER_ORJSON
+        # On-disk cache of issue/changelog/search responses (None - disabled)
+        self.response_cache: Optional[TrackerResponseCache] = None
+        # Serve only from response cache, never touch the network
+        self.offline = False
+        if settings.TRACKER_RESPONSE_CACHE or settings.TRACKER_OFFLINE:
+            self.enable_response_cache(
+                Path(settings.TRACKER_RESPONSE_CACHE or DEFAULT_CACHE_PATH),
+                offline=settings.TRACKER_OFFLINE,
+            )
+
+        # Paces sync and async requests alike; shared across batches and threads
+        # so learned rate survives between calls
+        self.rate_limiter = AdaptiveRateLimiter(
+            rate=settings.TRACKER_RATE_LIMIT_RPS,
+            burst=self.max_workers,
+            max_rate=settings.TRACKER_RATE_LIMIT_MAX_RPS,
+        )
+
+        # Keep-alive connections per thread (requests.Session and httpx clients
+        # are not shared between threads), closed by close_connections()
+        self._local = threading.local()
+        self._connections_lock = threading.Lock()
+        self._sessions: List[requests.Session] = []
+        self._async_clients: List[
+            Tuple[asyncio.AbstractEventLoop, AsyncTrackerClient]
+        ] = []
+
+    def _create_async_client(self) -> AsyncTrackerClient:
+        """Create pooled async client sharing this service's rate limiter."""
+        return AsyncTrackerClient(
+            headers=self.headers,
+            base_url=self.base_url,
+            max_connections=self.max_workers,
+            limiter=self.rate_limiter,
+        )
+
+    def _http_session(self) -> requests.Session:
+        """Keep-alive requests session of the current thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._connections_lock:
+                self._sessions.append(session)
+        return session
+
+    def _thread_async_client(
+        self,
+    ) -> Tuple[asyncio.AbstractEventLoop, AsyncTrackerClient]:
+        """Event loop and pooled async client of the current thread."""
+        client = getattr(self._local, "async_client", None)
+        if client is None:
+            # httpx pool is bound to its loop, so the loop lives as long as it
+            loop = asyncio.new_event_loop()
+            client = loop.run_until_complete(self._create_async_client().__aenter__())
+            self._local.loop, self._local.async_client = loop, client
+            with self._connections_lock:
+                self._async_clients.append((loop, client))
+        return self._local.loop, client
+
+    def _run_async_batch(self, method_name: str, *args, **kwargs) -> List[Any]:
+        """Run AsyncTrackerClient batch method on this thread's pooled client."""
+        loop, client = self._thread_async_client()
+        return loop.run_until_complete(getattr(client, method_name)(*args, **kwargs))
+
+    def close_connections(self) -> None:
+        """
+        Close pooled connections of all threads.
+
+        Threads that use the service afterwards open new ones.
+        """
+        with self._connections_lock:
+            sessions, self._sessions = self._sessions, []
+            async_clients, self._async_clients = self._async_clients, []
+        for session in sessions:
+            session.close()
+        for loop, client in async_clients:
+            loop.run_until_complete(client.__aexit__(None, None, None))
+            loop.close()
+        self._local = threading.local()
+
+    def enable_response_cache(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        max_bytes: int = None,
+        offline: bool = False,
+    ) -> TrackerResponseCache:
+        """
+        Cache issue, changelog and search responses on disk.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Size cap (default: TRACKER_RESPONSE_CACHE_MAX_MB)
+            offline: Serve only from the cache; requests not in it fail with
+                OfflineCacheMiss instead of going to the network
+
+        Returns:
+            Response cache
+        """
+        if self.response_cache is not None:
+            self.response_cache.close()
+        self.response_cache = TrackerResponseCache(
+            path,
+            max_bytes=max_bytes or settings.TRACKER_RESPONSE_CACHE_MAX_MB * 1024 * 1024,
+            offline=offline,
+        )
+        self.offline = offline
+        logger.info(
+            f"Кэш ответов Tracker: {path}"
+            + (" (офлайн, только из кэша)" if offline else "")
+        )
+        return self.response_cache
+
+    def _run_async_batch_cached(
+        self,
+        task_ids: List[str],
+        lookup: Callable[[str], Any],
+        store: Callable[[str, Any], None],
+        fetch: Callable[[List[str]], List[Tuple[str, Any, bool]]],
+    ) -> List[Tuple[str, Any]]:
+        """
+        Serve cached results and fetch only the rest with AsyncTrackerClient.
+
+        Args:
+            task_ids: Task IDs in Tracker
+            lookup: Returns the cached result of a task or None
+            store: Stores a fetched result in the cache
+            fetch: Fetches the missing task IDs as (task_id, value, complete);
+                only complete results are stored
+
+        Returns:
+            List of (task_id, value) in task_ids order. Offline, results
+            missing from the cache are None (as for API errors).
+        """
+        results = {task_id: lookup(task_id) for task_id in task_ids}
+        missing = [task_id for task_id, value in results.items() if value is None]
+        if missing and not self.offline:
+            for task_id, value, complete in fetch(missing):
+                results[task_id] = value
+                if complete:
+                    store(task_id, value)
+        return [(task_id, results[task_id]) for task_id in task_ids]
+
+    def _parse_json(self, response: requests.Response) -> Any:
+        """Parse full response body, with orjson when enabled and installed."""
+        if self.use_orjson and orjson_available():
+            try:
+                return loads(response.content)
+            except ValueError as e:
+                raise requests.exceptions.JSONDecodeError(str(e), response.text, 0)
+        return response.json()
+
+    def _iter_response_pages(
+        self,
+        response: requests.Response,
+        extract_full_data: bool = True,
+        page_size: int = None,
+    ) -> Iterator[List[Any]]:
+        """
+        Decode a streamed search response into pages of at most page_size tasks.
+
+        The body is read in chunks and issues are decoded one by one, so
+        neither the whole body nor the whole list of issues is held in memory.
+        A body that is an object (e.g. {"issues": [...]}) cannot be streamed
+        and is parsed whole, like a non-streamed response.
+
+        Args:
+            response: Response of a request made with stream=True
+            extract_full_data: Yield full task data if True, task IDs otherwise
+            page_size: Tasks per yielded page (default: API_PAGE_SIZE)
+
+        Yields:
+            Lists of full task data dictionaries or task IDs
+        """
+        page_size = page_size or settings.API_PAGE_SIZE
+        extract = (
+            self._extract_tasks_from_response
+            if extract_full_data
+            else self._extract_task_ids_from_response
+        )
+        try:
+            chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            head = b""
+            for chunk in chunks:
+                head += chunk
+                if head.strip():
+                    break
+
+            if head.lstrip().startswith(b"{"):
+                # Объект вместо массива - разбираем тело целиком
+                tasks = extract(loads(head + b"".join(chunks)))
+                for start in range(0, len(tasks), page_size):
+                    yield tasks[start : start + page_size]
+                return
+
+            page = []
+            for item in iter_json_array(
+                chain([head], chunks), response.encoding or "utf-8"
+            ):
+                page.extend(extract([item]))
+                if len(page) >= page_size:
+                    yield page
+                    page = []
+            if page:
+                yield page
+        finally:
+            response.close()
+
+    def _send_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send request paced by the shared rate limiter, retrying 429 responses.
+
+        Every attempt takes a token from rate_limiter, the same bucket the
+        async client uses. A 429 halves its rate and pauses it for Retry-After.
+
+        Returns:
+            Last response (still 429 if retries are exhausted)
+        """
+        attempt = 0
+        while True:
+            self.rate_limiter.wait()
+            response = self._http_session().request(
+                method, url, headers=self.headers, **kwargs
+            )
+            if response.status_code != 429 or attempt >= MAX_THROTTLE_RETRIES:
+                if response.ok:
+                    self.rate_limiter.on_success(response.headers)
+                return response
+
+            attempt += 1
+            self.rate_limiter.on_throttle(
+                parse_retry_after(response.headers.get("Retry-After"))
+            )
+            logger.warning(
+                f"⚠️ API Error 429: лимит запросов, снижаем скорость до "
+                f"{self.rate_limiter.rate:.1f} req/s (повтор {attempt})"
+            )
 
     def _make_request(
         self, url: str, method: str = "GET", **kwargs
     ) -> requests.Response:
         """Make HTTP request with error handling and rate limiting."""
+        if self.offline:
+            raise OfflineCacheMiss(f"Ответа нет в кэше, сеть отключена: {url}")
         try:
-            response = requests.request(method, url, headers=self.headers, **kwargs)
+            response = self._send_request(method, url, **kwargs)
             response.raise_for_status()
-            time.sleep(self.request_delay)  # Rate limiting
             return response
         except (
             requests.exceptions.RequestException,
@@ -80,22 +348,11 @@ class TrackerAPIService:
                 logger.error(f"🚫 API Error 401: Неавторизован (проверьте токен)")
                 logger.error(f"   URL: {url}")
             elif status_code == 429:
-                logger.warning(
-                    f"⚠️ API Error 429: Превышен лимит запросов, ждем 60 секунд..."
+                logger.error(
+                    f"🚫 API Error 429: Превышен лимит запросов, "
+                    f"{MAX_THROTTLE_RETRIES} повторов не помогли"
                 )
-                logger.warning(f"   URL: {url}")
-                time.sleep(60)  # Ждем 60 секунд при ошибке 429
-                # Попробуем повторить запрос
-                try:
-                    response = requests.request(
-                        method, url, headers=self.headers, **kwargs
-                    )
-                    response.raise_for_status()
-                    time.sleep(self.request_delay)
-                    return response
-                except Exception as retry_e:
-                    logger.error(f"🚫 Повторный запрос также failed: {retry_e}")
-                    raise e
+                logger.error(f"   URL: {url}")
             elif status_code == 400:
                 logger.error(f"🚫 API Error 400: Bad Request")
                 logger.error(f"   URL: {url}")
@@ -124,6 +381,13 @@ class TrackerAPIService:
         self, task_id: str, expand: List[str] = None, fields: List[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Get task details by ID."""
+        if self.response_cache is not None:
+            cached = self.response_cache.get_task(task_id, expand, fields)
+            if cached is not None:
+                return cached
+            if self.offline:
+                logger.warning(f"⚠️ Задачи {task_id} нет в кэше (офлайн)")
+                return None
         try:
             url = f"{self.base_url}issues/{task_id}"
             params = {}
@@ -132,14 +396,28 @@ class TrackerAPIService:
             if fields:
                 params["fields"] = ",".join(fields)
             response = self._make_request(url, params=params)
-            return response.json()
+            task = self._parse_json(response)
+            if self.response_cache is not None and isinstance(task, dict):
+                self.response_cache.put_task(task_id, task, expand, fields)
+            return task
         except Exception as e:
             logger.error(f"Failed to get task {task_id}: {e}")
             return None
 
-    def get_task_changelog(self, task_id: str) -> List[Dict[str, Any]]:
-        """Get task changelog with pagination support."""
+    def get_task_changelog(self, task_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Get task changelog with pagination support (None if offline cache miss)."""
+        if self.response_cache is not None:
+            cached = self.response_cache.get_changelog(task_id)
+            if cached is not None:
+                return cached
+            if self.offline:
+                # None, как при ошибке API: задача пропускается, а не получает
+                # пустую историю вместо сохраненной
+                logger.warning(f"⚠️ Истории задачи {task_id} нет в кэше (офлайн)")
+                return None
+
         all_data = []
+        complete = True
         page = 1
         per_page = 50  # API default and maximum per page
         next_page_id = (
@@ -159,7 +437,7 @@ class TrackerAPIService:
                     params["id"] = next_page_id
 
                 response = self._make_request(url, params=params)
-                page_data = response.json()
+                page_data = self._parse_json(response)
 
                 if not page_data:
                     break
@@ -184,6 +462,10 @@ class TrackerAPIService:
 
                 # Safety check to prevent infinite loops
                 if page > 100:  # Maximum 100 pages
+                    logger.warning(
+                        f"⚠️ История задачи {task_id} обрезана: больше 100 страниц"
+                    )
+                    complete = False
                     break
 
             except Exception as e:
@@ -203,13 +485,17 @@ class TrackerAPIService:
                 )
                 logger.error(f"📍 Error details: {error_details}")
                 logger.error(f"📍 Stacktrace: {traceback.format_exc()}")
+                complete = False
                 break
 
+        # Неполную историю (ошибка на середине) не кэшируем
+        if self.response_cache is not None and complete:
+            self.response_cache.put_changelog(task_id, all_data)
         return all_data
 
     def get_changelog_from_id(
         self, task_id: str, last_changelog_id: str
-    ) -> List[Dict[str, Any]]:
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         Get changelog entries after specified ID for incremental sync.
 
@@ -221,8 +507,19 @@ class TrackerAPIService:
             last_changelog_id: ID of the last processed changelog entry
 
         Returns:
-            List of new changelog entries (only those added after last_changelog_id)
+            List of new changelog entries (only those added after last_changelog_id),
+            None if offline and the entries are not in the response cache
         """
+        if self.response_cache is not None:
+            cached = self.response_cache.get_changelog(task_id, last_changelog_id)
+            if cached is not None:
+                return cached
+            if self.offline:
+                # None, как при ошибке API: задача пропускается, а не получает
+                # пустую историю вместо сохраненной
+                logger.warning(f"⚠️ Истории задачи {task_id} нет в кэше (офлайн)")
+                return None
+
         all_data = []
         per_page = 50  # API default and maximum per page
         next_page_id = last_changelog_id  # Start from the last known ID
@@ -241,7 +538,7 @@ class TrackerAPIService:
                 }
 
                 response = self._make_request(url, params=params)
-                page_data = response.json()
+                page_data = self._parse_json(response)
 
                 if not page_data:
                     # No more data available
@@ -298,6 +595,21 @@ class TrackerAPIService:
         self, task_ids: List[str], expand: List[str] = None
     ) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
         """Get multiple tasks in parallel with progress bar."""
+        if self.use_async_client:
+            if self.response_cache is None:
+                return self._run_async_batch("get_tasks_batch", task_ids, expand)
+            cache = self.response_cache
+            return self._run_async_batch_cached(
+                task_ids,
+                lambda task_id: cache.get_task(task_id, expand),
+                lambda task_id, task: cache.put_task(task_id, task, expand),
+                lambda missing: [
+                    (task_id, task, task is not None)
+                    for task_id, task in self._run_async_batch(
+                        "get_tasks_batch", missing, expand
+                    )
+                ],
+            )
 
         results = []
         total_tasks = len(task_ids)
@@ -346,9 +658,52 @@ class TrackerAPIService:
         return results
 
     def get_changelogs_batch(
-        self, task_ids: List[str]
+        self,
+        task_ids: List[str],
+        last_changelog_ids: Optional[Dict[str, str]] = None,
     ) -> List[Tuple[str, List[Dict[str, Any]]]]:
-        """Get changelogs for multiple tasks in parallel with progress bar."""
+        """
+        Get changelogs for multiple tasks in parallel with progress bar.
+
+        Args:
+            task_ids: Task IDs in Tracker
+            last_changelog_ids: Last processed changelog ID by task ID; for these
+                tasks only newer entries are fetched (get_changelog_from_id)
+
+        Returns:
+            List of (task_id, changelog) in task_ids order
+        """
+        last_changelog_ids = last_changelog_ids or {}
+
+        if self.use_async_client:
+            if self.response_cache is None:
+                return self._run_async_batch(
+                    "get_changelogs_batch", task_ids, last_changelog_ids
+                )
+            cache = self.response_cache
+
+            def fetch(missing: List[str]) -> List[Tuple[str, Any, bool]]:
+                # Ошибку и обрезанную историю не кэшируем, как в get_task_changelog
+                return [
+                    (task_id, [], False) if result is None else (task_id, *result)
+                    for task_id, result in self._run_async_batch(
+                        "get_changelogs_batch_checked", missing, last_changelog_ids
+                    )
+                ]
+
+            return self._run_async_batch_cached(
+                task_ids,
+                lambda task_id: cache.get_changelog(
+                    task_id, last_changelog_ids.get(task_id)
+                ),
+                # Кэшируется только полная история
+                lambda task_id, changelog: (
+                    None
+                    if task_id in last_changelog_ids
+                    else cache.put_changelog(task_id, changelog)
+                ),
+                fetch,
+            )
 
         total_tasks = len(task_ids)
 
@@ -359,7 +714,13 @@ class TrackerAPIService:
             # Submit all tasks and store futures with their indices
             future_to_index = {}
             for i, task_id in enumerate(task_ids):
-                future = executor.submit(self.get_task_changelog, task_id)
+                last_changelog_id = last_changelog_ids.get(task_id)
+                if last_changelog_id:
+                    future = executor.submit(
+                        self.get_changelog_from_id, task_id, last_changelog_id
+                    )
+                else:
+                    future = executor.submit(self.get_task_changelog, task_id)
                 future_to_index[future] = i
 
             # Use tqdm for real-time progress indication
@@ -905,7 +1266,7 @@ class TrackerAPIService:
                 response = self._make_request(
                     url, method="POST", json=post_data, params=params
                 )
-                data = response.json()
+                data = self._parse_json(response)
 
                 # Extract task IDs from response
                 page_task_ids = self._extract_task_ids_from_response(data)
@@ -918,7 +1279,7 @@ class TrackerAPIService:
 
                 # Check if we should continue pagination
                 if not self._should_continue_pagination(
-                    all_task_ids, limit, page, page_task_ids, response
+                    len(all_task_ids), limit, page, page_task_ids, response
                 ):
                     if len(all_task_ids) >= limit:
                         logger.info(f"   Достигнут лимит {limit} задач")
@@ -972,8 +1333,25 @@ class TrackerAPIService:
             List of full task data dictionaries
         """
         try:
+            if self.response_cache is not None:
+                # Страницы записываются в кэш для повторного запуска офлайн
+                all_tasks = []
+                for page_tasks in self.iter_search_pages(query, limit, expand, fields):
+                    all_tasks.extend(page_tasks)
+                    if progress_callback:
+                        progress_callback(len(all_tasks))
+                logger.info(f"Найдено {len(all_tasks)} задач с полными данными")
+                return all_tasks
+
             # Если limit не указан или равен MAX_UNLIMITED_LIMIT, проверяем total count для автоопределения
             if limit is None or limit == settings.MAX_UNLIMITED_LIMIT:
+                if self.search_shards > 1:
+                    return self.search_tasks_sharded(
+                        query,
+                        expand=expand,
+                        fields=fields,
+                        progress_callback=progress_callback,
+                    )
                 if self.should_use_scroll(query):
                     # API показывает 10000 - может быть больше, используем scroll
                     logger.info(
@@ -1011,27 +1389,73 @@ class TrackerAPIService:
                 )
 
             # Существующая логика для обычной пагинации v2 (БЕЗ ИЗМЕНЕНИЙ)
-            url = f"{self.base_url}issues/_search"
             all_tasks = []
-            page = 1
-            per_page = settings.API_PAGE_SIZE
+            for page_tasks in self._iter_v2_pages(query, limit, expand, fields):
+                # Add tasks to collection
+                all_tasks.extend(page_tasks)
 
-            while True:
-                # Prepare request data
-                post_data = {"query": query}
-                params = {"perPage": per_page, "page": page}
-                if expand:
-                    params["expand"] = ",".join(expand)
-                if fields:
-                    params["fields"] = ",".join(fields)
+                # Call progress callback if provided
+                if progress_callback:
+                    progress_callback(len(all_tasks))
 
-                logger.debug(f"   Страница {page}: запрос {per_page} задач")
+            # Limit results if needed
+            if len(all_tasks) > limit:
+                all_tasks = all_tasks[:limit]
+
+            logger.info(f"Найдено {len(all_tasks)} задач с полными данными")
+            return all_tasks
+
+        except Exception as e:
+            logger.error(f"Failed to search tasks with data: {e}")
+            import traceback
+
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            return []
+
+    def _iter_v2_pages(
+        self,
+        query: str,
+        limit: int,
+        expand: List[str] = None,
+        fields: List[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of full task data using v2 page pagination.
+
+        Pages are yielded as soon as they arrive, so callers can process them
+        without waiting for the whole result set.
+        """
+        url = f"{self.base_url}issues/_search"
+        total_received = 0
+        page = 1
+        per_page = settings.API_PAGE_SIZE
+
+        while True:
+            # Prepare request data
+            post_data = {"query": query}
+            params = {"perPage": per_page, "page": page}
+            if expand:
+                params["expand"] = ",".join(expand)
+            if fields:
+                params["fields"] = ",".join(fields)
+
+            logger.debug(f"   Страница {page}: запрос {per_page} задач")
+            if self.stream_json:
+                response = self._make_request(
+                    url, method="POST", json=post_data, params=params, stream=True
+                )
+                page_tasks = [
+                    task
+                    for tasks in self._iter_response_pages(response, page_size=per_page)
+                    for task in tasks
+                ]
+            else:
                 response = self._make_request(
                     url, method="POST", json=post_data, params=params
                 )
 
                 try:
-                    data = response.json()
+                    data = self._parse_json(response)
                 except requests.exceptions.JSONDecodeError as e:
                     logger.error(f"❌ Ошибка парсинга JSON на странице {page}: {e}")
                     logger.error(f"   Размер ответа: {len(response.text)} символов")
@@ -1041,44 +1465,235 @@ class TrackerAPIService:
 
                 # Extract full task data from response
                 page_tasks = self._extract_tasks_from_response(data)
+            total_received += len(page_tasks)
+            logger.debug(
+                f"   Страница {page}: получено {len(page_tasks)} задач, всего: {total_received}"
+            )
 
-                # Add tasks to collection
-                all_tasks.extend(page_tasks)
-                logger.debug(
-                    f"   Страница {page}: получено {len(page_tasks)} задач, всего: {len(all_tasks)}"
+            yield page_tasks
+
+            # Check if we should continue pagination
+            if not self._should_continue_pagination(
+                total_received, limit, page, page_tasks, response
+            ):
+                if total_received >= limit:
+                    logger.info(f"   Достигнут лимит {limit} задач")
+                elif not page_tasks:
+                    logger.info(f"   Больше задач нет")
+                else:
+                    logger.info(f"   Получены все доступные задачи")
+                break
+
+            page += 1
+
+    def iter_search_pages(
+        self,
+        query: str,
+        limit: int = None,
+        expand: List[str] = None,
+        fields: List[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Search tasks and yield pages of full task data as they arrive.
+
+        Uses the same pagination method selection as search_tasks_with_data
+        (scroll for >10000 results, v2 pages otherwise), but never holds more
+        than one page in memory.
+
+        Args:
+            query: Yandex Tracker search query
+            limit: Maximum number of tasks to return (None - all matching)
+            expand: List of fields to expand (e.g., ['links'])
+            fields: List of fields to request
+
+        Yields:
+            Lists of full task data dictionaries
+        """
+        if self.response_cache is None:
+            yield from self._iter_search_pages(query, limit, expand, fields)
+            return
+
+        cache = self.response_cache
+        search_key = cache.search_key(query, limit, expand, fields)
+        if self.offline:
+            pages = cache.iter_search_pages(search_key)
+            if pages is None:
+                raise OfflineCacheMiss(f"Поиска нет в кэше, сеть отключена: {query}")
+            for page_tasks in pages:
+                cache.note_versions(page_tasks)
+                yield page_tasks
+            return
+
+        number = 0
+        for page_tasks in self._iter_search_pages(query, limit, expand, fields):
+            cache.put_search_page(search_key, number, page_tasks)
+            number += 1
+            yield page_tasks
+        cache.finish_search(search_key, number)
+
+    def _iter_search_pages(
+        self,
+        query: str,
+        limit: int = None,
+        expand: List[str] = None,
+        fields: List[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Select pagination method and yield search pages (see iter_search_pages)."""
+        if limit is None or limit == settings.MAX_UNLIMITED_LIMIT:
+            if self.search_shards > 1:
+                yield from self.iter_search_shards(query, expand=expand, fields=fields)
+                return
+            if self.should_use_scroll(query):
+                yield from self._iter_scroll_pages(
+                    query, 999999, extract_full_data=True, expand=expand, fields=fields
                 )
+                return
+            limit = self.get_total_tasks_count(query)
 
-                # Call progress callback if provided
-                if progress_callback:
-                    progress_callback(len(all_tasks))
+        if limit <= 0:
+            return
 
-                # Check if we should continue pagination
-                if not self._should_continue_pagination(
-                    all_tasks, limit, page, page_tasks, response
-                ):
-                    if len(all_tasks) >= limit:
-                        logger.info(f"   Достигнут лимит {limit} задач")
-                    elif not page_tasks:
-                        logger.info(f"   Больше задач нет")
-                    else:
-                        logger.info(f"   Получены все доступные задачи")
-                    break
+        log_limit_info(f"Потоковый поиск задач: {query}", limit)
 
-                page += 1
+        if limit > 10000:
+            pages = self._iter_scroll_pages(
+                query, limit, extract_full_data=True, expand=expand, fields=fields
+            )
+        else:
+            pages = self._iter_v2_pages(query, limit, expand, fields)
 
-            # Limit results if needed
-            if len(all_tasks) > limit:
-                all_tasks = all_tasks[:limit]
+        remaining = limit
+        for page_tasks in pages:
+            if not page_tasks:
+                continue
+            page_tasks = page_tasks[:remaining]
+            remaining -= len(page_tasks)
+            yield page_tasks
+            if remaining <= 0:
+                break
 
-            logger.info(f"Найдено {len(all_tasks)} задач с полными данными")
-            return all_tasks
+    def plan_search_shards(self, query: str) -> List[SearchShard]:
+        """
+        Split query into disjoint date-range shards using X-Total-Count probes.
 
-        except Exception as e:
-            logger.error(f"Failed to search tasks with data: {e}")
-            import traceback
+        Args:
+            query: Yandex Tracker search query
 
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            return []
+        Returns:
+            Shards of at most TRACKER_SEARCH_SHARD_SIZE tasks where possible
+        """
+        planner = SearchShardPlanner(
+            self.get_total_tasks_count,
+            field=settings.TRACKER_SEARCH_SHARD_FIELD,
+            shard_size=settings.TRACKER_SEARCH_SHARD_SIZE,
+            max_workers=max(1, self.search_shards),
+        )
+        return planner.plan(query)
+
+    def _fetch_search_shard(
+        self,
+        query: str,
+        shard: SearchShard,
+        expand: List[str] = None,
+        fields: List[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch all tasks of one shard with its own v2 pages or scroll cursor."""
+        shard_query = shard.query(query, settings.TRACKER_SEARCH_SHARD_FIELD)
+        if shard.count >= 10000:
+            # Не удалось сузить до одного дня - только scroll отдаёт больше 10000
+            pages = self._iter_scroll_pages(
+                shard_query,
+                settings.MAX_UNLIMITED_LIMIT,
+                extract_full_data=True,
+                expand=expand,
+                fields=fields,
+            )
+        else:
+            # Лимит с запасом: задачи могут появиться после подсчёта
+            pages = self._iter_v2_pages(shard_query, 10000, expand, fields)
+
+        tasks = []
+        for page_tasks in pages:
+            tasks.extend(page_tasks)
+        return tasks
+
+    def iter_search_shards(
+        self,
+        query: str,
+        expand: List[str] = None,
+        fields: List[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Search all tasks of a query in concurrently fetched date-range shards.
+
+        Shards come from plan_search_shards and are fetched by search_shards
+        threads; each shard is yielded as soon as it is complete. Tasks already
+        yielded by another shard are skipped.
+
+        Args:
+            query: Yandex Tracker search query
+            expand: List of fields to expand (e.g., ['links'])
+            fields: List of fields to request
+
+        Yields:
+            Lists of full task data dictionaries, one per shard
+        """
+        shards = self.plan_search_shards(query)
+        if not shards:
+            return
+
+        logger.info(
+            f"🚀 Параллельный поиск: {len(shards)} частей, "
+            f"{self.search_shards} потоков"
+        )
+        seen_ids = set()
+        with ThreadPoolExecutor(max_workers=self.search_shards) as executor:
+            futures = [
+                executor.submit(self._fetch_search_shard, query, shard, expand, fields)
+                for shard in shards
+            ]
+            try:
+                for future in as_completed(futures):
+                    shard_tasks = deduplicate_by_key(future.result())
+                    new_tasks = [
+                        task
+                        for task_id, task in shard_tasks.items()
+                        if task_id not in seen_ids
+                    ]
+                    seen_ids.update(shard_tasks)
+                    if new_tasks:
+                        yield new_tasks
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def search_tasks_sharded(
+        self,
+        query: str,
+        expand: List[str] = None,
+        fields: List[str] = None,
+        progress_callback: Callable[[int], None] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search all tasks of a query with concurrent date-range shards.
+
+        Args:
+            query: Yandex Tracker search query
+            expand: List of fields to expand (e.g., ['links'])
+            fields: List of fields to request
+            progress_callback: Called with the number of tasks received so far
+
+        Returns:
+            List of full task data dictionaries, unique by id
+        """
+        all_tasks = []
+        for shard_tasks in self.iter_search_shards(query, expand, fields):
+            all_tasks.extend(shard_tasks)
+            if progress_callback:
+                progress_callback(len(all_tasks))
+
+        logger.info(f"Найдено {len(all_tasks)} задач с полными данными")
+        return all_tasks
 
     def _extract_tasks_from_response(self, data: Any) -> List[Dict[str, Any]]:
         """Extract full task data from API response data."""
@@ -1097,6 +1712,9 @@ class TrackerAPIService:
                     if isinstance(item, dict) and item.get("id"):
                         tasks.append(item)
 
+        if self.response_cache is not None:
+            # Свежий updatedAt подтверждает актуальность кэша задачи и истории
+            self.response_cache.note_versions(tasks)
         return tasks
 
     def _extract_task_ids_from_response(self, data: Any) -> List[str]:
@@ -1120,27 +1738,27 @@ class TrackerAPIService:
 
     def _should_continue_pagination(
         self,
-        all_task_ids: List[str],
+        received: int,
         limit: int,
         page: int,
-        page_task_ids: List[str],
+        page_task_ids: List[Any],
         response,
     ) -> bool:
         """
         Check if pagination should continue.
 
         Args:
-            all_task_ids: All collected task IDs so far
+            received: Number of tasks collected so far
             limit: Maximum number of tasks to collect
             page: Current page number
-            page_task_ids: Task IDs from current page
+            page_task_ids: Task IDs (or tasks) from current page
             response: HTTP response object
 
         Returns:
             True if pagination should continue, False otherwise
         """
         # Stop if we have enough tasks
-        if len(all_task_ids) >= limit:
+        if received >= limit:
             return False
 
         # Stop if no more tasks on current page
@@ -1232,12 +1850,62 @@ class TrackerAPIService:
             logger.error(f"Failed to get tasks by filter: {e}")
             return []
 
+    def build_search_query(self, filters: Dict[str, Any] = None) -> str:
+        """
+        Build Tracker query string from sync filters.
+
+        Args:
+            filters: Dictionary of filters; "query" is passed through as is
+
+        Returns:
+            Tracker query string (empty if no filters given)
+        """
+        # Check if we have a direct query string
+        if filters and "query" in filters:
+            # Use the query string directly as provided
+            return filters["query"]
+
+        # Build search query from filters using Tracker query syntax
+        search_parts = []
+
+        if filters:
+            for key, value in filters.items():
+                if value:
+                    if key == "status":
+                        search_parts.append(f'Status: "{value}"')
+                    elif key == "assignee":
+                        search_parts.append(f'Assignee: "{value}"')
+                    elif key == "team":
+                        search_parts.append(f'Team: "{value}"')
+                    elif key == "author":
+                        search_parts.append(f'Author: "{value}"')
+                    elif key == "updated_since":
+                        if isinstance(value, datetime):
+                            search_parts.append(
+                                f'Updated: >{value.strftime("%Y-%m-%d")}'
+                            )
+                        else:
+                            search_parts.append(f"Updated: >{value}")
+                    elif key == "created_since":
+                        if isinstance(value, datetime):
+                            search_parts.append(
+                                f'Created: >{value.strftime("%Y-%m-%d")}'
+                            )
+                        else:
+                            search_parts.append(f"Created: >{value}")
+                    else:
+                        # For custom fields, use the key directly
+                        search_parts.append(f"{key}: {value}")
+
+        return " AND ".join(search_parts) if search_parts else ""
+
     def get_tasks_by_filter_with_data(
         self,
         filters: Dict[str, Any] = None,
         limit: int = None,
         fields: List[str] = None,
         progress_callback: Callable[[int], None] = None,
+        expand: List[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get tasks with full data using various filters.
@@ -1245,6 +1913,9 @@ class TrackerAPIService:
         Args:
             filters: Dictionary of filters (status, assignee, team, etc.)
             limit: Maximum number of tasks to return (uses default from config if None)
+            fields: List of fields to request
+            progress_callback: Called with the number of tasks received so far
+            expand: List of fields to expand (default: ['links'])
 
         Returns:
             List of full task data dictionaries
@@ -1254,62 +1925,16 @@ class TrackerAPIService:
             if limit is None:
                 limit = settings.DEFAULT_SEARCH_LIMIT
 
-            # Check if we have a direct query string
-            if filters and "query" in filters:
-                # Use the query string directly as provided
-                search_query = filters["query"]
-                logger.info(f"Using direct query: {search_query}")
-                return self.search_tasks_with_data(
-                    query=search_query,
-                    limit=limit,
-                    expand=["links"],
-                    fields=fields,
-                    progress_callback=progress_callback,
-                )
-
-            # Build search query from filters using Tracker query syntax
-            search_parts = []
-
-            if filters:
-                for key, value in filters.items():
-                    if value:
-                        if key == "status":
-                            search_parts.append(f'Status: "{value}"')
-                        elif key == "assignee":
-                            search_parts.append(f'Assignee: "{value}"')
-                        elif key == "team":
-                            search_parts.append(f'Team: "{value}"')
-                        elif key == "author":
-                            search_parts.append(f'Author: "{value}"')
-                        elif key == "updated_since":
-                            if isinstance(value, datetime):
-                                search_parts.append(
-                                    f'Updated: >{value.strftime("%Y-%m-%d")}'
-                                )
-                            else:
-                                search_parts.append(f"Updated: >{value}")
-                        elif key == "created_since":
-                            if isinstance(value, datetime):
-                                search_parts.append(
-                                    f'Created: >{value.strftime("%Y-%m-%d")}'
-                                )
-                            else:
-                                search_parts.append(f"Created: >{value}")
-                        else:
-                            # For custom fields, use the key directly
-                            search_parts.append(f"{key}: {value}")
-
-            search_query = " AND ".join(search_parts) if search_parts else ""
-
+            search_query = self.build_search_query(filters)
             if not search_query:
                 logger.warning("No filters provided, returning empty list")
                 return []
 
-            logger.info(f"Built search query: {search_query}")
+            logger.info(f"Search query: {search_query}")
             return self.search_tasks_with_data(
                 query=search_query,
                 limit=limit,
-                expand=["links"],
+                expand=["links"] if expand is None else expand,
                 fields=fields,
                 progress_callback=progress_callback,
             )
@@ -1420,10 +2045,46 @@ class TrackerAPIService:
         Returns:
             Список задач (ID или полные данные в зависимости от extract_full_data)
         """
+        all_results = []
+        for page_results in self._iter_scroll_pages(
+            query, limit, extract_full_data, expand, fields
+        ):
+            all_results.extend(page_results)
+
+            # Call progress callback if provided
+            if progress_callback:
+                progress_callback(len(all_results))
+
+        # Ограничиваем результаты до запрошенного лимита
+        results = all_results[:limit]
+        logger.info(f"Scroll-пагинация завершена: получено {len(results)} задач")
+
+        # TTL сам очистит ресурсы через 60 секунд - ничего не делаем
+        return results
+
+    def _iter_scroll_pages(
+        self,
+        query: str,
+        limit: int,
+        extract_full_data: bool = False,
+        expand: List[str] = None,
+        fields: List[str] = None,
+    ) -> Iterator[List[Any]]:
+        """
+        Yield scroll pages (v3) until limit is reached or scroll is exhausted.
+
+        Args:
+            query: Поисковый запрос на языке Яндекс Трекера
+            limit: Максимальное количество задач
+            extract_full_data: Если True - полные данные, если False - только ID
+
+        Yields:
+            Lists of task IDs or full task data per scroll page
+        """
         # ВСЕГДА используем v3 для scroll
         url = "https://api.tracker.yandex.net/v3/issues/_search"
 
-        all_results = []
+        total_received = 0
         scroll_id = None
         page = 1
 
@@ -1438,10 +2099,11 @@ class TrackerAPIService:
         if fields:
             params["fields"] = ",".join(fields)
         post_data = {"query": query}
+        stream_kwargs = {"stream": True} if self.stream_json else {}
 
         logger.info(f"Начинаем scroll-пагинацию (v3) для запроса: {query}")
 
-        while len(all_results) < limit:
+        while total_received < limit:
             # Для последующих запросов используем scrollId
             if scroll_id:
                 params = {"scrollId": scroll_id, "scrollTTLMillis": 60000}
@@ -1451,32 +2113,43 @@ class TrackerAPIService:
                     params["fields"] = ",".join(fields)
 
             response = self._make_request(
-                url, method="POST", json=post_data, params=params
+                url,
+                method="POST",
+                json=post_data,
+                params=params,
+                **stream_kwargs,
             )
-            data = response.json()
+            # Получаем scroll_id до передачи страницы потребителю
+            scroll_id = response.headers.get("X-Scroll-Id")
 
-            # Извлекаем результаты
-            if extract_full_data:
-                page_results = self._extract_tasks_from_response(data)
+            if self.stream_json:
+                # Страница scroll (до 1000 задач) отдается частями по мере разбора
+                pages = self._iter_response_pages(response, extract_full_data)
             else:
-                page_results = self._extract_task_ids_from_response(data)
+                data = self._parse_json(response)
 
-            if not page_results:
+                # Извлекаем результаты
+                if extract_full_data:
+                    pages = [self._extract_tasks_from_response(data)]
+                else:
+                    pages = [self._extract_task_ids_from_response(data)]
+
+            page_received = 0
+            for page_results in pages:
+                if not page_results:
+                    continue
+                page_received += len(page_results)
+                total_received += len(page_results)
+                yield page_results
+
+            if not page_received:
                 logger.info(f"Scroll завершен: получен пустой ответ")
                 break
 
-            all_results.extend(page_results)
             logger.debug(
-                f"Scroll страница {page}: получено {len(page_results)}, всего {len(all_results)}"
+                f"Scroll страница {page}: получено {page_received}, всего {total_received}"
             )
 
-            # Call progress callback if provided
-            if progress_callback:
-                progress_callback(len(all_results))
-
-            # Получаем scroll_id для следующей страницы
-            scroll_id = response.headers.get("X-Scroll-Id")
-
             if not scroll_id:
                 logger.info(f"Scroll завершен: нет больше scroll ID")
                 break
@@ -1488,13 +2161,6 @@ class TrackerAPIService:
                 logger.warning("Достигнут максимальный лимит страниц (1000)")
                 break
 
-        # Ограничиваем результаты до запрошенного лимита
-        results = all_results[:limit]
-        logger.info(f"Scroll-пагинация завершена: получено {len(results)} задач")
-
-        # TTL сам очистит ресурсы через 60 секунд - ничего не делаем
-        return results
-
     def extract_field_from_full_data(
         self, full_data: Dict[str, Any], field_path: str
     ) -> Any:
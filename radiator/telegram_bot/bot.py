@@ -6,12 +6,13 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.error import TelegramError
 
 from radiator.core.single_instance import SingleInstance
+from radiator.services.report_watcher import ReportDirectoryWatcher
 
 from .command_executor import CommandExecutor
 from .config import TelegramBotConfig
@@ -392,10 +393,18 @@ class ReportsTelegramBot:
                 if success:
                     await asyncio.sleep(1)  # Small delay between files
 
-    async def check_and_send_new_files(self) -> None:
-        """Check for new files and send them."""
+    async def check_and_send_new_files(
+        self, filenames: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Check for new files and send them.
+
+        Args:
+            filenames: Only check these files (reported by the directory
+                watcher) instead of listing the whole reports directory
+        """
         try:
-            new_files = self.file_monitor.get_new_files()
+            new_files = self.file_monitor.get_new_files(filenames)
             if new_files:
                 logger.info(f"Found {len(new_files)} new files: {', '.join(new_files)}")
                 await self.send_new_files_notification(list(new_files))
@@ -424,9 +433,16 @@ class ReportsTelegramBot:
                     except Exception as e:
                         logger.warning(f"Could not send startup message: {e}")
 
-                    while True:
+                    async with ReportDirectoryWatcher(
+                        self.reports_dir,
+                        poll_interval=TelegramBotConfig.POLLING_INTERVAL,
+                    ) as watcher:
+                        # Полная проверка один раз: файлы, появившиеся пока бот
+                        # был остановлен; дальше проверяются только файлы из событий
                         await self.check_and_send_new_files()
-                        await asyncio.sleep(TelegramBotConfig.POLLING_INTERVAL)
+                        while True:
+                            changed_files = await watcher.wait_for_changes()
+                            await self.check_and_send_new_files(changed_files)
 
                 except KeyboardInterrupt:
                     logger.info("Monitoring stopped by user")
@@ -6,7 +6,7 @@ import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, Iterable, Optional, Set
 
 from .config import TelegramBotConfig
 
@@ -51,31 +51,56 @@ class FileMonitor:
         except Exception as e:
             print(f"Warning: Could not save state file: {e}")
 
-    def get_current_files(self) -> Dict[str, float]:
-        """Get current files in reports directory with timestamps."""
+    def _is_monitored(self, file_path: Path) -> bool:
+        """Check whether file is a report to send (not an upload marker)."""
+        # Skip upload marker files
+        if file_path.name.startswith(".upload_me_"):
+            return False
+        # Skip pivot upload marker files
+        if file_path.name.startswith(".upload_with_pivots_"):
+            return False
+        return file_path.suffix.lower() in TelegramBotConfig.MONITORED_EXTENSIONS
+
+    def get_current_files(
+        self, filenames: Optional[Iterable[str]] = None
+    ) -> Dict[str, float]:
+        """
+        Get current files in reports directory with timestamps.
+
+        Args:
+            filenames: Only check these files (e.g. reported by the directory
+                watcher) instead of listing the whole directory
+
+        Returns:
+            Dictionary mapping filename to modification timestamp
+        """
         if not self.reports_dir.exists():
             return {}
 
+        if filenames is None:
+            paths = self.reports_dir.iterdir()
+        else:
+            paths = (self.reports_dir / filename for filename in filenames)
+
         current_files = {}
-        for file_path in self.reports_dir.iterdir():
-            if file_path.is_file():
-                # Skip upload marker files
-                if file_path.name.startswith(".upload_me_"):
-                    continue
-                # Skip pivot upload marker files
-                if file_path.name.startswith(".upload_with_pivots_"):
-                    continue
-
-                extension = file_path.suffix.lower()
-                if extension in TelegramBotConfig.MONITORED_EXTENSIONS:
-                    file_key = file_path.name
-                    current_files[file_key] = file_path.stat().st_mtime
+        for file_path in paths:
+            if self._is_monitored(file_path) and file_path.is_file():
+                current_files[file_path.name] = file_path.stat().st_mtime
 
         return current_files
 
-    def get_new_files(self) -> Set[str]:
-        """Get list of new files since last check."""
-        current_files = self.get_current_files()
+    def get_new_files(self, filenames: Optional[Iterable[str]] = None) -> Set[str]:
+        """
+        Get list of new files since last check.
+
+        Args:
+            filenames: Only check these files instead of listing the whole
+                directory
+
+        Returns:
+            Names of new or modified files
+        """
+        current_files = self.get_current_files(filenames)
         new_files = set()
 
         for filename, timestamp in current_files.items():
@@ -0,0 +1,148 @@
+"""Named field profiles for Tracker search and sync payloads."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+FIELDS_CONFIG_DIR = Path(__file__).parent.parent.parent / "data" / "config"
+
+# Columns from extract_task_data every profile writes: identity and the
+# updatedAt watermark used to skip unchanged histories
+BASE_COLUMNS = frozenset({"tracker_id", "key", "task_updated_at", "created_at"})
+
+# How full_data is stored
+FULL_DATA_FULL = "full"  # API response as is
+FULL_DATA_TRIMMED = "trimmed"  # only requested fields, without heavy text fields
+FULL_DATA_SKIP = "skip"  # column is not written, stored value is kept
+
+
+@dataclass(frozen=True)
+class FieldProfile:
+    """
+    Fields requested from Tracker and task columns written by sync.
+
+    Attributes:
+        name: Profile name
+        fields_file: File in data/config with the `fields` param (None - all fields)
+        expand: Values of the `expand` param
+        columns: extract_task_data keys upserted to tracker_tasks (None - all)
+        full_data: full_data mode (FULL_DATA_FULL, FULL_DATA_TRIMMED, FULL_DATA_SKIP)
+        trimmed_keys: Keys dropped from trimmed full_data
+    """
+
+    name: str
+    fields_file: Optional[str]
+    expand: Tuple[str, ...]
+    columns: Optional[FrozenSet[str]]
+    full_data: str
+    trimmed_keys: FrozenSet[str] = frozenset({"description"})
+
+    @property
+    def fields_path(self) -> Optional[Path]:
+        """Path to the fields file, None to request all fields."""
+        if self.fields_file is None:
+            return None
+        return FIELDS_CONFIG_DIR / self.fields_file
+
+    def apply(
+        self, task_info: Dict[str, Any], fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Project extract_task_data result onto the profile.
+
+        Columns outside the profile are dropped, so the upsert leaves their
+        stored values untouched instead of overwriting them with empty ones.
+
+        Args:
+            task_info: Result of TrackerAPIService.extract_task_data
+            fields: Requested fields; trimmed full_data keeps only these
+
+        Returns:
+            Task data with profile columns and full_data
+        """
+        if self.columns is None:
+            projected = dict(task_info)
+        else:
+            projected = {
+                key: value
+                for key, value in task_info.items()
+                if key in self.columns or key in BASE_COLUMNS
+            }
+
+        full_data = task_info.get("full_data")
+        if self.full_data == FULL_DATA_SKIP or not isinstance(full_data, dict):
+            projected.pop("full_data", None)
+        elif self.full_data == FULL_DATA_TRIMMED:
+            allowed = set(fields) if fields else None
+            projected["full_data"] = {
+                key: value
+                for key, value in full_data.items()
+                if key not in self.trimmed_keys and (allowed is None or key in allowed)
+            }
+        else:
+            projected["full_data"] = full_data
+        return projected
+
+
+FIELD_PROFILES = {
+    # Только история статусов: без связей, команд и full_data
+    "minimal": FieldProfile(
+        name="minimal",
+        fields_file="fields_minimal.txt",
+        expand=(),
+        columns=frozenset({"summary", "status", "author", "assignee"}),
+        full_data=FULL_DATA_SKIP,
+    ),
+    # Всё, что нужно отчетам (TTM, TTD, FULLSTACK): поля из fields.txt и связи
+    "report": FieldProfile(
+        name="report",
+        fields_file="fields.txt",
+        expand=("links",),
+        columns=frozenset(
+            {
+                "summary",
+                "status",
+                "author",
+                "assignee",
+                "business_client",
+                "customer",
+                "team",
+                "prodteam",
+                "profit_forecast",
+                "links",
+            }
+        ),
+        full_data=FULL_DATA_TRIMMED,
+    ),
+    # Архив: все поля задачи, включая описание
+    "full": FieldProfile(
+        name="full",
+        fields_file=None,
+        expand=("links",),
+        columns=None,
+        full_data=FULL_DATA_FULL,
+    ),
+}
+
+DEFAULT_FIELD_PROFILE = "report"
+
+
+def get_field_profile(name: Optional[str] = None) -> FieldProfile:
+    """
+    Get field profile by name.
+
+    Args:
+        name: Profile name (None - DEFAULT_FIELD_PROFILE)
+
+    Returns:
+        Field profile
+
+    Raises:
+        ValueError: If there is no profile with this name.
+    """
+    name = name or DEFAULT_FIELD_PROFILE
+    if name not in FIELD_PROFILES:
+        raise ValueError(
+            f"Unknown field profile '{name}', available: {', '.join(FIELD_PROFILES)}"
+        )
+    return FIELD_PROFILES[name]
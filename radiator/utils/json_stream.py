@@ -0,0 +1,116 @@
+"""Incremental decoding of JSON arrays from chunked HTTP bodies."""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # orjson is optional (pip install orjson)
+    orjson = None
+
+# Whitespace and element separators between array items
+_SEPARATORS = re.compile(r"[\s,]*")
+_WHITESPACE = re.compile(r"\s*")
+
+
+def orjson_available() -> bool:
+    """Whether orjson is installed."""
+    return orjson is not None
+
+
+def loads(data: bytes) -> Any:
+    """
+    Parse a complete JSON document, with orjson when it is installed.
+
+    Args:
+        data: JSON document bytes
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON (orjson's
+            error is a subclass of it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Yield items of a top-level JSON array as soon as each item is complete.
+
+    Only the unparsed tail of the body is kept in memory, so a page of 1000
+    issues never exists as one string or one list. Items are parsed by the
+    C-accelerated json decoder; when an item is still incomplete, parsing is
+    retried after the buffer has doubled, which keeps the total work linear
+    even for items larger than a chunk.
+
+    Args:
+        chunks: Body chunks, e.g. response.iter_content(chunk_size=...)
+        encoding: Body encoding
+
+    Yields:
+        Decoded array items
+
+    Raises:
+        ValueError: If the body is not a JSON array or ends before the array
+            is closed (json.JSONDecodeError for malformed items).
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    started = False
+    exhausted = False
+    # Buffer length required before the next parse attempt of an incomplete item
+    wait_for = 0
+
+    while True:
+        if not exhausted and (pos >= len(buffer) or len(buffer) < wait_for):
+            # Отбрасываем разобранное начало буфера перед чтением следующего чанка
+            buffer = buffer[pos:]
+            wait_for = max(0, wait_for - pos)
+            pos = 0
+            try:
+                buffer += text_decoder.decode(next(chunks))
+            except StopIteration:
+                buffer += text_decoder.decode(b"", final=True)
+                exhausted = True
+            continue
+
+        pos = (_SEPARATORS if started else _WHITESPACE).match(buffer, pos).end()
+        if pos >= len(buffer):
+            if exhausted:
+                raise ValueError("Unexpected end of JSON array")
+            continue
+
+        if not started:
+            if buffer[pos] != "[":
+                raise ValueError(f"Expected JSON array, got {buffer[pos:pos + 20]!r}")
+            started = True
+            pos += 1
+            continue
+
+        if buffer[pos] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if exhausted:
+                raise
+            wait_for = 2 * len(buffer) - pos
+            continue
+        if end >= len(buffer) and not exhausted:
+            # Число на границе чанка могло быть обрезано - ждем разделитель
+            wait_for = len(buffer) + 1
+            continue
+
+        wait_for = 0
+        pos = end
+        yield item
@@ -6,7 +6,7 @@ import asyncio
 import logging
 import sys
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -17,6 +17,12 @@ from radiator.services.csv_file_monitor import CSVFileMonitor
 from radiator.services.csv_processor import CSVProcessor
 from radiator.services.google_sheets_config import GoogleSheetsConfig
 from radiator.services.google_sheets_service import GoogleSheetsService
+from radiator.services.report_watcher import ReportDirectoryWatcher
+
+# Marker files created by the Telegram bot to request an upload
+UPLOAD_MARKER_PREFIX = ".upload_me_"
+PIVOT_MARKER_PREFIX = ".upload_with_pivots_"
+MARKER_PREFIXES = (UPLOAD_MARKER_PREFIX, PIVOT_MARKER_PREFIX)
 
 
 class GoogleSheetsCSVUploader:
@@ -29,6 +35,8 @@ class GoogleSheetsCSVUploader:
         self.file_monitor = CSVFileMonitor()
         self.csv_processor = CSVProcessor()
         self.reports_dir = self.config.get_reports_dir()
+        # Markers of failed uploads, retried every POLLING_INTERVAL
+        self.failed_markers: Set[str] = set()
         self.setup_logging()
 
     def setup_logging(self):
@@ -212,20 +220,26 @@ class GoogleSheetsCSVUploader:
             logging.error(f"Error processing file with pivots {file_path.name}: {e}")
             return False
 
-    def process_files_with_markers(self) -> Dict[str, int]:
+    def process_files_with_markers(
+        self, files_with_markers: Optional[List[str]] = None
+    ) -> Dict[str, int]:
         """
         Process only CSV files that have upload markers (requested via Telegram).
 
+        Args:
+            files_with_markers: CSV files with upload markers (None - scan reports dir)
+
         Returns:
             Dictionary with processing statistics
         """
         stats = {"processed": 0, "failed": 0, "skipped": 0}
 
         # Get files with upload markers
-        files_with_markers = self.file_monitor.get_files_with_upload_markers()
+        if files_with_markers is None:
+            files_with_markers = self.file_monitor.get_files_with_upload_markers()
 
         if not files_with_markers:
-            logging.info("No files with upload markers found")
+            logging.debug("No files with upload markers found")
             return stats
 
         logging.info(f"Found {len(files_with_markers)} files with upload markers")
@@ -244,38 +258,47 @@ class GoogleSheetsCSVUploader:
                 # Mark as processed and remove marker
                 self.file_monitor.mark_file_processed(filename)
                 self.file_monitor.remove_upload_marker(filename)
+                self.failed_markers.discard(f"{UPLOAD_MARKER_PREFIX}{filename}")
                 stats["processed"] += 1
                 logging.info(
                     f"Successfully processed and removed marker for {filename}"
                 )
             else:
                 self.file_monitor.mark_file_failed(filename, "Processing failed")
+                self.failed_markers.add(f"{UPLOAD_MARKER_PREFIX}{filename}")
                 stats["failed"] += 1
 
         return stats
 
-    def process_files_with_pivot_markers(self) -> Dict[str, int]:
+    def process_files_with_pivot_markers(
+        self, files_with_markers: Optional[List[str]] = None
+    ) -> Dict[str, int]:
         """
         Process only CSV files that have pivot upload markers (requested via Telegram).
 
+        Args:
+            files_with_markers: CSV files with pivot upload markers (None - scan
+                reports dir)
+
         Returns:
             Dictionary with processing statistics
         """
         stats = {"processed": 0, "failed": 0, "skipped": 0}
 
         # Get files with pivot upload markers
-        files_with_markers = self.file_monitor.get_files_with_pivot_markers()
+        if files_with_markers is None:
+            files_with_markers = self.file_monitor.get_files_with_pivot_markers()
 
         if not files_with_markers:
-            logging.info("No files with pivot upload markers found")
+            logging.debug("No files with pivot upload markers found")
             return stats
 
         logging.info(f"Found {len(files_with_markers)} files with pivot upload markers")
 
         for filename in files_with_markers:
-            file_path = self.reports_dir / filename
+            file_path = self.file_monitor.get_file_path(filename)
 
-            if not file_path.exists():
+            if not file_path:
                 logging.warning(f"File {filename} no longer exists, skipping")
                 stats["skipped"] += 1
                 continue
@@ -285,6 +308,7 @@ class GoogleSheetsCSVUploader:
                 # Mark as processed and remove marker
                 self.file_monitor.mark_file_processed(filename)
                 self.file_monitor.remove_pivot_upload_marker(filename)
+                self.failed_markers.discard(f"{PIVOT_MARKER_PREFIX}{filename}")
                 logging.info(
                     f"Successfully processed and removed pivot marker for {filename}"
                 )
@@ -293,10 +317,98 @@ class GoogleSheetsCSVUploader:
                 self.file_monitor.mark_file_failed(
                     filename, "Processing with pivots failed"
                 )
+                self.failed_markers.add(f"{PIVOT_MARKER_PREFIX}{filename}")
                 stats["failed"] += 1
 
         return stats
 
+    def _files_of_markers(
+        self, marker_names: Iterable[str]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Get CSV files of existing upload and pivot upload markers.
+
+        Markers that are gone, or whose CSV file is gone, are no longer retried.
+
+        Args:
+            marker_names: Marker file names
+
+        Returns:
+            Tuple of (files with upload markers, files with pivot upload markers)
+        """
+        reports_dir = self.file_monitor.reports_dir
+        upload_files, pivot_files = [], []
+
+        for marker_name in sorted(marker_names):
+            if marker_name.startswith(UPLOAD_MARKER_PREFIX):
+                filename = marker_name[len(UPLOAD_MARKER_PREFIX) :]
+                files = upload_files
+            elif marker_name.startswith(PIVOT_MARKER_PREFIX):
+                filename = marker_name[len(PIVOT_MARKER_PREFIX) :]
+                files = pivot_files
+            else:
+                continue
+
+            if (
+                (reports_dir / marker_name).is_file()
+                and filename.endswith(".csv")
+                and (reports_dir / filename).exists()
+            ):
+                files.append(filename)
+            else:
+                self.failed_markers.discard(marker_name)
+
+        return upload_files, pivot_files
+
+    def process_marker_files(self, marker_names: Optional[Iterable[str]] = None):
+        """
+        Process files with upload and pivot upload markers, then clean up state.
+
+        Args:
+            marker_names: Marker file names to process (None - scan reports dir)
+        """
+        if marker_names is None:
+            self.process_files_with_markers()
+            self.process_files_with_pivot_markers()
+        else:
+            upload_files, pivot_files = self._files_of_markers(marker_names)
+            self.process_files_with_markers(upload_files)
+            self.process_files_with_pivot_markers(pivot_files)
+
+        # Cleanup old records
+        self.file_monitor.cleanup_old_files()
+
+    async def _watch_upload_markers(self):
+        """
+        Process marker files whenever the directory watcher reports new markers.
+
+        Only the reported markers are processed. Markers of failed uploads stay
+        in place and are retried every POLLING_INTERVAL while there are any;
+        with nothing to retry the loop just waits for file events.
+        """
+        async with ReportDirectoryWatcher(
+            self.file_monitor.reports_dir,
+            poll_interval=self.config.POLLING_INTERVAL,
+        ) as watcher:
+            # Маркеры, созданные пока загрузчик был остановлен
+            self.process_marker_files()
+            while True:
+                changed_files = await watcher.wait_for_changes(
+                    timeout=(
+                        self.config.POLLING_INTERVAL if self.failed_markers else None
+                    )
+                )
+                marker_names = {
+                    filename
+                    for filename in changed_files
+                    if filename.startswith(MARKER_PREFIXES)
+                }
+                # Пустой результат - таймаут: повторяем неудавшиеся загрузки
+                if not changed_files:
+                    marker_names = set(self.failed_markers)
+                if marker_names:
+                    self.process_marker_files(marker_names)
+
     def start_monitoring(self):
         """Start continuous monitoring of CSV files with upload markers."""
         logging.info("Starting CSV file monitoring for files with upload markers...")
@@ -307,70 +419,7 @@ class GoogleSheetsCSVUploader:
                 logging.info("Google Sheets uploader instance lock acquired")
 
                 try:
-                    while True:
-                        # Check for files with upload markers
-                        files_with_markers = (
-                            self.file_monitor.get_files_with_upload_markers()
-                        )
-
-                        if files_with_markers:
-                            logging.info(
-                                f"Found {len(files_with_markers)} files with upload markers"
-                            )
-
-                            for filename in files_with_markers:
-                                file_path = self.file_monitor.get_file_path(filename)
-                                if file_path:
-                                    success = self.process_single_file(file_path)
-                                    if success:
-                                        self.file_monitor.mark_file_processed(filename)
-                                        self.file_monitor.remove_upload_marker(filename)
-                                        logging.info(
-                                            f"Successfully processed and removed marker for {filename}"
-                                        )
-                                    else:
-                                        self.file_monitor.mark_file_failed(
-                                            filename, "Processing failed"
-                                        )
-
-                        # Check for files with pivot upload markers
-                        files_with_pivot_markers = (
-                            self.file_monitor.get_files_with_pivot_markers()
-                        )
-
-                        if files_with_pivot_markers:
-                            logging.info(
-                                f"Found {len(files_with_pivot_markers)} files with pivot upload markers"
-                            )
-
-                            for filename in files_with_pivot_markers:
-                                file_path = self.file_monitor.get_file_path(filename)
-                                if file_path:
-                                    success = self.process_file_with_pivots(file_path)
-                                    if success:
-                                        self.file_monitor.mark_file_processed(filename)
-                                        self.file_monitor.remove_pivot_upload_marker(
-                                            filename
-                                        )
-                                        logging.info(
-                                            f"Successfully processed and removed pivot marker for {filename}"
-                                        )
-                                    else:
-                                        self.file_monitor.mark_file_failed(
-                                            filename, "Processing with pivots failed"
-                                        )
-
-                        if not files_with_markers and not files_with_pivot_markers:
-                            logging.debug("No files with upload markers found")
-
-                        # Cleanup old records
-                        self.file_monitor.cleanup_old_files()
-
-                        # Wait before next check
-                        import time
-
-                        time.sleep(self.config.POLLING_INTERVAL)
-
+                    asyncio.run(self._watch_upload_markers())
                 except KeyboardInterrupt:
                     logging.info("Monitoring stopped by user")
                 except Exception as e:
@@ -4,12 +4,19 @@
 import argparse
 import hashlib
 import re
-import subprocess
 import sys
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-from tqdm import tqdm
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from radiator.commands.sync_tracker import TrackerSyncCommand
+from radiator.core.config import settings
+from radiator.core.single_instance import SingleInstance
+from radiator.services.tracker_service import tracker_service
+from radiator.utils.field_profiles import FIELD_PROFILES
 
 # Progress tracking
 PROGRESS_DIR = Path("data/.progress")
@@ -78,46 +85,6 @@ def split_into_batches(keys: List[str], batch_size: int) -> List[List[str]]:
     return batches
 
 
-def build_sync_command(
-    keys: List[str],
-    skip_history: bool,
-    limit: Optional[int],
-    force_full_history: bool = True,
-) -> List[str]:
-    """Формирует команду для subprocess."""
-    # Создаем фильтр с ключами
-    filter_value = f"Key: {', '.join(keys)}"
-
-    cmd = ["python", "-m", "radiator.commands.sync_tracker", "--filter", filter_value]
-
-    if skip_history:
-        cmd.append("--skip-history")
-
-    if force_full_history:
-        cmd.append("--force-full-history")
-
-    if limit is not None:
-        cmd.extend(["--limit", str(limit)])
-
-    return cmd
-
-
-def sync_batch(
-    keys: List[str],
-    skip_history: bool,
-    limit: Optional[int],
-    force_full_history: bool = True,
-) -> None:
-    """Синхронизирует один батч, выбрасывает исключение при ошибке."""
-    cmd = build_sync_command(keys, skip_history, limit, force_full_history)
-
-    # Запускаем без capture_output, чтобы вывод sync-tracker показывался в консоли
-    result = subprocess.run(cmd)
-
-    if result.returncode != 0:
-        raise RuntimeError(f"Batch sync failed with return code {result.returncode}")
-
-
 def main():
     """Основная логика с argparse."""
     parser = argparse.ArgumentParser(
@@ -149,6 +116,24 @@ def main():
         help="Disable force full history sync (use incremental updates if last_changelog_id exists)",
     )
     parser.add_argument("--limit", type=int, help="Limit number of tasks to sync")
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=1,
+        help="Number of batches synced in parallel in this process (default: 1)",
+    )
+    parser.add_argument(
+        "--async-http",
+        action="store_true",
+        help="Use pooled asyncio HTTP client with adaptive rate limiting for batch fetches",
+    )
+    parser.add_argument(
+        "--field-profile",
+        choices=sorted(FIELD_PROFILES),
+        help="Fields requested and columns written "
+        f"(default: {settings.TRACKER_FIELD_PROFILE})",
+    )
     parser.add_argument(
         "--reset-progress",
         action="store_true",
@@ -202,29 +187,38 @@ def main():
             else:
                 start_batch = 0
 
-        # Синхронизируем начиная с start_batch
-        print("🔄 Starting batch sync...")
-
-        for i in range(start_batch, len(batches)):
-            batch = batches[i]
-            batch_num = i + 1
-            total_batches = len(batches)
-
-            print(
-                f"\n📦 Processing batch {batch_num}/{total_batches} ({len(batch)} keys)..."
-            )
-
-            try:
-                sync_batch(
-                    batch, args.skip_history, args.limit, args.force_full_history
+        if not settings.TRACKER_API_TOKEN or not settings.TRACKER_ORG_ID:
+            print("❌ TRACKER_API_TOKEN and TRACKER_ORG_ID are required")
+            sys.exit(1)
+        if args.async_http:
+            tracker_service.use_async_client = True
+
+        # Синхронизируем начиная с start_batch в одном процессе
+        print(f"🔄 Starting batch sync ({args.concurrency} in parallel)...")
+
+        def on_progress(synced_batches: int, total_batches: int) -> None:
+            # Сохраняем прогресс: число батчей подряд с начала, которые синхронизированы
+            save_progress(args.file, synced_batches, total_batches)
+            print(f"✅ Batches synced: {synced_batches}/{total_batches}")
+
+        with SingleInstance("sync_tracker"):
+            with TrackerSyncCommand(field_profile=args.field_profile) as sync_cmd:
+                success = sync_cmd.run_by_keys(
+                    keys,
+                    batch_size=args.batch_size,
+                    concurrency=args.concurrency,
+                    skip_history=args.skip_history,
+                    force_full_history=args.force_full_history,
+                    limit=args.limit,
+                    start_batch=start_batch,
+                    on_progress=on_progress,
                 )
-                # Сохраняем прогресс после успешного батча
-                save_progress(args.file, i + 1, len(batches))
-                print(f"✅ Batch {batch_num} completed successfully")
-            except RuntimeError as e:
-                print(f"❌ Batch {batch_num} failed: {e}")
-                print(f"💾 Progress saved. Run again to continue from batch {batch_num}")
-                sys.exit(1)
+
+        if not success:
+            progress = load_progress(args.file)
+            resume_batch = progress[0] + 1 if progress else start_batch + 1
+            print(f"💾 Progress saved. Run again to continue from batch {resume_batch}")
+            sys.exit(1)
 
         # Успешно завершили все - удаляем прогресс
         clear_progress(args.file)
@@ -233,6 +227,9 @@ def main():
     except FileNotFoundError:
         print(f"❌ File not found: {args.file}")
         sys.exit(1)
+    except RuntimeError as e:
+        print(f"❌ Failed to start sync: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         sys.exit(1)
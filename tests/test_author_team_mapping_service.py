@@ -217,3 +217,44 @@ class TestAuthorTeamMappingService:
         assert service.get_team_by_author("Author A") == "Team Alpha"
         assert service.get_team_by_author("Author C") == "Без команды"
         assert "Без команды" in teams
+
+    def test_map_authors_parses_file_once(self):
+        """Test that lookups reuse parsed mapping while file is unchanged."""
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+            f.write("Author A;Team Alpha\n")
+            f.write("Author B;Team Beta\n")
+            temp_file = f.name
+
+        try:
+            service = AuthorTeamMappingService(temp_file)
+            with patch.object(
+                service,
+                "load_author_team_mapping",
+                wraps=service.load_author_team_mapping,
+            ) as load:
+                teams = service.map_authors(["Author B", "Unknown", "Author A"])
+                service.get_team_by_author("Author A")
+                service.get_all_teams()
+
+            assert teams == ["Team Beta", "Без команды", "Team Alpha"]
+            assert load.call_count == 1
+        finally:
+            os.unlink(temp_file)
+
+    def test_mapping_reloaded_when_file_changes(self):
+        """Test that edited mapping file is picked up by cached lookups."""
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+            f.write("Author A;Team Alpha\n")
+            temp_file = f.name
+
+        try:
+            service = AuthorTeamMappingService(temp_file)
+            assert service.get_team_by_author("Author A") == "Team Alpha"
+
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.write("Author A;Team Gamma\n")
+            os.utime(temp_file, ns=(0, 1_000_000_000))
+
+            assert service.get_team_by_author("Author A") == "Team Gamma"
+        finally:
+            os.unlink(temp_file)
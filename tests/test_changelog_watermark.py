@@ -0,0 +1,123 @@
+"""Tests for skipping changelog fetches of tasks unchanged since last sync."""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from radiator.commands.sync_tracker import TrackerSyncCommand
+from radiator.models.tracker import TrackerTask, TrackerTaskHistory
+from radiator.services.tracker_service import TrackerAPIService
+
+SERVICE = "radiator.commands.sync_tracker.tracker_service"
+SYNCED_AT = datetime(2024, 1, 5, 12, 0, tzinfo=timezone.utc)
+
+
+def task_obj(task_id, updated_at):
+    return {
+        "id": task_id,
+        "key": task_id.upper(),
+        "summary": task_id,
+        "status": {"key": "open", "display": "Open"},
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": updated_at,
+    }
+
+
+@pytest.fixture
+def stored_tasks(db_session):
+    """Tasks from a previous sync: two with synced history, one without."""
+    db_session.query(TrackerTaskHistory).delete()
+    db_session.query(TrackerTask).delete()
+    db_session.add_all(
+        [
+            TrackerTask(
+                tracker_id="wm_same",
+                key="WM-1",
+                task_updated_at=SYNCED_AT,
+                last_changelog_id="c_same",
+            ),
+            TrackerTask(
+                tracker_id="wm_changed",
+                key="WM-2",
+                task_updated_at=SYNCED_AT,
+                last_changelog_id="c_changed",
+            ),
+            TrackerTask(
+                tracker_id="wm_new_history", key="WM-3", task_updated_at=SYNCED_AT
+            ),
+        ]
+    )
+    db_session.commit()
+    return [
+        task_obj("wm_same", "2024-01-05T12:00:00.000+0000"),
+        task_obj("wm_changed", "2024-01-07T09:30:00.000+0000"),
+        task_obj("wm_new_history", "2024-01-05T12:00:00.000+0000"),
+    ]
+
+
+class TestChangelogWatermark:
+    """sync_tasks + sync_task_history skip unchanged tasks."""
+
+    def test_unchanged_tasks_detected_before_upsert(self, db_session, stored_tasks):
+        """Only tasks with equal updatedAt and synced history are unchanged."""
+        sync_cmd = TrackerSyncCommand(db=db_session)
+
+        sync_cmd.sync_tasks(stored_tasks)
+
+        assert sync_cmd.unchanged_task_ids == {"wm_same"}
+        changed = db_session.query(TrackerTask).filter_by(tracker_id="wm_changed").one()
+        assert changed.task_updated_at == datetime(2024, 1, 7, 9, 30)
+
+    def test_incremental_sync_fetches_only_changed_tasks(
+        self, db_session, stored_tasks
+    ):
+        """Changed tasks are fetched from last_changelog_id, unchanged skipped."""
+        sync_cmd = TrackerSyncCommand(db=db_session)
+        _, tasks_data, _ = sync_cmd.sync_tasks(stored_tasks)
+
+        with patch(
+            f"{SERVICE}.get_changelogs_batch",
+            return_value=[("wm_changed", []), ("wm_new_history", [])],
+        ) as get_changelogs:
+            sync_cmd.sync_task_history(
+                stored_tasks, tasks_data, force_full_history=False
+            )
+
+        get_changelogs.assert_called_once_with(
+            ["wm_changed", "wm_new_history"], {"wm_changed": "c_changed"}
+        )
+
+    def test_force_full_history_fetches_everything(self, db_session, stored_tasks):
+        """Forced full sync ignores the watermark."""
+        sync_cmd = TrackerSyncCommand(db=db_session)
+        _, tasks_data, _ = sync_cmd.sync_tasks(stored_tasks)
+
+        with patch(
+            f"{SERVICE}.get_changelogs_batch", return_value=[]
+        ) as get_changelogs:
+            sync_cmd.sync_task_history(
+                stored_tasks, tasks_data, force_full_history=True
+            )
+
+        get_changelogs.assert_called_once_with(
+            ["wm_same", "wm_changed", "wm_new_history"], {}
+        )
+
+
+class TestChangelogsBatchFromId:
+    """TrackerAPIService.get_changelogs_batch with last_changelog_ids."""
+
+    def test_uses_get_changelog_from_id_when_id_known(self):
+        service = TrackerAPIService()
+
+        with patch.object(
+            service, "get_task_changelog", return_value=[{"id": "full"}]
+        ) as full, patch.object(
+            service, "get_changelog_from_id", return_value=[{"id": "new"}]
+        ) as from_id:
+            result = service.get_changelogs_batch(["a", "b"], {"b": "c1"})
+
+        full.assert_called_once_with("a")
+        from_id.assert_called_once_with("b", "c1")
+        assert result == [("a", [{"id": "full"}]), ("b", [{"id": "new"}])]
@@ -0,0 +1,128 @@
+"""Tests for vectorised month-to-month TTM comparison."""
+
+from statistics import quantiles
+
+import pandas as pd
+import pytest
+
+from radiator.commands.compare_ttm_month_to_month import (
+    NO_TEAM,
+    compare_snapshots,
+    filter_wip_tasks,
+    format_comparison_table,
+    load_snapshot,
+    main,
+    snapshot_labels,
+)
+
+
+def snapshot(rows):
+    """Report frame with default WiP flags."""
+    defaults = {"Команда": "A", "Квартал": None, "Разработка": 1}
+    return pd.DataFrame([{**defaults, **row} for row in rows])
+
+
+def stats_of(comparison, label, team="A", metric="DevLT"):
+    row = comparison[
+        (comparison["snapshot"] == label)
+        & (comparison["team"] == team)
+        & (comparison["metric"] == metric)
+    ]
+    return row.iloc[0]
+
+
+class TestFilterWipTasks:
+    def test_keeps_development_tasks_without_quarter(self):
+        df = snapshot(
+            [
+                {"DevLT": 1},
+                {"DevLT": 2, "Квартал": "2025.Q1"},
+                {"DevLT": 3, "Разработка": 0},
+                {"DevLT": 4, "Команда": " "},
+            ]
+        )
+
+        wip = filter_wip_tasks(df)
+
+        assert wip["DevLT"].tolist() == [1, 4]
+        assert wip["Команда"].tolist() == ["A", NO_TEAM]
+
+
+class TestCompareSnapshots:
+    def test_p85_matches_statistics_quantiles(self):
+        values = [3, 9, 1, 14, 7, 20, 5, 11]
+
+        comparison = compare_snapshots({"m1": snapshot({"DevLT": v} for v in values)})
+
+        expected = round(quantiles(values, n=100)[84], 1)
+        assert stats_of(comparison, "m1")["p85"] == expected
+
+    def test_p85_of_small_group_stays_within_values(self):
+        comparison = compare_snapshots({"m1": snapshot([{"DevLT": 4}, {"DevLT": 6}])})
+
+        assert stats_of(comparison, "m1")["p85"] == 6.0
+
+    def test_all_metric_columns_and_deltas_across_snapshots(self):
+        snapshots = {
+            "jan": snapshot([{"DevLT": 4, "TTM": 10}, {"DevLT": 6, "TTM": 20}]),
+            "feb": snapshot([{"DevLT": 8, "TTM": 30}]),
+            "mar": snapshot([{"DevLT": 2, "TTM": None}, {"DevLT": 4, "TTM": None}]),
+        }
+
+        comparison = compare_snapshots(snapshots)
+
+        assert set(comparison["metric"]) == {"TTM", "DevLT"}
+        feb = stats_of(comparison, "feb")
+        assert (feb["count"], feb["median"], feb["delta_median"]) == (1, 8.0, 3.0)
+        assert feb["delta_count"] == -1
+        assert pd.isna(stats_of(comparison, "jan")["delta_median"])
+        mar_ttm = stats_of(comparison, "mar", metric="TTM")
+        assert mar_ttm["count"] == 0
+        assert mar_ttm["delta_count"] == -1
+        assert pd.isna(mar_ttm["median"])
+
+    def test_format_comparison_table_uses_zero_for_missing_team(self):
+        comparison = compare_snapshots(
+            {
+                "jan": snapshot([{"DevLT": 4}]),
+                "feb": snapshot([{"DevLT": 5, "Команда": "B"}]),
+            }
+        )
+
+        rows = format_comparison_table(comparison, "jan", "feb")
+
+        assert rows == [
+            ["A", 1, 0, 4.0, 0.0, 4.0, 0.0, 4.0, 0.0],
+            ["B", 0, 1, 0.0, 5.0, 0.0, 5.0, 0.0, 5.0],
+        ]
+
+
+class TestCli:
+    def test_snapshot_labels_fall_back_to_paths(self):
+        assert snapshot_labels(["a/x.csv", "b/y.csv"]) == ["x", "y"]
+        assert snapshot_labels(["a/x.csv", "b/x.csv"]) == ["a/x.csv", "b/x.csv"]
+
+    def test_main_writes_full_comparison(self, tmp_path, capsys):
+        paths = []
+        for name, devlt in [("jan", "3"), ("feb", "abc"), ("mar", "7")]:
+            path = tmp_path / f"{name}.csv"
+            path.write_text(
+                f"Команда,Квартал,DevLT,Разработка\nA,,{devlt},1\n", encoding="utf-8"
+            )
+            paths.append(str(path))
+        output = tmp_path / "comparison.csv"
+
+        main(paths + ["--output", str(output)])
+
+        result = pd.read_csv(output)
+        assert result["snapshot"].tolist() == ["jan", "feb", "mar"]
+        assert result["count"].tolist() == [1, 0, 1]
+        assert "📊 Total WiP: 0 → 1 (Δ +1)" in capsys.readouterr().out
+        assert load_snapshot(paths[1])["DevLT"].isna().all()
+
+    def test_main_requires_two_snapshots(self, tmp_path):
+        path = tmp_path / "jan.csv"
+        path.write_text("Команда,Квартал,DevLT,Разработка\n", encoding="utf-8")
+
+        with pytest.raises(SystemExit):
+            main([str(path)])
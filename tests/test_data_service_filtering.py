@@ -275,3 +275,50 @@ class TestDataServiceFiltering:
         # Assert
         assert result == []
         mock_db.rollback.assert_called_once()
+
+    def test_filtered_histories_batch_matches_get_task_history(self):
+        """Batch load applies the same short-transition and as_of_date filtering."""
+        # Arrange
+        mock_db = Mock()
+        data_service = DataService(mock_db)
+
+        start_time = datetime(2025, 1, 1, 10, 0, 0)
+        rows = [
+            ("Идея", "Идея", start_time, start_time + timedelta(seconds=30)),
+            (
+                "Готова к разработке",
+                "Готова к разработке",
+                start_time + timedelta(seconds=30),
+                start_time + timedelta(seconds=60),
+            ),
+            (
+                "Выполнено",
+                "Выполнено",
+                start_time + timedelta(seconds=60),
+                start_time + timedelta(days=2),
+            ),
+            ("Done", "Done", start_time + timedelta(days=2), None),
+        ]
+        query = mock_db.query.return_value.filter.return_value.order_by.return_value
+        query.all.side_effect = [
+            [(1, *row) for row in rows],
+            [],
+            rows,
+        ]
+        as_of_date = start_time + timedelta(days=1)
+
+        # Act
+        with patch(
+            "radiator.commands.services.data_service.HISTORY_BATCH_CHUNK_SIZE", 1
+        ):
+            result = data_service.get_filtered_task_histories_batch(
+                [1, 2, 1], as_of_date=as_of_date
+            )
+        expected = data_service.get_task_history(1, as_of_date=as_of_date)
+
+        # Assert
+        assert list(result) == [1, 2]
+        assert result[1] == expected
+        assert result[2] == []
+        assert [entry.status for entry in result[1]] == ["Идея", "Выполнено"]
+        assert result[1][-1].end_date is None
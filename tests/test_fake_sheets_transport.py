@@ -0,0 +1,113 @@
+"""Tests for the fake Google Sheets transport and upload benchmark."""
+
+import pandas as pd
+import pytest
+from googleapiclient.errors import HttpError
+
+from radiator.commands.benchmark_sheets_upload import (
+    benchmark_upload,
+    main,
+    write_synthetic_report,
+)
+from radiator.services.fake_sheets_transport import FakeSheetsHttp
+from radiator.services.google_sheets_service import GoogleSheetsService
+
+
+@pytest.fixture
+def report(tmp_path):
+    return write_synthetic_report(tmp_path / "ttm_details.csv", rows=30)
+
+
+def make_service(http):
+    return GoogleSheetsService("", "doc", http=http)
+
+
+class TestFakeSheetsHttp:
+    def test_upload_with_pivots_through_discovery_client(self, report):
+        http = FakeSheetsHttp(document_id="doc")
+        service = make_service(http)
+
+        sheet_name = service.upload_csv_to_sheet(report)
+        upload = http.summary()
+        http.reset_stats()
+        pivots = service.create_pivot_tables_from_dataframe(
+            service._read_csv_file(report), "doc", source_sheet_name=sheet_name
+        )
+
+        assert upload["by_operation"] == {
+            "spreadsheets.get": 1,
+            "spreadsheets.batchUpdate": 2,
+            "values.update": 1,
+        }
+        assert upload["bytes_sent"] > 0 and upload["failed"] == 0
+        assert len(http.sheet_by_title(sheet_name).values) == 31
+        assert None not in pivots.values()
+        assert http.summary()["by_operation"] == {
+            "spreadsheets.batchUpdate": 1,
+            "values.batchUpdate": 1,
+        }
+        assert [sheet.sheet_id for sheet in http.sheets[2:]] == [
+            pivots["ttd_pivot"],
+            pivots["ttm_pivot"],
+        ]
+
+    def test_errors_are_http_errors(self):
+        service = make_service(FakeSheetsHttp(document_id="doc"))
+        values = service.service.spreadsheets().values()
+
+        with pytest.raises(HttpError) as exc_info:
+            values.update(
+                spreadsheetId="doc",
+                range="Лист1!A1000",
+                valueInputOption="RAW",
+                body={"values": [[1], [2]]},
+            ).execute()
+        assert exc_info.value.resp.status == 400
+
+        with pytest.raises(HttpError):
+            service.service.spreadsheets().get(spreadsheetId="other").execute()
+
+    def test_quota_and_latency_are_simulated(self):
+        now = [0.0]
+        waits = []
+        http = FakeSheetsHttp(
+            latency=0.5,
+            bandwidth=1000,
+            quota_per_minute=2,
+            clock=lambda: now[0],
+            sleep=waits.append,
+        )
+        spreadsheets = make_service(http).service.spreadsheets()
+
+        spreadsheets.get(spreadsheetId="doc").execute()
+        spreadsheets.get(spreadsheetId="doc").execute()
+        with pytest.raises(HttpError) as exc_info:
+            spreadsheets.get(spreadsheetId="doc").execute()
+        now[0] = 60.0
+        spreadsheets.get(spreadsheetId="doc").execute()
+
+        assert exc_info.value.resp.status == 429
+        summary = http.summary()
+        assert (summary["calls"], summary["throttled"]) == (4, 1)
+        assert all(wait > 0.5 for wait in waits)
+        assert summary["simulated_wait"] == pytest.approx(sum(waits), abs=1e-3)
+
+
+class TestBenchmark:
+    def test_benchmark_upload_reports_calls_and_bytes(self, report):
+        result = benchmark_upload(report)
+
+        assert result["ok"] and result["rows"] == 30
+        assert result["calls"] == 6
+        assert result["bytes_sent"] > report.stat().st_size
+
+    def test_main_fails_when_quota_is_exceeded(self, tmp_path, capsys):
+        output = tmp_path / "results.csv"
+
+        with pytest.raises(SystemExit):
+            main(["--rows", "10", "--quota", "2", "--output", str(output)])
+
+        results = pd.read_csv(output)
+        assert results["ok"].tolist() == [False]
+        assert results["throttled"].tolist() == [1]
+        assert "synthetic_ttm_details_10.csv" in capsys.readouterr().out
@@ -0,0 +1,115 @@
+"""Tests for named field profiles of Tracker sync."""
+
+from unittest.mock import patch
+
+import pytest
+
+from radiator.commands.sync_tracker import TrackerSyncCommand
+from radiator.models.tracker import TrackerTask
+from radiator.services.tracker_service import TrackerAPIService
+from radiator.utils.field_profiles import FIELD_PROFILES, get_field_profile
+from radiator.utils.fields_loader import load_fields_list
+
+TEAM_FIELD = "63515d47fe387b7ce7b9fc55--team"
+
+
+def api_task(**overrides):
+    task = {
+        "id": "fp-1",
+        "key": "FP-1",
+        "summary": "Задача",
+        "description": "очень длинное описание " * 100,
+        "status": {"display": "Открыт"},
+        "createdAt": "2024-01-01T10:00:00.000+0000",
+        "updatedAt": "2024-02-01T10:00:00.000+0000",
+        TEAM_FIELD: "Команда A",
+        "links": [],
+    }
+    task.update(overrides)
+    return task
+
+
+class TestFieldProfile:
+    def test_profiles_fields_files_exist(self):
+        for profile in FIELD_PROFILES.values():
+            if profile.fields_path is not None:
+                assert "id" in load_fields_list(profile.fields_path)
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError, match="minimal"):
+            get_field_profile("tiny")
+
+    def test_report_profile_trims_full_data(self):
+        task_info = TrackerAPIService().extract_task_data(api_task())
+
+        projected = get_field_profile("report").apply(
+            task_info, ["id", "key", TEAM_FIELD]
+        )
+
+        assert "description" not in projected
+        assert projected["team"] == "Команда A"
+        assert projected["full_data"] == {
+            "id": "fp-1",
+            "key": "FP-1",
+            TEAM_FIELD: "Команда A",
+        }
+
+    def test_minimal_and_full_profiles(self):
+        task_info = TrackerAPIService().extract_task_data(api_task())
+
+        minimal = get_field_profile("minimal").apply(task_info)
+        full = get_field_profile("full").apply(task_info)
+
+        assert set(minimal) == {
+            "tracker_id",
+            "key",
+            "summary",
+            "status",
+            "author",
+            "assignee",
+            "task_updated_at",
+            "created_at",
+        }
+        assert full == task_info
+
+
+class TestSyncWithProfile:
+    def test_minimal_profile_request_params(self, db_session):
+        cmd = TrackerSyncCommand(db=db_session, field_profile="minimal")
+
+        with patch("radiator.commands.sync_tracker.tracker_service") as service:
+            service.get_tasks_by_filter_with_data.return_value = []
+            cmd.get_tasks_to_sync(filters={"query": "Queue: FP"}, limit=10)
+
+        kwargs = service.get_tasks_by_filter_with_data.call_args.kwargs
+        assert kwargs["expand"] == []
+        assert kwargs["fields"] == load_fields_list(
+            get_field_profile("minimal").fields_path
+        )
+
+    def test_full_profile_requests_all_fields(self, db_session):
+        cmd = TrackerSyncCommand(db=db_session, field_profile="full")
+
+        assert cmd.fields is None
+        assert cmd.expand == ["links"]
+
+    def test_minimal_sync_keeps_report_columns(self, db_session):
+        TrackerSyncCommand(db=db_session, field_profile="full").sync_tasks([api_task()])
+
+        TrackerSyncCommand(db=db_session, field_profile="minimal").sync_tasks(
+            [
+                {
+                    "id": "fp-1",
+                    "key": "FP-1",
+                    "summary": "Новое название",
+                    "updatedAt": "2024-03-01T10:00:00.000+0000",
+                }
+            ]
+        )
+
+        db_session.expire_all()
+        task = db_session.query(TrackerTask).filter_by(tracker_id="fp-1").one()
+        assert task.summary == "Новое название"
+        assert task.team == "Команда A"
+        assert task.description.startswith("очень длинное описание")
+        assert task.full_data[TEAM_FIELD] == "Команда A"
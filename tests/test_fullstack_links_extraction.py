@@ -1,50 +1,55 @@
 """Tests for FULLSTACK links extraction from task data."""
 
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
 
 from radiator.commands.services.testing_returns_service import TestingReturnsService
-from radiator.models.tracker import TrackerTask
+from radiator.models.tracker import TrackerTask, TrackerTaskLink
+from radiator.services.task_links_writer import TaskLinksWriter
+
+
+def relates(key, direction="inward", link_type="relates"):
+    """Link from Tracker API to task key."""
+    queue = key.split("-")[0]
+    return {
+        "type": {"id": link_type},
+        "direction": direction,
+        "object": {"key": key, "queue": {"key": queue}},
+    }
 
 
 class TestFullstackLinksExtraction:
     """Test cases for FULLSTACK links extraction."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_db = Mock()
-        self.service = TestingReturnsService(self.mock_db)
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """In-memory tracker_task_links table, no PostgreSQL needed."""
+        engine = create_engine("sqlite://")
+        TrackerTaskLink.__table__.create(engine)
+        self.db = sessionmaker(bind=engine)()
+        self.service = TestingReturnsService(self.db)
+        yield
+        self.db.close()
+        engine.dispose()
+
+    def store_links(self, links):
+        """Store edges of CPO-123 projected from raw links like sync does."""
+        rows = TaskLinksWriter._extract_edges("CPO-123", links)
+        if rows:
+            self.db.execute(insert(TrackerTaskLink), rows)
 
     def test_extract_fullstack_links_from_task(self):
         """Test: extract FULLSTACK links from task with links data."""
-        # Mock task with links
-        mock_task = Mock()
-        mock_task.links = [
-            {
-                "type": {"id": "relates"},
-                "direction": "inward",
-                "object": {"key": "FULLSTACK-123", "queue": {"key": "FULLSTACK"}},
-            },
-            {
-                "type": {"id": "relates"},
-                "direction": "inward",
-                "object": {"key": "FULLSTACK-456", "queue": {"key": "FULLSTACK"}},
-            },
-            {
-                "type": {"id": "depends"},
-                "direction": "inward",
-                "object": {"key": "FULLSTACK-789", "queue": {"key": "FULLSTACK"}},
-            },
-            {
-                "type": {"id": "relates"},
-                "direction": "outward",
-                "object": {"key": "FULLSTACK-999", "queue": {"key": "FULLSTACK"}},
-            },
-        ]
-
-        self.mock_db.query.return_value.filter.return_value.first.return_value = (
-            mock_task
+        self.store_links(
+            [
+                relates("FULLSTACK-123"),
+                relates("FULLSTACK-456"),
+                relates("FULLSTACK-789", link_type="depends"),
+                relates("FULLSTACK-999", direction="outward"),
+            ]
         )
 
         result = self.service.get_fullstack_links("CPO-123")
@@ -54,27 +59,12 @@ class TestFullstackLinksExtraction:
 
     def test_filter_relates_only(self):
         """Test: only relates links are returned (both directions)."""
-        mock_task = Mock()
-        mock_task.links = [
-            {
-                "type": {"id": "relates"},
-                "direction": "inward",
-                "object": {"key": "FULLSTACK-123", "queue": {"key": "FULLSTACK"}},
-            },
-            {
-                "type": {"id": "relates"},
-                "direction": "outward",  # Should be included
-                "object": {"key": "FULLSTACK-456", "queue": {"key": "FULLSTACK"}},
-            },
-            {
-                "type": {"id": "depends"},  # Should be ignored (wrong type)
-                "direction": "inward",
-                "object": {"key": "FULLSTACK-789", "queue": {"key": "FULLSTACK"}},
-            },
-        ]
-
-        self.mock_db.query.return_value.filter.return_value.first.return_value = (
-            mock_task
+        self.store_links(
+            [
+                relates("FULLSTACK-123"),
+                relates("FULLSTACK-456", direction="outward"),
+                relates("FULLSTACK-789", link_type="depends"),
+            ]
         )
 
         result = self.service.get_fullstack_links("CPO-123")
@@ -82,131 +72,160 @@ class TestFullstackLinksExtraction:
         # Should return both inward and outward relates, but not depends
         assert result == ["FULLSTACK-123", "FULLSTACK-456"]
 
-    def test_no_fullstack_links_returns_empty(self):
-        """Test: task with no FULLSTACK links returns empty list."""
-        mock_task = Mock()
-        mock_task.links = [
-            {
-                "type": {"id": "relates"},
-                "direction": "inward",
-                "object": {"key": "CPO-456", "queue": {"key": "CPO"}},
-            },
-            {
-                "type": {"id": "relates"},
-                "direction": "inward",
-                "object": {"key": "BACKEND-789", "queue": {"key": "BACKEND"}},
-            },
-        ]
-
-        self.mock_db.query.return_value.filter.return_value.first.return_value = (
-            mock_task
+    def test_same_task_in_both_directions_returned_once(self):
+        """Test: inward and outward relates to the same task give one key."""
+        self.store_links(
+            [relates("FULLSTACK-123"), relates("FULLSTACK-123", direction="outward")]
         )
 
-        result = self.service.get_fullstack_links("CPO-123")
+        assert self.service.get_fullstack_links("CPO-123") == ["FULLSTACK-123"]
 
-        assert result == []
+    def test_no_fullstack_links_returns_empty(self):
+        """Test: task with no FULLSTACK links returns empty list."""
+        self.store_links([relates("CPO-456"), relates("BACKEND-789")])
+
+        assert self.service.get_fullstack_links("CPO-123") == []
 
     def test_links_field_missing_returns_empty(self):
         """Test: task with no links field returns empty list."""
-        mock_task = Mock()
-        mock_task.links = None
-
-        self.mock_db.query.return_value.filter.return_value.first.return_value = (
-            mock_task
-        )
+        self.store_links(None)
 
-        result = self.service.get_fullstack_links("CPO-123")
-
-        assert result == []
+        assert self.service.get_fullstack_links("CPO-123") == []
 
     def test_task_not_found_returns_empty(self):
-        """Test: task not found in database returns empty list."""
-        self.mock_db.query.return_value.filter.return_value.first.return_value = None
-
-        result = self.service.get_fullstack_links("CPO-123")
-
-        assert result == []
+        """Test: task without stored edges returns empty list."""
+        assert self.service.get_fullstack_links("CPO-123") == []
 
     def test_empty_links_list_returns_empty(self):
         """Test: task with empty links list returns empty list."""
-        mock_task = Mock()
-        mock_task.links = []
+        self.store_links([])
 
-        self.mock_db.query.return_value.filter.return_value.first.return_value = (
-            mock_task
-        )
-
-        result = self.service.get_fullstack_links("CPO-123")
-
-        assert result == []
+        assert self.service.get_fullstack_links("CPO-123") == []
 
     def test_malformed_links_handled_gracefully(self):
         """Test: malformed links are handled gracefully."""
-        mock_task = Mock()
-        mock_task.links = [
-            {
-                "type": {"id": "relates"},
-                "direction": "inward",
-                "object": {"key": "FULLSTACK-123", "queue": {"key": "FULLSTACK"}},
-            },
-            {
-                # Missing required fields
-                "type": {"id": "relates"},
-                "direction": "inward",
-            },
-            {
-                "type": {"id": "relates"},
-                "direction": "inward",
-                "object": {"key": "FULLSTACK-456", "queue": {"key": "FULLSTACK"}},
-            },
-            None,  # None entry
-            {},  # Empty dict
-        ]
-
-        self.mock_db.query.return_value.filter.return_value.first.return_value = (
-            mock_task
+        self.store_links(
+            [
+                relates("FULLSTACK-123"),
+                {"type": {"id": "relates"}, "direction": "inward"},
+                relates("FULLSTACK-456"),
+                None,
+                {},
+                {"type": "relates", "object": "FULLSTACK-1"},
+            ]
         )
 
-        result = self.service.get_fullstack_links("CPO-123")
-
         # Should only return valid links
-        assert result == ["FULLSTACK-123", "FULLSTACK-456"]
+        assert self.service.get_fullstack_links("CPO-123") == [
+            "FULLSTACK-123",
+            "FULLSTACK-456",
+        ]
 
     def test_database_error_handled_gracefully(self):
         """Test: database error is handled gracefully."""
-        self.mock_db.query.return_value.filter.return_value.first.side_effect = (
-            Exception("Database error")
-        )
+        mock_db = Mock()
+        mock_db.query.side_effect = Exception("Database error")
 
-        result = self.service.get_fullstack_links("CPO-123")
+        result = TestingReturnsService(mock_db).get_fullstack_links("CPO-123")
 
         assert result == []
 
     def test_mixed_queue_types_filtered_correctly(self):
         """Test: only FULLSTACK queue links are returned."""
-        mock_task = Mock()
-        mock_task.links = [
-            {
-                "type": {"id": "relates"},
-                "direction": "inward",
-                "object": {"key": "FULLSTACK-123", "queue": {"key": "FULLSTACK"}},
-            },
-            {
-                "type": {"id": "relates"},
-                "direction": "inward",
-                "object": {"key": "BACKEND-456", "queue": {"key": "BACKEND"}},
-            },
-            {
-                "type": {"id": "relates"},
-                "direction": "inward",
-                "object": {"key": "FRONTEND-789", "queue": {"key": "FRONTEND"}},
-            },
-        ]
+        self.store_links(
+            [
+                relates("FULLSTACK-123"),
+                relates("BACKEND-456"),
+                relates("FRONTEND-789"),
+            ]
+        )
 
-        self.mock_db.query.return_value.filter.return_value.first.return_value = (
-            mock_task
+        assert self.service.get_fullstack_links("CPO-123") == ["FULLSTACK-123"]
+
+    def test_batch_load_groups_links_by_task(self):
+        """Test: batch load returns links of every requested task."""
+        self.store_links([relates("FULLSTACK-2"), relates("FULLSTACK-1")])
+
+        result = self.service.batch_load_fullstack_links(["CPO-123", "CPO-404"])
+
+        assert result == {"CPO-123": ["FULLSTACK-1", "FULLSTACK-2"], "CPO-404": []}
+
+
+class TestFullstackLinksInDatabase:
+    """FULLSTACK links written by TaskLinksWriter to PostgreSQL."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """Clean links of the CPO task used in tests."""
+        db_session.query(TrackerTaskLink).filter(
+            TrackerTaskLink.src_key == "CPO-123"
+        ).delete()
+        db_session.commit()
+        self.db = db_session
+        self.service = TestingReturnsService(db_session)
+
+    def store_links(self, links):
+        """Write links of CPO-123 to tracker_task_links like sync does."""
+        TaskLinksWriter(self.db).replace({"CPO-123": links})
+        self.db.commit()
+
+    def test_links_written_by_sync_are_found(self):
+        """Test: links replaced by the writer are read back filtered."""
+        self.store_links(
+            [
+                relates("FULLSTACK-123"),
+                relates("FULLSTACK-789", link_type="depends"),
+                relates("BACKEND-456"),
+                relates("FULLSTACK-999", direction="outward"),
+            ]
         )
 
-        result = self.service.get_fullstack_links("CPO-123")
+        assert self.service.get_fullstack_links("CPO-123") == [
+            "FULLSTACK-123",
+            "FULLSTACK-999",
+        ]
 
-        assert result == ["FULLSTACK-123"]
+    def test_replace_removes_stale_links(self):
+        """Test: links removed in Tracker disappear after next sync."""
+        self.store_links([relates("FULLSTACK-123"), relates("FULLSTACK-456")])
+        self.store_links([relates("FULLSTACK-456")])
+
+        assert self.service.get_fullstack_links("CPO-123") == ["FULLSTACK-456"]
+
+    def test_rebuild_matches_replace(self):
+        """Test: SQL rebuild projects links the same way as sync writer."""
+        self.db.query(TrackerTask).filter(TrackerTask.key == "CPO-123").delete()
+        links = [
+            relates("FULLSTACK-123", direction="outward"),
+            relates("FULLSTACK-123", direction="outward"),
+            {"type": {"id": "relates"}, "direction": "inward"},
+            None,
+            relates("FULLSTACK-456", link_type="subtask"),
+        ]
+        self.db.add(TrackerTask(tracker_id="links-cpo-123", key="CPO-123", links=links))
+        self.db.commit()
+
+        def stored_edges():
+            return sorted(
+                self.db.query(
+                    TrackerTaskLink.dst_key,
+                    TrackerTaskLink.type_id,
+                    TrackerTaskLink.direction,
+                )
+                .filter(TrackerTaskLink.src_key == "CPO-123")
+                .all()
+            )
+
+        self.store_links(links)
+        replaced = stored_edges()
+        TaskLinksWriter(self.db).rebuild()
+        self.db.commit()
+
+        assert (
+            stored_edges()
+            == replaced
+            == [
+                ("FULLSTACK-123", "relates", "outward"),
+                ("FULLSTACK-456", "subtask", "inward"),
+            ]
+        )
@@ -6,6 +6,7 @@ from radiator.commands.generate_fullstack_subepic_returns_report import (
     FullstackSubepicReturnsReportGenerator,
 )
 from radiator.models.tracker import TrackerTask
+from radiator.services.task_links_writer import TaskLinksWriter
 
 
 class TestExtractQuarterFromFullData:
@@ -295,6 +296,8 @@ class TestCollectRowsWithQuarters:
 
         db_session.add_all([epic, subepic, standalone_task])
         db_session.commit()
+        TaskLinksWriter(db_session).rebuild()
+        db_session.commit()
 
         # Add minimal history
         history1 = TrackerTaskHistory(
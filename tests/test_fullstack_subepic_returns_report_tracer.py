@@ -10,6 +10,7 @@ from radiator.commands.generate_fullstack_subepic_returns_report import (
     SubepicInfo,
 )
 from radiator.commands.models.time_to_market_models import StatusHistoryEntry
+from radiator.services.task_links_writer import TaskLinksWriter
 
 
 def test_tracer_creates_csv_header(tmp_path: Path):
@@ -505,6 +506,8 @@ def test_collect_rows_with_team_from_epic(db_session):
     )
     db_session.add(subepic)
     db_session.commit()
+    TaskLinksWriter(db_session).rebuild()
+    db_session.commit()
 
     rows = generator._collect_rows()
 
@@ -603,6 +606,8 @@ def test_load_tasks_includes_all_tasks(db_session):
     )
     db_session.add(regular_task)
 
+    db_session.commit()
+    TaskLinksWriter(db_session).rebuild()
     db_session.commit()
 
     tasks = generator._load_tasks()
@@ -739,6 +744,8 @@ def test_collect_rows_mixed_subepics_and_regular_tasks(db_session):
     )
     db_session.add(regular_task)
 
+    db_session.commit()
+    TaskLinksWriter(db_session).rebuild()
     db_session.commit()
 
     rows = generator._collect_rows()
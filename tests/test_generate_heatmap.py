@@ -0,0 +1,82 @@
+"""Tests for heatmap generation from TTM Details reports."""
+
+import numpy as np
+import pandas as pd
+
+from radiator.commands.generate_heatmap import (
+    DEFAULT_THRESHOLDS,
+    aggregate_metric,
+    generate_for_files,
+    jobs_for_file,
+)
+
+
+def write_report(path, rows):
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+
+ROWS = [
+    {"Команда": "A", "Квартал": "2025.Q2", "Разработка": 1, "DevLT": 10, "Tail": 0},
+    {"Команда": "A", "Квартал": "2025.Q2", "Разработка": 1, "DevLT": 30, "Tail": 5},
+    {"Команда": "B", "Квартал": "", "Разработка": 1, "DevLT": 70, "Tail": 80},
+    {"Команда": "B", "Квартал": "2025.Q1", "Разработка": 1, "DevLT": None, "Tail": 1},
+    {"Команда": "B", "Квартал": "2025.Q1", "Разработка": 0, "DevLT": 99, "Tail": 9},
+]
+
+
+def test_aggregate_metric_computes_all_aggs_in_one_frame():
+    df = pd.DataFrame(ROWS)
+
+    stats = aggregate_metric(
+        df, "DevLT", df["Разработка"] == 1, ["median", "mean", "p85"]
+    )
+
+    assert stats.columns.tolist() == ["count", "median", "mean", "p85"]
+    row = stats.loc[("A", "2025.Q2")]
+    assert (row["count"], row["median"], row["mean"]) == (2, 20.0, 20.0)
+    assert row["p85"] == np.percentile([10, 30], 85)
+
+
+def test_jobs_for_file_builds_matrices_per_metric_and_agg(tmp_path):
+    csv_path = tmp_path / "report.csv"
+    write_report(csv_path, ROWS)
+
+    jobs = jobs_for_file(
+        str(csv_path), str(tmp_path), ["median", "p85"], DEFAULT_THRESHOLDS
+    )
+
+    assert [(job.metric_col, job.agg) for job in jobs] == [
+        ("DevLT", "median"),
+        ("DevLT", "p85"),
+        ("Tail", "median"),
+        ("Tail", "p85"),
+    ]
+    devlt = jobs[0]
+    assert devlt.teams == ["A", "B"]
+    assert devlt.quarters == ["2025.Q2", "WiP"]
+    np.testing.assert_array_equal(devlt.counts, [[2, np.nan], [np.nan, 1]])
+    np.testing.assert_array_equal(devlt.values, [[20, np.nan], [np.nan, 70]])
+    assert devlt.out_path.endswith("report/devlt_median_heatmap.png")
+
+
+def test_generate_for_files_renders_all_files(tmp_path):
+    paths = []
+    for name in ("jan", "feb"):
+        path = tmp_path / f"{name}.csv"
+        write_report(path, ROWS)
+        paths.append(str(path))
+    output_dir = tmp_path / "heatmaps"
+
+    saved = generate_for_files(
+        paths + [str(tmp_path / "missing.csv")],
+        str(output_dir),
+        ["median"],
+        DEFAULT_THRESHOLDS,
+        workers=2,
+    )
+
+    assert sorted(saved) == sorted(
+        str(output_dir / name / f"{metric}_median_heatmap.png")
+        for name in ("jan", "feb")
+        for metric in ("devlt", "tail")
+    )
@@ -34,17 +34,16 @@ class TestGenerateStatusChangeReportCommand:
         """Test successful retrieval of status changes by author."""
         cmd = GenerateStatusChangeReportCommand(output_dir=test_reports_dir)
 
-        # Mock database query results (now includes task_id)
+        # Mock aggregated rows: author, period, changes, unique tasks
         mock_results = [
-            ("user1", 1, 101),
-            ("user1", 2, 102),
-            ("user2", 3, 201),
-            ("user3", 4, 301),
+            ("user1", 0, 2, 2),
+            ("user2", 0, 1, 1),
+            ("user3", 0, 1, 1),
         ]
 
         with patch.object(cmd.db, "query") as mock_query:
             # Mock the query chain
-            mock_query.return_value.join.return_value.filter.return_value.all.return_value = (
+            mock_query.return_value.join.return_value.filter.return_value.group_by.return_value.all.return_value = (
                 mock_results
             )
 
@@ -65,7 +64,7 @@ class TestGenerateStatusChangeReportCommand:
         cmd = GenerateStatusChangeReportCommand(output_dir=test_reports_dir)
 
         with patch.object(cmd.db, "query") as mock_query:
-            mock_query.return_value.join.return_value.filter.return_value.all.return_value = (
+            mock_query.return_value.join.return_value.filter.return_value.group_by.return_value.all.return_value = (
                 []
             )
 
@@ -233,12 +232,12 @@ class TestGenerateStatusChangeReportCommand:
 
         # Mock the methods directly on the command instance
         with patch.object(
-            cmd, "get_status_changes_by_group"
+            cmd, "get_status_changes_by_periods"
         ) as mock_get_changes, patch.object(
             cmd, "get_open_tasks_by_group"
         ) as mock_get_open_tasks:
             # Set up mock return values
-            mock_get_changes.side_effect = [
+            mock_get_changes.return_value = [
                 {
                     "user1": {"changes": 5, "tasks": 3},
                     "user2": {"changes": 3, "tasks": 2},
@@ -633,15 +632,15 @@ class TestGenerateStatusChangeReportIntegration:
 
             # Mock database session and query
             with patch.object(cmd, "db") as mock_db:
-                # Mock query results (now includes task_id)
-                mock_results = [("user1", 1, 101), ("user1", 2, 102), ("user2", 3, 201)]
+                # Mock aggregated rows: author, period, changes, unique tasks
+                mock_results = [("user1", 0, 2, 2), ("user2", 1, 1, 1)]
 
                 # Mock open tasks query results
                 mock_open_results = [("user1", 101), ("user2", 201)]
 
                 # Mock the complex query chain
                 mock_query = Mock()
-                mock_query.join.return_value.filter.return_value.all.return_value = (
+                mock_query.join.return_value.filter.return_value.group_by.return_value.all.return_value = (
                     mock_results
                 )
                 mock_db.query.return_value = mock_query
@@ -930,11 +929,11 @@ class TestExcludeDoneTasksAndFilterZeroRows:
 
         # Mock the methods to return the data we set
         with patch.object(
-            cmd, "get_status_changes_by_group"
+            cmd, "get_status_changes_by_periods"
         ) as mock_get_changes, patch.object(
             cmd, "get_open_tasks_by_group"
         ) as mock_get_open_tasks:
-            mock_get_changes.side_effect = [
+            mock_get_changes.return_value = [
                 cmd.week1_data,
                 cmd.week2_data,
                 cmd.week3_data,
@@ -1002,11 +1001,11 @@ class TestExcludeDoneTasksAndFilterZeroRows:
         }
 
         with patch.object(
-            cmd, "get_status_changes_by_group"
+            cmd, "get_status_changes_by_periods"
         ) as mock_get_changes, patch.object(
             cmd, "get_open_tasks_by_group"
         ) as mock_get_open_tasks:
-            mock_get_changes.side_effect = [
+            mock_get_changes.return_value = [
                 cmd.week1_data,
                 cmd.week2_data,
                 cmd.week3_data,
@@ -1052,11 +1051,11 @@ class TestExcludeDoneTasksAndFilterZeroRows:
         }
 
         with patch.object(
-            cmd, "get_status_changes_by_group"
+            cmd, "get_status_changes_by_periods"
         ) as mock_get_changes, patch.object(
             cmd, "get_open_tasks_by_group"
         ) as mock_get_open_tasks:
-            mock_get_changes.side_effect = [
+            mock_get_changes.return_value = [
                 cmd.week1_data,
                 cmd.week2_data,
                 cmd.week3_data,
@@ -1079,6 +1078,9 @@ class TestExcludeDoneTasksAndFilterZeroRows:
         mock_mapping_service.get_team_by_author.side_effect = (
             lambda author: f"team_{author}"
         )
+        mock_mapping_service.map_authors.side_effect = lambda authors: [
+            f"team_{author}" for author in authors
+        ]
         mock_mapping_service.get_all_teams.return_value = ["team_user1", "team_user2"]
         cmd.author_team_mapping_service = mock_mapping_service
 
@@ -1124,5 +1126,54 @@ class TestExcludeDoneTasksAndFilterZeroRows:
                 assert result == expected
 
 
+class TestStatusChangesAggregatedQuery:
+    """Status changes are aggregated by author and period in the database."""
+
+    def test_changes_counted_per_period_in_one_query(self, db_session, tmp_path):
+        base = datetime(2025, 3, 1)
+        db_session.query(TrackerTaskHistory).delete()
+        db_session.query(TrackerTask).delete()
+        tasks = [
+            TrackerTask(tracker_id="agg-1", key="CPO-901", author="alice"),
+            TrackerTask(tracker_id="agg-2", key="CPO-902", author="alice"),
+            TrackerTask(tracker_id="agg-3", key="CPO-903", author="bob"),
+            TrackerTask(tracker_id="agg-4", key="FULLSTACK-904", author="bob"),
+        ]
+        db_session.add_all(tasks)
+        db_session.commit()
+        for task, days in [
+            (tasks[0], [1, 2, 9]),
+            (tasks[1], [3]),
+            (tasks[2], [10, 11, 20]),
+            (tasks[3], [1]),  # Not a CPO task
+        ]:
+            for day in days:
+                db_session.add(
+                    TrackerTaskHistory(
+                        task_id=task.id,
+                        tracker_id=task.tracker_id,
+                        status="Открыт",
+                        status_display="Открыт",
+                        start_date=base + timedelta(days=day),
+                    )
+                )
+        db_session.commit()
+
+        cmd = GenerateStatusChangeReportCommand(db=db_session, output_dir=tmp_path)
+        periods = [
+            (base + timedelta(days=offset), base + timedelta(days=offset + 7))
+            for offset in (0, 7, 14)
+        ]
+
+        first, second, third = cmd.get_status_changes_by_periods(periods)
+
+        assert first == {"alice": {"changes": 3, "tasks": 2}}
+        assert second == {
+            "alice": {"changes": 1, "tasks": 1},
+            "bob": {"changes": 2, "tasks": 1},
+        }
+        assert third == {"bob": {"changes": 1, "tasks": 1}}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -51,7 +51,7 @@ def test_generate_csv_report_basic(tmp_csv_path):
     generator._ensure_output_dir = MagicMock()
     generator._get_tasks = MagicMock(return_value=tasks)
     generator.data_service.get_task_histories_by_keys_batch.return_value = histories
-    generator._collect_unique_statuses = MagicMock(return_value=statuses)
+    generator.data_service.get_statuses_by_queue.return_value = statuses
     generator._calculate_status_times = MagicMock(return_value=status_times)
 
     csv_path = generator.generate_csv(queue="CPO", output_path=tmp_csv_path)
@@ -86,7 +86,7 @@ def test_generate_csv_report_basic(tmp_csv_path):
     generator.data_service.get_task_histories_by_keys_batch.assert_called_once_with(
         ["CPO-1"]
     )
-    generator._collect_unique_statuses.assert_called_once_with(tasks, histories)
+    generator.data_service.get_statuses_by_queue.assert_called_once_with("CPO", None)
     generator._calculate_status_times.assert_called_once_with(histories["CPO-1"])
 
 
@@ -135,7 +135,7 @@ def test_generate_csv_with_multiple_tasks(tmp_csv_path):
     generator._ensure_output_dir = MagicMock()
     generator._get_tasks = MagicMock(return_value=tasks)
     generator.data_service.get_task_histories_by_keys_batch.return_value = histories
-    generator._collect_unique_statuses = MagicMock(return_value=statuses)
+    generator.data_service.get_statuses_by_queue.return_value = statuses
     generator._calculate_status_times = MagicMock(
         side_effect=[
             {"Discovery": 1, "Done": 0},
@@ -171,7 +171,36 @@ def test_generate_csv_with_multiple_tasks(tmp_csv_path):
     generator.data_service.get_task_histories_by_keys_batch.assert_called_once_with(
         ["CPO-1", "CPO-2"]
     )
-    generator._collect_unique_statuses.assert_called_once_with(tasks, histories)
+
+
+def test_generate_csv_loads_histories_per_chunk(tmp_csv_path):
+    from radiator.commands.generate_status_time_report import StatusTimeReportGenerator
+
+    generator = StatusTimeReportGenerator(data_service=MagicMock())
+    generator.CHUNK_SIZE = 2
+
+    tasks = [
+        SimpleNamespace(
+            id=i, key=f"CPO-{i}", summary=f"Task {i}", created_at=None, status="Open"
+        )
+        for i in range(1, 6)
+    ]
+    generator._get_tasks = MagicMock(return_value=iter(tasks))
+    generator.data_service.get_statuses_by_queue.return_value = []
+    generator.data_service.get_task_histories_by_keys_batch.side_effect = lambda keys: {
+        key: [] for key in keys
+    }
+
+    csv_path = generator.generate_csv(queue="CPO", output_path=tmp_csv_path)
+
+    with open(csv_path, newline="", encoding="utf-8") as fh:
+        rows = list(csv.reader(fh))
+
+    assert [row[0] for row in rows[1:]] == [task.key for task in tasks]
+    assert [
+        call.args[0]
+        for call in generator.data_service.get_task_histories_by_keys_batch.call_args_list
+    ] == [["CPO-1", "CPO-2"], ["CPO-3", "CPO-4"], ["CPO-5"]]
 
 
 def test_get_tasks_by_queue():
@@ -183,14 +212,16 @@ def test_get_tasks_by_queue():
     ]
 
     data_service = MagicMock()
-    data_service.get_tasks_by_queue.return_value = fake_tasks
+    data_service.iter_tasks_by_queue.return_value = iter(fake_tasks)
 
     generator = StatusTimeReportGenerator(data_service=data_service)
 
     tasks = generator._get_tasks(queue="CPO", created_since=None)
 
-    data_service.get_tasks_by_queue.assert_called_once_with("CPO", None)
-    assert tasks == fake_tasks
+    data_service.iter_tasks_by_queue.assert_called_once_with(
+        "CPO", None, chunk_size=generator.CHUNK_SIZE
+    )
+    assert list(tasks) == fake_tasks
 
 
 def test_get_tasks_by_queue_with_date():
@@ -200,74 +231,16 @@ def test_get_tasks_by_queue_with_date():
     fake_tasks = [SimpleNamespace(id=3, key="CPO-3")]
 
     data_service = MagicMock()
-    data_service.get_tasks_by_queue.return_value = fake_tasks
+    data_service.iter_tasks_by_queue.return_value = iter(fake_tasks)
 
     generator = StatusTimeReportGenerator(data_service=data_service)
 
     tasks = generator._get_tasks(queue="CPO", created_since=cutoff)
 
-    data_service.get_tasks_by_queue.assert_called_once_with("CPO", cutoff)
-    assert tasks == fake_tasks
-
-
-def test_collect_unique_statuses():
-    from radiator.commands.generate_status_time_report import StatusTimeReportGenerator
-    from radiator.commands.models.time_to_market_models import StatusHistoryEntry
-
-    tasks = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
-
-    data_service = MagicMock()
-    data_service.get_task_history.side_effect = [
-        [
-            StatusHistoryEntry(
-                status="Discovery",
-                status_display="Discovery",
-                start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
-                end_date=None,
-            ),
-            StatusHistoryEntry(
-                status="Delivery",
-                status_display="Delivery",
-                start_date=datetime(2025, 1, 5, tzinfo=timezone.utc),
-                end_date=None,
-            ),
-        ],
-        [
-            StatusHistoryEntry(
-                status="Discovery",
-                status_display="Discovery",
-                start_date=datetime(2025, 1, 2, tzinfo=timezone.utc),
-                end_date=None,
-            ),
-            StatusHistoryEntry(
-                status="Done",
-                status_display="Done",
-                start_date=datetime(2025, 1, 10, tzinfo=timezone.utc),
-                end_date=None,
-            ),
-        ],
-    ]
-
-    generator = StatusTimeReportGenerator(data_service=data_service)
-
-    statuses = generator._collect_unique_statuses(tasks)
-
-    assert statuses == ["Delivery", "Discovery", "Done"]
-
-
-def test_collect_unique_statuses_empty_history():
-    from radiator.commands.generate_status_time_report import StatusTimeReportGenerator
-
-    tasks = [SimpleNamespace(id=1)]
-
-    data_service = MagicMock()
-    data_service.get_task_history.return_value = []
-
-    generator = StatusTimeReportGenerator(data_service=data_service)
-
-    statuses = generator._collect_unique_statuses(tasks)
-
-    assert statuses == []
+    data_service.iter_tasks_by_queue.assert_called_once_with(
+        "CPO", cutoff, chunk_size=generator.CHUNK_SIZE
+    )
+    assert list(tasks) == fake_tasks
 
 
 def test_generate_csv_no_tasks(tmp_csv_path):
@@ -278,8 +251,8 @@ def test_generate_csv_no_tasks(tmp_csv_path):
     generator = StatusTimeReportGenerator(data_service=data_service)
     generator._ensure_output_dir = MagicMock()
     generator._get_tasks = MagicMock(return_value=[])
+    generator.data_service.get_statuses_by_queue.return_value = []
     generator.data_service.get_task_histories_by_keys_batch = MagicMock()
-    generator._collect_unique_statuses = MagicMock()
     generator._calculate_status_times = MagicMock()
 
     csv_path = generator.generate_csv(queue="CPO", output_path=tmp_csv_path)
@@ -297,7 +270,6 @@ def test_generate_csv_no_tasks(tmp_csv_path):
         ]
     ]
     generator.data_service.get_task_histories_by_keys_batch.assert_not_called()
-    generator._collect_unique_statuses.assert_not_called()
     generator._calculate_status_times.assert_not_called()
 
 
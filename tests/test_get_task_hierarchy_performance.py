@@ -7,6 +7,13 @@ import pytest
 
 from radiator.commands.services.testing_returns_service import TestingReturnsService
 from radiator.models.tracker import TrackerTask
+from radiator.services.task_links_writer import TaskLinksWriter
+
+
+def rebuild_links(db_session):
+    """Mirror links of inserted tasks to tracker_task_links, like sync does."""
+    TaskLinksWriter(db_session).rebuild()
+    db_session.commit()
 
 
 class QueryCounter:
@@ -105,6 +112,7 @@ class TestGetTaskHierarchyPerformance:
             db_session.add(subtask)
 
         db_session.commit()
+        rebuild_links(db_session)
 
         # Подсчитать количество запросов
         testing_returns_service = TestingReturnsService(db_session)
@@ -169,6 +177,7 @@ class TestGetTaskHierarchyPerformance:
             db_session.add(subtask)
 
         db_session.commit()
+        rebuild_links(db_session)
 
         # Подсчитать количество запросов
         testing_returns_service = TestingReturnsService(db_session)
@@ -202,6 +211,7 @@ class TestGetTaskHierarchyPerformance:
         )
         db_session.add(single_task)
         db_session.commit()
+        rebuild_links(db_session)
 
         # Подсчитать количество запросов
         testing_returns_service = TestingReturnsService(db_session)
@@ -258,6 +268,7 @@ class TestGetTaskHierarchyPerformance:
         )
         db_session.add(task2)
         db_session.commit()
+        rebuild_links(db_session)
 
         # Подсчитать количество запросов
         testing_returns_service = TestingReturnsService(db_session)
@@ -324,6 +335,7 @@ class TestGetTaskHierarchyPerformance:
         )
         db_session.add(grandchild)
         db_session.commit()
+        rebuild_links(db_session)
 
         # Подсчитать количество запросов
         testing_returns_service = TestingReturnsService(db_session)
@@ -344,3 +356,90 @@ class TestGetTaskHierarchyPerformance:
             f"Слишком много запросов для трехуровневой иерархии: {counter.query_count}. "
             f"Ожидается <= 10 для 3 уровней."
         )
+
+
+def subtask_of(parent_key):
+    """Link of a subtask to its parent."""
+    return [
+        {
+            "type": {"id": "subtask"},
+            "direction": "inward",
+            "object": {"key": parent_key},
+        }
+    ]
+
+
+class TestFullstackHierarchyRecursive:
+    """Recursive-CTE hierarchy resolution for many CPO tasks."""
+
+    def test_build_hierarchy_unlimited_depth_in_two_queries(self, db_session):
+        """
+        CPO -> эпик -> цепочка из 8 уровней: все задачи найдены,
+        без ограничения глубины и без запроса на каждый уровень.
+        """
+        db_session.add(
+            TrackerTask(
+                tracker_id="cte-cpo-1",
+                key="CPO-5001",
+                links=[
+                    {
+                        "type": {"id": "relates"},
+                        "direction": "outward",
+                        "object": {"key": "FULLSTACK-5000"},
+                    }
+                ],
+            )
+        )
+        db_session.add(TrackerTask(tracker_id="cte-cpo-2", key="CPO-5002", links=[]))
+        db_session.add(
+            TrackerTask(tracker_id="cte-fs-0", key="FULLSTACK-5000", links=[])
+        )
+        for level in range(1, 9):
+            db_session.add(
+                TrackerTask(
+                    tracker_id=f"cte-fs-{level}",
+                    key=f"FULLSTACK-500{level}",
+                    links=subtask_of(f"FULLSTACK-500{level - 1}"),
+                )
+            )
+        db_session.commit()
+        rebuild_links(db_session)
+
+        service = TestingReturnsService(db_session)
+        with QueryCounter(db_session) as counter:
+            result = service.build_fullstack_hierarchy_batched(["CPO-5001", "CPO-5002"])
+
+        assert set(result["CPO-5001"]) == {f"FULLSTACK-500{i}" for i in range(9)}
+        assert result["CPO-5002"] == []
+        # One query for direct links, one recursive query for all levels
+        assert counter.query_count == 2
+
+    def test_descendants_batch_cycle_terminates(self, db_session):
+        """Циклические ссылки не приводят к бесконечной рекурсии."""
+        db_session.add_all(
+            [
+                TrackerTask(
+                    tracker_id="cte-cycle-1",
+                    key="FULLSTACK-5101",
+                    links=subtask_of("FULLSTACK-5103"),
+                ),
+                TrackerTask(
+                    tracker_id="cte-cycle-2",
+                    key="FULLSTACK-5102",
+                    links=subtask_of("FULLSTACK-5101"),
+                ),
+                TrackerTask(
+                    tracker_id="cte-cycle-3",
+                    key="FULLSTACK-5103",
+                    links=subtask_of("FULLSTACK-5102"),
+                ),
+            ]
+        )
+        db_session.commit()
+        rebuild_links(db_session)
+
+        service = TestingReturnsService(db_session)
+        result = service.get_descendants_batch(["FULLSTACK-5101", "FULLSTACK-5102"])
+
+        assert sorted(result["FULLSTACK-5101"]) == ["FULLSTACK-5102", "FULLSTACK-5103"]
+        assert sorted(result["FULLSTACK-5102"]) == ["FULLSTACK-5101", "FULLSTACK-5103"]
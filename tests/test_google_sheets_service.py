@@ -10,6 +10,18 @@ from radiator.commands.models.ttm_details_columns import TTMDetailsColumns
 from radiator.services.google_sheets_service import GoogleSheetsService
 
 
+def added_sheet_ids(sheets_service):
+    """IDs of sheets added by the last batchUpdate call."""
+    requests = sheets_service.service.spreadsheets().batchUpdate.call_args[1]["body"][
+        "requests"
+    ]
+    return [
+        request["addSheet"]["properties"]["sheetId"]
+        for request in requests
+        if "addSheet" in request
+    ]
+
+
 class TestGoogleSheetsService:
     """Test cases for GoogleSheetsService."""
 
@@ -696,9 +708,18 @@ class TestGoogleSheetsService:
             source_sheet_name="Report_20240101",
         )
 
-        assert result == 200
+        # Sheet ID is chosen on the client and used by all requests of the batch
+        requests = mock_service.service.spreadsheets().batchUpdate.call_args[1]["body"][
+            "requests"
+        ]
+        assert requests[0]["addSheet"]["properties"]["sheetId"] == result
         # Verify that percentile statistics were added
-        mock_service.service.spreadsheets().values().update.assert_called()
+        value_ranges = (
+            mock_service.service.spreadsheets()
+            .values()
+            .batchUpdate.call_args[1]["body"]["data"]
+        )
+        assert value_ranges[0]["range"] == "TTM Pivot!R2:R7"
 
     def test_create_pivot_tables_from_dataframe_with_source_sheet_name(
         self, mock_service
@@ -719,7 +740,8 @@ class TestGoogleSheetsService:
             source_sheet_name="Report_20240101",
         )
 
-        assert result["ttm_pivot"] == 200
+        added = added_sheet_ids(mock_service)
+        assert [result["ttd_pivot"], result["ttm_pivot"]] == added
         # Verify source_sheet_name was used
         mock_service._get_sheet_id.assert_called_with("Report_20240101")
 
@@ -743,7 +765,9 @@ class TestGoogleSheetsService:
             source_sheet_name=None,
         )
 
-        assert result["ttm_pivot"] == 200
+        assert [result["ttd_pivot"], result["ttm_pivot"]] == added_sheet_ids(
+            mock_service
+        )
         # Verify sheet name was retrieved by ID
         mock_service._get_sheet_name_by_id.assert_called()
 
@@ -1721,3 +1745,120 @@ class TestGoogleSheetsService:
             )
         ]
         assert len(conditional_formatting_calls) > 0
+
+
+class TestBatchedUpload:
+    """Upload and pivot creation use a fixed, small number of API calls."""
+
+    @pytest.fixture
+    def sheets(self):
+        with patch(
+            "radiator.services.google_sheets_service.service_account.Credentials.from_service_account_file"
+        ), patch("radiator.services.google_sheets_service.build"):
+            service = GoogleSheetsService(
+                credentials_path="test_credentials.json",
+                document_id="test_document_id",
+            )
+        service.service = MagicMock()
+        api = service.service.spreadsheets.return_value
+        api.get.return_value.execute.return_value = {
+            "sheets": [{"properties": {"title": "Report", "sheetId": 7}}]
+        }
+        return service, api
+
+    def test_upload_uses_two_batch_updates_and_chunked_values(self, sheets):
+        service, api = sheets
+        df = pd.DataFrame(
+            {
+                "Ключ задачи": [f"CPO-{i}" for i in range(5)],
+                "Название": ["Task"] * 5,
+                "TTM": range(5),
+            }
+        )
+
+        with patch.object(service, "_read_csv_file", return_value=df), patch(
+            "radiator.services.google_sheets_service.VALUE_CHUNK_ROWS", 4
+        ):
+            sheet_name = service.upload_csv_to_sheet(Path("Report.csv"))
+
+        assert sheet_name.startswith("Report_")
+        assert api.get.call_count == 1
+        create, formatting = [
+            call.kwargs["body"]["requests"] for call in api.batchUpdate.call_args_list
+        ]
+        sheet_id = create[0]["addSheet"]["properties"]["sheetId"]
+        assert sheet_id != 7
+        assert create[0]["addSheet"]["properties"]["title"] == sheet_name
+        assert [next(iter(request)) for request in formatting] == [
+            "autoResizeDimensions",
+            "setBasicFilter",
+            "addConditionalFormatRule",
+            "addConditionalFormatRule",
+            "addConditionalFormatRule",
+            "addConditionalFormatRule",
+            "updateSheetProperties",
+            "updateDimensionProperties",
+            "repeatCell",
+            "repeatCell",
+            "repeatCell",
+        ]
+        assert all(
+            str(sheet_id) in str(request) for request in formatting
+        ), "formatting must target the new sheet"
+        updates = api.values.return_value.update.call_args_list
+        assert [call.kwargs["range"] for call in updates] == [
+            f"{sheet_name}!A1",
+            f"{sheet_name}!A5",
+        ]
+        assert len(updates[1].kwargs["body"]["values"]) == 2
+
+    def test_formatting_failure_keeps_uploaded_sheet(self, sheets):
+        service, api = sheets
+        df = pd.DataFrame({"Ключ задачи": ["CPO-1"], "Название": ["Task"]})
+        api.batchUpdate.return_value.execute.side_effect = [
+            {},
+            Exception("Invalid requests[1].setBasicFilter"),
+        ]
+
+        with patch.object(service, "_read_csv_file", return_value=df):
+            sheet_name = service.upload_csv_to_sheet(Path("Report.csv"))
+
+        assert sheet_name.startswith("Report_")
+        assert api.batchUpdate.call_count == 2
+        api.values.return_value.update.assert_called_once()
+
+    def test_sheet_lookups_reuse_metadata(self, sheets):
+        service, api = sheets
+        service._sheet_properties(refresh=True)
+        service._remember_sheet(8, "Added")
+
+        assert service._get_sheet_id("Report") == 7
+        assert service._get_sheet_name_by_id(8) == "Added"
+        assert api.get.call_count == 1
+
+        # Unknown sheet triggers one re-fetch
+        assert service._get_sheet_id("Other") is None
+        assert api.get.call_count == 2
+
+    def test_pivot_tables_created_with_one_batch_update(self, sheets):
+        service, api = sheets
+
+        result = service.create_pivot_tables_from_dataframe(
+            pd.DataFrame({"A": [1]}), "test_document_id", source_sheet_name="Report"
+        )
+
+        assert api.batchUpdate.call_count == 1
+        requests = api.batchUpdate.call_args.kwargs["body"]["requests"]
+        added = [r["addSheet"]["properties"] for r in requests if "addSheet" in r]
+        assert [sheet["sheetId"] for sheet in added] == [
+            result["ttd_pivot"],
+            result["ttm_pivot"],
+        ]
+        pivot_targets = [
+            r["updateCells"]["start"]["sheetId"] for r in requests if "updateCells" in r
+        ]
+        assert pivot_targets == [result["ttd_pivot"], result["ttm_pivot"]]
+        value_batches = api.values.return_value.batchUpdate.call_args_list
+        assert len(value_batches) == 1
+        assert len(value_batches[0].kwargs["body"]["data"]) == 2
+        api.values.return_value.update.assert_not_called()
@@ -0,0 +1,217 @@
+"""Tests for NumPy-backed HistoryArray kernels."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from radiator.commands.generate_ttm_details_report import TTMDetailsReportGenerator
+from radiator.commands.models.time_to_market_models import StatusHistoryEntry
+from radiator.commands.services.history_array import HistoryArray, to_epoch_us
+from radiator.commands.services.metrics_service import MetricsService
+from radiator.commands.services.testing_returns_service import TestingReturnsService
+
+PAUSE = "Приостановлено"
+STATUSES = [
+    "Открыт",
+    "Discovery backlog",
+    "Готова к разработке",
+    "МП / В работе",
+    PAUSE,
+    "Testing",
+    "Done",
+    "Закрыт",
+]
+DONE = ["Done", "Закрыт"]
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_history(rng, size):
+    """Random history with unsorted entries and occasional equal start dates."""
+    starts = sorted(BASE + timedelta(hours=rng.randint(0, 2000)) for _ in range(size))
+    entries = [
+        StatusHistoryEntry(
+            status=rng.choice(STATUSES),
+            status_display="",
+            start_date=start,
+            end_date=starts[i + 1] if i + 1 < size else None,
+        )
+        for i, start in enumerate(starts)
+    ]
+    rng.shuffle(entries)
+    return entries
+
+
+def reference_pause_up_to(history, end_date):
+    """Pre-NumPy calculate_pause_time_up_to_date loop."""
+    total = 0
+    sorted_history = sorted(history, key=lambda x: x.start_date)
+    for i, entry in enumerate(sorted_history):
+        if entry.status == PAUSE and entry.start_date < end_date:
+            next_entry = next(
+                (e for e in sorted_history[i + 1 :] if e.status != PAUSE), None
+            )
+            if next_entry and next_entry.start_date <= end_date:
+                total += max(0, (next_entry.start_date - entry.start_date).days)
+            else:
+                total += max(0, (end_date - entry.start_date).days)
+    return total
+
+
+def reference_stable_done(history):
+    """Pre-NumPy _find_stable_done without short-transition filtering."""
+    sorted_history = sorted(history, key=lambda x: x.start_date)
+    done_entries = [e for e in sorted_history if e.status in DONE]
+    if not done_entries:
+        return None
+    for done_entry in reversed(done_entries):
+        after = sorted_history[sorted_history.index(done_entry) + 1 :]
+        if all(e.status in DONE or e.status == PAUSE for e in after):
+            return done_entry
+    return done_entries[0]
+
+
+def reference_returns(history, status):
+    """Pre-NumPy count_status_returns loop."""
+    entries, prev_status = 0, None
+    for entry in sorted(history, key=lambda x: x.start_date):
+        if entry.status == status and prev_status != status:
+            entries += 1
+        prev_status = entry.status
+    return max(0, entries - 1)
+
+
+@pytest.fixture
+def histories():
+    rng = random.Random(42)
+    return [make_history(rng, rng.randint(0, 12)) for _ in range(300)]
+
+
+class TestHistoryArray:
+    """Kernels give the same results as the per-entry loops they replace."""
+
+    def test_entries_sorted_once_per_task(self, histories):
+        array = HistoryArray.from_histories(histories)
+
+        assert len(array) == len(histories)
+        for task_index, history in enumerate(histories):
+            begin, end = array.offsets[task_index], array.offsets[task_index + 1]
+            restored = [history[i] for i in array.order[begin:end]]
+            assert restored == sorted(history, key=lambda x: x.start_date)
+
+    def test_pause_days_up_to_matches_loop(self, histories):
+        end_date = BASE + timedelta(days=40)
+        array = HistoryArray.from_histories(histories)
+
+        result = array.pause_days(PAUSE, until=to_epoch_us(end_date))
+
+        assert list(result) == [reference_pause_up_to(h, end_date) for h in histories]
+
+    def test_pause_days_per_task_bounds(self, histories):
+        ends = [BASE + timedelta(days=10 + i % 60) for i in range(len(histories))]
+        array = HistoryArray.from_histories(histories)
+
+        result = array.pause_days(PAUSE, until=[to_epoch_us(end) for end in ends])
+
+        assert list(result) == [
+            reference_pause_up_to(h, end) for h, end in zip(histories, ends)
+        ]
+
+    def test_stable_done_matches_loop(self, histories):
+        array = HistoryArray.from_histories(histories)
+
+        indexes = array.stable_done_index(DONE, PAUSE)
+
+        for task_index, history in enumerate(histories):
+            expected = reference_stable_done(history)
+            if expected is None:
+                assert indexes[task_index] == -1
+            else:
+                assert history[array.order[indexes[task_index]]] == expected
+
+    def test_status_returns_matches_loop(self, histories):
+        array = HistoryArray.from_histories(histories)
+
+        assert list(array.status_returns("Testing")) == [
+            reference_returns(h, "Testing") for h in histories
+        ]
+
+    def test_unknown_status_matches_nothing(self, histories):
+        array = HistoryArray.from_histories(histories)
+
+        assert not array.status_days("Missing").any()
+        assert (array.stable_done_index(["Missing"], PAUSE) == -1).all()
+
+    def test_naive_and_aware_dates_are_equal(self):
+        naive = datetime(2025, 1, 1, 12, 0)
+
+        assert to_epoch_us(naive) == to_epoch_us(naive.replace(tzinfo=timezone.utc))
+
+
+class TestMetricsServiceBulk:
+    """MetricsService bulk API on top of HistoryArray."""
+
+    def test_find_stable_done_batch_matches_single(self, histories):
+        service = MetricsService(min_status_duration_seconds=0)
+
+        result = service.find_stable_done_batch(histories, DONE)
+
+        assert result == [service._find_stable_done(h, DONE) for h in histories]
+
+    def test_pause_time_batch_matches_single(self, histories):
+        service = MetricsService()
+        ends = [BASE + timedelta(days=10 + i % 60) for i in range(len(histories))]
+
+        assert service.calculate_pause_time_batch(histories) == [
+            service.calculate_pause_time(h) for h in histories
+        ]
+        assert service.calculate_pause_time_batch(histories, ends) == [
+            service.calculate_pause_time_up_to_date(h, end)
+            for h, end in zip(histories, ends)
+        ]
+
+    def test_status_durations_batch_matches_single(self, histories):
+        service = MetricsService(min_status_duration_seconds=300)
+        as_of_date = BASE + timedelta(days=120)
+
+        for as_of in (None, as_of_date):
+            result = service.calculate_status_durations_batch(
+                histories, ["Testing", PAUSE], as_of
+            )
+            for status in ("Testing", PAUSE):
+                assert result[status] == [
+                    service.calculate_status_duration(h, status, as_of)
+                    for h in histories
+                ]
+
+    def test_testing_returns_batch_matches_single(self, histories):
+        service = TestingReturnsService(db=Mock())
+        by_key = {f"FULLSTACK-{i}": h for i, h in enumerate(histories)}
+
+        result = service.calculate_testing_returns_batch(by_key)
+
+        assert result == {
+            key: service.calculate_testing_returns_for_task(key, h)
+            for key, h in by_key.items()
+        }
+
+    def test_report_history_metrics_batch_matches_single(self, histories):
+        generator = TTMDetailsReportGenerator(db=Mock())
+        as_of_date = BASE + timedelta(days=120)
+
+        for as_of in (None, as_of_date):
+            result = generator._calculate_history_metrics_batch(histories, as_of)
+            assert result == [
+                {
+                    "pause": generator._calculate_pause(1, h),
+                    "ttd_pause": generator._calculate_ttd_pause(1, h, as_of),
+                    "discovery_backlog_days": (
+                        generator._calculate_discovery_backlog_days(1, h, as_of)
+                    ),
+                    "ready_for_dev_days": generator._calculate_ready_for_dev_days(
+                        1, h, as_of
+                    ),
+                }
+                for h in histories
+            ]
@@ -0,0 +1,152 @@
+"""Tests for streaming JSON decoding of Tracker search pages."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from radiator.core.config import settings
+from radiator.services.tracker_service import TrackerAPIService
+from radiator.utils import json_stream
+from radiator.utils.json_stream import iter_json_array
+
+ISSUES = [
+    {
+        "id": str(i),
+        "key": f"TEST-{i}",
+        "description": 'скобки [{ "в" }] строке \\ ✓' * (i % 5),
+        "tags": [1, 2.5, None, True],
+    }
+    for i in range(30)
+]
+
+
+def split(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonArray:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1024, 1 << 20])
+    def test_yields_items_across_chunk_boundaries(self, chunk_size):
+        items = ISSUES + [12345, "строка", [1, [2]], {}]
+        data = json.dumps(items, ensure_ascii=False).encode()
+
+        assert list(iter_json_array(split(data, chunk_size))) == items
+
+    def test_items_are_yielded_before_body_ends(self):
+        def chunks():
+            yield b'[{"id": "1"}, {"id"'
+            pytest.fail("second item was awaited before the first was yielded")
+
+        assert next(iter_json_array(chunks())) == {"id": "1"}
+
+    @pytest.mark.parametrize(
+        "body, error",
+        [
+            (b'{"issues": []}', "Expected JSON array"),
+            (b'[{"id": "1"}', "Unexpected end"),
+            (b'[{"id": }]', "Expecting value"),
+        ],
+    )
+    def test_invalid_bodies(self, body, error):
+        with pytest.raises(ValueError, match=error):
+            list(iter_json_array(split(body, 3)))
+
+    def test_empty_array(self):
+        assert list(iter_json_array([b" [ ", b"] "])) == []
+
+
+def streamed_response(items, headers=None):
+    response = Mock()
+    body = json.dumps(items).encode() if isinstance(items, list) else items
+    response.iter_content.side_effect = lambda chunk_size: iter(split(body, 100))
+    response.encoding = None
+    response.headers = headers or {}
+    return response
+
+
+class TestStreamedSearch:
+    @pytest.fixture
+    def service(self):
+        service = TrackerAPIService()
+        service.stream_json = True
+        with patch.object(settings, "API_PAGE_SIZE", 8):
+            yield service
+
+    def test_scroll_pages_are_split_while_decoding(self, service):
+        first = streamed_response(ISSUES[:20], {"X-Scroll-Id": "scroll-2"})
+        last = streamed_response(ISSUES[20:])
+
+        with patch.object(
+            service, "_make_request", side_effect=[first, last]
+        ) as request:
+            pages = list(
+                service._iter_scroll_pages("Queue: TEST", 1000, extract_full_data=True)
+            )
+
+        assert [len(page) for page in pages] == [8, 8, 4, 8, 2]
+        assert [task for page in pages for task in page] == ISSUES
+        assert request.call_args_list[0].kwargs["stream"] is True
+        assert request.call_args_list[1].kwargs["params"]["scrollId"] == "scroll-2"
+        first.close.assert_called_once()
+
+    def test_scroll_ids_only(self, service):
+        response = streamed_response(ISSUES[:3])
+
+        with patch.object(service, "_make_request", return_value=response):
+            result = service._search_tasks_with_scroll("Queue: TEST", 1000)
+
+        assert result == ["0", "1", "2"]
+
+    def test_v2_page_is_decoded_from_stream(self, service):
+        response = streamed_response(ISSUES[:5], {"X-Total-Pages": "1"})
+
+        with patch.object(service, "_make_request", return_value=response):
+            pages = list(service._iter_v2_pages("Queue: TEST", 100))
+
+        assert pages == [ISSUES[:5]]
+
+    @pytest.mark.parametrize("chunk_size", [1, 100])
+    def test_object_body_is_parsed_whole(self, service, chunk_size):
+        body = b"  " + json.dumps({"issues": ISSUES[:10]}).encode()
+        response = streamed_response(body)
+        response.iter_content.side_effect = lambda **kwargs: iter(
+            split(body, chunk_size)
+        )
+
+        full = list(service._iter_response_pages(response))
+        ids = list(service._iter_response_pages(response, extract_full_data=False))
+
+        assert full == [ISSUES[:8], ISSUES[8:10]]
+        assert ids == [[str(i) for i in range(8)], ["8", "9"]]
+        response.close.assert_called()
+
+
+class TestOrjsonParsing:
+    def test_full_body_parsed_with_loads(self):
+        service = TrackerAPIService()
+        service.use_orjson = True
+        response = Mock(content=json.dumps(ISSUES).encode())
+
+        with patch.object(json_stream, "orjson", Mock(loads=json.loads)):
+            assert service._parse_json(response) == ISSUES
+        response.json.assert_not_called()
+
+    def test_invalid_body_raises_requests_error(self):
+        service = TrackerAPIService()
+        service.use_orjson = True
+        response = Mock(content=b"<html>", text="<html>")
+
+        with patch.object(json_stream, "orjson", Mock(loads=json.loads)):
+            with pytest.raises(requests.exceptions.JSONDecodeError):
+                service._parse_json(response)
+
+    def test_falls_back_to_response_json(self):
+        service = TrackerAPIService()
+        service.use_orjson = True
+        response = Mock()
+        response.json.return_value = ISSUES
+
+        with patch.object(json_stream, "orjson", None):
+            assert service._parse_json(response) == ISSUES
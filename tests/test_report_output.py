@@ -0,0 +1,153 @@
+"""Tests for typed Parquet / Arrow report output."""
+
+import os
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+
+from radiator.commands.compare_ttm_month_to_month import (
+    compare_snapshots,
+    filter_wip_tasks,
+    load_snapshot,
+)
+from radiator.commands.services.report_output import (
+    ReportTableWriter,
+    find_columnar_report,
+    read_columnar_report,
+    read_report_table,
+)
+
+COLUMNS = {"Ключ задачи": "string", "DevLT": "int", "Создана": "date"}
+ROWS = [
+    {"Ключ задачи": "CPO-1", "DevLT": 5, "Создана": "2025-01-02"},
+    {"Ключ задачи": "CPO-2", "DevLT": "", "Создана": ""},
+]
+
+
+def write_report(path, output_format, rows=ROWS, columns=COLUMNS):
+    with ReportTableWriter(path, columns, output_format) as writer:
+        for row in rows:
+            writer.write_row(row)
+    return writer
+
+
+class TestReportTableWriter:
+    @pytest.mark.parametrize("output_format", ["parquet", "arrow"])
+    def test_columnar_copy_has_typed_columns(self, tmp_path, output_format):
+        csv_path = tmp_path / "report.csv"
+
+        writer = write_report(csv_path, output_format)
+
+        assert writer.row_count == 2
+        assert writer.columnar_path == csv_path.with_suffix(f".{output_format}")
+        assert csv_path.read_text(encoding="utf-8").splitlines() == [
+            "Ключ задачи,DevLT,Создана",
+            "CPO-1,5,2025-01-02",
+            "CPO-2,,",
+        ]
+        df = read_columnar_report(writer.columnar_path)
+        assert list(df.columns) == list(COLUMNS)
+        assert df["DevLT"].iloc[0] == 5 and df["DevLT"].isna().iloc[1]
+        assert df["Создана"].iloc[0] == date(2025, 1, 2)
+
+    def test_batches_are_flushed_incrementally(self, tmp_path):
+        rows = [
+            {"Ключ задачи": f"CPO-{i}", "DevLT": i, "Создана": ""} for i in range(7)
+        ]
+        writer = ReportTableWriter(tmp_path / "report.csv", COLUMNS, "parquet")
+        writer.BATCH_ROWS = 3
+        with writer:
+            for row in rows:
+                writer.write_row(row)
+
+        df = read_report_table(tmp_path / "report.csv")
+        assert df["DevLT"].tolist() == list(range(7))
+
+    def test_csv_format_writes_no_copy(self, tmp_path):
+        csv_path = tmp_path / "report.csv"
+
+        writer = write_report(csv_path, "csv")
+
+        assert writer.columnar_path is None
+        assert find_columnar_report(csv_path) is None
+        assert read_report_table(csv_path)["Ключ задачи"].tolist() == ["CPO-1", "CPO-2"]
+
+    def test_unknown_format_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            ReportTableWriter(tmp_path / "report.csv", COLUMNS, "xlsx")
+
+
+class TestColumnarConsumers:
+    def test_stale_copy_is_ignored(self, tmp_path):
+        csv_path = tmp_path / "report.csv"
+        write_report(csv_path, "parquet")
+        parquet_path = csv_path.with_suffix(".parquet")
+        old = csv_path.stat().st_mtime - 60
+        os.utime(parquet_path, (old, old))
+
+        assert find_columnar_report(csv_path) is None
+
+    def test_dates_as_text_match_csv(self, tmp_path):
+        csv_path = tmp_path / "report.csv"
+        write_report(csv_path, "parquet")
+
+        df = read_columnar_report(csv_path.with_suffix(".parquet"), dates_as_text=True)
+
+        assert df["Создана"].tolist() == ["2025-01-02", ""]
+
+    def test_month_to_month_reads_parquet_copy(self, tmp_path):
+        csv_path = tmp_path / "ttm.csv"
+        columns = {
+            "Команда": "string",
+            "Квартал": "string",
+            "DevLT": "int",
+            "Разработка": "int",
+        }
+        rows = [
+            {"Команда": "A", "Квартал": "", "DevLT": 4, "Разработка": 1},
+            {"Команда": "A", "Квартал": "", "DevLT": 6, "Разработка": 1},
+            {"Команда": "A", "Квартал": "2025.Q1", "DevLT": 9, "Разработка": 1},
+            {"Команда": "", "Квартал": "", "DevLT": "", "Разработка": 1},
+        ]
+        write_report(csv_path, "parquet", rows, columns)
+        # Text copy is not parsed when the columnar copy is present
+        csv_path.write_text("garbage", encoding="utf-8")
+        os.utime(csv_path.with_suffix(".parquet"))
+
+        loaded = load_snapshot(str(csv_path))
+
+        assert loaded["Квартал"].isna()[3]
+        stats = compare_snapshots({"m1": filter_wip_tasks(loaded)})
+        devlt = stats[(stats["team"] == "A") & (stats["metric"] == "DevLT")]
+        assert devlt["count"].tolist() == [2]
+        assert devlt["median"].tolist() == [5.0]
+
+
+def test_ttm_details_generate_csv_writes_parquet(tmp_path):
+    from radiator.commands.generate_ttm_details_report import TTMDetailsReportGenerator
+    from radiator.commands.models.ttm_details_columns import TTMDetailsColumns
+
+    generator = TTMDetailsReportGenerator(db=Mock())
+    row = dict.fromkeys(TTMDetailsColumns.COLUMN_NAMES, "")
+    row.update({"Ключ задачи": "CPO-1", "TTM": 14, "Создана": "2025-01-01"})
+    generator._iter_csv_rows = Mock(return_value=iter([row]))
+
+    csv_path = tmp_path / "ttm_details.csv"
+    generator.generate_csv(str(csv_path), output_format="parquet")
+
+    df = read_report_table(csv_path)
+    assert list(df.columns) == TTMDetailsColumns.COLUMN_NAMES
+    assert df["TTM"].tolist() == [14]
+    assert df["Создана"].tolist() == [date(2025, 1, 1)]
+
+
+def test_failed_report_leaves_no_files(tmp_path):
+    csv_path = tmp_path / "report.csv"
+
+    with pytest.raises(RuntimeError):
+        with ReportTableWriter(csv_path, COLUMNS, "parquet") as writer:
+            writer.write_row(ROWS[0])
+            raise RuntimeError("row source failed")
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,109 @@
+"""Tests for event-driven reports directory watcher."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from radiator.services.report_watcher import ReportDirectoryWatcher
+from radiator.telegram_bot.file_monitor import FileMonitor
+from scripts.google_sheets_csv_uploader import GoogleSheetsCSVUploader
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_polling", [False, True])
+async def test_reports_written_file_once_settled(tmp_path, use_polling):
+    async with ReportDirectoryWatcher(
+        tmp_path, debounce=0.3, poll_interval=0.05, use_polling=use_polling
+    ) as watcher:
+        assert watcher.is_polling == use_polling
+        report = tmp_path / "report.csv"
+        report.write_text("a,b\n")
+        await asyncio.sleep(0.15)
+        with open(report, "a") as f:
+            f.write("1,2\n")
+
+        changed = await watcher.wait_for_changes(timeout=5)
+
+        assert changed == {"report.csv"}
+        assert await watcher.wait_for_changes(timeout=0.5) == set()
+
+
+@pytest.mark.asyncio
+async def test_file_growing_without_events_is_not_reported(tmp_path):
+    async with ReportDirectoryWatcher(tmp_path, debounce=0.2) as watcher:
+        report = tmp_path / "report.csv"
+        report.write_text("a")
+        loop = asyncio.get_running_loop()
+        # Событие пришло, но файл продолжает расти до конца периода ожидания
+        watcher._pending["report.csv"] = (loop.time() - 1, 0)
+
+        assert watcher._settled_files(loop) == set()
+        assert watcher._pending["report.csv"][1] == 1
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_polling_when_inotify_fails(tmp_path):
+    with patch(
+        "radiator.services.report_watcher.Observer",
+        side_effect=OSError("inotify watch limit reached"),
+    ):
+        async with ReportDirectoryWatcher(tmp_path, poll_interval=0.05) as watcher:
+            assert watcher.is_polling
+            (tmp_path / "chart.png").write_bytes(b"png")
+
+            assert await watcher.wait_for_changes(timeout=5) == {"chart.png"}
+
+
+def test_file_monitor_checks_only_given_files(tmp_path):
+    with patch("radiator.telegram_bot.file_monitor.TelegramBotConfig") as config:
+        config.get_reports_dir.return_value = tmp_path
+        config.MONITORED_EXTENSIONS = {".csv"}
+        monitor = FileMonitor()
+        monitor.state_file = tmp_path / "state.json"
+        monitor.known_files, monitor.file_timestamps = set(), {}
+        for name in ("old.csv", "new.csv", ".upload_me_new.csv"):
+            (tmp_path / name).touch()
+
+        new_files = monitor.get_new_files(["new.csv", ".upload_me_new.csv", "gone.csv"])
+
+    assert new_files == {"new.csv"}
+
+
+@pytest.mark.asyncio
+async def test_idle_uploader_does_not_rescan(tmp_path):
+    uploader = GoogleSheetsCSVUploader.__new__(GoogleSheetsCSVUploader)
+    uploader.config = SimpleNamespace(POLLING_INTERVAL=0.05)
+    uploader.file_monitor = SimpleNamespace(reports_dir=tmp_path)
+    uploader.failed_markers = set()
+    uploader.process_marker_files = Mock()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(uploader._watch_upload_markers(), timeout=0.3)
+
+    # Only the startup scan, no rescans without marker events
+    uploader.process_marker_files.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_uploader_retries_failed_markers_without_events(tmp_path):
+    (tmp_path / "report.csv").write_text("a,b\n")
+    (tmp_path / ".upload_me_report.csv").touch()
+    uploader = GoogleSheetsCSVUploader.__new__(GoogleSheetsCSVUploader)
+    uploader.config = SimpleNamespace(POLLING_INTERVAL=0.05)
+    uploader.file_monitor = Mock(reports_dir=tmp_path)
+    uploader.file_monitor.get_files_with_upload_markers.return_value = ["report.csv"]
+    uploader.file_monitor.get_files_with_pivot_markers.return_value = []
+    uploader.failed_markers = set()
+    uploader.process_single_file = Mock(side_effect=[False, False, True])
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(uploader._watch_upload_markers(), timeout=0.5)
+
+    # Startup failure, one failed retry, then success and no more retries
+    assert uploader.process_single_file.call_count == 3
+    uploader.file_monitor.remove_upload_marker.assert_called_once_with("report.csv")
+    assert uploader.failed_markers == set()
+    # Retries process only the failed marker, without directory scans
+    uploader.file_monitor.get_files_with_upload_markers.assert_called_once_with()
@@ -1407,5 +1407,116 @@ class TestDataServiceAsOfDate:
         assert full_history[1].status == "Done"
 
 
+class TestDataServiceStreaming:
+    """Tests for key-ordered task streams used by chunked CSV reports."""
+
+    @pytest.fixture
+    def stream_tasks(self, db_session):
+        """Three STRM tasks inserted out of key order, one created earlier."""
+        from datetime import timezone
+
+        from radiator.models.tracker import TrackerTask, TrackerTaskHistory
+
+        stale = db_session.query(TrackerTask).filter(TrackerTask.key.like("STRM-%"))
+        db_session.query(TrackerTaskHistory).filter(
+            TrackerTaskHistory.task_id.in_([task.id for task in stale])
+        ).delete(synchronize_session=False)
+        stale.delete(synchronize_session=False)
+
+        created = [
+            ("STRM-3", datetime(2031, 1, 3, tzinfo=timezone.utc)),
+            ("STRM-1", datetime(2031, 1, 1, tzinfo=timezone.utc)),
+            ("STRM-2", datetime(2030, 1, 1, tzinfo=timezone.utc)),
+        ]
+        tasks = []
+        for key, created_at in created:
+            task = TrackerTask(
+                tracker_id=f"strm_{key}",
+                key=key,
+                summary=key,
+                status="Done",
+                author="Stream Author",
+                created_at=created_at,
+            )
+            db_session.add(task)
+            tasks.append(task)
+        db_session.flush()
+        for task in tasks:
+            db_session.add_all(
+                [
+                    TrackerTaskHistory(
+                        task_id=task.id,
+                        tracker_id=task.tracker_id,
+                        status=status,
+                        status_display=status,
+                        start_date=task.created_at + timedelta(days=day),
+                        end_date=None,
+                    )
+                    for status, day in [("Открыт", 0), (task.key, 1)]
+                ]
+            )
+        db_session.commit()
+        return tasks
+
+    def test_iter_tasks_by_queue_streams_in_key_order(self, db_session, stream_tasks):
+        """Tasks come sorted by key and honour created_since."""
+        from datetime import timezone
+
+        data_service = DataService(db_session)
+
+        all_keys = [
+            task.key for task in data_service.iter_tasks_by_queue("STRM", chunk_size=2)
+        ]
+        recent_keys = [
+            task.key
+            for task in data_service.iter_tasks_by_queue(
+                "STRM", datetime(2031, 1, 1, tzinfo=timezone.utc), chunk_size=2
+            )
+        ]
+
+        assert all_keys == ["STRM-1", "STRM-2", "STRM-3"]
+        assert recent_keys == ["STRM-1", "STRM-3"]
+
+    def test_iter_tasks_by_queue_raises_on_error(self):
+        """Cursor failure mid-stream is raised, caller's session is kept."""
+
+        def rows():
+            yield (1, "STRM-1", "author", "team", "summary", None, "Открыт")
+            raise RuntimeError("cursor lost")
+
+        db = Mock()
+        query = db.query.return_value.filter.return_value
+        query.order_by.return_value.yield_per.return_value = rows()
+        stream = DataService(db).iter_tasks_by_queue("STRM")
+
+        assert next(stream).key == "STRM-1"
+        with pytest.raises(RuntimeError, match="cursor lost"):
+            next(stream)
+        db.rollback.assert_not_called()
+
+    def test_get_statuses_by_queue(self, db_session, stream_tasks):
+        """Distinct statuses of queue histories are returned sorted."""
+        from datetime import timezone
+
+        data_service = DataService(db_session)
+
+        assert data_service.get_statuses_by_queue("STRM") == [
+            "STRM-1",
+            "STRM-2",
+            "STRM-3",
+            "Открыт",
+        ]
+        assert data_service.get_statuses_by_queue(
+            "STRM", datetime(2031, 1, 1, tzinfo=timezone.utc)
+        ) == ["STRM-1", "STRM-3", "Открыт"]
+
+    def test_iter_chunks(self):
+        """Chunks keep input order and the last chunk may be shorter."""
+        from radiator.commands.services.data_service import iter_chunks
+
+        assert list(iter_chunks(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(iter_chunks([], 2)) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -60,20 +60,20 @@ class TestStatusChangeReportTeamMapping:
         """Test get_status_changes_by_group with team mapping from file."""
         config_dir = str(Path(author_team_mapping_file).parent)
 
-        # Mock database query results - return authors, not teams
+        # Mock aggregated rows - authors, not teams
         mock_results = [
-            ("Александр Тихонов", 1, 1),  # author, history_id, task_id
-            ("Александр Тихонов", 2, 1),
-            ("Александр Черкасов", 3, 2),
-            ("Алексей Какурин", 4, 3),
-            ("Алексей Красников", 5, 4),  # Author with team "Оплаты"
-            ("Алексей Никишанин", 6, 5),  # Author without team
-            ("Неизвестный Автор", 7, 6),  # Author not in mapping
+            ("Александр Тихонов", 0, 2, 1),  # author, period, changes, tasks
+            ("Александр Черкасов", 0, 1, 1),
+            ("Алексей Какурин", 0, 1, 1),
+            ("Алексей Красников", 0, 1, 1),  # Author with team "Оплаты"
+            ("Алексей Никишанин", 0, 1, 1),  # Author without team
+            ("Неизвестный Автор", 0, 1, 1),  # Author not in mapping
         ]
 
         mock_query = Mock()
         mock_query.join.return_value = mock_query
         mock_query.filter.return_value = mock_query
+        mock_query.group_by.return_value = mock_query
         mock_query.all.return_value = mock_results
 
         mock_db.query.return_value = mock_query
@@ -169,13 +169,14 @@ class TestStatusChangeReportTeamMapping:
 
         # Should still work, but all authors should be mapped to "Без команды"
         mock_results = [
-            ("Александр Тихонов", 1, 1),
-            ("Александр Черкасов", 2, 2),
+            ("Александр Тихонов", 0, 1, 1),
+            ("Александр Черкасов", 0, 1, 1),
         ]
 
         mock_query = Mock()
         mock_query.join.return_value = mock_query
         mock_query.filter.return_value = mock_query
+        mock_query.group_by.return_value = mock_query
         mock_query.all.return_value = mock_results
 
         mock_db.query.return_value = mock_query
@@ -203,12 +204,13 @@ class TestStatusChangeReportTeamMapping:
             )
 
             mock_results = [
-                ("Алексей Никишанин", 1, 1),
+                ("Алексей Никишанин", 0, 1, 1),
             ]
 
             mock_query = Mock()
             mock_query.join.return_value = mock_query
             mock_query.filter.return_value = mock_query
+            mock_query.group_by.return_value = mock_query
             mock_query.all.return_value = mock_results
 
             mock_db.query.return_value = mock_query
@@ -317,6 +319,7 @@ class TestStatusChangeReportTeamMapping:
         mock_query = Mock()
         mock_query.join.return_value = mock_query
         mock_query.filter.return_value = mock_query
+        mock_query.group_by.return_value = mock_query
         mock_query.all.return_value = mock_results
 
         mock_db.query.return_value = mock_query
@@ -330,8 +333,8 @@ class TestStatusChangeReportTeamMapping:
 
         # Mock the methods to return data that includes individual authors
         # This simulates the OLD behavior where individual authors were included
-        def mock_get_status_changes_by_group(start_date, end_date):
-            return {
+        def mock_get_status_changes_by_periods(periods):
+            week_data = {
                 "Корзинка и заказ": {"changes": 1, "tasks": 1},
                 "Каталог": {"changes": 2, "tasks": 2},
                 "Александр Тихонов": {
@@ -343,6 +346,7 @@ class TestStatusChangeReportTeamMapping:
                     "tasks": 2,
                 },  # Individual author - should NOT appear in team report
             }
+            return [week_data for _ in periods]
 
         def mock_get_open_tasks_by_group():
             return {
@@ -359,7 +363,7 @@ class TestStatusChangeReportTeamMapping:
             }
 
         # Replace the methods with mocks
-        cmd.get_status_changes_by_group = mock_get_status_changes_by_group
+        cmd.get_status_changes_by_periods = mock_get_status_changes_by_periods
         cmd.get_open_tasks_by_group = mock_get_open_tasks_by_group
 
         # Generate report data
@@ -398,8 +402,8 @@ class TestStatusChangeReportTeamMapping:
         )
 
         # Mock the methods to return team data (6 teams for better testing)
-        def mock_get_status_changes_by_group(start_date, end_date):
-            return {
+        def mock_get_status_changes_by_periods(periods):
+            week_data = {
                 "Корзинка и заказ": {"changes": 1, "tasks": 1},
                 "Каталог": {"changes": 2, "tasks": 2},
                 "Оплаты": {"changes": 1, "tasks": 1},
@@ -407,6 +411,7 @@ class TestStatusChangeReportTeamMapping:
                 "КПП": {"changes": 2, "tasks": 1},
                 "Гео и сервисы": {"changes": 1, "tasks": 1},
             }
+            return [week_data for _ in periods]
 
         def mock_get_open_tasks_by_group():
             return {
@@ -419,7 +424,7 @@ class TestStatusChangeReportTeamMapping:
             }
 
         # Replace the methods with mocks
-        cmd.get_status_changes_by_group = mock_get_status_changes_by_group
+        cmd.get_status_changes_by_periods = mock_get_status_changes_by_periods
         cmd.get_open_tasks_by_group = mock_get_open_tasks_by_group
 
         # Generate report data
@@ -1,7 +1,6 @@
 """Tests for sync_by_keys script."""
 
 import os
-import subprocess
 import sys
 import tempfile
 from pathlib import Path
@@ -13,19 +12,39 @@ import pytest
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from radiator.commands.sync_tracker import TrackerSyncCommand, build_keys_query
 from scripts.sync_by_keys import (
-    build_sync_command,
     clear_progress,
     get_progress_file_path,
     load_progress,
     read_keys_from_file,
     save_progress,
     split_into_batches,
-    sync_batch,
     validate_key,
 )
 
 
+@pytest.fixture
+def mock_sync():
+    """Patch in-process sync; yields mock of run_by_keys returning its batches."""
+    with patch("scripts.sync_by_keys.TrackerSyncCommand") as command_cls, patch(
+        "scripts.sync_by_keys.SingleInstance"
+    ), patch("scripts.sync_by_keys.settings") as settings:
+        settings.TRACKER_API_TOKEN = "token"
+        settings.TRACKER_ORG_ID = "org"
+        run_by_keys = command_cls.return_value.__enter__.return_value.run_by_keys
+        run_by_keys.return_value = True
+        yield run_by_keys
+
+
+def synced_batches(run_by_keys):
+    """Batches that run_by_keys was asked to sync."""
+    kwargs = run_by_keys.call_args.kwargs
+    keys = run_by_keys.call_args.args[0]
+    batches = split_into_batches(keys, kwargs["batch_size"])
+    return batches[kwargs["start_batch"] :]
+
+
 class TestReadKeysFromFile:
     """Test reading keys from file."""
 
@@ -119,199 +138,119 @@ class TestSplitIntoBatches:
         assert batches == []
 
 
-class TestBuildSyncCommand:
-    """Test building sync command."""
+class TestRunByKeys:
+    """Test in-process batched sync by keys."""
+
+    @pytest.fixture
+    def command(self):
+        return TrackerSyncCommand(db=Mock())
+
+    def test_build_keys_query(self):
+        assert build_keys_query(["A-1", "A-2", "A-3"]) == "Key: A-1, A-2, A-3"
+
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_syncs_all_batches_and_reports_progress(self, command, concurrency):
+        keys = [f"A-{i}" for i in range(7)]
+        progress = []
+
+        with patch.object(
+            TrackerSyncCommand, "_sync_keys_batch", return_value=True
+        ) as sync_batch:
+            success = command.run_by_keys(
+                keys,
+                batch_size=2,
+                concurrency=concurrency,
+                start_batch=1,
+                on_progress=lambda done, total: progress.append((done, total)),
+            )
+
+        assert success
+        batches = sorted(call.args[0] for call in sync_batch.call_args_list)
+        assert batches == [["A-2", "A-3"], ["A-4", "A-5"], ["A-6"]]
+        assert {call.args[1] for call in sync_batch.call_args_list} == {concurrency > 1}
+        assert progress[-1] == (4, 4)
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+    def test_run_per_batch_uses_keys_query(self, command):
+        with patch.object(TrackerSyncCommand, "run", return_value=True) as run:
+            assert command.run_by_keys(["A-1", "A-2", "A-3"], batch_size=2)
+
+        assert [call.args[0] for call in run.call_args_list] == [
+            {"query": "Key: A-1, A-2"},
+            {"query": "Key: A-3"},
+        ]
 
-    def test_build_basic_command(self):
-        """Test basic command without extra flags."""
-        keys = ["A-1", "A-2", "A-3"]
-        cmd = build_sync_command(keys, skip_history=False, limit=None)
+    def test_failure_stops_new_batches_and_keeps_leading_progress(self, command):
+        progress = []
 
-        expected = [
-            "python",
-            "-m",
-            "radiator.commands.sync_tracker",
-            "--filter",
-            "Key: A-1, A-2, A-3",
-            "--force-full-history",
-        ]
-        assert cmd == expected
-
-    def test_build_command_with_skip_history(self):
-        """Test command with --skip-history flag."""
-        keys = ["A-1", "A-2"]
-        cmd = build_sync_command(keys, skip_history=True, limit=None)
-
-        expected = [
-            "python",
-            "-m",
-            "radiator.commands.sync_tracker",
-            "--filter",
-            "Key: A-1, A-2",
-            "--skip-history",
-            "--force-full-history",
-        ]
-        assert cmd == expected
-
-    def test_build_command_with_limit(self):
-        """Test command with --limit flag."""
-        keys = ["A-1", "A-2"]
-        cmd = build_sync_command(keys, skip_history=False, limit=100)
-
-        expected = [
-            "python",
-            "-m",
-            "radiator.commands.sync_tracker",
-            "--filter",
-            "Key: A-1, A-2",
-            "--force-full-history",
-            "--limit",
-            "100",
-        ]
-        assert cmd == expected
-
-    def test_build_command_with_all_flags(self):
-        """Test command with all flags."""
-        keys = ["A-1", "A-2"]
-        cmd = build_sync_command(keys, skip_history=True, limit=50)
-
-        expected = [
-            "python",
-            "-m",
-            "radiator.commands.sync_tracker",
-            "--filter",
-            "Key: A-1, A-2",
-            "--skip-history",
-            "--force-full-history",
-            "--limit",
-            "50",
-        ]
-        assert cmd == expected
-
-
-class TestSyncBatch:
-    """Test syncing a single batch."""
-
-    @patch("subprocess.run")
-    def test_sync_batch_success(self, mock_run):
-        """Test successful batch sync."""
-        # Mock successful subprocess
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
-
-        keys = ["A-1", "A-2"]
-        sync_batch(keys, skip_history=False, limit=None)
-
-        # Verify subprocess was called correctly
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert "python" in args
-        assert "-m" in args
-        assert "radiator.commands.sync_tracker" in args
-        assert "--filter" in args
-        assert "Key: A-1, A-2" in args
-        assert "--force-full-history" in args
-
-    @patch("subprocess.run")
-    def test_sync_batch_failure(self, mock_run):
-        """Test batch sync failure raises exception."""
-        # Mock failed subprocess
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_run.return_value = mock_result
-
-        keys = ["A-1", "A-2"]
-
-        with pytest.raises(RuntimeError, match="Batch sync failed"):
-            sync_batch(keys, skip_history=False, limit=None)
-
-    @patch("subprocess.run")
-    def test_sync_batch_with_flags(self, mock_run):
-        """Test batch sync with all flags."""
-        # Mock successful subprocess
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
-
-        keys = ["A-1", "A-2"]
-        sync_batch(keys, skip_history=True, limit=100)
-
-        # Verify subprocess was called with all flags
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert "--skip-history" in args
-        assert "--limit" in args
-        assert "100" in args
+        def sync_batch(keys, *args):
+            if keys == ["A-2", "A-3"]:
+                raise RuntimeError("Tracker is down")
+            return True
+
+        with patch.object(
+            TrackerSyncCommand, "_sync_keys_batch", side_effect=sync_batch
+        ) as mock_batch:
+            success = command.run_by_keys(
+                [f"A-{i}" for i in range(10)],
+                batch_size=2,
+                on_progress=lambda done, total: progress.append(done),
+            )
+
+        assert not success
+        assert mock_batch.call_count == 2
+        assert progress == [1]
 
 
 class TestMainLogic:
     """Test main script logic."""
 
-    @patch("scripts.sync_by_keys.sync_batch")
-    @patch("scripts.sync_by_keys.split_into_batches")
     @patch("scripts.sync_by_keys.read_keys_from_file")
-    def test_main_stops_on_error(self, mock_read, mock_split, mock_sync):
-        """Test that main stops when batch fails."""
-        # Setup mocks
+    def test_main_stops_on_error(self, mock_read, mock_sync):
+        """Test that main exits with error when a batch fails."""
         mock_read.return_value = ["A-1", "A-2", "A-3", "A-4"]
-        mock_split.return_value = [["A-1", "A-2"], ["A-3", "A-4"]]
-
-        # First batch succeeds, second fails
-        def sync_side_effect(keys, skip_history, limit, force_full_history):
-            if keys == ["A-1", "A-2"]:
-                return  # success
-            else:
-                raise RuntimeError("Batch sync failed")
+        mock_sync.return_value = False
 
-        mock_sync.side_effect = sync_side_effect
-
-        # Import and test main function
         from scripts.sync_by_keys import main
 
-        # Mock sys.argv and clear progress
-        with patch("scripts.sync_by_keys.load_progress") as mock_load:
+        with patch("scripts.sync_by_keys.load_progress") as mock_load, patch(
+            "scripts.sync_by_keys.clear_progress"
+        ) as mock_clear:
             mock_load.return_value = None  # no saved progress
-            with patch("sys.argv", ["sync_by_keys.py", "--file", "test.txt"]):
+            with patch(
+                "sys.argv", ["sync_by_keys.py", "--file", "test.txt", "-b", "2"]
+            ):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
                 # Should exit with code 1
                 assert exc_info.value.code == 1
 
-            # Verify both batches were called (tqdm calls the function for each batch)
-            # but the second one should have failed
-            assert mock_sync.call_count == 2
-            # Note: force_full_history defaults to True
-            mock_sync.assert_any_call(["A-1", "A-2"], False, None, True)
-            mock_sync.assert_any_call(["A-3", "A-4"], False, None, True)
+            # Progress is kept for the next run
+            mock_clear.assert_not_called()
 
-    @patch("scripts.sync_by_keys.sync_batch")
-    @patch("scripts.sync_by_keys.split_into_batches")
     @patch("scripts.sync_by_keys.read_keys_from_file")
-    def test_main_success_all_batches(self, mock_read, mock_split, mock_sync):
-        """Test successful processing of all batches."""
-        # Setup mocks
+    def test_main_success_all_batches(self, mock_read, mock_sync):
+        """Test successful processing of all batches in one process."""
         mock_read.return_value = ["A-1", "A-2", "A-3", "A-4"]
-        mock_split.return_value = [["A-1", "A-2"], ["A-3", "A-4"]]
-        mock_sync.return_value = None  # success
 
-        # Mock no saved progress
         with patch("scripts.sync_by_keys.load_progress") as mock_load:
             mock_load.return_value = None  # no saved progress
 
-            # Import and test main function
             from scripts.sync_by_keys import main
 
-            # Mock sys.argv
-            with patch("sys.argv", ["sync_by_keys.py", "--file", "test.txt"]):
+            with patch(
+                "sys.argv",
+                ["sync_by_keys.py", "--file", "test.txt", "-b", "2", "-c", "4"],
+            ):
                 main()  # Should not raise exception
 
-            # Verify both batches were processed
-            assert mock_sync.call_count == 2
-            # Note: force_full_history defaults to True
-            mock_sync.assert_any_call(["A-1", "A-2"], False, None, True)
-            mock_sync.assert_any_call(["A-3", "A-4"], False, None, True)
+        mock_sync.assert_called_once()
+        kwargs = mock_sync.call_args.kwargs
+        assert (kwargs["concurrency"], kwargs["skip_history"]) == (4, False)
+        # Note: force_full_history defaults to True
+        assert kwargs["force_full_history"] is True
+        assert synced_batches(mock_sync) == [["A-1", "A-2"], ["A-3", "A-4"]]
 
 
 class TestProgressFunctions:
@@ -381,42 +320,29 @@ class TestProgressFunctions:
 class TestMainWithProgress:
     """Test main function with progress tracking."""
 
-    @patch("scripts.sync_by_keys.sync_batch")
-    @patch("scripts.sync_by_keys.split_into_batches")
     @patch("scripts.sync_by_keys.read_keys_from_file")
-    def test_main_continues_from_saved_progress(self, mock_read, mock_split, mock_sync):
+    def test_main_continues_from_saved_progress(self, mock_read, mock_sync):
         """Test that main continues from saved progress."""
-        # Setup mocks
         mock_read.return_value = ["A-1", "A-2", "A-3", "A-4", "A-5", "A-6"]
-        mock_split.return_value = [["A-1", "A-2"], ["A-3", "A-4"], ["A-5", "A-6"]]
-        mock_sync.return_value = None  # success
 
         # Mock saved progress: completed 1 batch out of 3
         with patch("scripts.sync_by_keys.load_progress") as mock_load:
             mock_load.return_value = (1, 3)  # completed batch 1, total 3
 
-            # Import and test main function
             from scripts.sync_by_keys import main
 
-            # Mock sys.argv
-            with patch("sys.argv", ["sync_by_keys.py", "--file", "test.txt"]):
+            with patch(
+                "sys.argv", ["sync_by_keys.py", "--file", "test.txt", "-b", "2"]
+            ):
                 main()
 
-            # Should start from batch 2 (index 1)
-            assert mock_sync.call_count == 2  # batches 2 and 3
-            # Note: force_full_history defaults to True
-            mock_sync.assert_any_call(["A-3", "A-4"], False, None, True)
-            mock_sync.assert_any_call(["A-5", "A-6"], False, None, True)
+        # Should start from batch 2 (index 1)
+        assert synced_batches(mock_sync) == [["A-3", "A-4"], ["A-5", "A-6"]]
 
-    @patch("scripts.sync_by_keys.sync_batch")
-    @patch("scripts.sync_by_keys.split_into_batches")
     @patch("scripts.sync_by_keys.read_keys_from_file")
-    def test_main_resets_progress_with_flag(self, mock_read, mock_split, mock_sync):
+    def test_main_resets_progress_with_flag(self, mock_read, mock_sync):
         """Test that --reset-progress flag resets progress."""
-        # Setup mocks
         mock_read.return_value = ["A-1", "A-2", "A-3", "A-4"]
-        mock_split.return_value = [["A-1", "A-2"], ["A-3", "A-4"]]
-        mock_sync.return_value = None  # success
 
         # Mock saved progress exists
         with patch("scripts.sync_by_keys.load_progress") as mock_load, patch(
@@ -424,74 +350,66 @@ class TestMainWithProgress:
         ) as mock_clear:
             mock_load.return_value = (1, 2)  # completed batch 1
 
-            # Import and test main function
             from scripts.sync_by_keys import main
 
-            # Mock sys.argv with --reset-progress
             with patch(
                 "sys.argv",
-                ["sync_by_keys.py", "--file", "test.txt", "--reset-progress"],
+                [
+                    "sync_by_keys.py",
+                    "--file",
+                    "test.txt",
+                    "-b",
+                    "2",
+                    "--reset-progress",
+                ],
             ):
                 main()
 
             # Should clear progress and start from beginning (called twice: reset + success)
             assert mock_clear.call_count == 2
             mock_clear.assert_any_call("test.txt")
-            assert mock_sync.call_count == 2  # both batches
-            # Note: force_full_history defaults to True
-            mock_sync.assert_any_call(["A-1", "A-2"], False, None, True)
-            mock_sync.assert_any_call(["A-3", "A-4"], False, None, True)
+        assert synced_batches(mock_sync) == [["A-1", "A-2"], ["A-3", "A-4"]]
 
-    @patch("scripts.sync_by_keys.sync_batch")
-    @patch("scripts.sync_by_keys.split_into_batches")
     @patch("scripts.sync_by_keys.read_keys_from_file")
-    def test_progress_cleared_on_success(self, mock_read, mock_split, mock_sync):
-        """Test that progress is cleared on successful completion."""
-        # Setup mocks
+    def test_progress_saved_per_batch_and_cleared_on_success(
+        self, mock_read, mock_sync
+    ):
+        """Test that progress callback saves progress and it is cleared on success."""
         mock_read.return_value = ["A-1", "A-2"]
-        mock_split.return_value = [["A-1", "A-2"]]
-        mock_sync.return_value = None  # success
 
-        # Import and test main function
+        def run_by_keys(keys, **kwargs):
+            kwargs["on_progress"](1, 1)
+            return True
+
+        mock_sync.side_effect = run_by_keys
+
         from scripts.sync_by_keys import main
 
-        with patch("scripts.sync_by_keys.clear_progress") as mock_clear:
-            # Mock sys.argv
+        with patch("scripts.sync_by_keys.save_progress") as mock_save, patch(
+            "scripts.sync_by_keys.clear_progress"
+        ) as mock_clear:
             with patch("sys.argv", ["sync_by_keys.py", "--file", "test.txt"]):
                 main()
 
+            mock_save.assert_called_once_with("test.txt", 1, 1)
             # Should clear progress on success
             mock_clear.assert_called_once_with("test.txt")
 
-    @patch("scripts.sync_by_keys.sync_batch")
-    @patch("scripts.sync_by_keys.split_into_batches")
     @patch("scripts.sync_by_keys.read_keys_from_file")
-    def test_batch_count_changed_resets_progress(
-        self, mock_read, mock_split, mock_sync
-    ):
+    def test_batch_count_changed_resets_progress(self, mock_read, mock_sync):
         """Test that changed batch count resets progress."""
-        # Setup mocks
         mock_read.return_value = ["A-1", "A-2", "A-3", "A-4", "A-5", "A-6"]
-        mock_split.return_value = [
-            ["A-1", "A-2"],
-            ["A-3", "A-4"],
-            ["A-5", "A-6"],
-        ]  # 3 batches
 
         # Mock saved progress with different batch count
         with patch("scripts.sync_by_keys.load_progress") as mock_load:
             mock_load.return_value = (2, 2)  # saved: 2 batches, current: 3 batches
 
-            # Import and test main function
             from scripts.sync_by_keys import main
 
-            # Mock sys.argv
-            with patch("sys.argv", ["sync_by_keys.py", "--file", "test.txt"]):
+            with patch(
+                "sys.argv", ["sync_by_keys.py", "--file", "test.txt", "-b", "2"]
+            ):
                 main()
 
-            # Should start from beginning due to batch count mismatch
-            assert mock_sync.call_count == 3  # all 3 batches
-            # Note: force_full_history defaults to True
-            mock_sync.assert_any_call(["A-1", "A-2"], False, None, True)
-            mock_sync.assert_any_call(["A-3", "A-4"], False, None, True)
-            mock_sync.assert_any_call(["A-5", "A-6"], False, None, True)
+        # Should start from beginning due to batch count mismatch
+        assert len(synced_batches(mock_sync)) == 3  # all 3 batches
@@ -94,7 +94,7 @@ class TestSyncErrorHandling:
             mock_service.extract_task_data.side_effect = mock_extract_task_data
 
             # Mock get_changelogs_batch to return mixed results (one task fails)
-            def mock_get_changelogs_batch(task_ids):
+            def mock_get_changelogs_batch(task_ids, last_changelog_ids=None):
                 return [
                     ("test_sync_001", []),  # Success - empty changelog
                     ("test_sync_002", None),  # Failure - None indicates API error
@@ -211,7 +211,7 @@ class TestSyncErrorHandling:
             mock_service.extract_task_data.side_effect = mock_extract_task_data
 
             # Mock get_changelogs_batch to return None for one task (API error)
-            def mock_get_changelogs_batch(task_ids):
+            def mock_get_changelogs_batch(task_ids, last_changelog_ids=None):
                 return [("test_sync_001", None)]  # API error - None indicates failure
 
             mock_service.get_changelogs_batch.side_effect = mock_get_changelogs_batch
@@ -78,7 +78,7 @@ class TestSyncOutputFormat:
             mock_service.extract_task_data.side_effect = mock_extract_task_data
 
             # Mock get_changelogs_batch to return successful results
-            def mock_get_changelogs_batch(task_ids):
+            def mock_get_changelogs_batch(task_ids, last_changelog_ids=None):
                 return [("test_sync_001", [])]  # Success - empty changelog
 
             mock_service.get_changelogs_batch.side_effect = mock_get_changelogs_batch
@@ -167,7 +167,7 @@ class TestSyncOutputFormat:
             mock_service.extract_task_data.side_effect = mock_extract_task_data
 
             # Mock get_changelogs_batch to return API error
-            def mock_get_changelogs_batch(task_ids):
+            def mock_get_changelogs_batch(task_ids, last_changelog_ids=None):
                 return [("test_sync_001", None)]  # API error - None indicates failure
 
             mock_service.get_changelogs_batch.side_effect = mock_get_changelogs_batch
@@ -256,7 +256,7 @@ class TestSyncOutputFormat:
             mock_service.extract_task_data.side_effect = mock_extract_task_data
 
             # Mock get_changelogs_batch to return successful results
-            def mock_get_changelogs_batch(task_ids):
+            def mock_get_changelogs_batch(task_ids, last_changelog_ids=None):
                 return [("test_sync_001", [])]  # Success - empty changelog
 
             mock_service.get_changelogs_batch.side_effect = mock_get_changelogs_batch
@@ -0,0 +1,170 @@
+"""Tests for streaming sync pipeline."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from radiator.commands.services.sync_pipeline import SyncPipeline
+from radiator.commands.sync_tracker import TrackerSyncCommand
+from radiator.models.tracker import TrackerSyncLog, TrackerTask, TrackerTaskHistory
+from radiator.services.tracker_service import TrackerAPIService
+
+SERVICE = "radiator.services.tracker_service.tracker_service"
+
+
+def make_task(n):
+    return {
+        "id": f"pipe_{n}",
+        "key": f"PIPE-{n}",
+        "summary": f"Pipeline task {n}",
+        "status": {"key": "done", "display": "Done"},
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-05T00:00:00Z",
+    }
+
+
+def make_changelog(task_id):
+    return [
+        {
+            "id": f"{task_id}_log",
+            "updatedAt": "2024-01-05T00:00:00Z",
+            "fields": [
+                {
+                    "field": {"id": "status"},
+                    "from": {"display": "Open"},
+                    "to": {"display": "Done"},
+                }
+            ],
+        }
+    ]
+
+
+@pytest.fixture
+def sync_cmd(db_session):
+    db_session.query(TrackerTaskHistory).delete()
+    db_session.query(TrackerTask).delete()
+    db_session.commit()
+    return TrackerSyncCommand(db=db_session)
+
+
+@pytest.fixture
+def pages():
+    """Three search pages with two tasks each."""
+    return [[make_task(2 * p + 1), make_task(2 * p + 2)] for p in range(3)]
+
+
+class TestSyncPipeline:
+    """Tests for SyncPipeline."""
+
+    def test_pipeline_persists_tasks_and_history(self, sync_cmd, db_session, pages):
+        """Every page is upserted and gets its history written."""
+
+        def changelogs(task_ids, last_changelog_ids):
+            return [(task_id, make_changelog(task_id)) for task_id in task_ids]
+
+        with patch(f"{SERVICE}.iter_search_pages", return_value=iter(pages)), patch(
+            f"{SERVICE}.get_changelogs_batch", side_effect=changelogs
+        ):
+            result = SyncPipeline(sync_cmd, max_pages=2).run("Queue: PIPE")
+
+        assert result.pages == 3
+        assert (result.tasks_found, result.tasks_created, result.tasks_updated) == (
+            6,
+            6,
+            0,
+        )
+        assert (result.history_entries, result.tasks_with_history) == (12, 6)
+        assert result.api_errors == 0
+        assert db_session.query(TrackerTask).count() == 6
+        assert db_session.query(TrackerTaskHistory).count() == 12
+
+    def test_search_waits_for_free_slot(self, sync_cmd, pages):
+        """Search never runs more than max_pages (+1 prefetched) ahead of history."""
+        yielded = []
+        persisted = []
+        in_flight = []
+
+        def search(*args, **kwargs):
+            for page in pages:
+                yielded.append(page)
+                in_flight.append(len(yielded) - len(persisted))
+                yield page
+
+        original = sync_cmd._persist_task_histories
+
+        def persist(changelogs_data, *args, **kwargs):
+            persisted.append(changelogs_data)
+            return original(changelogs_data, *args, **kwargs)
+
+        with patch(f"{SERVICE}.iter_search_pages", side_effect=search), patch(
+            f"{SERVICE}.get_changelogs_batch",
+            side_effect=lambda ids, last_ids: [(task_id, []) for task_id in ids],
+        ), patch.object(sync_cmd, "_persist_task_histories", side_effect=persist):
+            SyncPipeline(sync_cmd, max_pages=1).run("Queue: PIPE")
+
+        assert len(persisted) == 3
+        assert max(in_flight) <= 2
+
+    def test_skip_history_does_not_fetch_changelogs(self, sync_cmd, pages):
+        """With skip_history only task upserts are performed."""
+        with patch(f"{SERVICE}.iter_search_pages", return_value=iter(pages)), patch(
+            f"{SERVICE}.get_changelogs_batch"
+        ) as get_changelogs:
+            result = SyncPipeline(sync_cmd, skip_history=True).run("Queue: PIPE")
+
+        get_changelogs.assert_not_called()
+        assert result.tasks_created == 6
+        assert result.history_entries == 0
+
+    def test_fetch_error_is_raised(self, sync_cmd, pages):
+        """Error in changelog stage stops the pipeline and is re-raised."""
+        with patch(f"{SERVICE}.iter_search_pages", return_value=iter(pages)), patch(
+            f"{SERVICE}.get_changelogs_batch", side_effect=RuntimeError("boom")
+        ):
+            with pytest.raises(RuntimeError, match="boom"):
+                SyncPipeline(sync_cmd, max_pages=1).run("Queue: PIPE")
+
+    def test_run_with_pipeline_completes_sync_log(self, sync_cmd, db_session, pages):
+        """TrackerSyncCommand.run(pipeline=True) records totals in sync log."""
+        with patch(
+            f"{SERVICE}.iter_search_pages", return_value=iter(pages)
+        ) as search, patch(
+            f"{SERVICE}.get_changelogs_batch",
+            side_effect=lambda ids, last_ids: [(task_id, []) for task_id in ids],
+        ):
+            assert sync_cmd.run(filters={"query": "Queue: PIPE"}, pipeline=True)
+
+        assert search.call_args.args[0] == "Queue: PIPE"
+        sync_log = db_session.query(TrackerSyncLog).order_by(
+            TrackerSyncLog.sync_started_at.desc()
+        )[0]
+        assert sync_log.status == "completed"
+        assert (sync_log.tasks_processed, sync_log.tasks_created) == (6, 6)
+
+
+class TestIterSearchPages:
+    """Tests for TrackerAPIService.iter_search_pages."""
+
+    def test_pages_are_fetched_lazily_and_trimmed_to_limit(self):
+        """Next page is requested only when consumer asks for it."""
+        service = TrackerAPIService()
+        responses = []
+        for page in range(2):
+            response = Mock()
+            response.json.return_value = [{"id": f"t{page}_{i}"} for i in range(100)]
+            response.headers = {"X-Total-Pages": "2"}
+            responses.append(response)
+
+        with patch.object(
+            service, "_make_request", side_effect=responses
+        ) as request, patch(
+            "radiator.services.tracker_service.settings.API_PAGE_SIZE", 100
+        ):
+            pages = service.iter_search_pages("Queue: PIPE", limit=150)
+            first = next(pages)
+            assert request.call_count == 1
+            rest = list(pages)
+
+        assert len(first) == 100
+        assert [len(page) for page in rest] == [50]
+        assert request.call_count == 2
@@ -78,7 +78,7 @@ class TestSyncTaskLoadingProgress:
             mock_service.extract_task_data.side_effect = mock_extract_task_data
 
             # Mock get_changelogs_batch to return successful results
-            def mock_get_changelogs_batch(task_ids):
+            def mock_get_changelogs_batch(task_ids, last_changelog_ids=None):
                 return [("test_sync_001", [])]  # Success - empty changelog
 
             mock_service.get_changelogs_batch.side_effect = mock_get_changelogs_batch
@@ -137,7 +137,7 @@ class TestSyncTaskLoadingProgress:
         with patch("radiator.commands.sync_tracker.tracker_service") as mock_service:
             # Mock get_tasks_by_filter_with_data to call progress callback
             def mock_get_tasks_with_progress(
-                filters, limit=None, fields=None, progress_callback=None
+                filters, limit=None, fields=None, progress_callback=None, expand=None
             ):
                 # Simulate loading 3 pages of tasks with unique IDs
                 tasks = [
@@ -208,7 +208,7 @@ class TestSyncTaskLoadingProgress:
         with patch("radiator.commands.sync_tracker.tracker_service") as mock_service:
             # Mock get_tasks_by_filter_with_data to simulate scroll pagination
             def mock_get_tasks_scroll(
-                filters, limit=None, fields=None, progress_callback=None
+                filters, limit=None, fields=None, progress_callback=None, expand=None
             ):
                 # Simulate loading 10000+ tasks with scroll
                 tasks = [
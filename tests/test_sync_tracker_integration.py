@@ -114,6 +114,35 @@ class TestSyncTrackerIntegration:
         )
         assert updated_task.summary == "Updated Task Summary"
 
+    def test_bulk_upsert_mixed_batch_counts(self, db_session, sample_task_data):
+        """Upsert reports created/updated per row across several round trips."""
+        sync_cmd = TrackerSyncCommand(db=db_session)
+        sync_cmd.UPSERT_BATCH_SIZE = 2
+
+        existing = sample_task_data.copy()
+        existing["tracker_id"] = "test_upsert_000"
+        sync_cmd._bulk_create_or_update_tasks([existing])
+
+        tasks = []
+        for i in range(5):
+            task = sample_task_data.copy()
+            task["tracker_id"] = f"test_upsert_{i:03d}"
+            task["key"] = f"TEST-UPSERT-{i}"
+            task["summary"] = f"Summary {i}"
+            tasks.append(task)
+
+        result = sync_cmd._bulk_create_or_update_tasks(tasks)
+
+        assert result == {"created": 4, "updated": 1}
+        stored = (
+            db_session.query(TrackerTask)
+            .filter(TrackerTask.tracker_id.like("test_upsert_%"))
+            .order_by(TrackerTask.tracker_id)
+            .all()
+        )
+        assert [t.summary for t in stored] == [f"Summary {i}" for i in range(5)]
+        assert all(t.last_sync_at is not None for t in stored)
+
     def test_get_task_by_tracker_id(self, db_session, sample_task_data):
         """Test getting task by tracker_id."""
         sync_cmd = TrackerSyncCommand()
@@ -0,0 +1,227 @@
+"""Tests for batched COPY-based history writer."""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from radiator.commands.sync_tracker import TrackerSyncCommand
+from radiator.models.tracker import TrackerTask, TrackerTaskHistory
+from radiator.services.task_history_writer import TaskHistoryWriter
+
+
+@pytest.fixture
+def two_tasks(db_session):
+    """Two tasks, the first one with stale history."""
+    db_session.query(TrackerTaskHistory).delete()
+    db_session.query(TrackerTask).delete()
+    db_session.commit()
+
+    tasks = [
+        TrackerTask(tracker_id="hw_1", key="CPO-1", status="Done"),
+        TrackerTask(tracker_id="hw_2", key="CPO-2", status="Open"),
+    ]
+    db_session.add_all(tasks)
+    db_session.commit()
+
+    db_session.add(
+        TrackerTaskHistory(
+            task_id=tasks[0].id,
+            tracker_id="hw_1",
+            status="Stale",
+            status_display="Stale",
+            start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        )
+    )
+    db_session.commit()
+    return tasks
+
+
+def history_row(task, status, start, end=None):
+    return {
+        "task_id": task.id,
+        "tracker_id": task.tracker_id,
+        "status": status,
+        "status_display": status,
+        "start_date": start,
+        "end_date": end,
+    }
+
+
+class TestTaskHistoryWriter:
+    """Tests for TaskHistoryWriter."""
+
+    def test_flush_replaces_history_and_updates_last_changelog_id(
+        self, db_session, two_tasks
+    ):
+        """Flush deletes old rows, copies new ones and stores last changelog id."""
+        first, second = two_tasks
+        start = datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 2, 10, 0, tzinfo=timezone.utc)
+
+        writer = TaskHistoryWriter(db_session)
+        writer.add(
+            first.id,
+            [history_row(first, "Open", start, end), history_row(first, "Done", end)],
+            [{"id": "c1"}, {"id": "c2"}],
+        )
+        writer.add(second.id, [history_row(second, "Open", start)], [])
+
+        assert writer.flush() == 3
+        assert writer.pending_tasks == 0
+
+        rows = (
+            db_session.query(TrackerTaskHistory)
+            .order_by(TrackerTaskHistory.task_id, TrackerTaskHistory.start_date)
+            .all()
+        )
+        assert [(r.tracker_id, r.status) for r in rows] == [
+            ("hw_1", "Open"),
+            ("hw_1", "Done"),
+            ("hw_2", "Open"),
+        ]
+        assert rows[1].end_date is None
+        assert all(r.id is not None and r.created_at is not None for r in rows)
+
+        db_session.refresh(first)
+        db_session.refresh(second)
+        assert first.last_changelog_id == "c2"
+        assert second.last_changelog_id is None
+
+    def test_copy_stores_same_timestamps_as_orm_insert(self, db_session, two_tasks):
+        """COPY path converts aware datetimes exactly like ORM inserts do."""
+        first, second = two_tasks
+        start = datetime(2024, 3, 1, 23, 30, tzinfo=timezone.utc)
+
+        db_session.add(TrackerTaskHistory(**history_row(second, "Open", start)))
+        db_session.commit()
+
+        writer = TaskHistoryWriter(db_session)
+        writer.add(first.id, [history_row(first, "Open", start)])
+        writer.flush()
+
+        orm_row = db_session.query(TrackerTaskHistory).filter_by(task_id=second.id)
+        copy_row = db_session.query(TrackerTaskHistory).filter_by(task_id=first.id)
+        assert copy_row.one().start_date == orm_row.one().start_date
+
+    def test_multi_row_insert_fallback_without_copy(self, db_session, two_tasks):
+        """Drivers without COPY support fall back to multi-row INSERT."""
+        first, _ = two_tasks
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        writer = TaskHistoryWriter(db_session)
+        writer.add(first.id, [history_row(first, "Open", start)])
+        with patch.object(writer, "_copy_records") as copy_records, patch.object(
+            TaskHistoryWriter, "_supports_copy", return_value=False
+        ):
+            writer.flush()
+
+        copy_records.assert_not_called()
+        rows = db_session.query(TrackerTaskHistory).filter_by(task_id=first.id).all()
+        assert [r.status for r in rows] == ["Open"]
+
+
+class TestSyncTaskHistoryBatched:
+    """sync_task_history persists rebuilt histories through the writer."""
+
+    def test_sync_task_history_writes_batches(self, db_session, two_tasks):
+        """Full history sync is flushed per TRACKER_SYNC_BATCH_SIZE tasks."""
+        sync_cmd = TrackerSyncCommand(db=db_session)
+        task_objs = [
+            {
+                "id": task_id,
+                "key": key,
+                "status": {"display": "Done"},
+                "createdAt": "2024-01-01T00:00:00Z",
+            }
+            for task_id, key in (("hw_1", "CPO-1"), ("hw_2", "CPO-2"))
+        ]
+        changelog = [
+            {
+                "id": "log_1",
+                "updatedAt": "2024-01-05T00:00:00Z",
+                "fields": [
+                    {
+                        "field": {"id": "status"},
+                        "from": {"display": "Open"},
+                        "to": {"display": "Done"},
+                    }
+                ],
+            }
+        ]
+
+        with patch(
+            "radiator.commands.sync_tracker.tracker_service.get_changelogs_batch",
+            return_value=[("hw_1", changelog), ("hw_2", changelog)],
+        ), patch("radiator.commands.sync_tracker.settings.TRACKER_SYNC_BATCH_SIZE", 1):
+            entries, with_history, errors = sync_cmd.sync_task_history(
+                task_objs, [(t["id"], t) for t in task_objs], force_full_history=True
+            )
+
+        assert (entries, with_history, errors) == (4, 2, 0)
+        rows = (
+            db_session.query(TrackerTaskHistory)
+            .order_by(TrackerTaskHistory.tracker_id, TrackerTaskHistory.start_date)
+            .all()
+        )
+        assert [(r.tracker_id, r.status) for r in rows] == [
+            ("hw_1", "Open"),
+            ("hw_1", "Done"),
+            ("hw_2", "Open"),
+            ("hw_2", "Done"),
+        ]
+        assert {t.last_changelog_id for t in db_session.query(TrackerTask)} == {"log_1"}
+
+    def test_preloaded_tasks_are_not_reloaded_after_flush(self, db_session, two_tasks):
+        """Commits of batch flushes do not bring back one SELECT per task."""
+        sync_cmd = TrackerSyncCommand(db=db_session)
+        changelog = [
+            {
+                "id": "log_1",
+                "updatedAt": "2024-01-05T00:00:00Z",
+                "fields": [
+                    {
+                        "field": {"id": "status"},
+                        "from": {"display": "Open"},
+                        "to": {"display": "Done"},
+                    }
+                ],
+            }
+        ]
+        tasks_dict = {
+            task.tracker_id: {
+                "id": task.tracker_id,
+                "key": task.key,
+                "status": {"display": "Done"},
+                "createdAt": "2024-01-01T00:00:00Z",
+            }
+            for task in two_tasks
+        }
+        db_tasks = sync_cmd._load_db_tasks(list(tasks_dict))
+        task_selects = []
+
+        def count_task_selects(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT") and (
+                "FROM tracker_tasks" in statement
+            ):
+                task_selects.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", count_task_selects)
+        try:
+            with patch(
+                "radiator.commands.sync_tracker.settings.TRACKER_SYNC_BATCH_SIZE", 1
+            ):
+                result = sync_cmd._persist_task_histories(
+                    [(task_id, changelog) for task_id in tasks_dict],
+                    tasks_dict,
+                    force_full_history=False,
+                    db_tasks=db_tasks,
+                )
+        finally:
+            event.remove(engine, "before_cursor_execute", count_task_selects)
+
+        assert result == (4, 2, 0)
+        assert task_selects == []
+        assert sync_cmd.history_changed_task_ids == {task.id for task in two_tasks}
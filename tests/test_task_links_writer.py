@@ -0,0 +1,141 @@
+"""Tests for TaskLinksWriter edge projection and statements."""
+
+from unittest.mock import Mock
+
+from radiator.services.task_links_writer import REBUILD_SQL, TaskLinksWriter
+
+
+def link(key, link_type="relates", direction="inward", display=None):
+    """Link from Tracker API to task key."""
+    obj = {"key": key}
+    if display is not None:
+        obj["display"] = display
+    return {"type": {"id": link_type}, "direction": direction, "object": obj}
+
+
+class TestExtractEdges:
+    """Tests for projecting raw links to edge rows."""
+
+    def test_projects_links_to_edges(self):
+        edges = TaskLinksWriter._extract_edges(
+            "CPO-1",
+            [link("FULLSTACK-1", display="Epic"), link("CPO-2", "subtask", "outward")],
+        )
+
+        assert edges == [
+            {
+                "src_key": "CPO-1",
+                "dst_key": "FULLSTACK-1",
+                "type_id": "relates",
+                "direction": "inward",
+                "dst_display": "Epic",
+            },
+            {
+                "src_key": "CPO-1",
+                "dst_key": "CPO-2",
+                "type_id": "subtask",
+                "direction": "outward",
+                "dst_display": None,
+            },
+        ]
+
+    def test_skips_malformed_links(self):
+        links = [
+            None,
+            {},
+            "relates",
+            {"type": {"id": "relates"}, "direction": "inward"},
+            {"type": "relates", "object": {"key": "FULLSTACK-1"}},
+            {"type": {"id": ""}, "object": {"key": "FULLSTACK-1"}},
+            {"type": {"id": "relates"}, "object": {"display": "no key"}},
+            link("FULLSTACK-2"),
+        ]
+
+        edges = TaskLinksWriter._extract_edges("CPO-1", links)
+
+        assert [edge["dst_key"] for edge in edges] == ["FULLSTACK-2"]
+
+    def test_no_links(self):
+        assert TaskLinksWriter._extract_edges("CPO-1", None) == []
+        assert TaskLinksWriter._extract_edges("CPO-1", []) == []
+
+    def test_duplicates_collapsed_by_primary_key(self):
+        edges = TaskLinksWriter._extract_edges(
+            "CPO-1",
+            [
+                link("FULLSTACK-1", display="first"),
+                link("FULLSTACK-1", display="second"),
+                link("FULLSTACK-1", direction="outward"),
+                link("FULLSTACK-1", "depends"),
+            ],
+        )
+
+        assert [
+            (edge["type_id"], edge["direction"], edge["dst_display"]) for edge in edges
+        ] == [
+            ("relates", "inward", "first"),
+            ("relates", "outward", None),
+            ("depends", "inward", None),
+        ]
+
+    def test_missing_direction_and_long_display(self):
+        raw = link("FULLSTACK-1", display="x" * 600)
+        del raw["direction"]
+
+        (edge,) = TaskLinksWriter._extract_edges("CPO-1", [raw])
+
+        assert edge["direction"] == ""
+        assert len(edge["dst_display"]) == 500
+
+
+class TestStatements:
+    """Tests for statements issued by TaskLinksWriter."""
+
+    def test_replace_deletes_and_inserts_in_batches(self):
+        db = Mock()
+        writer = TaskLinksWriter(db, batch_size=2)
+
+        written = writer.replace(
+            {
+                "CPO-1": [link("FULLSTACK-1"), link("FULLSTACK-2")],
+                "CPO-2": [link("FULLSTACK-3")],
+                "CPO-3": None,
+            }
+        )
+
+        assert written == 3
+        statements = [call.args for call in db.execute.call_args_list]
+        deletes = [args[1]["keys"] for args in statements[:2]]
+        inserts = [args[1] for args in statements[2:]]
+        assert all("DELETE" in str(args[0]) for args in statements[:2])
+        assert deletes == [["CPO-1", "CPO-2"], ["CPO-3"]]
+        assert [[row["dst_key"] for row in rows] for rows in inserts] == [
+            ["FULLSTACK-1", "FULLSTACK-2"],
+            ["FULLSTACK-3"],
+        ]
+        db.commit.assert_not_called()
+
+    def test_replace_of_tasks_without_links_only_deletes(self):
+        db = Mock()
+
+        assert TaskLinksWriter(db).replace({"CPO-1": []}) == 0
+
+        db.execute.assert_called_once()
+        assert "DELETE" in str(db.execute.call_args.args[0])
+
+    def test_replace_nothing(self):
+        db = Mock()
+
+        assert TaskLinksWriter(db).replace({}) == 0
+        db.execute.assert_not_called()
+
+    def test_rebuild_clears_table_and_runs_projection(self):
+        db = Mock()
+        db.execute.return_value.rowcount = 7
+
+        assert TaskLinksWriter(db).rebuild() == 7
+
+        clear, projection = [str(call.args[0]) for call in db.execute.call_args_list]
+        assert clear == "DELETE FROM tracker_task_links"
+        assert projection == REBUILD_SQL
+        db.commit.assert_not_called()
@@ -0,0 +1,202 @@
+"""Tests for materialized per-task metrics (tracker_task_metrics)."""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from radiator.commands.generate_ttm_details_report import TTMDetailsReportGenerator
+from radiator.commands.models.time_to_market_models import Quarter, TaskData
+from radiator.commands.services.task_metrics_store import TaskMetricsStore
+from radiator.commands.sync_tracker import TrackerSyncCommand
+from radiator.models.tracker import TrackerTask, TrackerTaskHistory, TrackerTaskMetrics
+
+
+def add_history(db_session, task, statuses):
+    """Add consecutive history entries: (status, start, end)."""
+    for status, start, end in statuses:
+        db_session.add(
+            TrackerTaskHistory(
+                task_id=task.id,
+                tracker_id=task.tracker_id,
+                status=status,
+                status_display=status,
+                start_date=start,
+                end_date=end,
+            )
+        )
+
+
+@pytest.fixture
+def tasks(db_session):
+    """One finished and one unfinished task with history."""
+    db_session.query(TrackerTaskMetrics).delete()
+    db_session.query(TrackerTaskHistory).delete()
+    db_session.query(TrackerTask).delete()
+    finished = TrackerTask(tracker_id="m_1", key="CPO-1", last_changelog_id="c1")
+    unfinished = TrackerTask(tracker_id="m_2", key="CPO-2", last_changelog_id="c2")
+    db_session.add_all([finished, unfinished])
+    db_session.commit()
+
+    add_history(
+        db_session,
+        finished,
+        [
+            ("Открыт", datetime(2025, 1, 1), datetime(2025, 1, 3)),
+            ("Готова к разработке", datetime(2025, 1, 3), datetime(2025, 1, 5)),
+            ("МП / В работе", datetime(2025, 1, 5), datetime(2025, 1, 15)),
+            ("Done", datetime(2025, 1, 15), None),
+        ],
+    )
+    add_history(
+        db_session,
+        unfinished,
+        [
+            ("Открыт", datetime(2025, 1, 1), datetime(2025, 1, 3)),
+            ("МП / В работе", datetime(2025, 1, 3), None),
+        ],
+    )
+    db_session.commit()
+    return finished, unfinished
+
+
+class TestTaskMetricsStore:
+    """Tests for TaskMetricsStore."""
+
+    def test_refresh_stores_finished_tasks_only(self, db_session, tasks):
+        """Finished task gets a row with the same values as live calculation."""
+        finished, unfinished = tasks
+        store = TaskMetricsStore(db_session)
+
+        assert store.refresh([finished.id, unfinished.id]) == 1
+
+        row = db_session.query(TrackerTaskMetrics).one()
+        assert (row.task_id, row.history_version) == (finished.id, "c1")
+        assert row.config_version == store.config_version()
+        assert row.ttm == 14
+        assert row.stable_done_date == datetime(2025, 1, 15)
+        assert row.current_status == "Done"
+
+    def test_load_fresh_skips_stale_rows(self, db_session, tasks):
+        """Rows become stale when history version or config changes."""
+        finished, _ = tasks
+        store = TaskMetricsStore(db_session)
+        store.refresh([finished.id])
+
+        assert list(store.load_fresh([finished.id])) == [finished.id]
+
+        with patch.object(store, "config_version", return_value="other"):
+            assert store.load_fresh([finished.id]) == {}
+
+        finished.last_changelog_id = "c3"
+        db_session.commit()
+        assert store.load_fresh([finished.id]) == {}
+
+    def test_refresh_removes_rows_of_reopened_tasks(self, db_session, tasks):
+        """A task whose rewritten history has no done entries loses its row."""
+        finished, _ = tasks
+        store = TaskMetricsStore(db_session)
+        store.refresh([finished.id])
+
+        db_session.query(TrackerTaskHistory).filter(
+            TrackerTaskHistory.task_id == finished.id,
+            TrackerTaskHistory.status == "Done",
+        ).delete()
+        db_session.commit()
+        store.refresh([finished.id])
+
+        assert db_session.query(TrackerTaskMetrics).count() == 0
+
+
+class TestSyncRefreshesMetrics:
+    """Sync recomputes metrics only for tasks with rewritten history."""
+
+    def test_changed_tasks_are_refreshed_on_completion(self, db_session, tasks):
+        finished, _ = tasks
+        sync_cmd = TrackerSyncCommand(db=db_session)
+        task_obj = {
+            "id": "m_1",
+            "key": "CPO-1",
+            "status": {"display": "Done"},
+            "createdAt": "2025-01-01T00:00:00Z",
+        }
+        changelog = [
+            {
+                "id": "c9",
+                "updatedAt": "2025-01-20T00:00:00Z",
+                "fields": [
+                    {
+                        "field": {"id": "status"},
+                        "from": {"display": "Открыт"},
+                        "to": {"display": "Done"},
+                    }
+                ],
+            }
+        ]
+
+        with patch(
+            "radiator.commands.sync_tracker.tracker_service.get_changelogs_batch",
+            return_value=[("m_1", changelog)],
+        ):
+            sync_cmd.sync_task_history([task_obj], [("m_1", task_obj)])
+        assert sync_cmd.history_changed_task_ids == {finished.id}
+
+        with patch.object(TaskMetricsStore, "refresh") as refresh:
+            sync_cmd._refresh_task_metrics()
+
+        refresh.assert_called_once_with([finished.id])
+        assert sync_cmd.history_changed_task_ids == set()
+
+
+class TestReportUsesStoredMetrics:
+    """TTM details report reads fresh stored metrics instead of recomputing."""
+
+    def test_collect_csv_rows_uses_stored_row(self):
+        generator = TTMDetailsReportGenerator(db=Mock())
+        quarter = Quarter(
+            name="2025.Q1",
+            start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2025, 3, 31, tzinfo=timezone.utc),
+        )
+        task = TaskData(
+            id=1,
+            key="CPO-1",
+            group_value="Author",
+            author="Author",
+            team=None,
+            created_at=datetime(2025, 1, 1),
+            summary="Task",
+        )
+        done = Mock(start_date=datetime(2025, 1, 15, tzinfo=timezone.utc))
+        generator._load_quarters = Mock(return_value=[quarter])
+        generator._load_done_statuses = Mock(return_value=["Done"])
+        generator._get_ttm_tasks_for_date_range_corrected = Mock(return_value=[task])
+        generator._get_ready_tasks = Mock(return_value=[])
+        generator._get_unfinished_tasks = Mock(return_value=[])
+        generator.data_service.get_filtered_task_histories_batch = Mock(
+            return_value={1: []}
+        )
+        generator.metrics_service.find_stable_done_batch = Mock(return_value=[done])
+        generator.metrics_store.load_fresh = Mock(
+            return_value={
+                1: TrackerTaskMetrics(
+                    task_id=1,
+                    ttm=14,
+                    ttd_target_date=datetime(2025, 1, 3),
+                    current_status="Done",
+                )
+            }
+        )
+        generator.config_service.get_status_group = Mock(return_value="done")
+        generator._calculate_task_metrics = Mock()
+        generator._calculate_all_returns_batched = Mock(return_value={})
+        generator._format_task_row = Mock(side_effect=lambda *args: args)
+
+        rows = generator._collect_csv_rows()
+
+        generator.metrics_store.load_fresh.assert_called_once_with([1])
+        generator._calculate_task_metrics.assert_not_called()
+        task_arg, ttm, quarter_name, *_ = rows[0]
+        assert (task_arg, ttm, quarter_name) == (task, 14, "2025.Q1")
+        # ttd_quarter derived from stored TTD target date
+        assert rows[0][6] == "2025.Q1"
@@ -157,3 +157,27 @@ class TestTeamLeadMappingService:
             assert mapping["Гео и сервисы"] == "Саша Тихонов"
         finally:
             os.unlink(temp_file)
+
+    def test_map_teams_uses_cached_mapping(self):
+        """Test bulk lookup and reload after file change."""
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+            f.write("Авторизация;Лиза Купчинаус\n")
+            temp_file = f.name
+
+        try:
+            service = TeamLeadMappingService(temp_file)
+            with patch.object(
+                service, "load_team_lead_mapping", wraps=service.load_team_lead_mapping
+            ) as load:
+                leads = service.map_teams(["Авторизация", "Каталог"])
+                service.get_lead_by_team("Авторизация")
+
+            assert leads == ["Лиза Купчинаус", "Без команды"]
+            assert load.call_count == 1
+
+            with open(temp_file, "a", encoding="utf-8") as f:
+                f.write("Каталог;Марина Волкова\n")
+
+            assert service.get_lead_by_team("Каталог") == "Марина Волкова"
+        finally:
+            os.unlink(temp_file)
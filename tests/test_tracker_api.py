@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 import pytest
 import requests
 
-from radiator.services.tracker_service import TrackerAPIService
+from radiator.services.tracker_service import MAX_THROTTLE_RETRIES, TrackerAPIService
 
 
 class TestTrackerAPIServiceIntegration:
@@ -25,7 +25,6 @@ class TestTrackerAPIServiceIntegration:
             }
             service.base_url = "https://api.tracker.yandex.net/v2/"
             service.max_workers = 5
-            service.request_delay = 0.1
             return service
 
     def test_service_initialization(self, service):
@@ -34,7 +33,6 @@ class TestTrackerAPIServiceIntegration:
         assert service.headers["X-Org-ID"] == "test_org_456"
         assert service.base_url == "https://api.tracker.yandex.net/v2/"
         assert service.max_workers == 5
-        assert service.request_delay == 0.1
 
     def test_make_request_with_real_http_call(self, service):
         """Test making actual HTTP request (with mocked response)."""
@@ -44,7 +42,7 @@ class TestTrackerAPIServiceIntegration:
         mock_response.json.return_value = {"test": "data"}
 
         with patch(
-            "radiator.services.tracker_service.requests.request",
+            "radiator.services.tracker_service.requests.Session.request",
             return_value=mock_response,
         ) as mock_request:
             response = service._make_request("https://api.tracker.yandex.net/v2/issues")
@@ -95,7 +93,7 @@ class TestTrackerAPIServiceIntegration:
         ]
 
         with patch(
-            "radiator.services.tracker_service.requests.request",
+            "radiator.services.tracker_service.requests.Session.request",
             return_value=mock_response,
         ) as mock_request:
             result = service.search_tasks("Updated: >2024-01-01", limit=10)
@@ -136,7 +134,7 @@ class TestTrackerAPIServiceIntegration:
         }
 
         with patch(
-            "radiator.services.tracker_service.requests.request",
+            "radiator.services.tracker_service.requests.Session.request",
             return_value=mock_response,
         ) as mock_request:
             result = service.get_task("12345")
@@ -181,7 +179,7 @@ class TestTrackerAPIServiceIntegration:
         ]
 
         with patch(
-            "radiator.services.tracker_service.requests.request",
+            "radiator.services.tracker_service.requests.Session.request",
             return_value=mock_response,
         ) as mock_request:
             result = service.get_task_changelog("12345")
@@ -286,7 +284,7 @@ class TestTrackerAPIServiceIntegration:
         )
 
         with patch(
-            "radiator.services.tracker_service.requests.request",
+            "radiator.services.tracker_service.requests.Session.request",
             return_value=mock_error_response,
         ):
             with pytest.raises(requests.exceptions.HTTPError):
@@ -294,7 +292,7 @@ class TestTrackerAPIServiceIntegration:
 
         # Test connection error
         with patch(
-            "radiator.services.tracker_service.requests.request",
+            "radiator.services.tracker_service.requests.Session.request",
             side_effect=requests.exceptions.ConnectionError("Connection failed"),
         ):
             with pytest.raises(requests.exceptions.ConnectionError):
@@ -307,17 +305,57 @@ class TestTrackerAPIServiceIntegration:
         mock_response.json.return_value = [{"id": "12345"}]
 
         with patch(
-            "radiator.services.tracker_service.requests.request",
+            "radiator.services.tracker_service.requests.Session.request",
             return_value=mock_response,
-        ):
-            with patch("time.sleep") as mock_sleep:
+        ) as mock_request:
+            with patch.object(service.rate_limiter, "wait") as mock_wait:
                 service.search_tasks("test query")
                 service.search_tasks("another query")
 
-                # Verify sleep was called between requests
-                assert mock_sleep.call_count >= 1
-                # Verify sleep duration matches request_delay
-                assert mock_sleep.call_args[0][0] == service.request_delay
+                # Every request takes a token from the shared rate limiter
+                assert mock_wait.call_count == mock_request.call_count >= 2
+
+    def test_429_retried_after_retry_after(self, service):
+        """Test 429 slows the shared limiter down for Retry-After, then retries."""
+        throttled = Mock(status_code=429, ok=False, headers={"Retry-After": "2"})
+        success = Mock(status_code=200, ok=True, headers={})
+        rate = service.rate_limiter.rate
+
+        with patch(
+            "radiator.services.tracker_service.requests.Session.request",
+            side_effect=[throttled, success],
+        ):
+            with (
+                patch.object(service.rate_limiter, "wait"),
+                patch.object(service.rate_limiter, "_block_for") as block_for,
+                patch("time.sleep") as mock_sleep,
+            ):
+                response = service._make_request("https://api/issues/1")
+
+        assert response is success
+        block_for.assert_called_once_with(2.0)
+        # Halved by the 429, then increased by the successful retry
+        assert service.rate_limiter.rate == pytest.approx(
+            rate / 2 + service.rate_limiter.increase_step
+        )
+        mock_sleep.assert_not_called()
+
+    def test_429_raised_after_retries(self, service):
+        """Test HTTPError is raised when every retry is throttled."""
+        throttled = Mock(status_code=429, ok=False, headers={})
+        throttled.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=Mock(status_code=429, text="", headers={})
+        )
+
+        with patch(
+            "radiator.services.tracker_service.requests.Session.request",
+            return_value=throttled,
+        ) as mock_request:
+            with patch.object(service.rate_limiter, "wait"):
+                with pytest.raises(requests.exceptions.HTTPError):
+                    service._make_request("https://api/issues/1")
+
+        assert mock_request.call_count == MAX_THROTTLE_RETRIES + 1
 
     def test_parallel_processing_integration(self, service):
         """Test parallel processing with real task IDs."""
@@ -352,7 +390,7 @@ class TestTrackerAPIServiceIntegration:
         page2_response.json.return_value = [{"id": str(i)} for i in range(51, 101)]
 
         with patch(
-            "radiator.services.tracker_service.requests.request"
+            "radiator.services.tracker_service.requests.Session.request"
         ) as mock_request:
             mock_request.side_effect = [page1_response, page2_response]
 
@@ -438,7 +476,6 @@ class TestTrackerAPIServiceFieldsParameter:
             }
             service.base_url = "https://api.tracker.yandex.net/v2/"
             service.max_workers = 5
-            service.request_delay = 0.1
             return service
 
     def test_get_task_with_fields_parameter(self, service):
@@ -455,7 +492,7 @@ class TestTrackerAPIServiceFieldsParameter:
         }
 
         with patch(
-            "radiator.services.tracker_service.requests.request",
+            "radiator.services.tracker_service.requests.Session.request",
             return_value=mock_response,
         ) as mock_request:
             result = service.get_task(
@@ -494,7 +531,7 @@ class TestTrackerAPIServiceFieldsParameter:
         ]
 
         with patch(
-            "radiator.services.tracker_service.requests.request",
+            "radiator.services.tracker_service.requests.Session.request",
             return_value=mock_response,
         ) as mock_request:
             result = service.search_tasks_with_data(
@@ -531,7 +568,7 @@ class TestTrackerAPIServiceFieldsParameter:
         }
 
         with patch(
-            "radiator.services.tracker_service.requests.request",
+            "radiator.services.tracker_service.requests.Session.request",
             return_value=mock_response,
         ) as mock_request:
             result = service.get_task("12345")
@@ -558,7 +595,7 @@ class TestTrackerAPIServiceFieldsParameter:
         ]
 
         with patch(
-            "radiator.services.tracker_service.requests.request",
+            "radiator.services.tracker_service.requests.Session.request",
             return_value=mock_response,
         ) as mock_request:
             result = service.search_tasks_with_data(query="Status: Open", limit=10)
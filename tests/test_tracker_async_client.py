@@ -0,0 +1,289 @@
+"""Tests for asyncio Tracker client and adaptive rate limiter."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from radiator.services.tracker_async_client import (
+    AdaptiveRateLimiter,
+    AsyncTrackerClient,
+    parse_next_page_id,
+    parse_retry_after,
+)
+from radiator.services.tracker_service import TrackerAPIService
+
+BASE_URL = "https://api.tracker.yandex.net/v3/"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_client(handler, **kwargs):
+    """Create client backed by httpx.MockTransport."""
+    return AsyncTrackerClient(
+        headers={"Authorization": "OAuth test"},
+        base_url=BASE_URL,
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for AdaptiveRateLimiter token bucket."""
+
+    def test_throttle_halves_rate_and_blocks_for_retry_after(self):
+        """429 halves the rate and pauses the bucket for Retry-After seconds."""
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(rate=10, burst=5, clock=clock)
+
+        limiter.on_throttle(retry_after=3)
+
+        assert limiter.rate == 5
+        assert limiter._reserve() == pytest.approx(3)
+        clock.now = 3.0
+        assert limiter._reserve() == 0.0
+
+    def test_success_increases_rate_up_to_max(self):
+        """Successful responses increase the rate but not above max_rate."""
+        limiter = AdaptiveRateLimiter(rate=9, max_rate=10, increase_step=0.6)
+
+        limiter.on_success()
+        assert limiter.rate == pytest.approx(9.6)
+        limiter.on_success()
+        assert limiter.rate == 10
+
+    def test_rate_headers_cap_rate(self):
+        """X-RateLimit headers cap the rate to remaining quota per second."""
+        limiter = AdaptiveRateLimiter(rate=20, max_rate=50)
+
+        limiter.on_success({"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "5"})
+
+        assert limiter.rate == pytest.approx(2)
+
+    def test_bucket_refills_with_time(self):
+        """Tokens are consumed per request and refilled at current rate."""
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(rate=2, burst=2, clock=clock)
+
+        assert limiter._reserve() == 0.0
+        assert limiter._reserve() == 0.0
+        assert limiter._reserve() == pytest.approx(0.5)
+        clock.now = 0.5
+        assert limiter._reserve() == 0.0
+
+    def test_shared_between_threads_with_own_loops(self):
+        """Threads with separate event loops never take the same token twice."""
+        limiter = AdaptiveRateLimiter(
+            rate=0.5, min_rate=0.5, burst=40, clock=FakeClock()
+        )
+
+        def reserve_all():
+            async def run():
+                return [limiter._reserve() for _ in range(20)]
+
+            return asyncio.run(run())
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: reserve_all(), range(4)))
+
+        assert sum(delay == 0.0 for delays in results for delay in delays) == 40
+
+    def test_acquire_from_several_threads(self):
+        """Each thread's loop gets its own waiters lock."""
+        limiter = AdaptiveRateLimiter(rate=50, max_rate=50, burst=50)
+
+        def acquire_many():
+            async def run():
+                await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+
+            asyncio.run(run())
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: acquire_many(), range(8)))
+
+
+class TestParsingHelpers:
+    """Tests for header parsing helpers."""
+
+    def test_parse_retry_after_seconds(self):
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("garbage") is None
+
+    def test_parse_retry_after_http_date_in_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_parse_next_page_id(self):
+        link = '<https://api/v3/issues/X/changelog?id=abc&perPage=50>; rel="next"'
+        assert parse_next_page_id(link) == "abc"
+        assert parse_next_page_id('<https://api?id=abc>; rel="first"') is None
+
+
+class TestAsyncTrackerClient:
+    """Tests for AsyncTrackerClient request handling."""
+
+    def test_retries_429_and_slows_down(self):
+        """429 is retried after Retry-After and lowers limiter rate."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"id": "1", "key": "CPO-1"})
+
+        limiter = AdaptiveRateLimiter(rate=10, burst=10, increase_step=0)
+
+        async def run():
+            async with make_client(handler, limiter=limiter) as client:
+                return await client.get_task("1"), client.throttled_count
+
+        task, throttled = asyncio.run(run())
+
+        assert task["key"] == "CPO-1"
+        assert len(calls) == 2
+        assert throttled == 1
+        assert limiter.rate == 5
+        assert calls[0].headers["Authorization"] == "OAuth test"
+
+    def test_changelog_follows_link_pagination(self):
+        """Changelog pages are followed via Link header id."""
+
+        def handler(request):
+            if request.url.params.get("id") == "page2":
+                return httpx.Response(200, json=[{"id": "c2"}])
+            return httpx.Response(
+                200,
+                json=[{"id": "c1"}],
+                headers={"Link": '<https://x/changelog?id=page2>; rel="next"'},
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.get_task_changelog("T1")
+
+        assert [e["id"] for e in asyncio.run(run())] == ["c1", "c2"]
+
+    def test_changelogs_batch_preserves_order_and_isolates_errors(self):
+        """Batch keeps input order and returns empty changelog for failed tasks."""
+
+        def handler(request):
+            if "/issues/bad/" in request.url.path:
+                return httpx.Response(404)
+            task_id = request.url.path.split("/")[-2]
+            return httpx.Response(200, json=[{"id": f"{task_id}-1"}])
+
+        async def run():
+            async with make_client(handler, max_connections=3) as client:
+                return await client.get_changelogs_batch(["a", "bad", "c"])
+
+        result = asyncio.run(run())
+
+        assert result == [("a", [{"id": "a-1"}]), ("bad", []), ("c", [{"id": "c-1"}])]
+
+
+class TestTrackerAPIServiceAsyncMode:
+    """Tests for TrackerAPIService batch methods in async mode."""
+
+    def test_get_changelogs_batch_uses_async_client(self):
+        """With use_async_client batch calls go through AsyncTrackerClient."""
+        service = TrackerAPIService()
+        service.use_async_client = True
+        service.base_url = BASE_URL
+
+        def handler(request):
+            return httpx.Response(200, json=[{"id": "c1"}])
+
+        original = service._create_async_client
+
+        def create_client():
+            client = original()
+            client._transport = httpx.MockTransport(handler)
+            return client
+
+        with patch.object(service, "_create_async_client", side_effect=create_client):
+            with patch(
+                "radiator.services.tracker_service.requests.Session.request"
+            ) as sync:
+                result = service.get_changelogs_batch(["t1", "t2"])
+
+        sync.assert_not_called()
+        assert result == [("t1", [{"id": "c1"}]), ("t2", [{"id": "c1"}])]
+
+    def test_rate_limiter_shared_between_batches(self):
+        """Limiter keeps working across separate event loops."""
+        service = TrackerAPIService()
+        service.use_async_client = True
+        service.base_url = BASE_URL
+        service.rate_limiter.burst = 1
+        service.rate_limiter.rate = service.rate_limiter.max_rate
+
+        original = service._create_async_client
+
+        def create_client():
+            client = original()
+            client._transport = httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"id": "1"})
+            )
+            return client
+
+        with patch.object(service, "_create_async_client", side_effect=create_client):
+            first = service.get_tasks_batch(["1", "2"])
+            second = service.get_tasks_batch(["3", "4"])
+
+        assert [task_id for task_id, _ in first + second] == ["1", "2", "3", "4"]
+
+    def test_async_client_kept_per_thread(self):
+        """Batches of one thread reuse its client, other threads get their own."""
+        service = TrackerAPIService()
+        service.use_async_client = True
+        service.base_url = BASE_URL
+        original = service._create_async_client
+
+        def create_client():
+            client = original()
+            client._transport = httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"id": "1"})
+            )
+            return client
+
+        with patch.object(
+            service, "_create_async_client", side_effect=create_client
+        ) as create:
+            service.get_tasks_batch(["1"])
+            service.get_tasks_batch(["2"])
+            assert create.call_count == 1
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(service.get_tasks_batch, ["3"]).result()
+            assert create.call_count == 2
+
+            service.close_connections()
+            service.get_tasks_batch(["4"])
+            assert create.call_count == 3
+        service.close_connections()
+
+
+class TestTrackerAPIServiceSessions:
+    """Tests for keep-alive sessions of synchronous requests."""
+
+    def test_session_kept_per_thread(self):
+        service = TrackerAPIService()
+
+        session = service._http_session()
+        assert service._http_session() is session
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(service._http_session).result() is not session
+
+        service.close_connections()
+        assert service._http_session() is not session
@@ -0,0 +1,288 @@
+"""Tests for the persistent cache of Tracker API responses."""
+
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from radiator.commands.sync_tracker import TrackerSyncCommand
+from radiator.models.tracker import TrackerTask, TrackerTaskHistory
+from radiator.services import tracker_async_client
+from radiator.services.tracker_response_cache import (
+    OfflineCacheMiss,
+    TrackerResponseCache,
+)
+from radiator.services.tracker_service import TrackerAPIService
+
+V1 = "2024-01-01T10:00:00.000+0000"
+V2 = "2024-02-01T10:00:00.000+0000"
+
+CHANGELOG = [{"id": f"c{i}", "fields": [{"field": {"id": "status"}}]} for i in range(5)]
+
+
+def api_task(task_id="t1", updated_at=V1):
+    return {"id": task_id, "key": f"TEST-{task_id}", "updatedAt": updated_at}
+
+
+def json_response(data, headers=None):
+    response = Mock()
+    response.json.return_value = data
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TrackerResponseCache(tmp_path / "cache.sqlite3")
+    yield cache
+    cache.close()
+
+
+class TestTrackerResponseCache:
+    def test_entries_served_only_for_current_version(self, cache):
+        cache.put_task("t1", api_task())
+        cache.put_changelog("t1", CHANGELOG)
+
+        assert cache.get_task("t1") == api_task()
+        assert cache.get_changelog("t1") == CHANGELOG
+
+        cache.note_versions([api_task(updated_at=V2)])
+
+        assert cache.get_task("t1") is None
+        assert cache.get_changelog("t1") is None
+
+    def test_issue_not_seen_in_search_is_not_served(self, tmp_path, cache):
+        cache.put_changelog("t1", CHANGELOG)
+
+        reopened = TrackerResponseCache(tmp_path / "cache.sqlite3")
+        assert reopened.get_changelog("t1") is None
+        reopened.note_versions([api_task()])
+        assert reopened.get_changelog("t1") is None
+
+        cache.note_versions([api_task()])
+        cache.put_changelog("t1", CHANGELOG)
+        reopened.note_versions([api_task()])
+        assert reopened.get_changelog("t1") == CHANGELOG
+        reopened.close()
+
+    def test_task_key_includes_request_params(self, cache):
+        cache.put_task("t1", api_task(), expand=["links"], fields=["id"])
+
+        assert cache.get_task("t1", expand=["links"], fields=["id"]) == api_task()
+        assert cache.get_task("t1") is None
+
+    def test_incremental_changelog_tail(self, cache):
+        cache.note_versions([api_task()])
+        cache.put_changelog("t1", CHANGELOG)
+
+        assert cache.get_changelog("t1", after_id="c2") == CHANGELOG[3:]
+        assert cache.get_changelog("t1", after_id="c4") == []
+        assert cache.get_changelog("t1", after_id="unknown") is None
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = TrackerResponseCache(tmp_path / "cache.sqlite3", offline=True)
+        cache.put_changelog("t1", CHANGELOG)
+        cache.max_bytes = cache.total_size * 2.5
+
+        cache.put_changelog("t2", CHANGELOG)
+        cache.get_changelog("t1")
+        cache.put_changelog("t3", CHANGELOG)
+
+        assert cache.total_size <= cache.max_bytes
+        assert cache.get_changelog("t2") is None
+        assert cache.get_changelog("t1") == CHANGELOG
+        assert cache.get_changelog("t3") == CHANGELOG
+        assert cache.stats["evictions"] == 1
+        cache.close()
+
+    def test_search_replay(self, cache):
+        key = cache.search_key("Queue: TEST", 100)
+        pages = [[api_task("t1")], [api_task("t2")]]
+
+        assert cache.iter_search_pages(key) is None
+        for number, page in enumerate(pages):
+            cache.put_search_page(key, number, page)
+        assert cache.iter_search_pages(key) is None
+
+        cache.finish_search(key, len(pages))
+        assert list(cache.iter_search_pages(key)) == pages
+
+        cache.put_search_page(key, 0, pages[0])
+        cache.finish_search(key, 1)
+        assert list(cache.iter_search_pages(key)) == pages[:1]
+
+
+class TestServiceWithCache:
+    @pytest.fixture
+    def service(self, tmp_path):
+        service = TrackerAPIService()
+        service.enable_response_cache(tmp_path / "cache.sqlite3")
+        yield service
+        service.response_cache.close()
+
+    def test_unchanged_issue_is_not_fetched_again(self, service):
+        service._extract_tasks_from_response([api_task()])
+
+        with patch.object(
+            service, "_make_request", return_value=json_response(CHANGELOG)
+        ) as request:
+            assert service.get_task_changelog("t1") == CHANGELOG
+            assert service.get_task_changelog("t1") == CHANGELOG
+            assert service.get_changelog_from_id("t1", "c3") == CHANGELOG[4:]
+
+        request.assert_called_once()
+
+    def test_updated_issue_is_fetched_again(self, service):
+        service._extract_tasks_from_response([api_task()])
+        with patch.object(
+            service, "_make_request", return_value=json_response(api_task())
+        ):
+            service.get_task("t1")
+
+        service._extract_tasks_from_response([api_task(updated_at=V2)])
+        with patch.object(
+            service,
+            "_make_request",
+            return_value=json_response(api_task(updated_at=V2)),
+        ) as request:
+            assert service.get_task("t1")["updatedAt"] == V2
+
+        request.assert_called_once()
+
+    def test_failed_changelog_is_not_cached(self, service):
+        service._extract_tasks_from_response([api_task()])
+
+        with patch.object(service, "_make_request", side_effect=Exception("502")):
+            assert service.get_task_changelog("t1") == []
+
+        assert service.response_cache.get_changelog("t1") is None
+
+    def test_offline_replays_recorded_sync(self, service):
+        with patch.object(
+            service,
+            "_make_request",
+            side_effect=[
+                json_response([api_task("t1"), api_task("t2")], {"X-Total-Pages": "1"}),
+                json_response(CHANGELOG),
+            ],
+        ):
+            recorded = service.search_tasks_with_data("Queue: TEST", limit=10)
+            service.get_task_changelog("t1")
+        assert [task["id"] for task in recorded] == ["t1", "t2"]
+
+        service.offline = service.response_cache.offline = True
+        with patch(
+            "radiator.services.tracker_service.requests.Session.request"
+        ) as request:
+            assert service.search_tasks_with_data("Queue: TEST", limit=10) == recorded
+            assert service.get_task_changelog("t1") == CHANGELOG
+            assert service.get_task_changelog("t2") is None
+            with pytest.raises(OfflineCacheMiss):
+                list(service.iter_search_pages("Queue: OTHER", limit=10))
+
+        request.assert_not_called()
+
+    def test_async_batch_fetches_only_misses(self, service):
+        service.use_async_client = True
+        service._extract_tasks_from_response([api_task("t1"), api_task("t2")])
+        service.response_cache.put_changelog("t1", CHANGELOG)
+
+        with patch.object(
+            service, "_run_async_batch", return_value=[("t2", (CHANGELOG[:2], True))]
+        ) as batch:
+            result = service.get_changelogs_batch(["t1", "t2"])
+
+        assert result == [("t1", CHANGELOG), ("t2", CHANGELOG[:2])]
+        batch.assert_called_once_with("get_changelogs_batch_checked", ["t2"], {})
+        assert service.response_cache.get_changelog("t2") == CHANGELOG[:2]
+
+    def async_changelogs(self, service, handler, task_ids):
+        """Run get_changelogs_batch through AsyncTrackerClient with a mock transport."""
+        service.use_async_client = True
+        service.base_url = "https://api.tracker.yandex.net/v3/"
+        original = service._create_async_client
+
+        def create_client():
+            client = original()
+            client._transport = httpx.MockTransport(handler)
+            return client
+
+        with patch.object(service, "_create_async_client", side_effect=create_client):
+            try:
+                return service.get_changelogs_batch(task_ids)
+            finally:
+                service.close_connections()
+
+    def test_async_failed_changelog_is_not_cached(self, service):
+        service._extract_tasks_from_response([api_task("t1"), api_task("t2")])
+
+        def handler(request):
+            if "/issues/t2/" in request.url.path:
+                return httpx.Response(404)
+            return httpx.Response(200, json=CHANGELOG)
+
+        result = self.async_changelogs(service, handler, ["t1", "t2"])
+
+        assert result == [("t1", CHANGELOG), ("t2", [])]
+        assert service.response_cache.get_changelog("t1") == CHANGELOG
+        assert service.response_cache.get_changelog("t2") is None
+
+    def test_async_truncated_changelog_is_not_cached(self, service):
+        service._extract_tasks_from_response([api_task("t1")])
+
+        def handler(request):
+            page = int(request.url.params.get("id", "0"))
+            return httpx.Response(
+                200,
+                json=[CHANGELOG[page]],
+                headers={"Link": f'<https://x/changelog?id={page + 1}>; rel="next"'},
+            )
+
+        with patch.object(tracker_async_client, "MAX_CHANGELOG_PAGES", 2):
+            result = self.async_changelogs(service, handler, ["t1"])
+
+        assert result == [("t1", CHANGELOG[:2])]
+        assert service.response_cache.get_changelog("t1") is None
+
+    def test_offline_miss_keeps_stored_history(self, service, db_session):
+        task = {
+            **api_task("offline_1"),
+            "status": {"display": "Done"},
+            "createdAt": "2023-12-01T10:00:00.000+0000",
+        }
+        changelog = [
+            {
+                "id": "offline_1_log",
+                "updatedAt": V1,
+                "fields": [
+                    {
+                        "field": {"id": "status"},
+                        "from": {"display": "Open"},
+                        "to": {"display": "Done"},
+                    }
+                ],
+            }
+        ]
+        db_session.query(TrackerTaskHistory).delete()
+        db_session.query(TrackerTask).delete()
+        db_session.commit()
+        sync_cmd = TrackerSyncCommand(db=db_session)
+        sync_cmd.sync_tasks([task])
+        sync_cmd._persist_task_histories(
+            [("offline_1", changelog)], {"offline_1": task}
+        )
+        stored = db_session.query(TrackerTaskHistory).count()
+        assert stored > 1
+
+        service.offline = service.response_cache.offline = True
+        changelogs_data = service.get_changelogs_batch(["offline_1"])
+        service.use_async_client = True
+        assert service.get_changelogs_batch(["offline_1"]) == changelogs_data
+        assert changelogs_data == [("offline_1", None)]
+
+        _, _, api_errors = sync_cmd._persist_task_histories(
+            changelogs_data, {"offline_1": task}
+        )
+
+        assert api_errors == 1
+        assert db_session.query(TrackerTaskHistory).count() == stored
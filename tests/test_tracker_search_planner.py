@@ -0,0 +1,169 @@
+"""Tests for query-sharded parallel Tracker search."""
+
+import re
+from datetime import date, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from radiator.core.config import settings
+from radiator.services.tracker_search_planner import (
+    SearchShard,
+    SearchShardPlanner,
+    deduplicate_by_key,
+)
+from radiator.services.tracker_service import TrackerAPIService
+
+START = date(2024, 1, 1)
+END = date(2024, 3, 1)
+
+
+def make_tasks(count, first_day=START):
+    """Tasks created one per day in a loop over January-February."""
+    days = (END - first_day).days
+    return [
+        {"id": f"id{i}", "key": f"TEST-{i}", "created": first_day + timedelta(i % days)}
+        for i in range(count)
+    ]
+
+
+def matching(tasks, query):
+    """Filter tasks by Created bounds of a shard query."""
+    start = re.search(r"Created: >= (\S+)", query)
+    end = re.search(r"Created: < (\S+)", query)
+    return [
+        task
+        for task in tasks
+        if (not start or task["created"] >= date.fromisoformat(start.group(1)))
+        and (not end or task["created"] < date.fromisoformat(end.group(1)))
+    ]
+
+
+def fake_search(tasks, always=()):
+    """Fake _make_request answering v2 search and count probes."""
+
+    def request(url, method="GET", json=None, params=None):
+        found = matching(tasks, json["query"]) + list(always)
+        per_page, page = params["perPage"], params["page"]
+        response = Mock()
+        response.json.return_value = [
+            {"id": task["id"], "key": task["key"]}
+            for task in found[(page - 1) * per_page : page * per_page]
+        ]
+        response.headers = {
+            "X-Total-Count": str(min(len(found), 10000)),
+            "X-Total-Pages": str(max(1, -(-len(found) // per_page))),
+        }
+        return response
+
+    return request
+
+
+class TestSearchShardPlanner:
+    def test_small_query_is_single_unbounded_shard(self):
+        planner = SearchShardPlanner(lambda query: 10, shard_size=100)
+
+        assert planner.plan("Queue: TEST") == [SearchShard(None, None, 10)]
+        assert SearchShard(None, None).query("Queue: TEST") == "Queue: TEST"
+
+    def test_splits_until_shards_fit(self):
+        tasks = make_tasks(600)
+        queries = []
+
+        def count(query):
+            queries.append(query)
+            return len(matching(tasks, query))
+
+        planner = SearchShardPlanner(count, shard_size=100, start=START, end=END)
+        shards = planner.plan("Queue: TEST")
+
+        assert all(shard.count <= 100 for shard in shards)
+        assert sum(shard.count for shard in shards) == 600
+        for previous, shard in zip(shards, shards[1:]):
+            assert previous.end == shard.start
+        assert shards[0].query("Queue: TEST") == (
+            f"(Queue: TEST) AND Created: >= {shards[0].start} "
+            f"AND Created: < {shards[0].end}"
+        )
+        # Пустые открытые диапазоны до START и после END не попадают в план
+        assert "Created: < 2024-01-01" in queries[1]
+        assert shards[0].start == START and shards[-1].end == END
+
+    def test_single_day_over_limit_stays_one_shard(self):
+        tasks = make_tasks(50, first_day=END - timedelta(days=1))
+        planner = SearchShardPlanner(
+            lambda query: len(matching(tasks, query)),
+            shard_size=10,
+            start=START,
+            end=END,
+        )
+
+        shards = planner.plan("Queue: TEST")
+
+        assert [(shard.start, shard.count) for shard in shards] == [
+            (END - timedelta(days=1), 50)
+        ]
+
+    def test_rejects_unknown_field(self):
+        with pytest.raises(ValueError):
+            SearchShardPlanner(lambda query: 0, field="Deadline")
+
+
+def test_deduplicate_by_key_keeps_last_occurrence():
+    tasks = [{"id": "1", "v": 1}, {"id": "2"}, {"id": "1", "v": 2}, {"key": "X"}]
+
+    unique = deduplicate_by_key(tasks)
+
+    assert list(unique) == ["1", "2"]
+    assert unique["1"]["v"] == 2
+
+
+class TestShardedSearch:
+    @pytest.fixture
+    def service(self):
+        service = TrackerAPIService()
+        service.search_shards = 3
+        with (
+            patch.object(settings, "TRACKER_SEARCH_SHARD_SIZE", 40),
+            patch.object(settings, "API_PAGE_SIZE", 25),
+        ):
+            yield service
+
+    def test_search_tasks_with_data_merges_shards(self, service):
+        tasks = make_tasks(300)
+        duplicate = {"id": "dup", "key": "TEST-DUP", "created": START}
+        progress = []
+
+        with patch.object(
+            service, "_make_request", side_effect=fake_search(tasks, [duplicate])
+        ):
+            result = service.search_tasks_with_data(
+                "Queue: TEST", progress_callback=progress.append
+            )
+
+        ids = [task["id"] for task in result]
+        assert sorted(ids) == sorted([task["id"] for task in tasks] + ["dup"])
+        assert len(progress) > 1 and progress[-1] == len(result)
+
+    def test_single_shard_skips_date_filters(self, service):
+        tasks = make_tasks(30)
+
+        with patch.object(
+            service, "_make_request", side_effect=fake_search(tasks)
+        ) as request:
+            pages = list(service.iter_search_pages("Queue: TEST"))
+
+        assert [len(page) for page in pages] == [30]
+        queries = {call.kwargs["json"]["query"] for call in request.call_args_list}
+        assert queries == {"Queue: TEST"}
+
+    def test_limited_search_does_not_shard(self, service):
+        tasks = make_tasks(300)
+
+        with patch.object(
+            service, "_make_request", side_effect=fake_search(tasks)
+        ), patch.object(service, "plan_search_shards") as plan:
+            result = service.search_tasks_with_data("Queue: TEST", limit=50)
+
+        assert len(result) == 50
+        plan.assert_not_called()
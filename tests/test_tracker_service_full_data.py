@@ -27,7 +27,6 @@ class TestTrackerAPIServiceFullDataSupport:
             }
             service.base_url = "https://api.tracker.yandex.net/v2/"
             service.max_workers = 5
-            service.request_delay = 0.1
             return service
 
     def test_extract_task_data_includes_customer_field(self, service):
@@ -23,7 +23,6 @@ class TestTrackerAPIServiceJSONBExtraction:
             }
             service.base_url = "https://api.tracker.yandex.net/v2/"
             service.max_workers = 5
-            service.request_delay = 0.1
             return service
 
     def test_extract_field_from_full_data_success(self, service):
@@ -46,8 +46,8 @@ class TestTTMDetailsColumns:
         # Create generator
         generator = TTMDetailsReportGenerator(db=mock_db)
 
-        # Mock _collect_csv_rows to return empty list (we only need headers)
-        generator._collect_csv_rows = Mock(return_value=[])
+        # Mock _iter_csv_rows to return empty list (we only need headers)
+        generator._iter_csv_rows = Mock(return_value=[])
 
         # Generate CSV to get column structure
         csv_path = tmp_path / "test.csv"
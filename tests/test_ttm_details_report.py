@@ -9,6 +9,24 @@ import pytest
 from radiator.commands.generate_ttm_details_report import TTMDetailsReportGenerator
 
 
+def mock_histories_batch(get_history):
+    """Mock DataService.get_filtered_task_histories_batch from per-task histories."""
+    return Mock(
+        side_effect=lambda task_ids, as_of_date=None: {
+            task_id: get_history(task_id) for task_id in task_ids
+        }
+    )
+
+
+def mock_stable_done_batch(find_stable_done):
+    """Mock MetricsService.find_stable_done_batch from per-task stable done lookup."""
+    return Mock(
+        side_effect=lambda histories, done_statuses: [
+            find_stable_done(history, done_statuses) for history in histories
+        ]
+    )
+
+
 class TestTTMDetailsReport:
     """Test cases for TTM Details Report generator."""
 
@@ -25,6 +43,10 @@ class TestTTMDetailsReport:
 
         # Create generator
         generator = TTMDetailsReportGenerator(db=mock_db)
+        # No tasks in the period (stream errors are raised, not swallowed)
+        generator.data_service.iter_tasks_for_period = Mock(
+            side_effect=lambda *args, **kwargs: iter([])
+        )
 
         # Generate CSV
         output_path = f"{test_reports_dir}/ttm_details.csv"
@@ -355,8 +377,8 @@ class TestTTMDetailsReport:
                 end_date=None,
             )
         ]
-        generator.data_service.get_task_history = Mock(
-            return_value=mock_history_with_done
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            lambda task_id: mock_history_with_done
         )
 
         # Mock all calculation methods
@@ -374,7 +396,7 @@ class TestTTMDetailsReport:
         generator._get_last_discovery_backlog_exit_date = Mock(
             side_effect=[datetime(2025, 1, 10), datetime(2025, 1, 15), None]
         )
-        # Mock metrics_service._find_stable_done
+        # Mock metrics_service.find_stable_done_batch
         from radiator.commands.models.time_to_market_models import StatusHistoryEntry
 
         mock_stable_done_1 = StatusHistoryEntry(
@@ -395,8 +417,10 @@ class TestTTMDetailsReport:
             start_date=datetime(2025, 5, 1),  # In Q2
             end_date=None,
         )
-        generator.metrics_service._find_stable_done = Mock(
-            side_effect=[mock_stable_done_1, mock_stable_done_2, mock_stable_done_3]
+        generator.metrics_service.find_stable_done_batch = mock_stable_done_batch(
+            Mock(
+                side_effect=[mock_stable_done_1, mock_stable_done_2, mock_stable_done_3]
+            )
         )
 
         # Mock returns calculation
@@ -506,7 +530,7 @@ class TestTTMDetailsReport:
                 "Завершено": "",
             },
         ]
-        generator._collect_csv_rows = Mock(return_value=mock_rows)
+        generator._iter_csv_rows = Mock(return_value=mock_rows)
 
         # Test writing CSV
         output_path = f"{test_reports_dir}/ttm_details_with_data.csv"
@@ -570,8 +594,8 @@ class TestTTMDetailsReport:
             assert row2[0] == "CPO-456"
             assert row2[6] == "20"  # TTM
 
-        # Verify _collect_csv_rows was called
-        generator._collect_csv_rows.assert_called_once()
+        # Verify _iter_csv_rows was called
+        generator._iter_csv_rows.assert_called_once()
 
     def test_integration_with_real_db(self, test_reports_dir, db_session):
         """Test integration with real test database."""
@@ -691,7 +715,7 @@ class TestTTMDetailsReport:
                 "Квартал TTD": "",
             }
         ]
-        generator._collect_csv_rows = Mock(return_value=mock_rows)
+        generator._iter_csv_rows = Mock(return_value=mock_rows)
 
         # Test generating CSV
         output_path = f"{test_reports_dir}/ttm_details_with_tail.csv"
@@ -789,7 +813,7 @@ class TestTTMDetailsReport:
                 "Квартал TTD": "",
             }
         ]
-        generator._collect_csv_rows = Mock(return_value=mock_rows)
+        generator._iter_csv_rows = Mock(return_value=mock_rows)
 
         # Test generating CSV
         output_path = f"{test_reports_dir}/ttm_details_with_devlt.csv"
@@ -1269,8 +1293,8 @@ class TestTTMDetailsReport:
                 end_date=None,
             )
         ]
-        generator.data_service.get_task_history = Mock(
-            return_value=mock_history_with_done
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            lambda task_id: mock_history_with_done
         )
 
         # Mock all calculation methods
@@ -1655,7 +1679,7 @@ class TestTTMDetailsReport:
         generator = TTMDetailsReportGenerator(db=mock_db)
 
         # Mock the methods to return empty data
-        generator._collect_csv_rows = Mock(return_value=[])
+        generator._iter_csv_rows = Mock(return_value=[])
         generator._load_quarters = Mock(return_value=[])
         generator._load_done_statuses = Mock(return_value=[])
 
@@ -1842,8 +1866,8 @@ class TestTTMDetailsReport:
                 end_date=None,
             )
         ]
-        generator.data_service.get_task_history = Mock(
-            return_value=mock_history_with_done
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            lambda task_id: mock_history_with_done
         )
 
         # Mock all calculation methods
@@ -1926,7 +1950,7 @@ class TestTTMDetailsReport:
         generator = TTMDetailsReportGenerator(db=mock_db)
 
         # Mock the methods to return empty data
-        generator._collect_csv_rows = Mock(return_value=[])
+        generator._iter_csv_rows = Mock(return_value=[])
         generator._load_quarters = Mock(return_value=[])
         generator._load_done_statuses = Mock(return_value=[])
 
@@ -2068,7 +2092,9 @@ class TestTTMDetailsReport:
         generator._determine_quarter_for_ttm = Mock(return_value="2025.Q1")
 
         # Mock data service
-        generator.data_service.get_task_history = Mock(return_value=[])
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            lambda task_id: []
+        )
 
         # Mock all calculation methods
         generator._calculate_ttm = Mock(side_effect=[15, 20])
@@ -2098,8 +2124,8 @@ class TestTTMDetailsReport:
                 end_date=None,
             )
         ]
-        generator.data_service.get_task_history = Mock(
-            return_value=mock_history_with_done
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            lambda task_id: mock_history_with_done
         )
         generator._calculate_ttm = Mock(side_effect=[15, 20])
         generator._calculate_tail = Mock(side_effect=[5, None])
@@ -2107,8 +2133,23 @@ class TestTTMDetailsReport:
         generator._calculate_ttd = Mock(side_effect=[12, None])
         generator._get_ttd_target_date = Mock(side_effect=[datetime(2025, 1, 5), None])
         generator._determine_quarter_for_date = Mock(side_effect=["2025.Q1", None])
-        generator._calculate_pause = Mock(side_effect=[3, 7])  # Mock pause
-        generator._calculate_ttd_pause = Mock(side_effect=[2, None])  # Mock TTD pause
+        # Mock pause and TTD pause, calculated for the whole chunk at once
+        generator._calculate_history_metrics_batch = Mock(
+            return_value=[
+                {
+                    "pause": 3,
+                    "ttd_pause": 2,
+                    "discovery_backlog_days": None,
+                    "ready_for_dev_days": None,
+                },
+                {
+                    "pause": 7,
+                    "ttd_pause": None,
+                    "discovery_backlog_days": None,
+                    "ready_for_dev_days": None,
+                },
+            ]
+        )
 
         # Test collecting rows
         rows = generator._collect_csv_rows()
@@ -2123,9 +2164,8 @@ class TestTTMDetailsReport:
         assert row2["Пауза"] == 7
         assert row2["TTD Pause"] == ""
 
-        # Verify pause methods were called
-        assert generator._calculate_pause.call_count == 2
-        assert generator._calculate_ttd_pause.call_count == 2
+        # Verify pause metrics were calculated in one batch
+        generator._calculate_history_metrics_batch.assert_called_once()
 
     def test_format_task_row_with_pause_none(self, test_reports_dir):
         """Test formatting task row with pause None values."""
@@ -2184,7 +2224,7 @@ class TestTTMDetailsReport:
         output_path = f"{test_reports_dir}/test_status_duration.csv"
 
         # Mock empty data to get just headers
-        generator._collect_csv_rows = Mock(return_value=[])
+        generator._iter_csv_rows = Mock(return_value=[])
 
         generator.generate_csv(output_path)
 
@@ -2355,7 +2395,9 @@ class TestTTMDetailsReport:
         generator._determine_quarter_for_ttm = Mock(return_value="2025.Q1")
 
         # Mock data service
-        generator.data_service.get_task_history = Mock(return_value=[])
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            lambda task_id: []
+        )
 
         # Mock all calculation methods
         generator._calculate_ttm = Mock(side_effect=[15, 20])
@@ -2385,8 +2427,8 @@ class TestTTMDetailsReport:
                 end_date=None,
             )
         ]
-        generator.data_service.get_task_history = Mock(
-            return_value=mock_history_with_done
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            lambda task_id: mock_history_with_done
         )
         generator._calculate_ttm = Mock(side_effect=[15, 20])
         generator._calculate_tail = Mock(side_effect=[5, None])
@@ -2394,14 +2436,23 @@ class TestTTMDetailsReport:
         generator._calculate_ttd = Mock(side_effect=[12, None])
         generator._get_ttd_target_date = Mock(side_effect=[datetime(2025, 1, 5), None])
         generator._determine_quarter_for_date = Mock(side_effect=["2025.Q1", None])
-        generator._calculate_pause = Mock(side_effect=[3, 7])  # Mock pause
-        generator._calculate_ttd_pause = Mock(side_effect=[2, None])  # Mock TTD pause
-        generator._calculate_discovery_backlog_days = Mock(
-            side_effect=[4, None]
-        )  # Mock Discovery backlog
-        generator._calculate_ready_for_dev_days = Mock(
-            side_effect=[6, None]
-        )  # Mock Готова к разработке
+        # Mock pause and status durations, calculated for the whole chunk at once
+        generator._calculate_history_metrics_batch = Mock(
+            return_value=[
+                {
+                    "pause": 3,
+                    "ttd_pause": 2,
+                    "discovery_backlog_days": 4,
+                    "ready_for_dev_days": 6,
+                },
+                {
+                    "pause": 7,
+                    "ttd_pause": None,
+                    "discovery_backlog_days": None,
+                    "ready_for_dev_days": None,
+                },
+            ]
+        )
 
         # Test collecting rows
         rows = generator._collect_csv_rows()
@@ -2416,9 +2467,8 @@ class TestTTMDetailsReport:
         assert row2["Discovery backlog (дни)"] == ""
         assert row2["Готова к разработке (дни)"] == ""
 
-        # Verify status duration methods were called
-        assert generator._calculate_discovery_backlog_days.call_count == 2
-        assert generator._calculate_ready_for_dev_days.call_count == 2
+        # Verify status durations were calculated in one batch
+        generator._calculate_history_metrics_batch.assert_called_once()
 
     def test_format_task_row_with_status_duration_none(self, test_reports_dir):
         """Test formatting task row with status duration None values."""
@@ -2479,7 +2529,7 @@ class TestTTMDetailsReport:
 
         generator = TTMDetailsReportGenerator(Mock(), test_reports_dir)
         output_path = f"{test_reports_dir}/test_returns.csv"
-        generator._collect_csv_rows = Mock(return_value=[])
+        generator._iter_csv_rows = Mock(return_value=[])
         generator.generate_csv(output_path)
         with open(output_path, "r", encoding="utf-8") as f:
             reader = csv.DictReader(f)
@@ -2602,8 +2652,8 @@ class TestTTMDetailsReport:
                 end_date=None,
             )
         ]
-        generator.data_service.get_task_history = Mock(
-            return_value=mock_history_with_done
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            lambda task_id: mock_history_with_done
         )
 
         # Mock all calculation methods
@@ -2694,23 +2744,12 @@ class TestTTMDetailsReport:
 
         generator = TTMDetailsReportGenerator(Mock(), test_reports_dir)
 
-        # Mock the database query
-        mock_task1 = Mock()
-        mock_task1.key = "CPO-123"
-        mock_task1.links = [
-            {"type": {"id": "relates"}, "object": {"key": "FULLSTACK-456"}},
-            {"type": {"id": "relates"}, "object": {"key": "FULLSTACK-789"}},
-        ]
-
-        mock_task2 = Mock()
-        mock_task2.key = "CPO-456"
-        mock_task2.links = [
-            {"type": {"id": "relates"}, "object": {"key": "FULLSTACK-999"}}
-        ]
-
-        generator.testing_returns_service.db.query.return_value.filter.return_value.all.return_value = [
-            (mock_task1.key, mock_task1.links),
-            (mock_task2.key, mock_task2.links),
+        # Mock the database query: (src_key, dst_key) relates edges
+        links_query = generator.testing_returns_service.db.query.return_value
+        links_query.filter.return_value.distinct.return_value.order_by.return_value.filter.return_value.all.return_value = [
+            ("CPO-123", "FULLSTACK-456"),
+            ("CPO-123", "FULLSTACK-789"),
+            ("CPO-456", "FULLSTACK-999"),
         ]
 
         # Test batch loading
@@ -2798,7 +2837,7 @@ class TestTTMDetailsReport:
             return_value={"CPO-A": ["FULLSTACK-1"], "CPO-B": ["FULLSTACK-4"]}
         )
 
-        # Mock get_task_hierarchy_batch to return specific hierarchies
+        # Mock get_descendants_batch to return specific hierarchies
         def mock_hierarchy_batch(parent_keys):
             result = {}
             for parent in parent_keys:
@@ -2810,7 +2849,7 @@ class TestTTMDetailsReport:
                     result[parent] = []
             return result
 
-        generator.testing_returns_service.get_task_hierarchy_batch = Mock(
+        generator.testing_returns_service.get_descendants_batch = Mock(
             side_effect=mock_hierarchy_batch
         )
 
@@ -2863,7 +2902,7 @@ class TestTTMDetailsReport:
             }
         )
 
-        # Mock get_task_hierarchy_batch to return realistic hierarchies
+        # Mock get_descendants_batch to return realistic hierarchies
         def mock_hierarchy_batch(parent_keys):
             result = {}
             for parent in parent_keys:
@@ -2893,7 +2932,7 @@ class TestTTMDetailsReport:
                     result[parent] = []
             return result
 
-        generator.testing_returns_service.get_task_hierarchy_batch = Mock(
+        generator.testing_returns_service.get_descendants_batch = Mock(
             side_effect=mock_hierarchy_batch
         )
 
@@ -3324,7 +3363,7 @@ class TestTTMDetailsReport:
         output_path = f"{test_reports_dir}/test_development.csv"
 
         # Mock empty data to get just headers
-        generator._collect_csv_rows = Mock(return_value=[])
+        generator._iter_csv_rows = Mock(return_value=[])
 
         generator.generate_csv(output_path)
 
@@ -3462,8 +3501,8 @@ class TestTTMDetailsReport:
                 return mock_history_without_work
             return []
 
-        generator.data_service.get_task_history = Mock(
-            side_effect=get_history_side_effect
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            get_history_side_effect
         )
 
         # Mock all calculation methods
@@ -3561,6 +3600,7 @@ class TestTTMDetailsReport:
 
         # Mock _get_unfinished_tasks to return unfinished task
         generator._get_unfinished_tasks = Mock(return_value=[mock_unfinished_task])
+        generator._get_ready_tasks = Mock(return_value=[mock_unfinished_task])
 
         # Mock history for finished task (with stable_done)
         from radiator.commands.models.time_to_market_models import StatusHistoryEntry
@@ -3598,8 +3638,8 @@ class TestTTMDetailsReport:
                 return mock_unfinished_history
             return []
 
-        generator.data_service.get_task_history = Mock(
-            side_effect=get_history_side_effect
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            get_history_side_effect
         )
 
         # Mock stable_done: finished task has it, unfinished doesn't
@@ -3610,15 +3650,15 @@ class TestTTMDetailsReport:
             end_date=None,
         )
 
-        # _find_stable_done вызывается для разных задач, используем функцию
+        # find_stable_done_batch получает истории разных задач, используем функцию
         def find_stable_done_side_effect(history, done_statuses):
             # Проверяем наличие Done статуса в истории
             if any(entry.status == "Done" for entry in history):
                 return mock_stable_done_finished
             return None
 
-        generator.metrics_service._find_stable_done = Mock(
-            side_effect=find_stable_done_side_effect
+        generator.metrics_service.find_stable_done_batch = mock_stable_done_batch(
+            find_stable_done_side_effect
         )
 
         # Mock all calculation methods - используем функции для поддержки повторных вызовов
@@ -3757,11 +3797,11 @@ class TestTTMDetailsReport:
             summary="Finished Task",
         )
 
-        # Mock get_tasks_for_period to return both tasks
+        # Mock iter_tasks_for_period to stream both tasks
         from radiator.commands.models.time_to_market_models import GroupBy
 
-        generator.data_service.get_tasks_for_period = Mock(
-            return_value=[unfinished_task, finished_task]
+        generator.data_service.iter_tasks_for_period = Mock(
+            return_value=iter([unfinished_task, finished_task])
         )
         generator.config_service.load_status_mapping = Mock()
 
@@ -3799,8 +3839,8 @@ class TestTTMDetailsReport:
                 return finished_history
             return []
 
-        generator.data_service.get_task_history = Mock(
-            side_effect=get_history_side_effect
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            get_history_side_effect
         )
 
         # Mock stable_done: unfinished task doesn't have it, finished task has it
@@ -3816,8 +3856,8 @@ class TestTTMDetailsReport:
                 return mock_stable_done_finished
             return None
 
-        generator.metrics_service._find_stable_done = Mock(
-            side_effect=find_stable_done_side_effect
+        generator.metrics_service.find_stable_done_batch = mock_stable_done_batch(
+            find_stable_done_side_effect
         )
 
         # Test _get_unfinished_tasks
@@ -3860,8 +3900,8 @@ class TestTTMDetailsReport:
         mock_done_statuses = ["Done", "Закрыт"]
         generator._load_done_statuses = Mock(return_value=mock_done_statuses)
 
-        # Mock get_tasks_for_period to return empty list (no tasks with "Готова к разработке")
-        generator.data_service.get_tasks_for_period = Mock(return_value=[])
+        # Mock iter_tasks_for_period to stream nothing (no tasks with "Готова к разработке")
+        generator.data_service.iter_tasks_for_period = Mock(return_value=iter([]))
         generator.config_service.load_status_mapping = Mock()
 
         # Test _get_unfinished_tasks
@@ -3916,6 +3956,7 @@ class TestTTMDetailsReport:
 
         generator._get_ttm_tasks_for_date_range_corrected = Mock(return_value=[])
         generator._get_unfinished_tasks = Mock(return_value=[unfinished_task])
+        generator._get_ready_tasks = Mock(return_value=[unfinished_task])
 
         # Mock history
         from radiator.commands.models.time_to_market_models import StatusHistoryEntry
@@ -3929,8 +3970,12 @@ class TestTTMDetailsReport:
             ),
         ]
 
-        generator.data_service.get_task_history = Mock(return_value=unfinished_history)
-        generator.metrics_service._find_stable_done = Mock(return_value=None)
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            lambda task_id: unfinished_history
+        )
+        generator.metrics_service.find_stable_done_batch = mock_stable_done_batch(
+            Mock(return_value=None)
+        )
 
         # Mock all calculation methods
         generator._calculate_ttm_unfinished = Mock(return_value=20)
@@ -4032,6 +4077,7 @@ class TestTTMDetailsReport:
             return_value=[finished_task]
         )
         generator._get_unfinished_tasks = Mock(return_value=[unfinished_task])
+        generator._get_ready_tasks = Mock(return_value=[unfinished_task])
 
         # Mock histories
         from radiator.commands.models.time_to_market_models import StatusHistoryEntry
@@ -4061,8 +4107,8 @@ class TestTTMDetailsReport:
                 return unfinished_history
             return []
 
-        generator.data_service.get_task_history = Mock(
-            side_effect=get_history_side_effect
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            get_history_side_effect
         )
 
         # Mock stable_done
@@ -4078,8 +4124,8 @@ class TestTTMDetailsReport:
                 return mock_stable_done
             return None
 
-        generator.metrics_service._find_stable_done = Mock(
-            side_effect=find_stable_done_side_effect
+        generator.metrics_service.find_stable_done_batch = mock_stable_done_batch(
+            find_stable_done_side_effect
         )
 
         # Mock all calculation methods
@@ -4089,10 +4135,17 @@ class TestTTMDetailsReport:
         generator._calculate_devlt = Mock(return_value=8)
         generator._calculate_ttd = Mock(return_value=10)
         generator._calculate_ttd_quarter = Mock(return_value="Q1")
-        generator._calculate_pause = Mock(return_value=2)
-        generator._calculate_ttd_pause = Mock(return_value=1)
-        generator._calculate_discovery_backlog_days = Mock(return_value=3)
-        generator._calculate_ready_for_dev_days = Mock(return_value=4)
+        generator._calculate_history_metrics_batch = Mock(
+            side_effect=lambda histories, as_of_date=None: [
+                {
+                    "pause": 2,
+                    "ttd_pause": 1,
+                    "discovery_backlog_days": 3,
+                    "ready_for_dev_days": 4,
+                }
+                for _ in histories
+            ]
+        )
         generator._get_last_discovery_backlog_exit_date = Mock(
             return_value=datetime(2025, 1, 5)
         )
@@ -4355,16 +4408,14 @@ class TestTTMDetailsReport:
         generator = TTMDetailsReportGenerator(db=mock_db)
 
         # Mock all necessary services
-        with patch.object(
-            generator, "_collect_csv_rows", return_value=[]
-        ) as mock_collect:
+        with patch.object(generator, "_iter_csv_rows", return_value=[]) as mock_collect:
             as_of_date = datetime(2025, 2, 10, tzinfo=timezone.utc)
             output_path = f"{test_reports_dir}/test_as_of_date.csv"
 
             # Should not raise an error
             generator.generate_csv(output_path, as_of_date=as_of_date)
 
-            # Verify _collect_csv_rows was called with as_of_date
+            # Verify _iter_csv_rows was called with as_of_date
             mock_collect.assert_called_once_with(as_of_date)
 
     def test_generate_csv_uses_current_date_when_as_of_date_is_none(
@@ -4384,15 +4435,13 @@ class TestTTMDetailsReport:
         generator = TTMDetailsReportGenerator(db=mock_db)
 
         # Mock all necessary services
-        with patch.object(
-            generator, "_collect_csv_rows", return_value=[]
-        ) as mock_collect:
+        with patch.object(generator, "_iter_csv_rows", return_value=[]) as mock_collect:
             output_path = f"{test_reports_dir}/test_no_as_of_date.csv"
 
             # Call without as_of_date (default None)
             generator.generate_csv(output_path)
 
-            # Verify _collect_csv_rows was called with None
+            # Verify _iter_csv_rows was called with None
             mock_collect.assert_called_once_with(None)
 
     def test_get_effective_as_of_date_returns_current_when_none(self, test_reports_dir):
@@ -4681,6 +4730,152 @@ class TestTTMDetailsReport:
         assert metrics["current_status"] == "МП / В работе"
         assert metrics["status_group"] == "delivery"
 
+    def test_collect_csv_rows_loads_histories_per_chunk(self):
+        """Histories are loaded by one batch call per chunk and cut at as_of_date in memory."""
+        from collections import defaultdict
+
+        from radiator.commands.models.time_to_market_models import (
+            Quarter,
+            StatusHistoryEntry,
+            TaskData,
+        )
+
+        generator = TTMDetailsReportGenerator(db=Mock())
+        generator._load_quarters = Mock(
+            return_value=[
+                Quarter(
+                    name="2025.Q1",
+                    start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                    end_date=datetime(2025, 3, 31, tzinfo=timezone.utc),
+                )
+            ]
+        )
+        generator._load_done_statuses = Mock(return_value=["Done"])
+
+        def task(task_id):
+            return TaskData(
+                id=task_id,
+                key=f"CPO-{task_id}",
+                group_value="Author",
+                author="Author",
+                team=None,
+                created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                summary=f"Task {task_id}",
+            )
+
+        def entry(status, day, end_day=None):
+            return StatusHistoryEntry(
+                status=status,
+                status_display=status,
+                start_date=datetime(2025, 1, day, tzinfo=timezone.utc),
+                end_date=(
+                    datetime(2025, 1, end_day, tzinfo=timezone.utc) if end_day else None
+                ),
+            )
+
+        histories = {
+            1: [entry("Готова к разработке", 2, 5), entry("Done", 5)],
+            2: [entry("Готова к разработке", 3, 6), entry("Done", 6)],
+            # Moved on after as_of_date: history is cut in memory
+            3: [entry("Готова к разработке", 4, 20), entry("Testing", 20)],
+        }
+        generator._get_ttm_tasks_for_date_range_corrected = Mock(return_value=[task(1)])
+        generator._get_ready_tasks = Mock(return_value=[task(1), task(2), task(3)])
+        generator.data_service.get_filtered_task_histories_batch = mock_histories_batch(
+            histories.get
+        )
+        generator.data_service.get_task_history = Mock(
+            side_effect=AssertionError("per-task history query")
+        )
+        generator._calculate_all_returns_batched = Mock(return_value={})
+        generator.config_service.get_status_group = Mock(return_value="")
+        generator._calculate_task_metrics = Mock(
+            side_effect=lambda task, history, *args, **kwargs: defaultdict(
+                lambda: None, task=task, history=history
+            )
+        )
+        generator._format_task_row = Mock(side_effect=lambda task, *args: task.key)
+
+        rows = generator._collect_csv_rows(
+            as_of_date=datetime(2025, 1, 10, tzinfo=timezone.utc)
+        )
+
+        # One call for the finished chunk, one for the ready chunk
+        assert [
+            call.args[0]
+            for call in generator.data_service.get_filtered_task_histories_batch.call_args_list
+        ] == [[1], [1, 2, 3]]
+        assert rows == ["CPO-1", "CPO-3"]
+        unfinished_history = generator._calculate_task_metrics.call_args_list[1].args[1]
+        assert [e.status for e in unfinished_history] == ["Готова к разработке"]
+        assert unfinished_history[0].end_date is None
+
+    def test_calculate_metrics_with_workers_matches_serial(self):
+        """Process pool returns the same metrics in the same order as serial run."""
+        from unittest.mock import patch
+
+        from radiator.commands.models.time_to_market_models import (
+            Quarter,
+            StatusHistoryEntry,
+            TaskData,
+        )
+        from radiator.commands.services.config_service import ConfigService
+
+        quarters = [
+            Quarter(
+                name="2025.Q1",
+                start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                end_date=datetime(2025, 3, 31, tzinfo=timezone.utc),
+            )
+        ]
+        metric_jobs = []
+        for task_id in range(1, 8):
+            done = StatusHistoryEntry(
+                "Done", "Done", datetime(2025, 2, task_id, tzinfo=timezone.utc), None
+            )
+            history = [
+                StatusHistoryEntry(
+                    "Готова к разработке",
+                    "Готова к разработке",
+                    datetime(2025, 1, task_id, tzinfo=timezone.utc),
+                    datetime(2025, 1, 10 + task_id, tzinfo=timezone.utc),
+                ),
+                StatusHistoryEntry(
+                    "МП / В работе",
+                    "МП / В работе",
+                    datetime(2025, 1, 10 + task_id, tzinfo=timezone.utc),
+                    done.start_date,
+                ),
+                done,
+            ]
+            task = TaskData(
+                id=task_id,
+                key=f"CPO-{task_id}",
+                group_value="Author",
+                author="Author",
+                team=None,
+                created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                summary=f"Task {task_id}",
+            )
+            finished = task_id % 2 == 1
+            metric_jobs.append((task, history, done if finished else None, finished))
+
+        as_of_date = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        with patch.object(
+            ConfigService, "get_status_group", create=True, return_value="done"
+        ):
+            serial = TTMDetailsReportGenerator(db=Mock())._calculate_metrics_for_tasks(
+                metric_jobs, ["Done"], quarters, as_of_date
+            )
+            parallel = TTMDetailsReportGenerator(
+                db=Mock(), workers=2
+            )._calculate_metrics_for_tasks(metric_jobs, ["Done"], quarters, as_of_date)
+
+        assert [m["task"].key for m in parallel] == [f"CPO-{i}" for i in range(1, 8)]
+        assert parallel == serial
+        assert serial[0]["quarter_name"] == "2025.Q1"
+        assert serial[0]["ttm"] is not None
+
 
 if __name__ == "__main__":
     pytest.main([__file__])